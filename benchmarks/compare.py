@@ -0,0 +1,96 @@
+"""Compare two benchmark result files and flag regressions.
+
+Reads the JSON written by ``pytest benchmarks --benchmark-json PATH``
+(from pytest-benchmark or the fallback timer in conftest.py), matches
+cases by full name, and compares a timing statistic. Exits with status 1
+when any case slowed down by more than the threshold, so it can gate CI.
+Cases that ran on a different study size are reported but not compared.
+
+Usage:
+    python benchmarks/compare.py BASELINE.json CURRENT.json [--stat min] [--threshold 0.1]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any
+
+
+def load_results(path: Path) -> dict[str, dict[str, Any]]:
+    """Benchmark entries of a result file, keyed by full name."""
+    data = json.loads(path.read_text())
+    return {bench["fullname"]: bench for bench in data["benchmarks"]}
+
+
+def _commit(path: Path) -> str:
+    info = json.loads(path.read_text()).get("commit_info", {})
+    commit = info.get("id", "unknown")[:10]
+    return f"{commit}{' (dirty)' if info.get('dirty') else ''}"
+
+
+def compare(
+    baseline: dict[str, dict[str, Any]],
+    current: dict[str, dict[str, Any]],
+    *,
+    stat: str = "min",
+    threshold: float = 0.1,
+) -> tuple[list[str], list[str]]:
+    """Compare ``stat`` of every case present in both runs.
+
+    Returns:
+        Report lines, and the names of cases slower by more than ``threshold``.
+    """
+    lines: list[str] = []
+    regressions: list[str] = []
+    width = max((len(name) for name in current), default=0)
+    for name, bench in current.items():
+        base = baseline.get(name)
+        if base is None:
+            lines.append(f"{name:<{width}}  new")
+            continue
+        if base.get("extra_info", {}).get("study") != bench.get("extra_info", {}).get("study"):
+            lines.append(f"{name:<{width}}  skipped: different study size")
+            continue
+
+        before = base["stats"][stat]
+        after = bench["stats"][stat]
+        change = after / before - 1 if before else 0.0
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif change < -threshold:
+            flag = "  faster"
+        lines.append(f"{name:<{width}}  {before:9.4f}s -> {after:9.4f}s  {change:+7.1%}{flag}")
+    for name in baseline.keys() - current.keys():
+        lines.append(f"{name:<{width}}  missing from current run")
+    return lines, regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument("--stat", default="min", choices=["min", "mean", "median", "max"])
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="Relative slowdown flagged (default 0.1)"
+    )
+    args = parser.parse_args()
+
+    lines, regressions = compare(
+        load_results(args.baseline),
+        load_results(args.current),
+        stat=args.stat,
+        threshold=args.threshold,
+    )
+    print(f"{_commit(args.baseline)} -> {_commit(args.current)}  ({args.stat})")
+    for line in lines:
+        print(line)
+    if regressions:
+        raise SystemExit(f"{len(regressions)} case(s) slower by more than {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""Fixtures for the pipeline benchmark suite.
+
+Run with ``pytest benchmarks`` (the default test run only collects
+``tests/``). The synthetic study is sized with ``--study-subjects``,
+``--study-visits``, ``--study-lab-tests`` and ``--study-edc-columns``.
+
+With pytest-benchmark installed its ``benchmark`` fixture and options are
+used as-is, e.g. ``--benchmark-json results.json``. Without it, a minimal
+fixture with the same calling convention times each case and
+``--benchmark-json PATH`` writes results in the same JSON layout, so
+``benchmarks/compare.py`` reads files from either.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+from loguru import logger
+from synthetic_study import (
+    StudyConfig,
+    SyntheticStudy,
+    generate_study,
+    write_study,
+    write_xport_study,
+)
+
+from astraea.io.sas_cache import SASReadCache
+from astraea.reference import (
+    CTReference,
+    SDTMReference,
+    load_ct_reference,
+    load_sdtm_reference,
+)
+
+HAVE_PYTEST_BENCHMARK = importlib.util.find_spec("pytest_benchmark") is not None
+
+_DEFAULT_ROUNDS = 5
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("synthetic study")
+    defaults = StudyConfig()
+    group.addoption("--study-subjects", type=int, default=defaults.subjects)
+    group.addoption("--study-visits", type=int, default=defaults.visits)
+    group.addoption("--study-lab-tests", type=int, default=defaults.lab_tests)
+    group.addoption("--study-edc-columns", type=int, default=defaults.edc_columns)
+    if not HAVE_PYTEST_BENCHMARK:
+        group = parser.getgroup("benchmark (fallback timer)")
+        group.addoption("--benchmark-json", type=Path, default=None)
+        group.addoption("--benchmark-min-rounds", type=int, default=_DEFAULT_ROUNDS)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _quiet_astraea() -> None:
+    # Per-row log output would dominate the timings
+    logger.disable("astraea")
+
+
+@pytest.fixture(scope="session")
+def study_config(request: pytest.FixtureRequest) -> StudyConfig:
+    opt = request.config.getoption
+    return StudyConfig(
+        subjects=opt("--study-subjects"),
+        visits=opt("--study-visits"),
+        lab_tests=opt("--study-lab-tests"),
+        edc_columns=opt("--study-edc-columns"),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _record_study_size(request: pytest.FixtureRequest, study_config: StudyConfig) -> None:
+    # Stored with each result so runs at different sizes are not compared
+    if "benchmark" in request.fixturenames:
+        request.getfixturevalue("benchmark").extra_info["study"] = study_config.model_dump()
+
+
+@pytest.fixture(scope="session")
+def study(study_config: StudyConfig) -> SyntheticStudy:
+    return generate_study(study_config)
+
+
+@pytest.fixture(scope="session")
+def study_files(
+    study: SyntheticStudy, tmp_path_factory: pytest.TempPathFactory
+) -> tuple[Path, SASReadCache]:
+    """Raw data directory of the written study and the cache serving it."""
+    out_dir = tmp_path_factory.mktemp("study")
+    cache = SASReadCache(out_dir / "sas_cache")
+    return write_study(study, out_dir, cache), cache
+
+
+@pytest.fixture(scope="session")
+def study_xpt_dir(study: SyntheticStudy, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory of the study's raw datasets as real SAS transport files."""
+    return write_xport_study(study, tmp_path_factory.mktemp("study_xpt"))
+
+
+@pytest.fixture(scope="session")
+def sdtm_ref() -> SDTMReference:
+    return load_sdtm_reference()
+
+
+@pytest.fixture(scope="session")
+def ct_ref() -> CTReference:
+    return load_ct_reference()
+
+
+class _Timer:
+    """Minimal stand-in for pytest-benchmark's ``benchmark`` fixture."""
+
+    def __init__(self, node: pytest.Item, min_rounds: int) -> None:
+        self.name = node.name
+        self.fullname = node.nodeid
+        self.group: str | None = None
+        self.extra_info: dict[str, Any] = {}
+        self.min_rounds = min_rounds
+        self.times: list[float] = []
+
+    def __call__(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        return self.pedantic(fn, args=args, kwargs=kwargs, rounds=self.min_rounds)
+
+    def pedantic(
+        self,
+        target: Callable[..., Any],
+        args: tuple[Any, ...] = (),
+        kwargs: dict[str, Any] | None = None,
+        setup: Callable[[], Any] | None = None,
+        rounds: int = 1,
+        iterations: int = 1,
+        warmup_rounds: int = 0,
+    ) -> Any:
+        kwargs = kwargs or {}
+        for _ in range(warmup_rounds):
+            target(*args, **kwargs)
+        result = None
+        for _ in range(rounds):
+            if setup is not None:
+                prepared = setup()
+                if prepared is not None:
+                    args, kwargs = prepared
+            t0 = time.perf_counter()
+            for _ in range(iterations):
+                result = target(*args, **kwargs)
+            self.times.append((time.perf_counter() - t0) / iterations)
+        return result
+
+    def as_dict(self) -> dict[str, Any]:
+        times = self.times
+        return {
+            "name": self.name,
+            "fullname": self.fullname,
+            "group": self.group,
+            "extra_info": self.extra_info,
+            "stats": {
+                "min": min(times),
+                "max": max(times),
+                "mean": statistics.fmean(times),
+                "median": statistics.median(times),
+                "stddev": statistics.stdev(times) if len(times) > 1 else 0.0,
+                "rounds": len(times),
+            },
+        }
+
+
+_timers: list[_Timer] = []
+
+
+if not HAVE_PYTEST_BENCHMARK:
+
+    @pytest.fixture
+    def benchmark(request: pytest.FixtureRequest) -> _Timer:
+        timer = _Timer(request.node, request.config.getoption("--benchmark-min-rounds"))
+        _timers.append(timer)
+        return timer
+
+    def pytest_terminal_summary(terminalreporter: Any) -> None:
+        timed = [t for t in _timers if t.times]
+        if not timed:
+            return
+        terminalreporter.section("benchmark (fallback timer)")
+        for timer in timed:
+            stats = timer.as_dict()["stats"]
+            terminalreporter.write_line(
+                f"{timer.name:<40} min {stats['min']:9.4f}s  mean {stats['mean']:9.4f}s"
+                f"  rounds {stats['rounds']}"
+            )
+
+    def pytest_sessionfinish(session: pytest.Session) -> None:
+        path = session.config.getoption("--benchmark-json")
+        timed = [t for t in _timers if t.times]
+        if path is None or not timed:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(
+                {
+                    "machine_info": {
+                        "node": platform.node(),
+                        "python_version": platform.python_version(),
+                    },
+                    "commit_info": _commit_info(),
+                    "benchmarks": [t.as_dict() for t in timed],
+                    "datetime": datetime.now(UTC).isoformat(),
+                },
+                indent=2,
+            )
+        )
+
+
+def _commit_info() -> dict[str, Any]:
+    """Current commit id and dirty flag, as pytest-benchmark records them."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = bool(
+            subprocess.run(
+                ["git", "status", "--porcelain", "--untracked-files=no"],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return {"error": "not a git checkout", "python": sys.version}
+    return {"id": commit, "dirty": dirty}
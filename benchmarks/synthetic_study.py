@@ -0,0 +1,480 @@
+"""Deterministic synthetic study for the pipeline benchmarks.
+
+Generates raw Rave-style DM, AE and LB datasets -- subject and site
+columns, EDC system columns, SAS numeric dates -- sized by the number of
+subjects, visits, lab tests and extra EDC columns, together with the
+DomainMappingSpec for each domain. The same config and seed always
+produce the same data.
+
+pyreadstat cannot write .sas7bdat files, so ``write_study`` writes each
+raw dataset as a placeholder ``<name>.sas7bdat`` plus a SASReadCache entry
+holding the decoded frame and its DatasetMetadata. ``read_sas_with_metadata``
+with that cache then serves the file exactly as it would after a first
+decode of a real export -- this exercises the cache-hit path only. The
+specs are written as ``<domain>_spec.json``.
+
+To time actual decoding, ``write_xport_study`` writes each raw dataset as
+a real SAS transport file (``<name>.xpt``, version 8 so long EDC column
+names survive), which ReadStat decodes with the same machinery it uses
+for .sas7bdat.
+
+Usage:
+    python benchmarks/synthetic_study.py OUT_DIR [--subjects N] [--visits N]
+        [--lab-tests N] [--edc-columns N]
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyreadstat
+from pydantic import BaseModel, Field
+
+from astraea.io.sas_cache import SASReadCache
+from astraea.models.mapping import (
+    ConfidenceLevel,
+    DomainMappingSpec,
+    MappingPattern,
+    VariableMapping,
+)
+from astraea.models.metadata import DatasetMetadata, VariableMetadata
+from astraea.models.sdtm import CoreDesignation
+
+STUDY_ID = "BENCH-01"
+
+# (test code, test name, category, unit, normal range low, normal range high)
+_LAB_TESTS: list[tuple[str, str, str, str, float, float]] = [
+    ("ALT", "Alanine Aminotransferase", "CHEMISTRY", "U/L", 7.0, 56.0),
+    ("AST", "Aspartate Aminotransferase", "CHEMISTRY", "U/L", 10.0, 40.0),
+    ("ALP", "Alkaline Phosphatase", "CHEMISTRY", "U/L", 44.0, 147.0),
+    ("BILI", "Bilirubin", "CHEMISTRY", "umol/L", 5.0, 21.0),
+    ("CREAT", "Creatinine", "CHEMISTRY", "umol/L", 60.0, 110.0),
+    ("GLUC", "Glucose", "CHEMISTRY", "mmol/L", 3.9, 5.6),
+    ("SODIUM", "Sodium", "CHEMISTRY", "mmol/L", 135.0, 145.0),
+    ("K", "Potassium", "CHEMISTRY", "mmol/L", 3.5, 5.1),
+    ("CHOL", "Cholesterol", "CHEMISTRY", "mmol/L", 3.0, 5.2),
+    ("ALB", "Albumin", "CHEMISTRY", "g/L", 35.0, 50.0),
+    ("HGB", "Hemoglobin", "HEMATOLOGY", "g/dL", 12.0, 17.5),
+    ("HCT", "Hematocrit", "HEMATOLOGY", "%", 36.0, 50.0),
+    ("PLAT", "Platelets", "HEMATOLOGY", "10^9/L", 150.0, 400.0),
+    ("WBC", "Leukocytes", "HEMATOLOGY", "10^9/L", 4.0, 11.0),
+    ("RBC", "Erythrocytes", "HEMATOLOGY", "10^12/L", 4.2, 5.9),
+    ("NEUT", "Neutrophils", "HEMATOLOGY", "10^9/L", 1.5, 8.0),
+]
+
+_AE_TERMS = [
+    "HEADACHE",
+    "NAUSEA",
+    "FATIGUE",
+    "DIZZINESS",
+    "RASH",
+    "DIARRHOEA",
+    "INSOMNIA",
+    "ARTHRALGIA",
+    "COUGH",
+    "PYREXIA",
+]
+
+# Days between 1960-01-01 (SAS epoch) and 2024-01-01
+_SAS_2024 = 23376
+
+
+class StudyConfig(BaseModel):
+    """Size and seed of a synthetic study."""
+
+    subjects: int = Field(default=200, ge=1)
+    visits: int = Field(default=8, ge=1)
+    lab_tests: int = Field(default=12, ge=1, le=len(_LAB_TESTS))
+    ae_per_subject: int = Field(default=3, ge=1)
+    edc_columns: int = Field(default=20, ge=0, description="Filler EDC columns per dataset")
+    seed: int = 0
+
+
+class SyntheticStudy(BaseModel):
+    """Raw datasets and mapping specs of a generated study."""
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    config: StudyConfig
+    raw: dict[str, pd.DataFrame]
+    specs: dict[str, DomainMappingSpec]
+
+
+def _edc_columns(n_rows: int, config: StudyConfig, rng: np.random.Generator) -> dict[str, object]:
+    """Rave system columns plus ``config.edc_columns`` filler columns."""
+    columns: dict[str, object] = {
+        "projectid": np.full(n_rows, 101.0),
+        "project": np.full(n_rows, STUDY_ID, dtype=object),
+        "environmentName": np.full(n_rows, "PROD", dtype=object),
+        "InstanceName": np.full(n_rows, "Screening", dtype=object),
+        "RecordId": np.arange(n_rows, dtype="float64") + 1,
+    }
+    for i in range(config.edc_columns):
+        if i % 2:
+            flags = np.array(["", "Y", "N", "UNK"], dtype=object)
+            columns[f"EDCCHAR{i:03d}"] = rng.choice(flags, size=n_rows)
+        else:
+            columns[f"EDCNUM{i:03d}"] = rng.integers(0, 1000, size=n_rows).astype("float64")
+    return columns
+
+
+def _subject_columns(subject: np.ndarray) -> dict[str, np.ndarray]:
+    site = 100 + subject // 25
+    return {
+        "Subject": np.array([f"{s:05d}" for s in range(subject.max() + 1)], dtype=object)[subject],
+        "SiteNumber": np.array([f"{s:03d}" for s in range(site.max() + 1)], dtype=object)[site],
+    }
+
+
+def make_raw_dm(config: StudyConfig) -> pd.DataFrame:
+    """One row per subject."""
+    rng = np.random.default_rng(config.seed)
+    n = config.subjects
+    subject = np.arange(n)
+    return pd.DataFrame(
+        {
+            **_subject_columns(subject),
+            "SEX": rng.choice(np.array(["M", "F"], dtype=object), size=n),
+            "AGE": rng.integers(18, 80, size=n).astype("float64"),
+            "BRTHDAT": (_SAS_2024 - rng.integers(18 * 365, 80 * 365, size=n)).astype("float64"),
+            "RFSTDAT": (_SAS_2024 + subject % 180).astype("float64"),
+            **_edc_columns(n, config, rng),
+        }
+    )
+
+
+def make_raw_ae(config: StudyConfig) -> pd.DataFrame:
+    """``ae_per_subject`` adverse events per subject."""
+    rng = np.random.default_rng(config.seed + 1)
+    n = config.subjects * config.ae_per_subject
+    subject = np.repeat(np.arange(config.subjects), config.ae_per_subject)
+    terms = np.array(_AE_TERMS, dtype=object)[rng.integers(0, len(_AE_TERMS), size=n)]
+    return pd.DataFrame(
+        {
+            **_subject_columns(subject),
+            "AETERM": terms,
+            "AEDECOD": terms,
+            "AESER": rng.choice(np.array(["Y", "N"], dtype=object), size=n, p=[0.1, 0.9]),
+            "AESTDAT": (_SAS_2024 + subject % 180 + rng.integers(1, 120, size=n)).astype("float64"),
+            **_edc_columns(n, config, rng),
+        }
+    )
+
+
+def make_raw_lb(config: StudyConfig) -> pd.DataFrame:
+    """One row per lab test per visit per subject."""
+    rng = np.random.default_rng(config.seed + 2)
+    tests = _LAB_TESTS[: config.lab_tests]
+    per_subject = config.visits * len(tests)
+    n = config.subjects * per_subject
+    subject = np.repeat(np.arange(config.subjects), per_subject)
+    visit = np.tile(np.repeat(np.arange(1, config.visits + 1), len(tests)), config.subjects)
+    test = np.tile(np.arange(len(tests)), config.subjects * config.visits)
+
+    code, name, cat, unit, low, high = (np.array(col) for col in zip(*tests, strict=True))
+    mid = ((low + high) / 2)[test]
+    spread = ((high - low) / 3)[test]
+    values = np.round(np.abs(rng.normal(mid, spread)), 1)
+    return pd.DataFrame(
+        {
+            **_subject_columns(subject),
+            "LBTESTCD": code.astype(object)[test],
+            "LBTEST": name.astype(object)[test],
+            "LBCAT": cat.astype(object)[test],
+            "LBORRES": values.astype(str).astype(object),
+            "LBORRESU": unit.astype(object)[test],
+            "LBSTNRLO": low[test],
+            "LBSTNRHI": high[test],
+            "VISITNUM": visit.astype("float64"),
+            "VISIT": np.array([f"VISIT {v}" for v in range(1, config.visits + 1)], dtype=object)[
+                visit - 1
+            ],
+            "LBDAT": (_SAS_2024 + subject % 180 + (visit - 1) * 14).astype("float64"),
+            **_edc_columns(n, config, rng),
+        }
+    )
+
+
+def _mapping(
+    variable: str,
+    pattern: MappingPattern,
+    order: int,
+    *,
+    data_type: str = "Char",
+    core: CoreDesignation = CoreDesignation.REQ,
+    **kwargs: str,
+) -> VariableMapping:
+    return VariableMapping(
+        sdtm_variable=variable,
+        sdtm_label=variable,
+        sdtm_data_type=data_type,
+        core=core,
+        mapping_pattern=pattern,
+        mapping_logic="synthetic benchmark study",
+        confidence=0.95,
+        confidence_level=ConfidenceLevel.HIGH,
+        confidence_rationale="synthetic benchmark study",
+        order=order,
+        **kwargs,
+    )
+
+
+def _spec(
+    domain: str,
+    label: str,
+    domain_class: str,
+    structure: str,
+    source: str,
+    mappings: list[VariableMapping],
+) -> DomainMappingSpec:
+    n = len(mappings)
+    return DomainMappingSpec(
+        domain=domain,
+        domain_label=label,
+        domain_class=domain_class,
+        structure=structure,
+        study_id=STUDY_ID,
+        source_datasets=[source],
+        variable_mappings=mappings,
+        total_variables=n,
+        required_mapped=n,
+        expected_mapped=0,
+        high_confidence_count=n,
+        medium_confidence_count=0,
+        low_confidence_count=0,
+        mapping_timestamp="2026-01-01T00:00:00",
+        model_used="synthetic",
+    )
+
+
+def _identifiers(domain: str) -> list[VariableMapping]:
+    return [
+        _mapping("STUDYID", MappingPattern.ASSIGN, 1, assigned_value=STUDY_ID),
+        _mapping("DOMAIN", MappingPattern.ASSIGN, 2, assigned_value=domain),
+        _mapping("USUBJID", MappingPattern.DERIVATION, 3, derivation_rule="generate_usubjid"),
+    ]
+
+
+def make_specs() -> dict[str, DomainMappingSpec]:
+    """Mapping specs for the DM, AE and LB raw datasets."""
+    exp = CoreDesignation.EXP
+    dm = _spec(
+        "DM",
+        "Demographics",
+        "Special Purpose",
+        "One record per subject",
+        "dm",
+        [
+            *_identifiers("DM"),
+            _mapping("SUBJID", MappingPattern.DIRECT, 4, source_variable="Subject"),
+            _mapping("SITEID", MappingPattern.DIRECT, 5, source_variable="SiteNumber"),
+            _mapping(
+                "RFSTDTC",
+                MappingPattern.REFORMAT,
+                6,
+                core=exp,
+                source_variable="RFSTDAT",
+                derivation_rule="sas_date_to_iso",
+            ),
+            _mapping(
+                "BRTHDTC",
+                MappingPattern.REFORMAT,
+                7,
+                core=exp,
+                source_variable="BRTHDAT",
+                derivation_rule="sas_date_to_iso",
+            ),
+            _mapping(
+                "AGE", MappingPattern.DIRECT, 8, data_type="Num", core=exp, source_variable="AGE"
+            ),
+            _mapping("AGEU", MappingPattern.ASSIGN, 9, core=exp, assigned_value="YEARS"),
+            _mapping(
+                "SEX",
+                MappingPattern.LOOKUP_RECODE,
+                10,
+                source_variable="SEX",
+                codelist_code="C66731",
+            ),
+            _mapping("COUNTRY", MappingPattern.ASSIGN, 11, assigned_value="USA"),
+        ],
+    )
+    ae = _spec(
+        "AE",
+        "Adverse Events",
+        "Events",
+        "One record per adverse event per subject",
+        "ae",
+        [
+            *_identifiers("AE"),
+            _mapping(
+                "AESEQ",
+                MappingPattern.DERIVATION,
+                4,
+                data_type="Num",
+                derivation_rule="generate_seq",
+            ),
+            _mapping("AETERM", MappingPattern.DIRECT, 5, source_variable="AETERM"),
+            _mapping("AEDECOD", MappingPattern.DIRECT, 6, source_variable="AEDECOD"),
+            _mapping(
+                "AESER",
+                MappingPattern.LOOKUP_RECODE,
+                7,
+                core=exp,
+                source_variable="AESER",
+                codelist_code="C66742",
+            ),
+            _mapping(
+                "AESTDTC",
+                MappingPattern.REFORMAT,
+                8,
+                core=exp,
+                source_variable="AESTDAT",
+                derivation_rule="sas_date_to_iso",
+            ),
+        ],
+    )
+    lb_direct = ["LBTESTCD", "LBTEST", "LBCAT", "LBORRES", "LBORRESU"]
+    lb = _spec(
+        "LB",
+        "Laboratory Test Results",
+        "Findings",
+        "One record per lab test per visit per subject",
+        "lb",
+        [
+            *_identifiers("LB"),
+            _mapping(
+                "LBSEQ",
+                MappingPattern.DERIVATION,
+                4,
+                data_type="Num",
+                derivation_rule="generate_seq",
+            ),
+            *(
+                _mapping(name, MappingPattern.DIRECT, 5 + i, source_variable=name)
+                for i, name in enumerate(lb_direct)
+            ),
+            _mapping(
+                "VISITNUM",
+                MappingPattern.DIRECT,
+                10,
+                data_type="Num",
+                core=exp,
+                source_variable="VISITNUM",
+            ),
+            _mapping("VISIT", MappingPattern.DIRECT, 11, core=exp, source_variable="VISIT"),
+            _mapping(
+                "LBDTC",
+                MappingPattern.REFORMAT,
+                12,
+                core=exp,
+                source_variable="LBDAT",
+                derivation_rule="sas_date_to_iso",
+            ),
+        ],
+    )
+    return {"DM": dm, "AE": ae, "LB": lb}
+
+
+def generate_study(config: StudyConfig | None = None) -> SyntheticStudy:
+    """Generate the raw datasets and specs of a synthetic study in memory."""
+    config = config or StudyConfig()
+    return SyntheticStudy(
+        config=config,
+        raw={"dm": make_raw_dm(config), "ae": make_raw_ae(config), "lb": make_raw_lb(config)},
+        specs=make_specs(),
+    )
+
+
+def dataset_metadata(name: str, df: pd.DataFrame) -> DatasetMetadata:
+    """DatasetMetadata as the SAS reader would report it for ``df``."""
+    variables = []
+    for col in df.columns:
+        numeric = pd.api.types.is_numeric_dtype(df[col])
+        sas_format = "DATE9" if col.endswith("DAT") else None if numeric else "$"
+        variables.append(
+            VariableMetadata(
+                name=col,
+                label=col,
+                sas_format=sas_format,
+                dtype="numeric" if numeric else "character",
+            )
+        )
+    return DatasetMetadata(
+        filename=f"{name}.sas7bdat",
+        row_count=len(df),
+        col_count=len(df.columns),
+        variables=variables,
+        file_encoding="UTF-8",
+    )
+
+
+def write_study(study: SyntheticStudy, out_dir: str | Path, cache: SASReadCache) -> Path:
+    """Write the raw datasets and specs of ``study`` under ``out_dir``.
+
+    Raw datasets go to ``out_dir/raw`` as placeholder .sas7bdat files whose
+    decoded contents are stored in ``cache``; specs go to
+    ``out_dir/specs/<domain>_spec.json``.
+
+    Returns:
+        The raw data directory.
+    """
+    out_dir = Path(out_dir)
+    raw_dir = out_dir / "raw"
+    spec_dir = out_dir / "specs"
+    raw_dir.mkdir(parents=True, exist_ok=True)
+    spec_dir.mkdir(parents=True, exist_ok=True)
+
+    for name, df in study.raw.items():
+        path = raw_dir / f"{name}.sas7bdat"
+        path.write_bytes(b"")
+        cache.put(path, df, dataset_metadata(name, df))
+    for domain, spec in study.specs.items():
+        (spec_dir / f"{domain.lower()}_spec.json").write_text(spec.model_dump_json(indent=2))
+    return raw_dir
+
+
+def write_xport_study(study: SyntheticStudy, out_dir: str | Path) -> Path:
+    """Write the raw datasets of ``study`` as SAS transport files under ``out_dir/xpt``.
+
+    Returns:
+        The directory holding ``<name>.xpt`` for each raw dataset.
+    """
+    xpt_dir = Path(out_dir) / "xpt"
+    xpt_dir.mkdir(parents=True, exist_ok=True)
+    for name, df in study.raw.items():
+        pyreadstat.write_xport(
+            df, str(xpt_dir / f"{name}.xpt"), table_name=name.upper(), file_format_version=8
+        )
+    return xpt_dir
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("out_dir", type=Path)
+    parser.add_argument("--subjects", type=int, default=StudyConfig().subjects)
+    parser.add_argument("--visits", type=int, default=StudyConfig().visits)
+    parser.add_argument("--lab-tests", type=int, default=StudyConfig().lab_tests)
+    parser.add_argument("--edc-columns", type=int, default=StudyConfig().edc_columns)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    config = StudyConfig(
+        subjects=args.subjects,
+        visits=args.visits,
+        lab_tests=args.lab_tests,
+        edc_columns=args.edc_columns,
+        seed=args.seed,
+    )
+    cache = SASReadCache(args.out_dir / "sas_cache")
+    study = generate_study(config)
+    raw_dir = write_study(study, args.out_dir, cache)
+    for name, df in study.raw.items():
+        print(f"{name:>3}: {len(df):>9,} rows x {len(df.columns)} columns")
+    print(f"Raw data: {raw_dir}  (read with SASReadCache({cache.cache_dir}))")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""Benchmarks of the per-row derivations: EPOCH, SUPPQUAL, SV and DERIVATION rules.
+
+Each case runs one derivation on a synthetic frame of ``SUBJECTS`` subjects
+(``ROWS_PER_SUBJECT`` records each, or ``VISITS`` visits for SV) with
+partial, missing and invalid values mixed in, so the timings cover the
+fallback paths as well as the common one.
+
+Usage:
+    pytest benchmarks/test_derivations.py [--benchmark-json results/<commit>.json]
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+from synthetic_study import STUDY_ID
+
+from astraea.execution.pattern_handlers import handle_derivation
+from astraea.execution.subject_visits import build_sv_domain, extract_visit_dates
+from astraea.execution.suppqual import generate_suppqual
+from astraea.models.mapping import ConfidenceLevel, MappingPattern, VariableMapping
+from astraea.models.sdtm import CoreDesignation
+from astraea.models.suppqual import SuppVariable
+from astraea.transforms.epoch import assign_epoch
+
+SUBJECTS = 500
+ROWS_PER_SUBJECT = 200
+VISITS = 20
+
+_BASE = np.datetime64("2022-01-01", "D")
+_DAY = np.timedelta64(1, "D")
+_RACE_COLS = ["RACEAME", "RACEASI", "RACEBLA", "RACENAT", "RACEWHI"]
+
+
+def _subjects() -> list[str]:
+    return [f"{STUDY_ID}-{i:05d}" for i in range(SUBJECTS)]
+
+
+@pytest.fixture(scope="module")
+def epoch_data() -> tuple[pd.DataFrame, pd.DataFrame]:
+    """LB dates and three SE elements per subject, with overlaps and open ends."""
+    rng = np.random.default_rng(0)
+    subjects = _subjects()
+    se_rows = []
+    for i, subj in enumerate(subjects):
+        start = _BASE + int(rng.integers(0, 60)) * _DAY
+        se_rows.append((subj, str(start), str(start + 14 * _DAY), "SCREENING"))
+        # Overlaps screening by 2 days on every 7th subject
+        tx_start = start + (13 if i % 7 == 0 else 15) * _DAY
+        se_rows.append((subj, str(tx_start), str(tx_start + 180 * _DAY), "TREATMENT"))
+        fu_end = None if i % 5 == 0 else str(tx_start + 270 * _DAY)
+        se_rows.append((subj, str(tx_start + 181 * _DAY), fu_end, "FOLLOW-UP"))
+    se_df = pd.DataFrame(se_rows, columns=["USUBJID", "SESTDTC", "SEENDTC", "EPOCH"])
+
+    n = SUBJECTS * ROWS_PER_SUBJECT
+    dates = (_BASE + rng.integers(-10, 400, size=n) * _DAY).astype(str).astype(object)
+    dates[::53] = "2022-03"
+    dates[::97] = None
+    dates[::31] = [f"{d}T08:30" for d in dates[::31]]
+    df = pd.DataFrame({"USUBJID": np.repeat(subjects, ROWS_PER_SUBJECT), "LBDTC": dates})
+    return df, se_df
+
+
+@pytest.fixture(scope="module")
+def suppqual_data() -> tuple[pd.DataFrame, list[SuppVariable]]:
+    """LB rows with blank, padded, missing and numeric supplemental values."""
+    rng = np.random.default_rng(0)
+    n = SUBJECTS * ROWS_PER_SUBJECT
+    seq = np.tile(np.arange(1, ROWS_PER_SUBJECT + 1, dtype="float64"), SUBJECTS)
+    seq[::997] = np.nan
+    toxgr = rng.integers(0, 5, size=n).astype("float64")
+    toxgr[rng.random(n) < 0.6] = np.nan
+    df = pd.DataFrame(
+        {
+            "USUBJID": np.repeat(_subjects(), ROWS_PER_SUBJECT),
+            "LBSEQ": seq,
+            "LBCOM": rng.choice(["", "  ", "HEMOLYZED", " Repeat sample ", None], size=n),
+            "LBCLSIG": rng.choice(["Y", "N", None], size=n),
+            "LBFAST2": rng.choice(["Y", "N", "", None], size=n),
+            "LBTOXGR2": toxgr,
+        }
+    )
+    supp_vars = [
+        SuppVariable(qnam="LBCOM", qlabel="Lab Comment", source_col="LBCOM", qorig="CRF"),
+        SuppVariable(
+            qnam="LBCLSIG", qlabel="Clinically Significant", source_col="LBCLSIG", qorig="CRF"
+        ),
+        SuppVariable(qnam="LBFAST", qlabel="Fasting Status", source_col="LBFAST2", qorig="CRF"),
+        SuppVariable(
+            qnam="LBTOXGR", qlabel="Toxicity Grade", source_col="LBTOXGR2", qorig="DERIVED"
+        ),
+    ]
+    return df, supp_vars
+
+
+@pytest.fixture(scope="module")
+def visit_data() -> dict[str, pd.DataFrame]:
+    """Raw AE, LB and CM with visit dates; CM has no FolderSeq."""
+    rng = np.random.default_rng(0)
+    subjects = [f"{1000 + i}" for i in range(SUBJECTS)]
+    raw_dfs: dict[str, pd.DataFrame] = {}
+    for name, rows_per_visit, with_seq in (("ae", 2, True), ("lb", 12, True), ("cm", 3, False)):
+        n = SUBJECTS * VISITS * rows_per_visit
+        visit_idx = np.tile(np.repeat(np.arange(VISITS), rows_per_visit), SUBJECTS)
+        offsets = visit_idx * 28 + rng.integers(-3, 4, size=n)
+        start = (_BASE + offsets).astype(str).astype(object)
+        end = (_BASE + offsets + rng.integers(0, 5, size=n)).astype(str).astype(object)
+        start[rng.random(n) < 0.1] = None
+        end[rng.random(n) < 0.5] = None
+        folders = np.array([f"V{v + 1}" for v in visit_idx], dtype=object)
+        folders[::211] = None
+        df = pd.DataFrame(
+            {
+                "Subject": np.repeat(subjects, VISITS * rows_per_visit),
+                "InstanceName": [f"Visit {v + 1}" for v in visit_idx],
+                "FolderName": folders,
+                f"{name.upper()}STDAT": start,
+                f"{name.upper()}ENDAT": end,
+            }
+        )
+        if with_seq:
+            df["FolderSeq"] = (visit_idx + 1).astype("float64")
+        # Visits with no date at all on the last subject
+        undated = df["Subject"] == subjects[-1]
+        df.loc[undated, [f"{name.upper()}STDAT", f"{name.upper()}ENDAT"]] = None
+        raw_dfs[name] = df
+    return raw_dfs
+
+
+@pytest.fixture(scope="module")
+def dm_data() -> pd.DataFrame:
+    """Race checkboxes (0/1 with gaps) and birth date parts with gaps and invalid days."""
+    rng = np.random.default_rng(0)
+    n = SUBJECTS * ROWS_PER_SUBJECT
+    data: dict[str, np.ndarray] = {}
+    for col in _RACE_COLS:
+        values = (rng.random(n) < 0.25).astype("float64")
+        values[rng.random(n) < 0.1] = np.nan
+        data[col] = values
+    for col, low, high, missing in (
+        ("BRTHYR", 1930, 2005, 0.02),
+        ("BRTHMO", 1, 13, 0.2),
+        ("BRTHDY", 1, 32, 0.3),
+    ):
+        values = rng.integers(low, high, size=n).astype("float64")
+        values[rng.random(n) < missing] = np.nan
+        data[col] = values
+    return pd.DataFrame(data)
+
+
+def test_assign_epoch(benchmark, epoch_data: tuple[pd.DataFrame, pd.DataFrame]) -> None:
+    df, se_df = epoch_data
+    epochs = benchmark(assign_epoch, df, se_df, "LBDTC")
+    assert epochs.notna().any()
+
+
+def test_generate_suppqual(
+    benchmark, suppqual_data: tuple[pd.DataFrame, list[SuppVariable]]
+) -> None:
+    df, supp_vars = suppqual_data
+    supp = benchmark(generate_suppqual, df, "LB", STUDY_ID, supp_vars)
+    assert set(supp["QNAM"]) == {v.qnam for v in supp_vars}
+
+
+def test_build_sv_domain(benchmark, visit_data: dict[str, pd.DataFrame]) -> None:
+    sv = benchmark(lambda: build_sv_domain(extract_visit_dates(visit_data), STUDY_ID))
+    assert len(sv) == SUBJECTS * VISITS
+
+
+@pytest.mark.parametrize(
+    ("variable", "rule"),
+    [
+        ("RACE", f"RACE_CHECKBOX({', '.join(_RACE_COLS)})"),
+        ("BRTHDTC", "ISO8601_PARTIAL_DATE(BRTHYR, BRTHMO, BRTHDY)"),
+    ],
+    ids=["RACE_CHECKBOX", "ISO8601_PARTIAL_DATE"],
+)
+def test_handle_derivation(benchmark, dm_data: pd.DataFrame, variable: str, rule: str) -> None:
+    mapping = VariableMapping(
+        sdtm_variable=variable,
+        sdtm_label=variable,
+        sdtm_data_type="Char",
+        core=CoreDesignation.EXP,
+        mapping_pattern=MappingPattern.DERIVATION,
+        mapping_logic="benchmark",
+        derivation_rule=rule,
+        confidence=0.9,
+        confidence_level=ConfidenceLevel.HIGH,
+        confidence_rationale="benchmark",
+    )
+    result = benchmark(handle_derivation, dm_data, mapping)
+    assert len(result) == len(dm_data)
@@ -0,0 +1,127 @@
+"""Rule-level benchmarks of the FDA business rules on 1M-row domains.
+
+Each case evaluates one rule on a synthetic domain with ``ROWS`` records,
+mostly valid values with a sprinkling of invalid ones, so the timings
+reflect the per-row work of the rule rather than result building.
+
+Usage:
+    pytest benchmarks/test_fda_business_rules.py [--benchmark-json results/<commit>.json]
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+from synthetic_study import STUDY_ID
+
+from astraea.models.mapping import DomainMappingSpec
+from astraea.reference import CTReference, SDTMReference
+from astraea.validation.rules.base import ValidationRule
+from astraea.validation.rules.fda_business import (
+    FDAB001Rule,
+    FDAB002Rule,
+    FDAB003Rule,
+    FDAB004Rule,
+    FDAB009Rule,
+    FDAB015Rule,
+    FDAB016Rule,
+    FDAB020Rule,
+    FDAB021Rule,
+    FDAB030Rule,
+    FDAB039Rule,
+    FDAB055Rule,
+    FDAB057Rule,
+)
+
+ROWS = 1_000_000
+
+
+def _column(rng: np.random.Generator, valid: list[str], invalid: list[str]) -> np.ndarray:
+    """ROWS values drawn from ``valid``, with about 0.1% from ``invalid``."""
+    values = rng.choice(np.array(valid, dtype=object), size=ROWS)
+    bad = rng.random(ROWS) < 0.001
+    values[bad] = rng.choice(np.array(invalid, dtype=object), size=int(bad.sum()))
+    return values
+
+
+@pytest.fixture(scope="module")
+def domains() -> dict[str, pd.DataFrame]:
+    rng = np.random.default_rng(20240101)
+    visitnum = rng.integers(1, 20, size=ROWS).astype(str).astype(object)
+    visitnum[rng.random(ROWS) < 0.001] = "UNSCHED"
+    aestdy = rng.integers(-30, 300, size=ROWS).astype(float)
+    aestdy[rng.random(ROWS) < 0.05] = np.nan
+
+    tests = [f"T{i:02d}" for i in range(60)]
+    testcd = rng.choice(np.array(tests, dtype=object), size=ROWS)
+    test = np.array([f"Test {cd[1:]}" for cd in testcd], dtype=object)
+    test[rng.random(ROWS) < 0.0005] = "Test 00"
+    stresu = np.where(testcd == "T07", rng.choice(["mg/dL", "mmol/L"], size=ROWS), "g/L")
+    ornrlo = rng.uniform(0, 10, size=ROWS).round(1).astype(str).astype(object)
+    ornrlo[rng.random(ROWS) < 0.001] = "<LLOQ"
+
+    return {
+        "AE": pd.DataFrame(
+            {
+                "STUDYID": STUDY_ID,
+                "AESER": _column(rng, ["Y", "N"], ["y", "YES"]),
+                "AEREL": _column(rng, ["RELATED", "NOT RELATED"], ["MAYBE"]),
+                "AEOUT": _column(rng, ["RECOVERED/RESOLVED", "FATAL"], ["RESOLVED"]),
+                "AEACN": _column(rng, ["DOSE NOT CHANGED", "DRUG WITHDRAWN"], ["NONE"]),
+                "AESTDY": aestdy,
+                "VISITNUM": visitnum,
+            }
+        ),
+        "DM": pd.DataFrame(
+            {
+                "STUDYID": STUDY_ID,
+                "SEX": _column(rng, ["M", "F"], ["X"]),
+                "RACE": _column(rng, ["WHITE", "ASIAN"], ["CAUCASIAN"]),
+                "ETHNIC": _column(rng, ["HISPANIC OR LATINO", "NOT HISPANIC OR LATINO"], ["H"]),
+                "COUNTRY": _column(rng, ["USA", "DEU", "JPN"], ["US", "XXX"]),
+            }
+        ),
+        "LB": pd.DataFrame(
+            {
+                "STUDYID": STUDY_ID,
+                "LBTESTCD": testcd,
+                "LBTEST": test,
+                "LBSTRESU": stresu,
+                "LBSTRESN": rng.uniform(0, 100, size=ROWS),
+                "LBORNRLO": ornrlo,
+            }
+        ),
+    }
+
+
+@pytest.mark.parametrize(
+    ("rule", "domain"),
+    [
+        (FDAB001Rule(), "AE"),
+        (FDAB002Rule(), "AE"),
+        (FDAB003Rule(), "AE"),
+        (FDAB004Rule(), "AE"),
+        (FDAB020Rule(), "AE"),
+        (FDAB021Rule(), "AE"),
+        (FDAB015Rule(), "DM"),
+        (FDAB016Rule(), "DM"),
+        (FDAB055Rule(), "DM"),
+        (FDAB057Rule(), "DM"),
+        (FDAB009Rule(), "LB"),
+        (FDAB030Rule(), "LB"),
+        (FDAB039Rule(), "LB"),
+    ],
+    ids=lambda value: value.rule_id if isinstance(value, ValidationRule) else value,
+)
+def test_fda_business_rule(
+    benchmark,
+    domains: dict[str, pd.DataFrame],
+    sdtm_ref: SDTMReference,
+    ct_ref: CTReference,
+    rule: ValidationRule,
+    domain: str,
+) -> None:
+    spec = DomainMappingSpec.model_construct(domain=domain, study_id=STUDY_ID)
+    results = benchmark(rule.evaluate, domain, domains[domain], spec, sdtm_ref, ct_ref)
+    assert results, f"{rule.rule_id} found nothing to report"
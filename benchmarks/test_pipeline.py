@@ -0,0 +1,162 @@
+"""Pipeline benchmarks on the synthetic study: read, profile, execute, validate, submit.
+
+Reads are timed twice: ``test_readstat_decode_xport`` decodes real SAS
+transport files (the cost of a cache miss), and
+``test_read_sas_with_metadata_cache_hit`` serves the same data from the
+SAS read cache.
+
+Usage:
+    pytest benchmarks [--study-subjects N] [--benchmark-json results/<commit>.json]
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pyreadstat
+import pytest
+from synthetic_study import STUDY_ID, SyntheticStudy
+
+from astraea.execution.executor import DatasetExecutor
+from astraea.execution.findings import FindingsExecutor
+from astraea.io.sas_cache import SASReadCache
+from astraea.io.sas_reader import read_sas_with_metadata
+from astraea.io.xpt_writer import write_xpt_v5
+from astraea.models.mapping import DomainMappingSpec
+from astraea.profiling.profiler import profile_dataset
+from astraea.reference import CTReference, SDTMReference
+from astraea.submission.define_xml import generate_define_xml
+from astraea.validation.engine import ValidationEngine
+
+
+@pytest.fixture(scope="session")
+def sdtm_domains(
+    study: SyntheticStudy, sdtm_ref: SDTMReference, ct_ref: CTReference
+) -> dict[str, tuple[pd.DataFrame, DomainMappingSpec]]:
+    """Executed DM, AE and LB, as validate_all takes them."""
+    executor = DatasetExecutor(sdtm_ref=sdtm_ref, ct_ref=ct_ref)
+    domains = {}
+    for domain, spec in study.specs.items():
+        source = spec.source_datasets[0]
+        domains[domain] = (executor.execute(spec, {source: study.raw[source]}), spec)
+    return domains
+
+
+@pytest.mark.parametrize("dataset", ["dm", "lb"])
+def test_read_sas_with_metadata_cache_hit(
+    benchmark, study: SyntheticStudy, study_files: tuple[Path, SASReadCache], dataset: str
+) -> None:
+    """Cached read: the placeholder .sas7bdat is served from SASReadCache, never decoded."""
+    raw_dir, cache = study_files
+    df, meta = benchmark(read_sas_with_metadata, raw_dir / f"{dataset}.sas7bdat", cache=cache)
+    assert meta.row_count == len(study.raw[dataset]) == len(df)
+
+
+@pytest.mark.parametrize("dataset", ["dm", "lb"])
+def test_readstat_decode_xport(
+    benchmark, study: SyntheticStudy, study_xpt_dir: Path, dataset: str
+) -> None:
+    """Uncached decode of a real SAS file through ReadStat, as on a cache miss."""
+    df, _meta = benchmark(
+        pyreadstat.read_xport,
+        str(study_xpt_dir / f"{dataset}.xpt"),
+        disable_datetime_conversion=True,
+    )
+    assert len(df) == len(study.raw[dataset])
+
+
+def test_profile_dataset(benchmark, study_files: tuple[Path, SASReadCache]) -> None:
+    raw_dir, cache = study_files
+    df, meta = read_sas_with_metadata(raw_dir / "lb.sas7bdat", cache=cache)
+    profile = benchmark(profile_dataset, df, meta)
+    assert profile.row_count == len(df)
+
+
+@pytest.mark.parametrize("domain", ["DM", "AE"])
+def test_dataset_executor_execute(
+    benchmark,
+    study: SyntheticStudy,
+    sdtm_ref: SDTMReference,
+    ct_ref: CTReference,
+    domain: str,
+) -> None:
+    spec = study.specs[domain]
+    source = spec.source_datasets[0]
+    executor = DatasetExecutor(sdtm_ref=sdtm_ref, ct_ref=ct_ref)
+    result = benchmark(executor.execute, spec, {source: study.raw[source]})
+    assert len(result) == len(study.raw[source])
+
+
+@pytest.mark.parametrize("char_storage", ["object", "category"])
+def test_dataset_executor_char_storage(
+    benchmark,
+    study: SyntheticStudy,
+    sdtm_ref: SDTMReference,
+    ct_ref: CTReference,
+    char_storage: str,
+) -> None:
+    """LB execution per character storage mode; the result frame size goes in extra_info."""
+    spec = study.specs["LB"]
+    executor = DatasetExecutor(sdtm_ref=sdtm_ref, ct_ref=ct_ref, char_storage=char_storage)
+    result = benchmark(executor.execute, spec, {"lb": study.raw["lb"]})
+    benchmark.extra_info["frame_mb"] = round(result.memory_usage(deep=True).sum() / 2**20, 1)
+    assert len(result) == len(study.raw["lb"])
+
+
+def test_findings_executor_lb(
+    benchmark, study: SyntheticStudy, sdtm_ref: SDTMReference, ct_ref: CTReference
+) -> None:
+    executor = FindingsExecutor(sdtm_ref=sdtm_ref, ct_ref=ct_ref)
+    result, _supp = benchmark(
+        executor.execute_lb, study.specs["LB"], {"lb": study.raw["lb"]}, study_id=STUDY_ID
+    )
+    assert len(result) == len(study.raw["lb"])
+
+
+@pytest.mark.parametrize(("workers", "execution"), [(1, "thread"), (4, "thread"), (4, "process")])
+def test_validation_engine_validate_all(
+    benchmark,
+    sdtm_domains: dict[str, tuple[pd.DataFrame, DomainMappingSpec]],
+    sdtm_ref: SDTMReference,
+    ct_ref: CTReference,
+    workers: int,
+    execution: str,
+) -> None:
+    engine = ValidationEngine(
+        sdtm_ref=sdtm_ref, ct_ref=ct_ref, max_workers=workers, execution=execution
+    )
+    results = benchmark(engine.validate_all, sdtm_domains)
+    assert isinstance(results, list)
+
+
+def test_generate_define_xml(
+    benchmark,
+    sdtm_domains: dict[str, tuple[pd.DataFrame, DomainMappingSpec]],
+    sdtm_ref: SDTMReference,
+    ct_ref: CTReference,
+    tmp_path: Path,
+) -> None:
+    path = benchmark(
+        generate_define_xml,
+        [spec for _df, spec in sdtm_domains.values()],
+        ct_ref,
+        STUDY_ID,
+        "Synthetic benchmark study",
+        tmp_path / "define.xml",
+        generated_dfs={domain: df for domain, (df, _spec) in sdtm_domains.items()},
+        sdtm_ref=sdtm_ref,
+    )
+    assert path.stat().st_size > 0
+
+
+def test_write_xpt_v5(
+    benchmark,
+    sdtm_domains: dict[str, tuple[pd.DataFrame, DomainMappingSpec]],
+    tmp_path: Path,
+) -> None:
+    df, spec = sdtm_domains["LB"]
+    labels = {m.sdtm_variable: m.sdtm_label for m in spec.variable_mappings}
+    labels = {col: labels.get(col, col) for col in df.columns}
+    result = benchmark(write_xpt_v5, df, tmp_path / "lb.xpt", "LB", labels, spec.domain_label)
+    assert result.row_count == len(df)
@@ -20,6 +20,7 @@ Usage:
     astraea resume [session-id]
     astraea sessions
     astraea execute-domain <spec-path> <data-dir>
+    astraea execute-study <specs-dir> <data-dir>
     astraea validate <output-dir>
     astraea auto-fix <output-dir>
     astraea generate-define <output-dir>
@@ -28,6 +29,7 @@ Usage:
     astraea learn-stats [--learning-db PATH]
     astraea learn-optimize --learning-db PATH --output PATH
     astraea generate-trial-design <config-path>
+    astraea clear-sas-cache
 """
 
 from __future__ import annotations
@@ -39,8 +41,12 @@ import typer
 from rich.console import Console
 
 if TYPE_CHECKING:
+    from pandas import DataFrame
+
+    from astraea.io.sas_cache import SASReadCache
     from astraea.learning.retriever import LearningRetriever
     from astraea.models.mapping import DomainMappingSpec
+    from astraea.models.metadata import DatasetMetadata
     from astraea.review.models import ReviewDecision
 
 app = typer.Typer(
@@ -74,42 +80,100 @@ def profile(
         bool,
         typer.Option("--detail", "-d", help="Show variable-level detail for each dataset"),
     ] = False,
+    no_sas_cache: Annotated[
+        bool,
+        typer.Option("--no-sas-cache", help="Bypass the on-disk cache of decoded SAS files"),
+    ] = False,
+    chunk_size: Annotated[
+        int | None,
+        typer.Option(
+            "--chunk-size",
+            help="Stream each file in chunks of this many rows (for files larger than RAM)",
+        ),
+    ] = None,
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            "--workers",
+            "-w",
+            help="Worker processes for reading SAS files (default: CPU count, 1 = serial)",
+        ),
+    ] = None,
+    approx_distinct: Annotated[
+        bool | None,
+        typer.Option(
+            "--approx-distinct/--exact-distinct",
+            help=(
+                "Estimate unique counts of very high-cardinality columns (HyperLogLog). "
+                "Default: on with --chunk-size, off otherwise"
+            ),
+        ),
+    ] = None,
 ) -> None:
     """Profile SAS datasets in a directory.
 
     Reads all .sas7bdat files, computes statistics, detects EDC columns
     and date variables, and displays a summary table.
+
+    Files are decoded in parallel worker processes (--workers) and the
+    read time of each file is reported. With --chunk-size, each file is
+    instead streamed and profiled chunk by chunk so no dataset is ever
+    fully resident (the SAS read cache is not used). --approx-distinct
+    caps the memory spent counting distinct values of identifier-like
+    columns; estimated counts are shown with a leading "~". It is on by
+    default with --chunk-size; pass --exact-distinct to count exactly.
     """
     from astraea.cli.display import display_profile_summary, display_variable_detail
-    from astraea.io.sas_reader import read_all_sas_files
-    from astraea.profiling.profiler import profile_dataset
+    from astraea.io.sas_reader import iter_sas_chunks, read_sas_metadata
+    from astraea.models.profiling import DatasetProfile
+    from astraea.profiling.profiler import profile_dataset, profile_dataset_chunks
 
     # Validate directory
     if not data_dir.is_dir():
         console.print(f"[bold red]Error:[/bold red] Directory not found: {data_dir}")
         raise typer.Exit(code=1)
 
-    sas_files = list(data_dir.glob("*.sas7bdat"))
+    sas_files = sorted(data_dir.glob("*.sas7bdat"))
     if not sas_files:
         console.print(f"[bold red]Error:[/bold red] No .sas7bdat files found in {data_dir}")
         raise typer.Exit(code=1)
-
-    # Stage 1: Read SAS files
-    console.print(f"\n[bold blue][1/2][/bold blue] Reading {len(sas_files)} SAS files...")
-    try:
-        datasets = read_all_sas_files(data_dir)
-    except Exception as e:
-        console.print(f"[bold red]Error reading SAS files:[/bold red] {e}")
-        raise typer.Exit(code=1) from e
-
-    # Stage 2: Profile datasets
-    console.print(f"[bold blue][2/2][/bold blue] Profiling {len(datasets)} datasets...")
-    from astraea.models.profiling import DatasetProfile
+    if chunk_size is not None and chunk_size < 1:
+        console.print("[bold red]Error:[/bold red] --chunk-size must be at least 1")
+        raise typer.Exit(code=1)
+    if workers is not None and workers < 1:
+        console.print("[bold red]Error:[/bold red] --workers must be at least 1")
+        raise typer.Exit(code=1)
 
     profiles: list[DatasetProfile] = []
-    for _name, (df, meta) in sorted(datasets.items()):
-        p = profile_dataset(df, meta)
-        profiles.append(p)
+    if chunk_size is not None:
+        # Streaming: read and profile each file in a single pass
+        console.print(
+            f"\n[bold blue][1/1][/bold blue] Streaming {len(sas_files)} SAS files "
+            f"in chunks of {chunk_size} rows..."
+        )
+        try:
+            for sas_file in sas_files:
+                meta = read_sas_metadata(sas_file)
+                profiles.append(
+                    profile_dataset_chunks(
+                        iter_sas_chunks(sas_file, chunk_size),
+                        meta,
+                        approx_distinct=approx_distinct is not False,
+                    )
+                )
+        except Exception as e:
+            console.print(f"[bold red]Error reading SAS files:[/bold red] {e}")
+            raise typer.Exit(code=1) from e
+    else:
+        # Stage 1: Read SAS files
+        console.print(f"\n[bold blue][1/2][/bold blue] Reading {len(sas_files)} SAS files...")
+        datasets = _read_sas_datasets(data_dir, workers, no_sas_cache)
+
+        # Stage 2: Profile datasets
+        console.print(f"[bold blue][2/2][/bold blue] Profiling {len(datasets)} datasets...")
+        for df, meta in datasets:
+            p = profile_dataset(df, meta, approx_distinct=bool(approx_distinct))
+            profiles.append(p)
 
     # Display summary
     console.print()
@@ -285,6 +349,10 @@ def map_domain(
             ),
         ),
     ] = None,
+    no_sas_cache: Annotated[
+        bool,
+        typer.Option("--no-sas-cache", help="Bypass the on-disk cache of decoded SAS files"),
+    ] = False,
 ) -> None:
     """Map a raw SAS dataset to an SDTM domain.
 
@@ -330,8 +398,9 @@ def map_domain(
     console.print(
         f"\n[bold blue][1/5][/bold blue] Profiling primary dataset: [cyan]{primary_sas.name}[/cyan]"
     )
+    sas_cache = _open_sas_cache(no_sas_cache)
     try:
-        df, meta = read_sas_with_metadata(primary_sas)
+        df, meta = read_sas_with_metadata(primary_sas, cache=sas_cache)
         primary_profile = profile_dataset(df, meta)
     except Exception as e:
         console.print(f"[bold red]Error profiling {primary_sas.name}:[/bold red] {e}")
@@ -349,7 +418,7 @@ def map_domain(
             cd_path = data_folder / f"{cd_name.lower()}.sas7bdat"
             if cd_path.exists():
                 try:
-                    cd_df, cd_meta = read_sas_with_metadata(cd_path)
+                    cd_df, cd_meta = read_sas_with_metadata(cd_path, cache=sas_cache)
                     cross_domain_profiles[cd_name] = profile_dataset(cd_df, cd_meta)
                 except Exception as e:
                     console.print(f"[yellow]Warning: Could not profile {cd_name}: {e}[/yellow]")
@@ -450,6 +519,39 @@ def execute_domain(
             help="Path to DM dataset (for RFSTDTC cross-domain context)",
         ),
     ] = None,
+    no_sas_cache: Annotated[
+        bool,
+        typer.Option("--no-sas-cache", help="Bypass the on-disk cache of decoded SAS files"),
+    ] = False,
+    all_columns: Annotated[
+        bool,
+        typer.Option(
+            "--all-columns",
+            help="Load every source column instead of only those the spec references",
+        ),
+    ] = False,
+    verify_readback: Annotated[
+        bool,
+        typer.Option(
+            "--verify-readback",
+            help="Read each written XPT back in full to verify it (slow, paranoid)",
+        ),
+    ] = False,
+    subject_batch_size: Annotated[
+        int | None,
+        typer.Option(
+            "--subject-batch-size",
+            min=1,
+            help="LB/EG/VS only: execute this many subjects at a time, appending to the XPT",
+        ),
+    ] = None,
+    char_storage: Annotated[
+        str,
+        typer.Option(
+            "--char-storage",
+            help="Storage for character result columns: object, category or arrow",
+        ),
+    ] = "object",
 ) -> None:
     """Execute a mapping spec against raw data to produce an SDTM XPT file.
 
@@ -459,11 +561,24 @@ def execute_domain(
 
     Optionally provide --dm-path to enable cross-domain features like
     study day (--DY) derivation using RFSTDTC from the DM domain.
+
+    Only the source columns the spec references are decoded (Findings
+    domains excepted); pass --all-columns to load every column.
+
+    For large Findings domains, --subject-batch-size executes batches of
+    whole subjects one at a time and streams them into the XPT, keeping
+    memory flat as the study grows. --char-storage category (or arrow)
+    keeps repeated strings compact in memory until they are written.
     """
-    from astraea.execution.executor import CrossDomainContext, DatasetExecutor
+    from astraea.execution.executor import (
+        CrossDomainContext,
+        DatasetExecutor,
+        required_source_columns,
+    )
     from astraea.io.sas_reader import read_sas_with_metadata
     from astraea.models.mapping import DomainMappingSpec
     from astraea.reference import load_ct_reference, load_sdtm_reference
+    from astraea.transforms.char_storage import require_char_storage
 
     # Validate spec file
     if not spec_path.exists():
@@ -475,6 +590,12 @@ def execute_domain(
         console.print(f"[bold red]Error:[/bold red] Directory not found: {data_dir}")
         raise typer.Exit(code=1)
 
+    try:
+        storage = require_char_storage(char_storage)
+    except (ValueError, ImportError) as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        raise typer.Exit(code=1) from e
+
     # Step 1: Load spec
     console.print("[bold blue][1/4][/bold blue] Loading mapping specification...")
     try:
@@ -489,10 +610,22 @@ def execute_domain(
         f"{len(spec.variable_mappings)} variables"
     )
 
+    _FINDINGS_DOMAINS = {"LB", "VS", "EG"}
+    if subject_batch_size is not None and domain not in _FINDINGS_DOMAINS:
+        console.print(
+            f"[bold red]Error:[/bold red] --subject-batch-size supports LB, EG and VS, not {domain}"
+        )
+        raise typer.Exit(code=1)
+
     # Step 2: Load raw data
     console.print("[bold blue][2/4][/bold blue] Loading raw datasets...")
     import pandas as pd
 
+    usecols: set[str] | None = None
+    if not all_columns and domain not in _FINDINGS_DOMAINS:
+        usecols = required_source_columns(spec)
+
+    sas_cache = _open_sas_cache(no_sas_cache)
     raw_dfs: dict[str, pd.DataFrame] = {}
     for source_name in spec.source_datasets:
         # Try exact name, then without extension
@@ -502,9 +635,14 @@ def execute_domain(
             source_path = data_dir / f"{stem}.sas7bdat"
         if source_path.exists():
             try:
-                df, _meta = read_sas_with_metadata(source_path)
+                df, meta = read_sas_with_metadata(
+                    source_path, cache=sas_cache, usecols=usecols
+                )
                 raw_dfs[source_name] = df
-                console.print(f"  Loaded {source_path.name}: {len(df)} rows")
+                console.print(
+                    f"  Loaded {source_path.name}: {len(df)} rows, "
+                    f"{len(df.columns)} of {meta.col_count} columns"
+                )
             except Exception as e:
                 console.print(f"[yellow]Warning: Could not read {source_name}: {e}[/yellow]")
         else:
@@ -522,7 +660,9 @@ def execute_domain(
         else:
             console.print("[bold blue][3/4][/bold blue] Loading DM for cross-domain context...")
             try:
-                dm_df, _dm_meta = read_sas_with_metadata(dm_path)
+                dm_df, _dm_meta = read_sas_with_metadata(
+                    dm_path, cache=sas_cache, usecols={"USUBJID", "RFSTDTC"}
+                )
                 rfstdtc_lookup: dict[str, str] = {}
                 if "USUBJID" in dm_df.columns and "RFSTDTC" in dm_df.columns:
                     for _, row in dm_df.iterrows():
@@ -537,7 +677,6 @@ def execute_domain(
 
     # Step 4: Execute
     console.print("[bold blue][4/4][/bold blue] Executing mapping...")
-    _FINDINGS_DOMAINS = {"LB", "VS", "EG"}
 
     try:
         sdtm_ref = load_sdtm_reference()
@@ -550,8 +689,32 @@ def execute_domain(
             from astraea.execution.findings import FindingsExecutor
             from astraea.io.xpt_writer import write_xpt_v5
 
-            findings_executor = FindingsExecutor(sdtm_ref=sdtm_ref, ct_ref=ct_ref)
+            findings_executor = FindingsExecutor(
+                sdtm_ref=sdtm_ref, ct_ref=ct_ref, char_storage=storage
+            )
 
+        if domain in _FINDINGS_DOMAINS and subject_batch_size is not None:
+            partitioned = findings_executor.execute_partitioned_to_xpt(
+                spec,
+                raw_dfs,
+                xpt_path,
+                cross_domain=cross_domain,
+                study_id=spec.study_id,
+                subjects_per_batch=subject_batch_size,
+                lc_output_path=output_dir_path / "lc.xpt" if domain == "LB" else None,
+                verify_readback=verify_readback,
+            )
+            console.print(
+                f"  Main domain: {partitioned.row_count} rows "
+                f"({partitioned.subject_count} subjects in {partitioned.batch_count} batches) "
+                f"-> {xpt_path}"
+            )
+            if partitioned.lc_xpt is not None:
+                console.print(
+                    f"  [green]LC domain:[/green] {partitioned.lc_xpt.row_count} rows "
+                    f"-> {partitioned.lc_xpt.path}"
+                )
+        elif domain in _FINDINGS_DOMAINS:
             # Dispatch to domain-specific method
             execute_method = {
                 "LB": findings_executor.execute_lb,
@@ -579,36 +742,28 @@ def execute_domain(
                 table_name=domain,
                 column_labels=column_labels,
                 table_label=spec.domain_label,
+                verify_readback=verify_readback,
             )
             console.print(f"  Main domain: {len(main_df)} rows -> {xpt_path}")
 
             # Write SUPPQUAL if generated
             if supp_df is not None and not supp_df.empty:
                 supp_xpt_path = output_dir_path / f"supp{domain.lower()}.xpt"
-                supp_labels = {
-                    "STUDYID": "Study Identifier",
-                    "RDOMAIN": "Related Domain Abbreviation",
-                    "USUBJID": "Unique Subject Identifier",
-                    "IDVAR": "Identifying Variable",
-                    "IDVARVAL": "Identifying Variable Value",
-                    "QNAM": "Qualifier Variable Name",
-                    "QLABEL": "Qualifier Variable Label",
-                    "QVAL": "Data Value",
-                    "QORIG": "Origin",
-                    "QEVAL": "Evaluator",
-                }
+                from astraea.execution.suppqual import SUPPQUAL_COLUMN_LABELS
+
                 write_xpt_v5(
                     supp_df,
                     supp_xpt_path,
                     table_name=f"SUPP{domain}",
-                    column_labels=supp_labels,
+                    column_labels=SUPPQUAL_COLUMN_LABELS,
                     table_label=f"Supplemental Qualifiers for {domain}",
+                    verify_readback=verify_readback,
                 )
                 console.print(f"  SUPPQUAL: {len(supp_df)} rows -> {supp_xpt_path}")
 
             # Auto-generate LC domain when executing LB
             if domain == "LB":
-                from astraea.execution.lc_domain import generate_lc_from_lb
+                from astraea.execution.lc_domain import LC_XPT_TABLE_LABEL, generate_lc_from_lb
 
                 console.print(
                     "\n[bold blue]Auto-generating LC domain from LB...[/bold blue]"
@@ -631,18 +786,20 @@ def execute_domain(
                     lc_xpt_path,
                     table_name="LC",
                     column_labels=lc_column_labels,
-                    table_label="Laboratory Test Results - Conventional Units",
+                    table_label=LC_XPT_TABLE_LABEL,
+                    verify_readback=verify_readback,
                 )
                 console.print(
                     f"  [green]LC domain:[/green] {len(lc_df)} rows -> {lc_xpt_path}"
                 )
         else:
-            executor = DatasetExecutor(sdtm_ref=sdtm_ref, ct_ref=ct_ref)
+            executor = DatasetExecutor(sdtm_ref=sdtm_ref, ct_ref=ct_ref, char_storage=storage)
             executor.execute_to_xpt(
                 spec,
                 raw_dfs,
                 xpt_path,
                 cross_domain=cross_domain,
+                verify_readback=verify_readback,
             )
     except Exception as e:
         console.print(f"[bold red]Error during execution:[/bold red] {e}")
@@ -657,6 +814,135 @@ def execute_domain(
         console.print("  Executor: FindingsExecutor (multi-source merge + SUPPQUAL)")
 
 
+@app.command(name="execute-study")
+def execute_study(
+    specs_dir: Annotated[
+        Path,
+        typer.Argument(help="Directory with *_spec.json / *_mapping.json / *_reviewed.json"),
+    ],
+    data_dir: Annotated[
+        Path,
+        typer.Argument(help="Path to raw data directory"),
+    ],
+    output_dir: Annotated[
+        Path,
+        typer.Option("--output-dir", help="Output directory for XPT files"),
+    ] = Path("output"),
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            "--workers",
+            "-w",
+            help="Worker processes per dependency wave (default: CPU count, 1 = serial)",
+        ),
+    ] = None,
+    no_sas_cache: Annotated[
+        bool,
+        typer.Option("--no-sas-cache", help="Bypass the on-disk cache of decoded SAS files"),
+    ] = False,
+    all_columns: Annotated[
+        bool,
+        typer.Option(
+            "--all-columns",
+            help="Load every source column instead of only those the specs reference",
+        ),
+    ] = False,
+    verify_readback: Annotated[
+        bool,
+        typer.Option(
+            "--verify-readback",
+            help="Read each written XPT back in full to verify it (slow, paranoid)",
+        ),
+    ] = False,
+) -> None:
+    """Execute every mapping spec of a study in one run.
+
+    Reads each raw source dataset and the SDTM-IG/CT references once,
+    executes DM/SE/TV first, builds the cross-domain context (RFSTDTC,
+    SE epochs, TV visits) from their results, then executes all remaining
+    domains in parallel worker processes. Writes one XPT per domain plus
+    SUPPQUAL where generated.
+
+    Exit code 1 if any domain failed.
+    """
+    from astraea.execution.study import StudyExecutor, load_study_sources
+    from astraea.models.mapping import DomainMappingSpec
+    from astraea.reference import load_ct_reference, load_sdtm_reference
+
+    if not specs_dir.is_dir():
+        console.print(f"[bold red]Error:[/bold red] Directory not found: {specs_dir}")
+        raise typer.Exit(code=1)
+    if not data_dir.is_dir():
+        console.print(f"[bold red]Error:[/bold red] Directory not found: {data_dir}")
+        raise typer.Exit(code=1)
+    if workers is not None and workers < 1:
+        console.print("[bold red]Error:[/bold red] --workers must be at least 1")
+        raise typer.Exit(code=1)
+
+    # Step 1: Load specs (last file wins per domain, matching validate)
+    console.print("[bold blue][1/3][/bold blue] Loading mapping specifications...")
+    spec_files = (
+        sorted(specs_dir.glob("*_spec.json"))
+        + sorted(specs_dir.glob("*_mapping.json"))
+        + sorted(specs_dir.glob("*_reviewed.json"))
+    )
+    specs_by_domain: dict[str, DomainMappingSpec] = {}
+    for spec_path in spec_files:
+        try:
+            spec = DomainMappingSpec.model_validate_json(spec_path.read_text())
+            specs_by_domain[spec.domain.upper()] = spec
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not load spec {spec_path.name}: {e}[/yellow]")
+
+    if not specs_by_domain:
+        console.print(f"[bold red]Error:[/bold red] No mapping specs found in {specs_dir}")
+        raise typer.Exit(code=1)
+    specs = list(specs_by_domain.values())
+    console.print(f"  {len(specs)} domain(s): {', '.join(sorted(specs_by_domain))}")
+
+    # Step 2: Load each raw source dataset once
+    console.print("[bold blue][2/3][/bold blue] Loading raw datasets...")
+    raw_data = load_study_sources(
+        specs,
+        data_dir,
+        cache=_open_sas_cache(no_sas_cache),
+        project_columns=not all_columns,
+    )
+    console.print(f"  Loaded {len(raw_data)} source dataset(s)")
+
+    # Step 3: Execute in dependency waves
+    console.print("[bold blue][3/3][/bold blue] Executing domains...")
+    study_executor = StudyExecutor(
+        sdtm_ref=load_sdtm_reference(),
+        ct_ref=load_ct_reference(),
+        max_workers=workers,
+        verify_readback=verify_readback,
+    )
+    results = study_executor.execute_study(specs, raw_data, output_dir)
+
+    failed = 0
+    for result in results:
+        if result.succeeded:
+            console.print(
+                f"  [green]{result.domain}[/green] (wave {result.wave}): "
+                f"{result.row_count} rows -> {result.output_path}"
+            )
+            if result.supp_output_path is not None:
+                console.print(f"    SUPPQUAL -> {result.supp_output_path}")
+            if result.lc_output_path is not None:
+                console.print(f"    LC -> {result.lc_output_path}")
+        else:
+            failed += 1
+            console.print(f"  [bold red]{result.domain}[/bold red]: {result.error}")
+
+    console.print(
+        f"\n[bold green]Study execution complete:[/bold green] "
+        f"{len(results) - failed}/{len(results)} domain(s) written to {output_dir}"
+    )
+    if failed:
+        raise typer.Exit(code=1)
+
+
 @app.command(name="validate")
 def validate_cmd(
     output_dir: Annotated[
@@ -682,12 +968,29 @@ def validate_cmd(
         bool,
         typer.Option("--auto-fix", help="Auto-fix deterministic issues after validation"),
     ] = False,
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            "--workers",
+            "-w",
+            help="Workers evaluating validation rules (default: CPU count, 1 = serial)",
+        ),
+    ] = None,
+    processes: Annotated[
+        bool,
+        typer.Option(
+            "--processes",
+            help="Evaluate rules in worker processes instead of threads",
+        ),
+    ] = False,
 ) -> None:
     """Run SDTM validation on generated datasets.
 
     Loads .xpt files and mapping specs from the output directory, runs the
     full validation pipeline (per-domain rules, cross-domain consistency,
     FDA TRC pre-checks, package size/naming checks), and displays results.
+    Rules are evaluated in parallel worker threads (--workers), or worker
+    processes with --processes.
 
     Use --auto-fix to automatically fix deterministic issues (CT case
     normalization, missing DOMAIN/STUDYID columns, name/label truncation,
@@ -704,7 +1007,7 @@ def validate_cmd(
         check_submission_size,
         validate_file_naming,
     )
-    from astraea.validation.engine import ValidationEngine
+    from astraea.validation.engine import RuleExecution, ValidationEngine
     from astraea.validation.report import ValidationReport
     from astraea.validation.rules.fda_trc import TRCPreCheck
 
@@ -712,6 +1015,9 @@ def validate_cmd(
     if not output_dir.is_dir():
         console.print(f"[bold red]Error:[/bold red] Directory not found: {output_dir}")
         raise typer.Exit(code=1)
+    if workers is not None and workers < 1:
+        console.print("[bold red]Error:[/bold red] --workers must be at least 1")
+        raise typer.Exit(code=1)
 
     # Step 1: Load .xpt files
     console.print("[bold blue][1/4][/bold blue] Loading datasets...")
@@ -753,7 +1059,12 @@ def validate_cmd(
     console.print("[bold blue][3/4][/bold blue] Running validation...")
     sdtm_ref = load_sdtm_reference()
     ct_ref = load_ct_reference()
-    engine = ValidationEngine(sdtm_ref=sdtm_ref, ct_ref=ct_ref)
+    engine = ValidationEngine(
+        sdtm_ref=sdtm_ref,
+        ct_ref=ct_ref,
+        max_workers=workers,
+        execution=RuleExecution.PROCESS if processes else RuleExecution.THREAD,
+    )
 
     # Build domain tuples for domains that have both data and specs
     domains_to_validate: dict[str, tuple[pd.DataFrame, DomainMappingSpec]] = {}
@@ -1057,6 +1368,21 @@ def auto_fix_cmd(
         str,
         typer.Option("--format", help="Report format: markdown or json"),
     ] = "markdown",
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            "--workers",
+            "-w",
+            help="Workers evaluating validation rules (default: CPU count, 1 = serial)",
+        ),
+    ] = None,
+    processes: Annotated[
+        bool,
+        typer.Option(
+            "--processes",
+            help="Evaluate rules in worker processes instead of threads",
+        ),
+    ] = False,
 ) -> None:
     """Auto-fix deterministic validation issues in generated SDTM datasets.
 
@@ -1067,6 +1393,9 @@ def auto_fix_cmd(
 
     Fixed datasets are written back to the output directory. An audit trail
     of all fixes is saved to autofix_audit.json.
+
+    Each validation pass evaluates rules in parallel worker threads
+    (--workers), or worker processes with --processes.
     """
     import pandas as pd
     import pyreadstat
@@ -1079,13 +1408,16 @@ def auto_fix_cmd(
     from astraea.models.mapping import DomainMappingSpec
     from astraea.reference import load_ct_reference, load_sdtm_reference
     from astraea.validation.autofix import AutoFixer
-    from astraea.validation.engine import ValidationEngine
+    from astraea.validation.engine import RuleExecution, ValidationEngine
     from astraea.validation.fix_loop import FixLoopEngine
 
     # Validate directory
     if not output_dir.is_dir():
         console.print(f"[bold red]Error:[/bold red] Directory not found: {output_dir}")
         raise typer.Exit(code=1)
+    if workers is not None and workers < 1:
+        console.print("[bold red]Error:[/bold red] --workers must be at least 1")
+        raise typer.Exit(code=1)
 
     # Step 1: Load .xpt files
     console.print("[bold blue][1/4][/bold blue] Loading datasets...")
@@ -1137,7 +1469,12 @@ def auto_fix_cmd(
     )
     sdtm_ref = load_sdtm_reference()
     ct_ref = load_ct_reference()
-    engine = ValidationEngine(sdtm_ref=sdtm_ref, ct_ref=ct_ref)
+    engine = ValidationEngine(
+        sdtm_ref=sdtm_ref,
+        ct_ref=ct_ref,
+        max_workers=workers,
+        execution=RuleExecution.PROCESS if processes else RuleExecution.THREAD,
+    )
     auto_fixer = AutoFixer(ct_ref=ct_ref, sdtm_ref=sdtm_ref)
     fix_engine = FixLoopEngine(engine=engine, auto_fixer=auto_fixer, max_iterations=max_iterations)
 
@@ -1373,6 +1710,10 @@ def generate_trial_design(
         Path | None,
         typer.Option("--dm-path", help="Path to DM XPT for TS date derivation"),
     ] = None,
+    no_sas_cache: Annotated[
+        bool,
+        typer.Option("--no-sas-cache", help="Bypass the on-disk cache of decoded SAS files"),
+    ] = False,
 ) -> None:
     """Generate trial design domains (TS, TA, TE, TV, TI, SV) from a JSON config.
 
@@ -1442,7 +1783,7 @@ def generate_trial_design(
         elif dm_path.suffix.lower() == ".sas7bdat":
             from astraea.io.sas_reader import read_sas_with_metadata
 
-            dm_df, _ = read_sas_with_metadata(dm_path)
+            dm_df, _ = read_sas_with_metadata(dm_path, cache=_open_sas_cache(no_sas_cache))
         else:
             console.print(
                 f"[bold red]Error:[/bold red] Unsupported DM file format: {dm_path.suffix}"
@@ -1487,10 +1828,11 @@ def generate_trial_design(
         from astraea.io.sas_reader import read_sas_with_metadata
 
         sas_files = sorted(data_dir.glob("*.sas7bdat"))
+        sas_cache = _open_sas_cache(no_sas_cache)
         raw_dfs: dict[str, pd.DataFrame] = {}
         for sas_file in sas_files:
             try:
-                df, _ = read_sas_with_metadata(sas_file)
+                df, _ = read_sas_with_metadata(sas_file, cache=sas_cache)
                 raw_dfs[sas_file.stem] = df
             except Exception as e:
                 console.print(f"  [yellow]Warning: Could not read {sas_file.name}: {e}[/yellow]")
@@ -1602,6 +1944,60 @@ def generate_trial_design(
     console.print(summary_table)
 
 
+@app.command(name="clear-sas-cache")
+def clear_sas_cache_cmd(
+    cache_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--cache-dir", help="SAS read cache directory (default: per-user cache directory)"
+        ),
+    ] = None,
+) -> None:
+    """Delete all decoded SAS files from the on-disk read cache."""
+    from astraea.io.sas_cache import SASReadCache
+
+    cache = SASReadCache(cache_dir)
+    removed = cache.clear()
+    console.print(f"[green]Removed {removed} cached SAS read(s) from {cache.cache_dir}[/green]")
+
+
+def _read_sas_datasets(
+    data_dir: Path, workers: int | None, no_sas_cache: bool
+) -> list[tuple[DataFrame, DatasetMetadata]]:
+    """Read a SAS directory in parallel, print per-file timings, drop failures.
+
+    Exits with code 1 if the directory cannot be read or no file succeeds.
+    """
+    from astraea.cli.display import display_read_timings
+    from astraea.io.sas_reader import read_sas_directory
+
+    try:
+        reads = read_sas_directory(
+            data_dir, max_workers=workers, cache=_open_sas_cache(no_sas_cache)
+        )
+    except Exception as e:
+        console.print(f"[bold red]Error reading SAS files:[/bold red] {e}")
+        raise typer.Exit(code=1) from e
+
+    display_read_timings(reads, console)
+    datasets = [
+        (r.data, r.metadata) for r in reads if r.data is not None and r.metadata is not None
+    ]
+    if not datasets:
+        console.print("[bold red]Error:[/bold red] No SAS files could be read")
+        raise typer.Exit(code=1)
+    return datasets
+
+
+def _open_sas_cache(no_sas_cache: bool) -> SASReadCache | None:
+    """Return the default on-disk SAS read cache, or None when bypassed."""
+    if no_sas_cache:
+        return None
+    from astraea.io.sas_cache import SASReadCache
+
+    return SASReadCache()
+
+
 def _find_primary_sas(
     data_folder: Path, domain: str, source_file_override: str | None
 ) -> Path | None:
@@ -1929,6 +2325,18 @@ def classify(
         Path | None,
         typer.Option("--cache-dir", help="Directory for caching results"),
     ] = None,
+    no_sas_cache: Annotated[
+        bool,
+        typer.Option("--no-sas-cache", help="Bypass the on-disk cache of decoded SAS files"),
+    ] = False,
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            "--workers",
+            "-w",
+            help="Worker processes for reading SAS files (default: CPU count, 1 = serial)",
+        ),
+    ] = None,
 ) -> None:
     """Classify raw SAS datasets to SDTM domains.
 
@@ -1946,7 +2354,6 @@ def classify(
         save_classification,
     )
     from astraea.cli.display import display_classification
-    from astraea.io.sas_reader import read_all_sas_files
     from astraea.models.profiling import DatasetProfile
     from astraea.parsing.ecrf_parser import load_extraction, parse_ecrf
     from astraea.parsing.form_dataset_matcher import match_all_forms
@@ -1984,14 +2391,13 @@ def classify(
 
     # Step 1: Profile datasets
     console.print(f"\n[bold blue][1/3][/bold blue] Profiling {len(sas_files)} datasets...")
-    try:
-        datasets = read_all_sas_files(data_dir)
-    except Exception as e:
-        console.print(f"[bold red]Error reading SAS files:[/bold red] {e}")
-        raise typer.Exit(code=1) from e
+    if workers is not None and workers < 1:
+        console.print("[bold red]Error:[/bold red] --workers must be at least 1")
+        raise typer.Exit(code=1)
+    datasets = _read_sas_datasets(data_dir, workers, no_sas_cache)
 
     profiles: list[DatasetProfile] = []
-    for _name, (df, meta) in sorted(datasets.items()):
+    for df, meta in datasets:
         p = profile_dataset(df, meta)
         profiles.append(p)
 
@@ -14,6 +14,7 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
+from astraea.io.sas_reader import SASFileRead
 from astraea.models.classification import ClassificationResult
 from astraea.models.controlled_terms import Codelist
 from astraea.models.ecrf import ECRFExtractionResult, ECRFForm
@@ -79,6 +80,44 @@ def display_profile_summary(profiles: list[DatasetProfile], console: Console) ->
     console.print(f"\n[bold]{len(profiles)}[/bold] datasets profiled")
 
 
+def display_read_timings(reads: list[SASFileRead], console: Console) -> None:
+    """Print per-file read timings, slowest first, with any read errors.
+
+    Args:
+        reads: Results from read_sas_directory.
+        console: Rich Console for output.
+    """
+    table = Table(title="SAS Read Times", show_lines=False)
+    table.add_column("Dataset", style="bold cyan", no_wrap=True)
+    table.add_column("Rows", justify="right", style="green")
+    table.add_column("Columns", justify="right")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Status")
+
+    for r in sorted(reads, key=lambda x: x.seconds, reverse=True):
+        if r.succeeded and r.metadata is not None:
+            rows, cols, status = str(r.metadata.row_count), str(r.metadata.col_count), "OK"
+            status_style = "green"
+        else:
+            rows, cols, status = "-", "-", r.error or "Failed"
+            status_style = "bold red"
+        table.add_row(
+            r.filename.replace(".sas7bdat", ""),
+            rows,
+            cols,
+            f"{r.seconds:.2f}",
+            Text(status, style=status_style),
+        )
+
+    console.print(table)
+    total = sum(r.seconds for r in reads)
+    n_failed = sum(1 for r in reads if not r.succeeded)
+    console.print(
+        f"[bold]{len(reads) - n_failed}[/bold] of {len(reads)} files read "
+        f"({total:.2f}s total read time)"
+    )
+
+
 def display_variable_detail(profile: DatasetProfile, console: Console) -> None:
     """Print variable-level detail for a single dataset.
 
@@ -123,7 +162,7 @@ def display_variable_detail(profile: DatasetProfile, console: Console) -> None:
             v.dtype,
             v.sas_format or "",
             f"{v.missing_pct:.1f}%",
-            str(v.n_unique),
+            f"~{v.n_unique}" if v.n_unique_approximate else str(v.n_unique),
             top_display,
             style=row_style,
         )
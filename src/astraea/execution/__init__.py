@@ -2,15 +2,18 @@
 
 Re-exports key classes for convenient imports:
     from astraea.execution import DatasetExecutor, CrossDomainContext, ExecutionError
+    from astraea.execution import StudyExecutor
 """
 
 from astraea.execution.executor import CrossDomainContext, DatasetExecutor, ExecutionError
 from astraea.execution.preprocessing import align_multi_source_columns, filter_rows
+from astraea.execution.study import StudyExecutor
 
 __all__ = [
     "CrossDomainContext",
     "DatasetExecutor",
     "ExecutionError",
+    "StudyExecutor",
     "align_multi_source_columns",
     "filter_rows",
 ]
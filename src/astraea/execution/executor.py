@@ -4,7 +4,17 @@ Provides DatasetExecutor, the core class that takes a DomainMappingSpec and
 raw DataFrames and produces a fully-formed SDTM DataFrame with correct
 variable order, derived fields (--DY, --SEQ, EPOCH, VISIT), ASCII cleanup,
 character length optimization, sort order enforcement, and only mapped
-columns retained.
+columns retained. ``required_source_columns`` lists the raw columns a spec
+reads, so callers can load only those from wide source datasets.
+
+Each spec is compiled once into an ExecutionPlan (see ``plan.py``) and
+cached per executor by content hash, so repeated executions of a spec --
+e.g. the subject batches of a partitioned Findings domain -- reuse parsed
+rules, recode tables and handler lookups.
+
+With ``char_storage=CharStorage.CATEGORY`` (or ``ARROW``) the character
+columns of the result are stored compactly as soon as each is produced;
+see ``astraea.transforms.char_storage``. The default stores object columns.
 """
 
 from __future__ import annotations
@@ -16,15 +26,30 @@ import pandas as pd
 from loguru import logger
 from pydantic import BaseModel, ConfigDict, Field
 
-from astraea.execution.pattern_handlers import PATTERN_HANDLERS
-from astraea.models.mapping import DomainMappingSpec, MappingPattern, VariableMapping
+from astraea.execution.pattern_handlers import (
+    _EDC_ALIASES,
+    ColumnLookup,
+    parse_derivation_rule,
+)
+from astraea.execution.plan import CompiledMapping, ExecutionPlan, PlanCache
+from astraea.models.mapping import DomainMappingSpec, MappingPattern
 from astraea.reference.controlled_terms import CTReference
 from astraea.reference.sdtm_ig import SDTMReference
 from astraea.transforms.ascii_validation import fix_common_non_ascii, validate_ascii
 from astraea.transforms.char_length import optimize_char_lengths
+from astraea.transforms.char_scan import CharColumnScan, scan_char_columns
+from astraea.transforms.char_storage import (
+    CharStorage,
+    compact_char_column,
+    compact_char_columns,
+    require_char_storage,
+)
 from astraea.transforms.epoch import assign_epoch
 from astraea.transforms.sequence import generate_seq
-from astraea.transforms.study_day import calculate_study_day_column
+from astraea.transforms.study_day import (
+    build_reference_dates,
+    calculate_study_day_from_reference,
+)
 from astraea.transforms.visit import assign_visit
 
 
@@ -62,15 +87,57 @@ class CrossDomainContext(BaseModel):
 # Critical SDTM variables -- if these fail, execution should abort
 _CRITICAL_VARIABLES = frozenset({"STUDYID", "DOMAIN", "USUBJID"})
 
-# Pattern execution priority order
-_PATTERN_ORDER: list[set[MappingPattern]] = [
-    {MappingPattern.ASSIGN},
-    {MappingPattern.DIRECT, MappingPattern.RENAME},
-    {MappingPattern.REFORMAT},
-    {MappingPattern.LOOKUP_RECODE},
-    {MappingPattern.DERIVATION, MappingPattern.COMBINE},
-    {MappingPattern.SPLIT, MappingPattern.TRANSPOSE},
-]
+# Raw EDC column holding the visit identifier used for VISITNUM/VISIT
+_RAW_VISIT_COL = "InstanceName"
+
+
+def _strip_dataset_prefix(name: str) -> str:
+    """Strip a dataset prefix (``dm.AGE`` -> ``AGE``), leaving numeric literals alone."""
+    if "." in name and not name.replace(".", "").replace("-", "").isdigit():
+        return name.split(".")[-1]
+    return name
+
+
+def required_source_columns(
+    spec: DomainMappingSpec,
+    *,
+    site_col: str = "SiteNumber",
+    subject_col: str = "Subject",
+) -> set[str] | None:
+    """Raw source columns that executing ``spec`` can read.
+
+    Collects every column the pattern handlers and derived-variable steps
+    may touch: each mapping's ``source_variable``, every derivation rule
+    argument, the site/subject columns and EDC alias targets used to build
+    USUBJID, USUBJID itself, and InstanceName for VISITNUM/VISIT. Rule
+    arguments that are literals rather than columns are harmless extras --
+    readers match the names against the file header case-insensitively
+    and ignore names that are not present.
+
+    Args:
+        spec: Domain mapping specification to be executed.
+        site_col: Raw column name for site ID passed to ``execute``.
+        subject_col: Raw column name for subject ID passed to ``execute``.
+
+    Returns:
+        Set of column names, or None if the spec must see every column
+        (TRANSPOSE mappings unpivot columns the spec does not name).
+    """
+    if any(m.mapping_pattern == MappingPattern.TRANSPOSE for m in spec.variable_mappings):
+        return None
+
+    columns: set[str] = {site_col, subject_col, "USUBJID", _RAW_VISIT_COL}
+    columns.update(_EDC_ALIASES)
+    columns.update(_EDC_ALIASES.values())
+
+    for mapping in spec.variable_mappings:
+        if mapping.source_variable:
+            columns.add(_strip_dataset_prefix(mapping.source_variable))
+        if mapping.derivation_rule:
+            _keyword, args = parse_derivation_rule(mapping.derivation_rule)
+            columns.update(args)
+
+    return columns
 
 
 class DatasetExecutor:
@@ -79,6 +146,16 @@ class DatasetExecutor:
     Applies variable mappings via pattern handlers in priority order, then
     derives cross-domain fields (--DY, --SEQ, EPOCH, VISIT), enforces
     column order, and drops unmapped columns.
+
+    Args:
+        sdtm_ref: SDTM-IG reference for key variables.
+        ct_ref: Controlled terminology for LOOKUP_RECODE.
+        char_storage: Storage for character result columns. CATEGORY keeps
+            repeated strings as categoricals, ARROW as ``string[pyarrow]``;
+            both are written to XPT as plain text.
+
+    Raises:
+        ImportError: If char_storage is ARROW and pyarrow is not installed.
     """
 
     def __init__(
@@ -86,10 +163,18 @@ class DatasetExecutor:
         *,
         sdtm_ref: SDTMReference | None = None,
         ct_ref: CTReference | None = None,
+        char_storage: CharStorage | str = CharStorage.OBJECT,
     ) -> None:
         self.sdtm_ref = sdtm_ref
         self.ct_ref = ct_ref
+        self.char_storage = require_char_storage(char_storage)
+        self.plan_cache = PlanCache(sdtm_ref=sdtm_ref, ct_ref=ct_ref)
         self._last_char_widths: dict[str, int] = {}
+        self._last_char_scan: dict[str, CharColumnScan] = {}
+
+    def compile(self, spec: DomainMappingSpec) -> ExecutionPlan:
+        """Return the compiled ExecutionPlan for ``spec`` (cached by spec hash)."""
+        return self.plan_cache.get(spec)
 
     def execute(
         self,
@@ -118,6 +203,8 @@ class DatasetExecutor:
             ExecutionError: If a critical variable (STUDYID, DOMAIN, USUBJID)
                 fails to map.
         """
+        plan = self.compile(spec)
+
         # Step a: Merge raw DataFrames
         merged_df = self._merge_raw(raw_dfs)
 
@@ -144,46 +231,52 @@ class DatasetExecutor:
             "site_col": site_col,
             "subject_col": subject_col,
             "column_aliases": column_aliases,
+            "column_lookup": ColumnLookup(merged_df),
             "cross_domain_dfs": cross_domain_dfs,
         }
 
-        for pattern_group in _PATTERN_ORDER:
-            group_mappings = [
-                m for m in spec.variable_mappings if m.mapping_pattern in pattern_group
-            ]
-            for mapping in group_mappings:
-                self._apply_mapping(mapping, merged_df, result_df, mapped_vars, handler_kwargs)
+        for compiled in plan.mappings:
+            self._apply_mapping(compiled, merged_df, result_df, mapped_vars, handler_kwargs)
 
         # Step c: Derive --DY variables
         if cross_domain and cross_domain.rfstdtc_lookup:
-            self._derive_dy(result_df, spec, cross_domain)
+            self._derive_dy(result_df, plan, cross_domain)
 
         # Step d: Assign EPOCH
         if cross_domain and cross_domain.se_data is not None:
-            self._assign_epoch(result_df, spec, cross_domain)
+            self._assign_epoch(result_df, plan, cross_domain)
 
         # Step e: Assign VISITNUM/VISIT
         if cross_domain and cross_domain.visit_mapping:
             self._assign_visit(result_df, merged_df, cross_domain)
 
         # Step f: Generate --SEQ (not for DM)
-        if spec.domain.upper() != "DM":
-            self._generate_seq(result_df, spec)
+        self._generate_seq(result_df, plan)
 
         # Step f.5: Generate --DTF and --TMF imputation flag columns
         result_df = self._generate_dtf_tmf_flags(result_df, spec)
 
+        # Derived columns (EPOCH, VISIT, flags) join the compact storage
+        compact_char_columns(result_df, self.char_storage)
+
         # Step g + h: Enforce variable column order and drop unmapped
-        result_df = self._enforce_column_order(result_df, spec)
+        result_df = self._enforce_column_order(result_df, plan)
 
         # Step i: Sort rows by domain key variables
-        result_df = self._sort_rows(result_df, spec)
-
-        # Step j: Fix common non-ASCII characters
-        result_df = fix_common_non_ascii(result_df)
+        result_df = self._sort_rows(result_df, plan)
+
+        # Step j: Fix common non-ASCII characters. The column scan is
+        # shared with steps k and l and the XPT pre-write checks; only
+        # columns the fix may have rewritten are scanned again.
+        char_scan = scan_char_columns(result_df)
+        result_df = fix_common_non_ascii(result_df, char_scan=char_scan)
+        self._last_char_scan = scan_char_columns(
+            result_df,
+            {col: scan for col, scan in char_scan.items() if not scan.non_ascii_count},
+        )
 
         # Step k: Validate remaining ASCII (warn only, don't raise)
-        ascii_issues = validate_ascii(result_df)
+        ascii_issues = validate_ascii(result_df, char_scan=self._last_char_scan)
         if ascii_issues:
             logger.warning(
                 "{} non-ASCII issue(s) remain after auto-fix in {} domain",
@@ -192,7 +285,9 @@ class DatasetExecutor:
             )
 
         # Step l: Optimize character lengths
-        self._last_char_widths = optimize_char_lengths(result_df)
+        self._last_char_widths = optimize_char_lengths(
+            result_df, char_scan=self._last_char_scan
+        )
 
         logger.info(
             "Executed {} domain: {} rows x {} columns",
@@ -213,11 +308,13 @@ class DatasetExecutor:
         study_id: str | None = None,
         site_col: str = "SiteNumber",
         subject_col: str = "Subject",
+        verify_readback: bool = False,
     ) -> Path:
         """Execute a mapping spec and write the result as an XPT v5 file.
 
-        Calls execute() to produce the SDTM DataFrame, then writes it to
-        an XPT file with optimized column widths and proper labels.
+        Calls execute() to produce the SDTM DataFrame, then streams it to
+        an XPT file using the character widths computed by execute() and
+        the spec's labels.
 
         Args:
             spec: Domain mapping specification to execute.
@@ -227,6 +324,7 @@ class DatasetExecutor:
             study_id: Study identifier for USUBJID generation.
             site_col: Raw column name for site ID.
             subject_col: Raw column name for subject ID.
+            verify_readback: Read the written file back in full to verify it.
 
         Returns:
             The output path where the XPT file was written.
@@ -258,11 +356,62 @@ class DatasetExecutor:
             table_name=spec.domain.upper(),
             column_labels=column_labels,
             table_label=spec.domain_label,
+            char_widths=self._last_char_widths,
+            verify_readback=verify_readback,
+            char_scan=self._last_char_scan,
         )
 
         logger.info("Wrote XPT: {} -> {}", spec.domain, output_path)
         return output_path
 
+    def derive_usubjid(
+        self,
+        spec: DomainMappingSpec,
+        raw_df: pd.DataFrame,
+        *,
+        study_id: str | None = None,
+        site_col: str = "SiteNumber",
+        subject_col: str = "Subject",
+    ) -> pd.Series | None:
+        """Derive USUBJID for each raw row without executing the rest of the spec.
+
+        Applies only the spec's USUBJID mapping, exactly as ``execute`` would,
+        so callers can partition source rows by subject before execution.
+
+        Args:
+            spec: Domain mapping specification.
+            raw_df: One raw source DataFrame.
+            study_id: Study identifier for USUBJID generation.
+            site_col: Raw column name for site ID.
+            subject_col: Raw column name for subject ID.
+
+        Returns:
+            USUBJID Series aligned to ``raw_df``'s index, or None if the spec
+            has no USUBJID mapping.
+
+        Raises:
+            ExecutionError: If the USUBJID mapping fails.
+        """
+        compiled = next(
+            (c for c in self.compile(spec).mappings if c.mapping.sdtm_variable == "USUBJID"),
+            None,
+        )
+        if compiled is None:
+            return None
+
+        handler_kwargs = {
+            "ct_reference": self.ct_ref,
+            "study_id": study_id or spec.study_id,
+            "site_col": site_col,
+            "subject_col": subject_col,
+            "column_aliases": self._build_column_aliases(raw_df),
+            "column_lookup": ColumnLookup(raw_df),
+            "cross_domain_dfs": {},
+        }
+        result_df = pd.DataFrame(index=raw_df.index)
+        self._apply_mapping(compiled, raw_df, result_df, set(), handler_kwargs)
+        return result_df["USUBJID"]
+
     @staticmethod
     def validate_cross_domain_usubjid(
         dm_df: pd.DataFrame,
@@ -329,20 +478,23 @@ class DatasetExecutor:
 
     def _apply_mapping(
         self,
-        mapping: VariableMapping,
+        compiled: CompiledMapping,
         source_df: pd.DataFrame,
         result_df: pd.DataFrame,
         mapped_vars: set[str],
         handler_kwargs: dict[str, Any],
     ) -> None:
-        """Apply a single mapping, handling errors gracefully.
+        """Apply a single compiled mapping, handling errors gracefully.
 
         Before calling the handler, resolves the source variable name through
         the column alias map if the original name is not in the DataFrame.
         The resolved name is passed via ``kwargs["resolved_source"]`` so handlers
-        can use it without mutating the mapping object.
+        can use it without mutating the mapping object; the plan's parsed rule
+        and recode table travel as ``kwargs["parsed_rule"]`` and
+        ``kwargs["recode_table"]``.
         """
-        handler = PATTERN_HANDLERS.get(mapping.mapping_pattern)
+        mapping = compiled.mapping
+        handler = compiled.handler
         if handler is None:
             logger.error(
                 "No handler for pattern {} on {}",
@@ -366,11 +518,16 @@ class DatasetExecutor:
                 )
 
         # Pass resolved name to handler
-        call_kwargs = {**handler_kwargs, "resolved_source": resolved_source}
+        call_kwargs = {
+            **handler_kwargs,
+            "resolved_source": resolved_source,
+            "parsed_rule": compiled.parsed_rule,
+            "recode_table": compiled.recode_table,
+        }
 
         try:
             series = handler(source_df, mapping, **call_kwargs)
-            result_df[mapping.sdtm_variable] = series
+            result_df[mapping.sdtm_variable] = compact_char_column(series, self.char_storage)
             mapped_vars.add(mapping.sdtm_variable)
         except Exception as exc:
             if mapping.sdtm_variable in _CRITICAL_VARIABLES:
@@ -389,28 +546,29 @@ class DatasetExecutor:
     def _derive_dy(
         self,
         result_df: pd.DataFrame,
-        spec: DomainMappingSpec,
+        plan: ExecutionPlan,
         cross_domain: CrossDomainContext,
     ) -> None:
         """Derive --DY columns from --DTC columns using cross-domain RFSTDTC."""
-        # Get the set of --DY variables defined in the spec
-        dy_vars = {
-            m.sdtm_variable for m in spec.variable_mappings if m.sdtm_variable.endswith("DY")
-        }
+        # --DY variables defined in the spec
+        dy_vars = plan.dy_vars
 
         if not dy_vars:
             return
 
+        # Parse RFSTDTC once per domain, shared by every --DY column
+        reference_dates = build_reference_dates(cross_domain.rfstdtc_lookup)
+
         # Find matching --DTC columns
         for col in list(result_df.columns):
             if col.endswith("DTC"):
                 dy_name = col.replace("DTC", "DY")
                 if dy_name in dy_vars and "USUBJID" in result_df.columns:
                     try:
-                        result_df[dy_name] = calculate_study_day_column(
+                        result_df[dy_name] = calculate_study_day_from_reference(
                             result_df,
                             date_col=col,
-                            rfstdtc_lookup=cross_domain.rfstdtc_lookup,
+                            reference_dates=reference_dates,
                         )
                     except Exception as exc:
                         logger.warning("Failed to derive {}: {}", dy_name, exc)
@@ -418,21 +576,15 @@ class DatasetExecutor:
     def _assign_epoch(
         self,
         result_df: pd.DataFrame,
-        spec: DomainMappingSpec,
+        plan: ExecutionPlan,
         cross_domain: CrossDomainContext,
     ) -> None:
         """Assign EPOCH from SE domain data."""
-        # Check if EPOCH is in the spec
-        has_epoch = any(m.sdtm_variable == "EPOCH" for m in spec.variable_mappings)
-        if not has_epoch:
+        # Date column by domain class; None if EPOCH is not in the spec
+        date_col = plan.epoch_date_col
+        if date_col is None:
             return
 
-        # Determine date column based on domain class
-        domain = spec.domain.upper()
-        domain_class = spec.domain_class.lower()
-
-        date_col = f"{domain}DTC" if domain_class == "findings" else f"{domain}STDTC"
-
         if date_col not in result_df.columns or "USUBJID" not in result_df.columns:
             return
 
@@ -448,21 +600,24 @@ class DatasetExecutor:
         source_df: pd.DataFrame,
         cross_domain: CrossDomainContext,
     ) -> None:
-        """Assign VISITNUM and VISIT from visit mapping."""
+        """Assign VISITNUM and VISIT from visit mapping.
+
+        Fills each column that the spec's mappings left absent or entirely
+        null (e.g. a DERIVATION placeholder); populated columns are kept.
+        """
         # Look for raw visit column in source data
-        raw_visit_col = "InstanceName"
-        if raw_visit_col not in source_df.columns:
+        if _RAW_VISIT_COL not in source_df.columns:
             return
 
         try:
             visitnum, visit = assign_visit(
                 source_df,
                 cross_domain.visit_mapping,
-                raw_visit_col=raw_visit_col,
+                raw_visit_col=_RAW_VISIT_COL,
             )
-            if "VISITNUM" not in result_df.columns:
+            if "VISITNUM" not in result_df.columns or result_df["VISITNUM"].isna().all():
                 result_df["VISITNUM"] = visitnum
-            if "VISIT" not in result_df.columns:
+            if "VISIT" not in result_df.columns or result_df["VISIT"].isna().all():
                 result_df["VISIT"] = visit
         except Exception as exc:
             logger.warning("Failed to assign VISIT: {}", exc)
@@ -470,37 +625,25 @@ class DatasetExecutor:
     def _generate_seq(
         self,
         result_df: pd.DataFrame,
-        spec: DomainMappingSpec,
+        plan: ExecutionPlan,
     ) -> None:
-        """Generate --SEQ for the domain."""
-        domain = spec.domain.upper()
-        seq_var = f"{domain}SEQ"
-
-        # Check if SEQ is in the spec
-        has_seq = any(m.sdtm_variable == seq_var for m in spec.variable_mappings)
-        if not has_seq:
+        """Generate --SEQ for the domain (never for DM)."""
+        seq_var = plan.seq_var
+        if seq_var is None:
             return
 
         if "USUBJID" not in result_df.columns:
             return
 
-        # Get sort keys from SDTM reference or spec
-        sort_keys: list[str] = []
-        if self.sdtm_ref:
-            domain_spec = self.sdtm_ref.get_domain_spec(domain)
-            if domain_spec and domain_spec.key_variables:
-                sort_keys = [
-                    k
-                    for k in domain_spec.key_variables
-                    if k != "STUDYID" and k != "USUBJID" and k != seq_var
-                ]
+        # Sort keys from the SDTM reference
+        sort_keys = list(plan.seq_sort_keys)
 
         # Fallback: use date columns as sort keys
         if not sort_keys:
             sort_keys = [c for c in result_df.columns if c.endswith("DTC") or c.endswith("STDTC")]
 
         try:
-            result_df[seq_var] = generate_seq(result_df, domain, sort_keys)
+            result_df[seq_var] = generate_seq(result_df, plan.domain, sort_keys)
         except Exception as exc:
             logger.warning("Failed to generate {}: {}", seq_var, exc)
 
@@ -531,17 +674,13 @@ class DatasetExecutor:
     def _enforce_column_order(
         self,
         result_df: pd.DataFrame,
-        spec: DomainMappingSpec,
+        plan: ExecutionPlan,
     ) -> pd.DataFrame:
         """Sort columns by mapping order and drop unmapped columns."""
-        # Build order map from spec
-        order_map: dict[str, int] = {}
-        for m in spec.variable_mappings:
-            order_map[m.sdtm_variable] = m.order
+        order_map = plan.column_order
 
         # Only keep columns that appear in variable_mappings
-        mapped_names = {m.sdtm_variable for m in spec.variable_mappings}
-        keep_cols = [c for c in result_df.columns if c in mapped_names]
+        keep_cols = [c for c in result_df.columns if c in order_map]
 
         # Sort by order value
         keep_cols.sort(key=lambda c: order_map.get(c, 9999))
@@ -551,18 +690,13 @@ class DatasetExecutor:
     def _sort_rows(
         self,
         result_df: pd.DataFrame,
-        spec: DomainMappingSpec,
+        plan: ExecutionPlan,
     ) -> pd.DataFrame:
         """Sort rows by domain key variables."""
         if result_df.empty:
             return result_df
 
-        sort_cols: list[str] = []
-
-        if self.sdtm_ref:
-            domain_spec = self.sdtm_ref.get_domain_spec(spec.domain.upper())
-            if domain_spec and domain_spec.key_variables:
-                sort_cols = [k for k in domain_spec.key_variables if k in result_df.columns]
+        sort_cols = [k for k in plan.key_variables if k in result_df.columns]
 
         if not sort_cols:
             # Fallback: sort by STUDYID, USUBJID if available
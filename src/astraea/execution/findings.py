@@ -13,21 +13,67 @@ Exports:
     merge_findings_sources: Multi-source alignment and concatenation.
     derive_standardized_results: Derive STRESC/STRESN/STRESU from ORRES.
     derive_nrind: Derive NRIND from STRESN and reference ranges.
+    subject_batches: Split source rows into batches of whole subjects.
+    PartitionedFindingsResult: Outcome of a subject-partitioned execution.
 """
 
 from __future__ import annotations
 
+import tempfile
+from contextlib import ExitStack
+from pathlib import Path
+
 import numpy as np
 import pandas as pd
 from loguru import logger
+from pydantic import BaseModel, ConfigDict, Field
 
-from astraea.execution.executor import CrossDomainContext, DatasetExecutor
+from astraea.execution.executor import CrossDomainContext, DatasetExecutor, ExecutionError
+from astraea.execution.lc_domain import LC_XPT_TABLE_LABEL, get_lb_to_lc_rename_map
 from astraea.execution.preprocessing import align_multi_source_columns
 from astraea.execution.suppqual import generate_suppqual
+from astraea.io.frame_arrays import load_frame, save_frame
+from astraea.io.xpt_writer import (
+    XPTStreamWriter,
+    XPTValidationError,
+    XPTWriteResult,
+    validate_for_xpt_v5,
+    verify_xpt_header,
+    verify_xpt_readback,
+    xpt_columns_for,
+)
 from astraea.models.mapping import DomainMappingSpec
 from astraea.models.suppqual import SuppVariable
 from astraea.reference.controlled_terms import CTReference
 from astraea.reference.sdtm_ig import SDTMReference
+from astraea.transforms.char_length import optimize_char_lengths
+from astraea.transforms.char_scan import CharColumnScan, scan_char_columns, stack_char_scans
+from astraea.transforms.char_storage import (
+    CharStorage,
+    is_text_column,
+    restore_char_columns,
+)
+
+# Distinct subjects executed together by FindingsExecutor.execute_partitioned_to_xpt
+DEFAULT_SUBJECTS_PER_BATCH = 250
+
+
+def _spill_batch(df: pd.DataFrame, path: Path) -> None:
+    """Write an executed batch to ``path`` with ``save_frame``.
+
+    Compact text columns are restored to object columns, and other
+    character columns holding non-string values (dates, numbers) are
+    stored as their ``str()`` -- the text the XPT writer encodes for them.
+    """
+    batch = restore_char_columns(df)
+    for col in batch.columns:
+        series = batch[col]
+        if pd.api.types.is_numeric_dtype(series) or is_text_column(series):
+            continue
+        if series.notna().any():
+            values = series.astype(object)
+            batch[col] = values.map(str).where(values.notna(), None)
+    save_frame(path, batch)
 
 
 def normalize_lab_columns(df: pd.DataFrame, source_name: str) -> pd.DataFrame:
@@ -474,6 +520,68 @@ def _pass_through_findings_metadata(
     return df
 
 
+def subject_batches(
+    keys: dict[str, pd.Series],
+    subjects_per_batch: int,
+) -> list[dict[str, np.ndarray]]:
+    """Split source rows into batches of whole subjects, in USUBJID order.
+
+    Args:
+        keys: Source name -> USUBJID of each source row.
+        subjects_per_batch: Maximum distinct subjects per batch.
+
+    Returns:
+        One dict per non-empty batch mapping source name -> row positions.
+        Positions are ascending, so every source keeps its row order. Rows
+        without a USUBJID form a final batch of their own.
+
+    Raises:
+        ValueError: If subjects_per_batch is not positive.
+    """
+    if subjects_per_batch <= 0:
+        msg = f"subjects_per_batch must be positive, got {subjects_per_batch}"
+        raise ValueError(msg)
+
+    all_keys = pd.concat(list(keys.values()), ignore_index=True) if keys else pd.Series()
+    subjects = pd.Index(all_keys.dropna().unique()).sort_values()
+    n_batches = -(-len(subjects) // subjects_per_batch)
+
+    # Per source: rows grouped by batch id (n_batches = missing USUBJID)
+    split_rows: dict[str, list[np.ndarray]] = {}
+    for name, key in keys.items():
+        codes = subjects.get_indexer(key)
+        batch_ids = np.where(codes >= 0, codes // subjects_per_batch, n_batches)
+        order = np.argsort(batch_ids, kind="stable")
+        bounds = np.searchsorted(batch_ids[order], np.arange(n_batches + 2))
+        split_rows[name] = [order[bounds[b] : bounds[b + 1]] for b in range(n_batches + 1)]
+
+    batches: list[dict[str, np.ndarray]] = []
+    for b in range(n_batches + 1):
+        batch = {name: rows[b] for name, rows in split_rows.items()}
+        if any(len(rows) for rows in batch.values()):
+            batches.append(batch)
+    return batches
+
+
+class PartitionedFindingsResult(BaseModel):
+    """Outcome of ``FindingsExecutor.execute_partitioned_to_xpt``."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    domain: str = Field(..., description="SDTM domain code")
+    subject_count: int = Field(..., ge=0, description="Distinct USUBJIDs executed")
+    batch_count: int = Field(..., ge=0, description="Subject batches executed")
+    max_batch_rows: int = Field(default=0, ge=0, description="Output rows of the largest batch")
+    xpt: XPTWriteResult = Field(..., description="Main domain XPT")
+    lc_xpt: XPTWriteResult | None = Field(default=None, description="LC XPT, if requested")
+    supp_df: pd.DataFrame | None = Field(default=None, description="SUPP-- records, if any")
+
+    @property
+    def row_count(self) -> int:
+        """Rows written to the main domain XPT."""
+        return self.xpt.row_count
+
+
 class FindingsExecutor:
     """Orchestrator for multi-source Findings domain execution.
 
@@ -484,6 +592,7 @@ class FindingsExecutor:
     Args:
         sdtm_ref: SDTM-IG reference for domain specs.
         ct_ref: Controlled terminology reference for codelist lookups.
+        char_storage: Storage for character result columns (see DatasetExecutor).
     """
 
     def __init__(
@@ -491,10 +600,13 @@ class FindingsExecutor:
         *,
         sdtm_ref: SDTMReference | None = None,
         ct_ref: CTReference | None = None,
+        char_storage: CharStorage | str = CharStorage.OBJECT,
     ) -> None:
         self.sdtm_ref = sdtm_ref
         self.ct_ref = ct_ref
-        self._executor = DatasetExecutor(sdtm_ref=sdtm_ref, ct_ref=ct_ref)
+        self._executor = DatasetExecutor(
+            sdtm_ref=sdtm_ref, ct_ref=ct_ref, char_storage=char_storage
+        )
 
     def _derive_findings_variables(
         self,
@@ -722,3 +834,244 @@ class FindingsExecutor:
         )
 
         return vs_df, suppvs_df
+
+    def execute_partitioned_to_xpt(
+        self,
+        spec: DomainMappingSpec,
+        raw_dfs: dict[str, pd.DataFrame],
+        output_path: Path,
+        cross_domain: CrossDomainContext | None = None,
+        *,
+        study_id: str | None = None,
+        site_col: str = "SiteNumber",
+        subject_col: str = "Subject",
+        supp_variables: list[SuppVariable] | None = None,
+        time_points: dict[str, str] | None = None,
+        subjects_per_batch: int = DEFAULT_SUBJECTS_PER_BATCH,
+        lc_output_path: Path | None = None,
+        verify_readback: bool = False,
+    ) -> PartitionedFindingsResult:
+        """Execute an LB, EG or VS spec one batch of subjects at a time, streaming to XPT.
+
+        Every derivation in the Findings pipeline (--SEQ, --NRIND, --DY,
+        EPOCH, VISIT) depends only on the subject's own records, so batches
+        of whole subjects can be executed independently. Source rows are
+        partitioned by the USUBJID the spec derives for them, and each
+        batch runs through ``execute_lb``/``execute_eg``/``execute_vs``
+        unchanged. Executed batches are spilled next to ``output_path`` in
+        the pickle-free ``astraea.io.frame_arrays`` format -- character
+        widths are only known once every batch has run, and XPT headers
+        come first -- then streamed into the XPT in USUBJID order. A
+        column is numeric if any batch types it numeric and none holds
+        character values in it. The file matches the one the in-memory
+        path writes, while the normalized, merged and executed copies of
+        the domain never exist for more than one batch at a time.
+
+        Args:
+            spec: LB, EG or VS domain mapping specification.
+            raw_dfs: Dict of source_name -> raw source DataFrame.
+            output_path: Path for the domain .xpt file.
+            cross_domain: Cross-domain context for --DY, EPOCH, VISIT.
+            study_id: Study identifier for USUBJID generation.
+            site_col: Raw column name for site ID.
+            subject_col: Raw column name for subject ID.
+            supp_variables: Optional SUPPQUAL variables to extract.
+            time_points: EG only -- source_name -> time point value.
+            subjects_per_batch: Distinct subjects executed together.
+            lc_output_path: LB only -- also write the LC domain here.
+            verify_readback: Read each written XPT back in full to verify it.
+
+        Returns:
+            PartitionedFindingsResult with the XPT results and the
+            concatenated SUPP-- records.
+
+        Raises:
+            ValueError: If the domain is not LB, EG or VS, or LC output is
+                requested for another domain.
+            ExecutionError: If the spec has no USUBJID mapping, or a column
+                is numeric in some batches and character in others.
+            XPTValidationError: If the result violates XPT v5 constraints.
+        """
+        domain = spec.domain.upper()
+        execute_methods = {"LB": self.execute_lb, "EG": self.execute_eg, "VS": self.execute_vs}
+        if domain not in execute_methods:
+            msg = f"Partitioned execution supports LB, EG and VS, not {domain}"
+            raise ValueError(msg)
+        if lc_output_path is not None and domain != "LB":
+            msg = f"LC output can only be derived from LB, not {domain}"
+            raise ValueError(msg)
+        extra_kwargs = {"time_points": time_points} if domain == "EG" else {}
+
+        # Step 1: Partition source rows by the USUBJID the spec derives
+        keys: dict[str, pd.Series] = {}
+        for name, df in raw_dfs.items():
+            usubjid = self._executor.derive_usubjid(
+                spec, df, study_id=study_id, site_col=site_col, subject_col=subject_col
+            )
+            if usubjid is None:
+                msg = f"Partitioned {domain} execution requires a USUBJID mapping"
+                raise ExecutionError(msg)
+            keys[name] = usubjid
+        batches = subject_batches(keys, subjects_per_batch)
+        subject_count = pd.concat(list(keys.values())).nunique() if keys else 0
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(prefix=".partition-", dir=output_path.parent) as tmp:
+            # Step 2: Execute and spill each batch, collecting the XPT layout
+            spills: list[Path] = []
+            scans: list[tuple[dict[str, CharColumnScan], int]] = []
+            column_order: dict[str, None] = {}
+            numeric_cols: set[str] = set()
+            numeric_valued: set[str] = set()
+            character_valued: set[str] = set()
+            supp_frames: list[pd.DataFrame] = []
+            for i, batch in enumerate(batches):
+                batch_dfs = {
+                    name: raw_dfs[name].iloc[rows].reset_index(drop=True)
+                    for name, rows in batch.items()
+                }
+                main_df, supp_df = execute_methods[domain](  # type: ignore[operator]
+                    spec,
+                    batch_dfs,
+                    cross_domain=cross_domain,
+                    study_id=study_id,
+                    site_col=site_col,
+                    subject_col=subject_col,
+                    supp_variables=supp_variables,
+                    **extra_kwargs,
+                )
+                if supp_df is not None:
+                    supp_frames.append(supp_df)
+                if main_df.empty:
+                    continue
+
+                for col in main_df.columns:
+                    column_order[col] = None
+                    has_values = main_df[col].notna().any()
+                    if pd.api.types.is_numeric_dtype(main_df[col]):
+                        numeric_cols.add(col)
+                        if has_values:
+                            numeric_valued.add(col)
+                    elif has_values:
+                        character_valued.add(col)
+                scans.append((scan_char_columns(main_df), len(main_df)))
+
+                spill = Path(tmp) / f"batch{i:06d}.npz"
+                _spill_batch(main_df, spill)
+                spills.append(spill)
+                logger.debug("{} batch {}/{}: {} rows", domain, i + 1, len(batches), len(main_df))
+
+            conflicts = sorted(numeric_valued & character_valued)
+            if conflicts:
+                msg = (
+                    f"Columns {conflicts} are numeric in some subject batches and "
+                    f"character in others; execute {domain} without partitioning"
+                )
+                raise ExecutionError(msg)
+
+            # Step 3: Validate the combined layout before writing anything
+            columns = list(column_order)
+            numeric_cols -= character_valued
+            template = pd.DataFrame(
+                {
+                    col: pd.Series(dtype="float64" if col in numeric_cols else object)
+                    for col in columns
+                }
+            )
+            char_scan = stack_char_scans(scans)
+            column_labels = {
+                m.sdtm_variable: m.sdtm_label
+                for m in spec.variable_mappings
+                if m.sdtm_variable in column_order
+            }
+            errors = validate_for_xpt_v5(
+                template, column_labels, domain, spec.domain_label, char_scan=char_scan
+            )
+            if errors:
+                raise XPTValidationError(errors)
+            char_widths = optimize_char_lengths(template, char_scan=char_scan)
+            layout = xpt_columns_for(template, column_labels, char_widths)
+
+            lc_rename = get_lb_to_lc_rename_map(columns)
+            lc_labels = {
+                lc_rename[col]: label for col, label in column_labels.items() if col in lc_rename
+            }
+            lc_layout = [
+                c.model_copy(
+                    update={
+                        "name": lc_rename.get(col, col).upper(),
+                        "label": lc_labels.get(lc_rename.get(col, col), c.label),
+                    }
+                )
+                for col, c in zip(columns, layout, strict=True)
+            ]
+            if lc_output_path is not None:
+                lc_errors = validate_for_xpt_v5(
+                    template.rename(columns=lc_rename),
+                    {**column_labels, **lc_labels},
+                    "LC",
+                    LC_XPT_TABLE_LABEL,
+                    char_scan={lc_rename.get(c, c): scan for c, scan in char_scan.items()},
+                )
+                if lc_errors:
+                    raise XPTValidationError(lc_errors)
+
+            # Step 4: Stream the spilled batches into the XPT file(s)
+            with ExitStack() as stack:
+                writer = stack.enter_context(
+                    XPTStreamWriter(output_path, domain, layout, table_label=spec.domain_label)
+                )
+                lc_writer = None
+                if lc_output_path is not None:
+                    lc_writer = stack.enter_context(
+                        XPTStreamWriter(
+                            lc_output_path,
+                            "LC",
+                            lc_layout,
+                            table_label=LC_XPT_TABLE_LABEL,
+                        )
+                    )
+                for spill in spills:
+                    batch_df = load_frame(spill).reindex(columns=columns)
+                    spill.unlink()
+                    writer.write(batch_df)
+                    if lc_writer is not None:
+                        lc_df = batch_df.rename(columns=lc_rename)
+                        if "DOMAIN" in lc_df.columns:
+                            lc_df["DOMAIN"] = "LC"
+                        lc_writer.write(lc_df)
+
+        xpt_result = writer.close()
+        verify_xpt_header(output_path, layout, xpt_result.row_count)
+        if verify_readback:
+            verify_xpt_readback(xpt_result, layout)
+
+        lc_result = None
+        if lc_writer is not None:
+            lc_result = lc_writer.close()
+            verify_xpt_header(lc_result.path, lc_layout, lc_result.row_count)
+            if verify_readback:
+                verify_xpt_readback(lc_result, lc_layout)
+            logger.warning(
+                "LC domain generated as structural copy of LB. Unit conversion from SI "
+                "to conventional units not performed. Manual review required."
+            )
+
+        logger.info(
+            "{} partitioned execution complete: {} rows, {} subjects in {} batches -> {}",
+            domain,
+            xpt_result.row_count,
+            subject_count,
+            len(batches),
+            output_path,
+        )
+        return PartitionedFindingsResult(
+            domain=domain,
+            subject_count=subject_count,
+            batch_count=len(batches),
+            max_batch_rows=max((n for _scan, n in scans), default=0),
+            xpt=xpt_result,
+            lc_xpt=lc_result,
+            supp_df=pd.concat(supp_frames, ignore_index=True) if supp_frames else None,
+        )
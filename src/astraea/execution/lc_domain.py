@@ -11,6 +11,7 @@ Exports:
     get_lb_to_lc_rename_map: Build column rename mapping from LB to LC.
     generate_lc_mapping_spec: Create LC mapping spec from LB spec.
     LC_DOMAIN_DEFINITION: Basic metadata for define.xml reference.
+    LC_XPT_TABLE_LABEL: Dataset label for lc.xpt (within the 40-char XPT limit).
 """
 
 from __future__ import annotations
@@ -56,6 +57,9 @@ LC_DOMAIN_DEFINITION: dict[str, str] = {
     "structure": "One record per subject per visit per lab test per time point",
 }
 
+# The define.xml label above exceeds the 40-character XPT v5 dataset label
+LC_XPT_TABLE_LABEL = "Laboratory Results - Conventional Units"
+
 
 def get_lb_to_lc_rename_map(columns: list[str]) -> dict[str, str]:
     """Build the column rename mapping from LB-prefixed to LC-prefixed names.
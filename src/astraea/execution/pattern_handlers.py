@@ -16,11 +16,12 @@ from __future__ import annotations
 import re
 from collections.abc import Callable
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 
 from astraea.execution.transpose import handle_transpose
-from astraea.mapping.transform_registry import get_transform
+from astraea.mapping.transform_registry import get_column_transform, get_transform
 from astraea.models.mapping import MappingPattern, VariableMapping
 from astraea.reference.controlled_terms import CTReference
 
@@ -78,6 +79,19 @@ def parse_derivation_rule(rule: str) -> tuple[str, list[str]]:
     return rule.strip().upper(), []
 
 
+class ColumnLookup:
+    """Case-insensitive name index over one DataFrame's columns.
+
+    The executor builds one per execution and passes it to handlers as
+    ``kwargs["column_lookup"]``; ``_resolve_column`` uses it for that
+    DataFrame instead of rebuilding the index on every call.
+    """
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self.columns = df.columns
+        self.lower_map: dict[str, str] = {str(c).lower(): str(c) for c in df.columns}
+
+
 def _resolve_column(
     df: pd.DataFrame, name: str, kwargs: dict[str, object]
 ) -> str | None:
@@ -88,7 +102,8 @@ def _resolve_column(
     2. Exact match in ``df.columns``
     3. Custom aliases from ``kwargs["column_aliases"]``
     4. Hardcoded EDC aliases (``_EDC_ALIASES``)
-    5. Case-insensitive fallback
+    5. Case-insensitive fallback (via ``kwargs["column_lookup"]`` when it
+       indexes ``df``)
     """
     # Strip dataset prefix
     if "." in name and not name.replace(".", "").replace("-", "").isdigit():
@@ -108,7 +123,11 @@ def _resolve_column(
         return _EDC_ALIASES[name]
 
     # 4. Case-insensitive fallback
-    lower_map: dict[str, str] = {str(c).lower(): str(c) for c in df.columns}
+    lookup = kwargs.get("column_lookup")
+    if isinstance(lookup, ColumnLookup) and lookup.columns is df.columns:
+        lower_map = lookup.lower_map
+    else:
+        lower_map = {str(c).lower(): str(c) for c in df.columns}
     if name.lower() in lower_map:
         return lower_map[name.lower()]
 
@@ -200,8 +219,8 @@ def _handle_iso8601_date(
     mapping: VariableMapping,
     **kwargs: object,
 ) -> pd.Series:
-    """Convert SAS numeric DATE values to ISO 8601."""
-    from astraea.transforms.dates import sas_date_to_iso
+    """Convert SAS numeric DATE values to ISO 8601 (whole column in one pass)."""
+    from astraea.transforms.dates import sas_date_column_to_iso
 
     col_hint = args[0] if args else (mapping.source_variable or "")
     if not col_hint:
@@ -211,7 +230,7 @@ def _handle_iso8601_date(
     if col not in df.columns:
         logger.warning("ISO8601_DATE: column '{}' not found for {}", col, mapping.sdtm_variable)
         return pd.Series(None, index=df.index, dtype="object")
-    return df[col].map(sas_date_to_iso)
+    return sas_date_column_to_iso(df[col])
 
 
 def _handle_iso8601_datetime(
@@ -220,8 +239,8 @@ def _handle_iso8601_datetime(
     mapping: VariableMapping,
     **kwargs: object,
 ) -> pd.Series:
-    """Convert SAS numeric DATETIME values to ISO 8601."""
-    from astraea.transforms.dates import sas_datetime_to_iso
+    """Convert SAS numeric DATETIME values to ISO 8601 (whole column in one pass)."""
+    from astraea.transforms.dates import sas_datetime_column_to_iso
 
     col_hint = args[0] if args else (mapping.source_variable or "")
     if not col_hint:
@@ -231,7 +250,7 @@ def _handle_iso8601_datetime(
     if col not in df.columns:
         logger.warning("ISO8601_DATETIME: column '{}' not found for {}", col, mapping.sdtm_variable)
         return pd.Series(None, index=df.index, dtype="object")
-    return df[col].map(sas_datetime_to_iso)
+    return sas_datetime_column_to_iso(df[col])
 
 
 def _handle_iso8601_partial_date(
@@ -241,28 +260,21 @@ def _handle_iso8601_partial_date(
     **kwargs: object,
 ) -> pd.Series:
     """Build partial ISO 8601 from year/month/day component columns."""
-    from astraea.transforms.dates import format_partial_iso8601
+    from astraea.transforms.dates import format_partial_iso8601_column
 
     if not args:
         return pd.Series(None, index=df.index, dtype="object")
 
     # Resolve up to 3 columns: year, month, day
-    year_col = _resolve_column(df, args[0], kwargs)
-    month_col = _resolve_column(df, args[1], kwargs) if len(args) > 1 else None
-    day_col = _resolve_column(df, args[2], kwargs) if len(args) > 2 else None
-
-    def _row_to_iso(row: pd.Series) -> str:
-        year_val = row.get(year_col) if year_col else None
-        month_val = row.get(month_col) if month_col else None
-        day_val = row.get(day_col) if day_col else None
-
-        year = int(float(year_val)) if pd.notna(year_val) and year_val is not None else None
-        month = int(float(month_val)) if pd.notna(month_val) and month_val is not None else None
-        day = int(float(day_val)) if pd.notna(day_val) and day_val is not None else None
-
-        return format_partial_iso8601(year=year, month=month, day=day)
+    components: list[pd.Series | None] = []
+    for hint in args[:3]:
+        col = _resolve_column(df, hint, kwargs)
+        components.append(df[col] if col is not None and col in df.columns else None)
+    year, month, day = (components + [None, None])[:3]
+    if year is None:
+        return pd.Series("", index=df.index, dtype="object")
 
-    return df.apply(_row_to_iso, axis=1)
+    return format_partial_iso8601_column(year, month, day)
 
 
 def _handle_parse_string_date(
@@ -271,8 +283,8 @@ def _handle_parse_string_date(
     mapping: VariableMapping,
     **kwargs: object,
 ) -> pd.Series:
-    """Parse string dates (DD Mon YYYY, etc.) to ISO 8601."""
-    from astraea.transforms.dates import parse_string_date_to_iso
+    """Parse string dates (DD Mon YYYY, etc.) to ISO 8601, once per distinct value."""
+    from astraea.transforms.dates import parse_string_date_column
 
     col_hint = args[0] if args else (mapping.source_variable or "")
     if not col_hint:
@@ -283,7 +295,7 @@ def _handle_parse_string_date(
             "PARSE_STRING_DATE: column '{}' not found for {}", col, mapping.sdtm_variable,
         )
         return pd.Series(None, index=df.index, dtype="object")
-    return df[col].map(parse_string_date_to_iso)
+    return parse_string_date_column(df[col])
 
 
 def _handle_min_date_per_subject(
@@ -319,7 +331,7 @@ def _handle_date_agg_per_subject(
     If the source column is in a cross-domain DataFrame, look it up from
     ``kwargs["cross_domain_dfs"]``.
     """
-    from astraea.transforms.dates import sas_date_to_iso
+    from astraea.transforms.dates import sas_date_column_to_iso
 
     if not args:
         return pd.Series(None, index=df.index, dtype="object")
@@ -371,7 +383,7 @@ def _handle_date_agg_per_subject(
     mapped_numeric = df[df_usubjid_col].map(agg_dates)
 
     # Convert to ISO 8601
-    return mapped_numeric.map(sas_date_to_iso)
+    return sas_date_column_to_iso(mapped_numeric)
 
 
 def _handle_race_checkbox(
@@ -399,19 +411,18 @@ def _handle_race_checkbox(
         )
         return pd.Series(None, index=df.index, dtype="object")
 
-    def _derive_race(row: pd.Series) -> str | None:
-        checked = []
-        for col, race in resolved_cols:
-            val = row.get(col)
-            if pd.notna(val) and float(val) == 1:
-                checked.append(race)
-        if len(checked) == 0:
-            return None
-        if len(checked) == 1:
-            return checked[0]
-        return "MULTIPLE"
+    # One boolean column per checkbox; a box counts as checked when it is numerically 1
+    checked = np.column_stack(
+        [(pd.to_numeric(df[col], errors="coerce") == 1).to_numpy() for col, _ in resolved_cols]
+    )
+    n_checked = checked.sum(axis=1)
+    races = np.array([race for _, race in resolved_cols], dtype=object)
 
-    return df.apply(_derive_race, axis=1)
+    result = np.full(len(df), None, dtype=object)
+    single = n_checked == 1
+    result[single] = races[checked[single].argmax(axis=1)]
+    result[n_checked > 1] = "MULTIPLE"
+    return pd.Series(result, index=df.index, dtype="object")
 
 
 def _handle_numeric_to_yn(
@@ -463,9 +474,11 @@ def _dispatch_derivation_rule(
 ) -> pd.Series | None:
     """Parse a derivation rule and dispatch to the appropriate handler.
 
-    Returns None if the keyword is not recognized.
+    Uses the pre-parsed ``kwargs["parsed_rule"]`` from an execution plan
+    when present. Returns None if the keyword is not recognized.
     """
-    keyword, args = parse_derivation_rule(rule)
+    parsed: tuple[str, list[str]] | None = kwargs.get("parsed_rule")  # type: ignore[assignment]
+    keyword, args = parsed if parsed is not None else parse_derivation_rule(rule)
     handler = _DERIVATION_DISPATCH.get(keyword)
     if handler is not None:
         return handler(df, args, mapping, **kwargs)
@@ -562,6 +575,11 @@ def handle_reformat(df: pd.DataFrame, mapping: VariableMapping, **kwargs: object
             msg = f"Source variable '{mapping.source_variable}' not found in DataFrame columns"
             raise KeyError(msg)
 
+    if mapping.derivation_rule:
+        column_fn = get_column_transform(mapping.derivation_rule)
+        if column_fn is not None:
+            return column_fn(df[col])  # type: ignore[return-value]
+
     transform_fn = get_transform(mapping.derivation_rule) if mapping.derivation_rule else None
 
     if transform_fn is not None:
@@ -575,11 +593,36 @@ def handle_reformat(df: pd.DataFrame, mapping: VariableMapping, **kwargs: object
     return df[col].copy()
 
 
+def build_recode_table(ct_reference: CTReference, codelist_code: str) -> dict[str, str] | None:
+    """Build the LOOKUP_RECODE table for a codelist.
+
+    Maps each term's NCI preferred term (display name) and its submission
+    value to the submission value.
+
+    Returns:
+        The recode dict, or None if the codelist is unknown.
+    """
+    codelist = ct_reference.lookup_codelist(codelist_code)
+    if codelist is None:
+        return None
+
+    # CT terms are keyed by submission value; map raw values to submission values
+    recode_dict: dict[str, str] = {}
+    for submission_value, term in codelist.terms.items():
+        # Map the nci_preferred_term (display name) to submission_value
+        if term.nci_preferred_term:
+            recode_dict[term.nci_preferred_term] = submission_value
+        # Also map submission_value to itself (identity)
+        recode_dict[submission_value] = submission_value
+    return recode_dict
+
+
 def handle_lookup_recode(df: pd.DataFrame, mapping: VariableMapping, **kwargs: object) -> pd.Series:
     """Map source values through a codelist lookup table.
 
     If mapping.codelist_code and a CTReference are available, builds a recode
-    dictionary from codelist terms and applies it. Non-matching values are
+    dictionary from codelist terms (or takes the plan's prebuilt
+    ``kwargs["recode_table"]``) and applies it. Non-matching values are
     kept as-is (important for extensible codelists).
 
     Args:
@@ -607,21 +650,14 @@ def handle_lookup_recode(df: pd.DataFrame, mapping: VariableMapping, **kwargs: o
 
     ct_reference: CTReference | None = kwargs.get("ct_reference")  # type: ignore[assignment]
 
-    if mapping.codelist_code and ct_reference is not None:
-        codelist = ct_reference.lookup_codelist(mapping.codelist_code)
-        if codelist is not None:
-            # Build recode dict: submission_value -> submission_value
-            # (CT terms are keyed by submission value, we map raw values to submission values)
-            recode_dict: dict[str, str] = {}
-            for submission_value, term in codelist.terms.items():
-                # Map the nci_preferred_term (display name) to submission_value
-                if term.nci_preferred_term:
-                    recode_dict[term.nci_preferred_term] = submission_value
-                # Also map submission_value to itself (identity)
-                recode_dict[submission_value] = submission_value
-
-            source_col = df[col]
-            return source_col.map(lambda v: recode_dict.get(str(v), v) if pd.notna(v) else v)
+    # Prebuilt by the execution plan, else built from the codelist here
+    recode_dict: dict[str, str] | None = kwargs.get("recode_table")  # type: ignore[assignment]
+    if recode_dict is None and mapping.codelist_code and ct_reference is not None:
+        recode_dict = build_recode_table(ct_reference, mapping.codelist_code)
+
+    if recode_dict is not None:
+        source_col = df[col]
+        return source_col.map(lambda v: recode_dict.get(str(v), v) if pd.notna(v) else v)
 
     logger.warning(
         "No codelist available for LOOKUP_RECODE on {} (code={}); passing through source column",
@@ -670,6 +706,9 @@ def handle_derivation(df: pd.DataFrame, mapping: VariableMapping, **kwargs: obje
         and mapping.source_variable in df.columns
     )
     if has_transform:
+        column_fn = get_column_transform(rule)
+        if column_fn is not None:
+            return column_fn(df[mapping.source_variable])  # type: ignore[return-value]
         return df[mapping.source_variable].map(transform_fn)
 
     logger.warning(
@@ -722,7 +761,8 @@ def handle_split(df: pd.DataFrame, mapping: VariableMapping, **kwargs: object) -
     rule = mapping.derivation_rule or ""
 
     if rule:
-        keyword, args = parse_derivation_rule(rule)
+        parsed: tuple[str, list[str]] | None = kwargs.get("parsed_rule")  # type: ignore[assignment]
+        keyword, args = parsed if parsed is not None else parse_derivation_rule(rule)
 
         if keyword == "SUBSTRING" and len(args) >= 3:
             col = _resolve_column(df, args[0], kwargs)
@@ -0,0 +1,228 @@
+"""Compiled execution plans for DatasetExecutor.
+
+Everything DatasetExecutor derives from a DomainMappingSpec alone -- the
+pattern-priority order of the mappings, each mapping's handler, parsed
+derivation rule keyword and arguments, codelist recode tables, the --DY,
+EPOCH and --SEQ targets, column order and sort keys -- is compiled once
+into an ExecutionPlan. Plans are cached by a hash of the spec's content,
+so repeated runs of the same spec (subject batches of a Findings domain,
+re-runs in one process) skip recompilation, while any edit to the spec
+produces a new hash and a fresh plan.
+
+A plan is only valid with the SDTM and CT references it was compiled
+against; each DatasetExecutor owns its own PlanCache.
+
+Exports:
+    CompiledMapping: One variable mapping with its resolved handler and rule.
+    ExecutionPlan: The compiled form of a DomainMappingSpec.
+    PlanCache: LRU cache of plans keyed by spec hash.
+    compile_plan: Compile a spec into an ExecutionPlan.
+    spec_fingerprint: Content hash of a spec.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from collections.abc import Callable
+
+import pandas as pd
+from loguru import logger
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation
+
+from astraea.execution.pattern_handlers import (
+    PATTERN_HANDLERS,
+    build_recode_table,
+    parse_derivation_rule,
+)
+from astraea.models.mapping import DomainMappingSpec, MappingPattern, VariableMapping
+from astraea.reference.controlled_terms import CTReference
+from astraea.reference.sdtm_ig import SDTMReference
+
+# Pattern execution priority order
+_PATTERN_ORDER: list[set[MappingPattern]] = [
+    {MappingPattern.ASSIGN},
+    {MappingPattern.DIRECT, MappingPattern.RENAME},
+    {MappingPattern.REFORMAT},
+    {MappingPattern.LOOKUP_RECODE},
+    {MappingPattern.DERIVATION, MappingPattern.COMBINE},
+    {MappingPattern.SPLIT, MappingPattern.TRANSPOSE},
+]
+
+# Plans kept per executor
+DEFAULT_MAX_PLANS = 64
+
+
+class CompiledMapping(BaseModel):
+    """A variable mapping with everything spec-derived resolved up front."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    mapping: VariableMapping = Field(..., description="The source variable mapping")
+    handler: Callable[..., pd.Series] | None = Field(
+        default=None, description="Pattern handler, or None if the pattern has none"
+    )
+    parsed_rule: SkipValidation[tuple[str, list[str]] | None] = Field(
+        default=None, description="(KEYWORD, args) of the derivation rule, if any"
+    )
+    recode_table: SkipValidation[dict[str, str] | None] = Field(
+        default=None, description="LOOKUP_RECODE table built from the codelist, if any"
+    )
+
+
+class ExecutionPlan(BaseModel):
+    """The compiled form of one DomainMappingSpec."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    spec_hash: str = Field(..., description="spec_fingerprint of the compiled spec")
+    domain: str = Field(..., description="Upper-cased domain code")
+    mappings: list[CompiledMapping] = Field(
+        default_factory=list, description="Mappings in pattern priority order"
+    )
+    column_order: dict[str, int] = Field(
+        default_factory=dict, description="SDTM variable -> mapping order"
+    )
+    dy_vars: set[str] = Field(default_factory=set, description="--DY variables in the spec")
+    epoch_date_col: str | None = Field(
+        default=None, description="--DTC column EPOCH is assigned from, if EPOCH is mapped"
+    )
+    seq_var: str | None = Field(default=None, description="--SEQ variable to generate, if any")
+    seq_sort_keys: list[str] = Field(
+        default_factory=list,
+        description="--SEQ ordering keys from the SDTM-IG (empty: fall back to --DTC columns)",
+    )
+    key_variables: list[str] = Field(
+        default_factory=list, description="SDTM-IG key variables for row sorting"
+    )
+
+
+def spec_fingerprint(spec: DomainMappingSpec) -> str:
+    """SHA-256 of the spec's JSON form -- changes whenever any field changes."""
+    return hashlib.sha256(spec.model_dump_json().encode("utf-8")).hexdigest()
+
+
+def _compile_mapping(mapping: VariableMapping, ct_ref: CTReference | None) -> CompiledMapping:
+    parsed_rule = None
+    if mapping.derivation_rule:
+        parsed_rule = parse_derivation_rule(mapping.derivation_rule)
+
+    recode_table = None
+    if (
+        mapping.mapping_pattern == MappingPattern.LOOKUP_RECODE
+        and mapping.codelist_code
+        and ct_ref is not None
+    ):
+        recode_table = build_recode_table(ct_ref, mapping.codelist_code)
+
+    return CompiledMapping(
+        mapping=mapping,
+        handler=PATTERN_HANDLERS.get(mapping.mapping_pattern),
+        parsed_rule=parsed_rule,
+        recode_table=recode_table,
+    )
+
+
+def compile_plan(
+    spec: DomainMappingSpec,
+    *,
+    sdtm_ref: SDTMReference | None = None,
+    ct_ref: CTReference | None = None,
+) -> ExecutionPlan:
+    """Compile a mapping spec into an ExecutionPlan.
+
+    Args:
+        spec: Domain mapping specification.
+        sdtm_ref: SDTM-IG reference for key variables (--SEQ and row order).
+        ct_ref: Controlled terminology for LOOKUP_RECODE tables.
+
+    Returns:
+        ExecutionPlan for ``spec``.
+    """
+    domain = spec.domain.upper()
+    names = {m.sdtm_variable for m in spec.variable_mappings}
+
+    mappings = [
+        _compile_mapping(m, ct_ref)
+        for pattern_group in _PATTERN_ORDER
+        for m in spec.variable_mappings
+        if m.mapping_pattern in pattern_group
+    ]
+
+    epoch_date_col = None
+    if "EPOCH" in names:
+        findings = spec.domain_class.lower() == "findings"
+        epoch_date_col = f"{domain}DTC" if findings else f"{domain}STDTC"
+
+    seq_var = f"{domain}SEQ"
+    key_variables: list[str] = []
+    if sdtm_ref:
+        domain_spec = sdtm_ref.get_domain_spec(domain)
+        if domain_spec and domain_spec.key_variables:
+            key_variables = list(domain_spec.key_variables)
+
+    return ExecutionPlan(
+        spec_hash=spec_fingerprint(spec),
+        domain=domain,
+        mappings=mappings,
+        column_order={m.sdtm_variable: m.order for m in spec.variable_mappings},
+        dy_vars={name for name in names if name.endswith("DY")},
+        epoch_date_col=epoch_date_col,
+        seq_var=seq_var if domain != "DM" and seq_var in names else None,
+        seq_sort_keys=[k for k in key_variables if k not in ("STUDYID", "USUBJID", seq_var)],
+        key_variables=key_variables,
+    )
+
+
+class PlanCache:
+    """LRU cache of ExecutionPlans keyed by spec content hash.
+
+    Args:
+        sdtm_ref: SDTM-IG reference plans are compiled against.
+        ct_ref: Controlled terminology plans are compiled against.
+        max_plans: Plans kept before the least recently used is evicted.
+
+    Raises:
+        ValueError: If max_plans is not positive.
+    """
+
+    def __init__(
+        self,
+        *,
+        sdtm_ref: SDTMReference | None = None,
+        ct_ref: CTReference | None = None,
+        max_plans: int = DEFAULT_MAX_PLANS,
+    ) -> None:
+        if max_plans <= 0:
+            msg = f"max_plans must be positive, got {max_plans}"
+            raise ValueError(msg)
+        self.sdtm_ref = sdtm_ref
+        self.ct_ref = ct_ref
+        self.max_plans = max_plans
+        self.hits = 0
+        self.misses = 0
+        self._plans: OrderedDict[str, ExecutionPlan] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+    def get(self, spec: DomainMappingSpec) -> ExecutionPlan:
+        """Return the plan for ``spec``, compiling it on a miss."""
+        key = spec_fingerprint(spec)
+        plan = self._plans.get(key)
+        if plan is not None:
+            self._plans.move_to_end(key)
+            self.hits += 1
+            return plan
+
+        self.misses += 1
+        plan = compile_plan(spec, sdtm_ref=self.sdtm_ref, ct_ref=self.ct_ref)
+        self._plans[key] = plan
+        if len(self._plans) > self.max_plans:
+            self._plans.popitem(last=False)
+        logger.debug("Compiled execution plan for {} ({})", plan.domain, key[:12])
+        return plan
+
+    def clear(self) -> None:
+        """Drop every cached plan."""
+        self._plans.clear()
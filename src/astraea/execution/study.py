@@ -0,0 +1,480 @@
+"""Study-level execution of many domain mapping specs in a single run.
+
+Provides StudyExecutor, which executes every DomainMappingSpec of a study
+in dependency order instead of one ``execute-domain`` call per domain:
+
+- Raw source datasets are read once and shared by every domain that
+  lists them in ``source_datasets``, loading only the columns those
+  domains' specs reference.
+- SDTM-IG and CT references are loaded once per worker process.
+- Domains are grouped into dependency waves: DM, SE and TV (the domains
+  that feed CrossDomainContext) run first, then every other domain runs
+  with the context built from their results.
+- Domains within a wave are independent and run on a process pool.
+
+Exports:
+    StudyExecutor: Orchestrator for parallel multi-domain execution.
+    StudyDomainResult: Per-domain outcome of a study run.
+    plan_study_waves: Dependency-ordered grouping of domain specs.
+    build_study_context: CrossDomainContext from executed DM/SE/TV frames.
+    load_study_sources: Read every source dataset referenced by the specs once.
+    study_source_columns: Columns each source dataset must supply.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+from loguru import logger
+from pydantic import BaseModel, Field
+
+from astraea.execution.executor import (
+    CrossDomainContext,
+    DatasetExecutor,
+    required_source_columns,
+)
+from astraea.execution.suppqual import SUPPQUAL_COLUMN_LABELS
+from astraea.models.mapping import DomainMappingSpec
+from astraea.reference.controlled_terms import CTReference
+from astraea.reference.sdtm_ig import SDTMReference
+from astraea.transforms.visit import build_visit_mapping_from_tv
+
+if TYPE_CHECKING:
+    from astraea.io.sas_cache import SASReadCache
+
+# Domains whose executed output feeds CrossDomainContext for all others
+_CONTEXT_DOMAINS = frozenset({"DM", "SE", "TV"})
+
+# Findings domains routed through FindingsExecutor (multi-source + SUPPQUAL)
+_FINDINGS_DOMAINS = frozenset({"LB", "VS", "EG"})
+
+
+class StudyDomainResult(BaseModel):
+    """Outcome of executing one domain as part of a study run."""
+
+    domain: str = Field(..., description="SDTM domain code")
+    wave: int = Field(..., description="Dependency wave the domain ran in (0 = context)")
+    row_count: int = Field(default=0, description="Rows in the main domain output")
+    output_path: Path | None = Field(default=None, description="Written XPT path")
+    supp_output_path: Path | None = Field(
+        default=None, description="Written SUPPQUAL XPT path, if any"
+    )
+    lc_output_path: Path | None = Field(default=None, description="Written LC XPT path (LB only)")
+    error: str | None = Field(default=None, description="Error message if execution failed")
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+def plan_study_waves(specs: list[DomainMappingSpec]) -> list[list[DomainMappingSpec]]:
+    """Group domain specs into dependency-ordered execution waves.
+
+    Wave 0 holds the context domains (DM, SE, TV) that every other domain
+    needs for --DY, EPOCH and VISIT derivation. Wave 1 holds all remaining
+    domains. Within a wave, specs are sorted by domain code so results are
+    deterministic. Empty waves are omitted.
+
+    Raises:
+        ValueError: If two specs target the same domain.
+    """
+    seen: set[str] = set()
+    for spec in specs:
+        domain = spec.domain.upper()
+        if domain in seen:
+            msg = f"Duplicate mapping spec for domain {domain}"
+            raise ValueError(msg)
+        seen.add(domain)
+
+    context_wave = sorted(
+        (s for s in specs if s.domain.upper() in _CONTEXT_DOMAINS),
+        key=lambda s: s.domain.upper(),
+    )
+    dependent_wave = sorted(
+        (s for s in specs if s.domain.upper() not in _CONTEXT_DOMAINS),
+        key=lambda s: s.domain.upper(),
+    )
+    return [wave for wave in (context_wave, dependent_wave) if wave]
+
+
+def _resolve_source_path(data_dir: Path, source_name: str) -> Path | None:
+    """Resolve a spec source dataset name to a file, mirroring execute-domain."""
+    source_path = data_dir / source_name
+    if source_path.exists():
+        return source_path
+    stem = source_name.replace(".sas7bdat", "")
+    source_path = data_dir / f"{stem}.sas7bdat"
+    return source_path if source_path.exists() else None
+
+
+def study_source_columns(specs: list[DomainMappingSpec]) -> dict[str, set[str] | None]:
+    """Union of the columns each source dataset must supply across all specs.
+
+    Sources used by a Findings domain (LB, VS, EG) map to None: their
+    normalizers and merges read raw columns that the spec does not name,
+    so those datasets are loaded whole. The same holds for any spec that
+    ``required_source_columns`` cannot project.
+
+    Returns:
+        Dict of source dataset name -> column names, or None for all columns.
+    """
+    columns: dict[str, set[str] | None] = {}
+    for spec in specs:
+        needed: set[str] | None = None
+        if spec.domain.upper() not in _FINDINGS_DOMAINS:
+            needed = required_source_columns(spec)
+        for name in spec.source_datasets:
+            if name in columns and columns[name] is None:
+                continue
+            if needed is None:
+                columns[name] = None
+            else:
+                columns[name] = (columns.get(name) or set()) | needed
+    return columns
+
+
+def load_study_sources(
+    specs: list[DomainMappingSpec],
+    data_dir: Path,
+    *,
+    cache: SASReadCache | None = None,
+    project_columns: bool = True,
+) -> dict[str, pd.DataFrame]:
+    """Read every source dataset referenced by the specs exactly once.
+
+    Args:
+        specs: Domain mapping specs for the study.
+        data_dir: Directory containing raw .sas7bdat files.
+        cache: Optional on-disk SAS read cache.
+        project_columns: Load only the columns the specs reference
+            (see ``study_source_columns``). False loads every column.
+
+    Returns:
+        Dict of source dataset name (as written in ``source_datasets``) ->
+        raw DataFrame. Sources that are missing or unreadable are logged
+        and omitted.
+    """
+    from astraea.io.sas_reader import read_sas_with_metadata
+
+    source_columns = study_source_columns(specs)
+    names = sorted(source_columns)
+    raw_data: dict[str, pd.DataFrame] = {}
+    for name in names:
+        source_path = _resolve_source_path(data_dir, name)
+        if source_path is None:
+            logger.warning("Source dataset not found: {}", name)
+            continue
+        usecols = source_columns[name] if project_columns else None
+        try:
+            df, _meta = read_sas_with_metadata(source_path, cache=cache, usecols=usecols)
+        except Exception as exc:
+            logger.warning("Could not read {}: {}", name, exc)
+            continue
+        raw_data[name] = df
+
+    logger.info("Loaded {} of {} study source datasets", len(raw_data), len(names))
+    return raw_data
+
+
+def build_study_context(domain_dfs: dict[str, pd.DataFrame]) -> CrossDomainContext | None:
+    """Build a CrossDomainContext from executed context-domain DataFrames.
+
+    Args:
+        domain_dfs: Executed SDTM DataFrames keyed by upper-case domain code.
+            DM supplies RFSTDTC, SE supplies EPOCH ranges, TV supplies the
+            VISITNUM/VISIT mapping.
+
+    Returns:
+        CrossDomainContext, or None if none of DM/SE/TV produced usable data.
+    """
+    rfstdtc_lookup: dict[str, str] = {}
+    dm_df = domain_dfs.get("DM")
+    if dm_df is not None and {"USUBJID", "RFSTDTC"} <= set(dm_df.columns):
+        valid = dm_df["USUBJID"].notna() & dm_df["RFSTDTC"].notna()
+        valid &= dm_df["USUBJID"].astype(str).str.len().gt(0)
+        valid &= dm_df["RFSTDTC"].astype(str).str.len().gt(0)
+        subset = dm_df.loc[valid]
+        rfstdtc_lookup = dict(
+            zip(subset["USUBJID"].astype(str), subset["RFSTDTC"].astype(str), strict=True)
+        )
+
+    se_df = domain_dfs.get("SE")
+    tv_df = domain_dfs.get("TV")
+
+    if not rfstdtc_lookup and se_df is None and tv_df is None:
+        return None
+
+    visit_mapping = build_visit_mapping_from_tv(tv_df) if tv_df is not None else {}
+
+    return CrossDomainContext(
+        rfstdtc_lookup=rfstdtc_lookup,
+        se_data=se_df,
+        tv_data=tv_df,
+        visit_mapping=visit_mapping,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Worker process state and task function
+# ---------------------------------------------------------------------------
+
+# Populated once per worker by _init_worker so raw data and references are
+# transferred to each process a single time rather than once per domain.
+_WORKER_STATE: dict[str, Any] = {}
+
+
+def _init_worker(
+    raw_data: dict[str, pd.DataFrame],
+    sdtm_ref: SDTMReference | None,
+    ct_ref: CTReference | None,
+) -> None:
+    """Install shared study state in the current (worker) process."""
+    _WORKER_STATE["raw_data"] = raw_data
+    _WORKER_STATE["sdtm_ref"] = sdtm_ref
+    _WORKER_STATE["ct_ref"] = ct_ref
+
+
+def _execute_domain_task(
+    spec: DomainMappingSpec,
+    cross_domain: CrossDomainContext | None,
+) -> tuple[pd.DataFrame, pd.DataFrame | None]:
+    """Execute one domain spec against the shared worker state.
+
+    Returns:
+        Tuple of (main_df, supp_df_or_none).
+
+    Raises:
+        ValueError: If none of the spec's source datasets were loaded.
+    """
+    raw_data: dict[str, pd.DataFrame] = _WORKER_STATE["raw_data"]
+    sdtm_ref: SDTMReference | None = _WORKER_STATE["sdtm_ref"]
+    ct_ref: CTReference | None = _WORKER_STATE["ct_ref"]
+
+    raw_dfs = {name: raw_data[name] for name in spec.source_datasets if name in raw_data}
+    if not raw_dfs:
+        msg = f"No source datasets could be loaded for {spec.domain}"
+        raise ValueError(msg)
+
+    domain = spec.domain.upper()
+    if domain in _FINDINGS_DOMAINS:
+        from astraea.execution.findings import FindingsExecutor
+
+        findings_executor = FindingsExecutor(sdtm_ref=sdtm_ref, ct_ref=ct_ref)
+        execute_method = {
+            "LB": findings_executor.execute_lb,
+            "VS": findings_executor.execute_vs,
+            "EG": findings_executor.execute_eg,
+        }[domain]
+        return execute_method(  # type: ignore[operator]
+            spec, raw_dfs, cross_domain=cross_domain, study_id=spec.study_id
+        )
+
+    executor = DatasetExecutor(sdtm_ref=sdtm_ref, ct_ref=ct_ref)
+    main_df = executor.execute(spec, raw_dfs, cross_domain=cross_domain, study_id=spec.study_id)
+    return main_df, None
+
+
+class StudyExecutor:
+    """Executes all domain mapping specs of a study in dependency waves.
+
+    Args:
+        sdtm_ref: SDTM-IG reference for domain specs.
+        ct_ref: Controlled terminology reference for codelist lookups.
+        max_workers: Worker processes per wave. ``1`` executes in-process
+            without a pool; ``None`` uses ``os.cpu_count()``.
+        verify_readback: Read each written XPT back in full to verify it.
+    """
+
+    def __init__(
+        self,
+        *,
+        sdtm_ref: SDTMReference | None = None,
+        ct_ref: CTReference | None = None,
+        max_workers: int | None = None,
+        verify_readback: bool = False,
+    ) -> None:
+        self.sdtm_ref = sdtm_ref
+        self.ct_ref = ct_ref
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.verify_readback = verify_readback
+
+    def execute_study(
+        self,
+        specs: list[DomainMappingSpec],
+        raw_data: dict[str, pd.DataFrame],
+        output_dir: Path,
+    ) -> list[StudyDomainResult]:
+        """Execute every spec and write one XPT (plus SUPPQUAL) per domain.
+
+        A failing domain is recorded in its StudyDomainResult and does not
+        stop the run; dependents of a failed context domain run without the
+        context that domain would have supplied.
+
+        Args:
+            specs: Domain mapping specs for the study.
+            raw_data: Source dataset name -> raw DataFrame, shared by all domains
+                (see ``load_study_sources``).
+            output_dir: Directory to write ``<domain>.xpt`` files into.
+
+        Returns:
+            One StudyDomainResult per spec, in wave order then domain order.
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        waves = plan_study_waves(specs)
+        results: list[StudyDomainResult] = []
+        context_dfs: dict[str, pd.DataFrame] = {}
+        cross_domain: CrossDomainContext | None = None
+
+        for wave_index, wave in enumerate(waves):
+            logger.info(
+                "Study wave {}: {} domain(s) ({})",
+                wave_index,
+                len(wave),
+                ", ".join(s.domain.upper() for s in wave),
+            )
+            outcomes = self._run_wave(wave, raw_data, cross_domain)
+
+            for spec, outcome in zip(wave, outcomes, strict=True):
+                domain = spec.domain.upper()
+                if isinstance(outcome, BaseException):
+                    logger.error("Study execution failed for {}: {}", domain, outcome)
+                    results.append(
+                        StudyDomainResult(domain=domain, wave=wave_index, error=str(outcome))
+                    )
+                    continue
+
+                main_df, supp_df = outcome
+                if domain in _CONTEXT_DOMAINS:
+                    context_dfs[domain] = main_df
+                results.append(
+                    self._write_domain(
+                        spec,
+                        main_df,
+                        supp_df,
+                        output_dir,
+                        wave_index,
+                        verify_readback=self.verify_readback,
+                    )
+                )
+
+            cross_domain = build_study_context(context_dfs)
+
+        return results
+
+    def _run_wave(
+        self,
+        wave: list[DomainMappingSpec],
+        raw_data: dict[str, pd.DataFrame],
+        cross_domain: CrossDomainContext | None,
+    ) -> list[tuple[pd.DataFrame, pd.DataFrame | None] | BaseException]:
+        """Execute a wave of independent specs, preserving spec order in the result."""
+        workers = min(self.max_workers, len(wave))
+
+        if workers <= 1:
+            _init_worker(raw_data, self.sdtm_ref, self.ct_ref)
+            outcomes: list[tuple[pd.DataFrame, pd.DataFrame | None] | BaseException] = []
+            for spec in wave:
+                try:
+                    outcomes.append(_execute_domain_task(spec, cross_domain))
+                except Exception as exc:
+                    outcomes.append(exc)
+            return outcomes
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(raw_data, self.sdtm_ref, self.ct_ref),
+        ) as pool:
+            futures = [pool.submit(_execute_domain_task, spec, cross_domain) for spec in wave]
+            outcomes = []
+            for future in futures:
+                try:
+                    outcomes.append(future.result())
+                except Exception as exc:
+                    outcomes.append(exc)
+            return outcomes
+
+    @staticmethod
+    def _write_domain(
+        spec: DomainMappingSpec,
+        main_df: pd.DataFrame,
+        supp_df: pd.DataFrame | None,
+        output_dir: Path,
+        wave_index: int,
+        *,
+        verify_readback: bool = False,
+    ) -> StudyDomainResult:
+        """Write the main, SUPPQUAL and (for LB) LC XPT files for one executed domain."""
+        from astraea.execution.lc_domain import (
+            LC_XPT_TABLE_LABEL,
+            generate_lc_from_lb,
+            get_lb_to_lc_rename_map,
+        )
+        from astraea.io.xpt_writer import write_xpt_v5
+
+        domain = spec.domain.upper()
+        column_labels = {
+            m.sdtm_variable: m.sdtm_label
+            for m in spec.variable_mappings
+            if m.sdtm_variable in main_df.columns
+        }
+
+        try:
+            xpt_path = output_dir / f"{domain.lower()}.xpt"
+            write_xpt_v5(
+                main_df,
+                xpt_path,
+                table_name=domain,
+                column_labels=column_labels,
+                table_label=spec.domain_label,
+                verify_readback=verify_readback,
+            )
+
+            supp_path: Path | None = None
+            if supp_df is not None and not supp_df.empty:
+                supp_path = output_dir / f"supp{domain.lower()}.xpt"
+                write_xpt_v5(
+                    supp_df,
+                    supp_path,
+                    table_name=f"SUPP{domain}",
+                    column_labels=SUPPQUAL_COLUMN_LABELS,
+                    table_label=f"Supplemental Qualifiers for {domain}",
+                    verify_readback=verify_readback,
+                )
+
+            lc_path: Path | None = None
+            if domain == "LB":
+                # Same as execute-domain: LC is a structural copy of LB, and
+                # generate_lc_from_lb logs that no unit conversion was done.
+                lc_df, _lc_warnings = generate_lc_from_lb(main_df, spec.study_id)
+                lc_rename = get_lb_to_lc_rename_map(list(main_df.columns))
+                lc_labels = {lc_rename.get(col, col): label for col, label in column_labels.items()}
+                lc_path = output_dir / "lc.xpt"
+                write_xpt_v5(
+                    lc_df,
+                    lc_path,
+                    table_name="LC",
+                    column_labels=lc_labels,
+                    table_label=LC_XPT_TABLE_LABEL,
+                    verify_readback=verify_readback,
+                )
+        except Exception as exc:
+            logger.error("Failed to write XPT for {}: {}", domain, exc)
+            return StudyDomainResult(
+                domain=domain, wave=wave_index, row_count=len(main_df), error=str(exc)
+            )
+
+        return StudyDomainResult(
+            domain=domain,
+            wave=wave_index,
+            row_count=len(main_df),
+            output_path=xpt_path,
+            supp_output_path=supp_path,
+            lc_output_path=lc_path,
+        )
@@ -12,10 +12,72 @@ Exports:
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 
 
+def _none_if_null(series: pd.Series) -> pd.Series:
+    """Object Series with nulls as None, matching frames built from record dicts."""
+    return series.astype(object).where(series.notna(), None)
+
+
+def _aggregate_visit_dates(
+    df: pd.DataFrame,
+    subject_col: str,
+    folder_seq_col: str | None,
+    date_cols: list[str],
+) -> pd.DataFrame:
+    """Earliest and latest date per (subject, visit) group of one raw DataFrame.
+
+    Date columns are stringified column by column, melted into a single
+    value column, factorized in sort order and reduced with one grouped
+    min/max over the integer codes, so the cost scales
+    with rows rather than with the number of subject-visit groups. Groups
+    without any date value get None for both dates.
+    """
+    group_cols = [subject_col, "InstanceName", "FolderName"]
+    if folder_seq_col:
+        group_cols.append(folder_seq_col)
+
+    df = df.loc[df[subject_col].notna() & df["InstanceName"].notna()]
+    if df.empty:
+        return pd.DataFrame()
+
+    # Compare dates as strings, as they appear in each source column
+    dates = pd.DataFrame(
+        {
+            f"_date{i}": df[col].astype(str).where(df[col].notna())
+            for i, col in enumerate(date_cols)
+        },
+        index=df.index,
+    )
+    if dates.empty:
+        dates["_date0"] = pd.Series(None, index=df.index, dtype=object)
+    keys = pd.DataFrame({f"_key{i}": df[col] for i, col in enumerate(group_cols)})
+    melted = pd.concat([keys, dates], axis=1).melt(id_vars=list(keys.columns), value_name="_date")
+
+    # Sorted factorization: min/max over integer codes is min/max over strings
+    codes, uniques = pd.factorize(melted["_date"], sort=True)
+    melted["_date"] = np.where(codes >= 0, codes, np.nan)
+    grouped = melted.groupby(list(keys.columns), dropna=False, sort=True)["_date"]
+    visits = grouped.agg(["min", "max"]).reset_index()
+    lookup = np.append(np.asarray(uniques, dtype=object), None)
+    for stat in ("min", "max"):
+        visits[stat] = lookup[visits[stat].fillna(-1).to_numpy(dtype=np.int64)]
+
+    return pd.DataFrame(
+        {
+            "subject_id": visits["_key0"].astype(str),
+            "visit_name": visits["_key1"].astype(str),
+            "visit_folder": visits["_key2"].astype(str),
+            "visit_seq": visits["_key3"].astype(float) if folder_seq_col else None,
+            "earliest_date": _none_if_null(visits["min"]),
+            "latest_date": _none_if_null(visits["max"]),
+        }
+    )
+
+
 def extract_visit_dates(
     raw_dfs: dict[str, pd.DataFrame],
     date_cols: list[str] | None = None,
@@ -25,7 +87,8 @@ def extract_visit_dates(
     Scans all raw DataFrames for visit metadata columns (InstanceName,
     FolderName, FolderSeq) and a subject identifier (Subject or USUBJID).
     For each unique (subject, visit) tuple, finds the earliest and latest
-    date values from any date-like column.
+    date values from any date-like column, with one melt and one grouped
+    min/max per raw DataFrame.
 
     Args:
         raw_dfs: Dictionary of source dataset name -> DataFrame.
@@ -46,7 +109,7 @@ def extract_visit_dates(
         "latest_date",
     ]
 
-    visit_records: list[dict[str, object]] = []
+    visit_frames: list[pd.DataFrame] = []
 
     for ds_name, df in raw_dfs.items():
         # Check for required visit metadata columns
@@ -76,55 +139,21 @@ def extract_visit_dates(
         # Determine FolderSeq column
         folder_seq_col = "FolderSeq" if "FolderSeq" in df.columns else None
 
-        # Group by subject + visit
-        group_cols = [subject_col, "InstanceName", "FolderName"]
-        if folder_seq_col:
-            group_cols.append(folder_seq_col)
-
-        for group_key, group_df in df.groupby(group_cols, dropna=False):
-            if folder_seq_col:
-                subj, inst, folder, seq = group_key
-            else:
-                subj, inst, folder = group_key
-                seq = None
-
-            if pd.isna(subj) or pd.isna(inst):
-                continue
-
-            # Find earliest and latest dates
-            earliest: str | None = None
-            latest: str | None = None
-
-            for dcol in det_date_cols:
-                col_values = group_df[dcol].dropna()
-                if col_values.empty:
-                    continue
-
-                col_strs = col_values.astype(str)
-                col_min = col_strs.min()
-                col_max = col_strs.max()
-
-                if earliest is None or col_min < earliest:
-                    earliest = col_min
-                if latest is None or col_max > latest:
-                    latest = col_max
-
-            visit_records.append(
-                {
-                    "subject_id": str(subj),
-                    "visit_name": str(inst),
-                    "visit_folder": str(folder),
-                    "visit_seq": float(seq) if seq is not None and not pd.isna(seq) else None,
-                    "earliest_date": earliest,
-                    "latest_date": latest,
-                }
-            )
-
-    if not visit_records:
+        visits = _aggregate_visit_dates(df, subject_col, folder_seq_col, det_date_cols)
+        if not visits.empty:
+            visit_frames.append(visits)
+
+    if not visit_frames:
         logger.info("No visit metadata found in {} raw DataFrames", len(raw_dfs))
         return pd.DataFrame(columns=result_columns)
 
-    result = pd.DataFrame(visit_records, columns=result_columns)
+    result = pd.DataFrame(
+        {
+            col: np.concatenate([frame[col].to_numpy(dtype=object) for frame in visit_frames])
+            for col in result_columns
+        }
+    )
+    result["visit_seq"] = _none_if_null(result["visit_seq"]).infer_objects()
 
     # Deduplicate: keep the widest date range per subject+visit
     dedup_key = ["subject_id", "visit_name"]
@@ -184,34 +213,35 @@ def build_sv_domain(
         logger.info("No visit data provided -- returning empty SV domain")
         return pd.DataFrame(columns=sv_columns)
 
-    rows: list[dict[str, object]] = []
-
-    for _, row in visit_data.iterrows():
-        subj_id = str(row["subject_id"])
-
-        if usubjid_lookup is not None:
-            usubjid = usubjid_lookup.get(subj_id, f"{study_id}-{subj_id}")
-        else:
-            usubjid = f"{study_id}-{subj_id}"
-
-        visitnum = row["visit_seq"] if pd.notna(row.get("visit_seq")) else None
-        svstdtc = row["earliest_date"] if pd.notna(row.get("earliest_date")) else ""
-        svendtc = row["latest_date"] if pd.notna(row.get("latest_date")) else ""
-
-        rows.append(
-            {
-                "STUDYID": study_id,
-                "DOMAIN": "SV",
-                "USUBJID": usubjid,
-                "VISITNUM": visitnum,
-                "VISIT": str(row["visit_name"]) if pd.notna(row.get("visit_name")) else "",
-                "SVSTDTC": svstdtc,
-                "SVENDTC": svendtc,
-                "SVUPDES": "",
-            }
-        )
-
-    sv_df = pd.DataFrame(rows, columns=sv_columns[:-1])  # Without SVSEQ initially
+    subj_id = visit_data["subject_id"].astype(str)
+    default_usubjid = study_id + "-" + subj_id
+    if usubjid_lookup is not None:
+        usubjid = subj_id.map(usubjid_lookup).fillna(default_usubjid)
+    else:
+        usubjid = default_usubjid
+
+    def _column(name: str) -> pd.Series:
+        if name in visit_data.columns:
+            return visit_data[name]
+        return pd.Series(None, index=visit_data.index, dtype=object)
+
+    earliest = _column("earliest_date")
+    latest = _column("latest_date")
+    visit_name = _column("visit_name")
+
+    sv_df = pd.DataFrame(
+        {
+            "STUDYID": study_id,
+            "DOMAIN": "SV",
+            "USUBJID": usubjid,
+            "VISITNUM": _none_if_null(_column("visit_seq")).infer_objects(),
+            "VISIT": visit_name.astype(str).where(visit_name.notna(), ""),
+            "SVSTDTC": earliest.astype(object).where(earliest.notna(), ""),
+            "SVENDTC": latest.astype(object).where(latest.notna(), ""),
+            "SVUPDES": "",
+        },
+        columns=sv_columns[:-1],  # Without SVSEQ initially
+    ).reset_index(drop=True)
 
     # Sort by STUDYID, USUBJID, VISITNUM
     sort_cols = ["STUDYID", "USUBJID"]
@@ -11,11 +11,50 @@ LLM-generated, per the architecture guidelines in PITFALLS.md (C4).
 
 from __future__ import annotations
 
+from collections.abc import Callable
+
+import numpy as np
 import pandas as pd
 from loguru import logger
 
 from astraea.models.suppqual import SuppVariable
 
+# XPT column labels of a SUPP-- dataset
+SUPPQUAL_COLUMN_LABELS: dict[str, str] = {
+    "STUDYID": "Study Identifier",
+    "RDOMAIN": "Related Domain Abbreviation",
+    "USUBJID": "Unique Subject Identifier",
+    "IDVAR": "Identifying Variable",
+    "IDVARVAL": "Identifying Variable Value",
+    "QNAM": "Qualifier Variable Name",
+    "QLABEL": "Qualifier Variable Label",
+    "QVAL": "Data Value",
+    "QORIG": "Origin",
+    "QEVAL": "Evaluator",
+}
+
+
+def _distinct_map(
+    series: pd.Series,
+    func: Callable[[object], str],
+    where: np.ndarray | None = None,
+) -> np.ndarray:
+    """Apply ``func`` once per distinct non-null value and broadcast it back.
+
+    Null rows, and rows outside ``where`` when given, map to "".
+    """
+    codes, uniques = pd.factorize(series)
+    if where is not None:
+        codes = np.where(where, codes, -1)
+    used = np.zeros(len(uniques), dtype=bool)
+    used[codes[codes >= 0]] = True
+    # Trailing "" is what code -1 (null / excluded) indexes
+    mapped = np.array(
+        [func(v) if u else "" for v, u in zip(uniques, used, strict=True)] + [""],
+        dtype=object,
+    )
+    return mapped[codes]
+
 
 def generate_suppqual(
     parent_df: pd.DataFrame,
@@ -29,6 +68,11 @@ def generate_suppqual(
     source column value is non-null and non-empty, creates a SUPPQUAL
     record with proper referential integrity linkage.
 
+    The source columns are melted column by column into candidate records,
+    filtered with vectorized null/blank masks, then ordered row-major (each
+    parent row's records in ``supp_variables`` order). String conversion of
+    QVAL, USUBJID and IDVARVAL runs once per distinct value.
+
     Args:
         parent_df: Finalized parent domain DataFrame (must have USUBJID
             and {domain}SEQ columns).
@@ -69,47 +113,55 @@ def generate_suppqual(
         logger.error("Parent DataFrame missing {} column", seq_var)
         return pd.DataFrame(columns=supp_columns)
 
-    records: list[dict[str, str]] = []
-
-    for _, row in parent_df.iterrows():
-        usubjid = row.get("USUBJID")
-        seq_val = row.get(seq_var)
-
-        if pd.isna(usubjid) or pd.isna(seq_val):
+    # Parent rows that can anchor a SUPPQUAL record
+    usubjid = parent_df["USUBJID"]
+    seq = parent_df[seq_var]
+    anchored = (usubjid.notna() & seq.notna()).to_numpy()
+
+    # Melt the source columns: one candidate record per (row, supp variable)
+    row_blocks: list[np.ndarray] = []
+    var_blocks: list[np.ndarray] = []
+    qval_blocks: list[np.ndarray] = []
+    for k, sv in enumerate(supp_variables):
+        if sv.source_col not in parent_df.columns:
             continue
-
-        # Convert SEQ to string integer (no decimals)
-        idvarval = str(int(seq_val))
-
-        for sv in supp_variables:
-            source_val = row.get(sv.source_col)
-
-            # Skip null/empty values
-            if pd.isna(source_val):
-                continue
-            str_val = str(source_val).strip()
-            if not str_val:
-                continue
-
-            records.append(
-                {
-                    "STUDYID": study_id,
-                    "RDOMAIN": domain_upper,
-                    "USUBJID": str(usubjid),
-                    "IDVAR": seq_var,
-                    "IDVARVAL": idvarval,
-                    "QNAM": sv.qnam[:8],
-                    "QLABEL": sv.qlabel[:40],
-                    "QVAL": str_val,
-                    "QORIG": sv.qorig,
-                    "QEVAL": sv.qeval,
-                }
-            )
-
-    if not records:
+        source = parent_df[sv.source_col]
+        values = _distinct_map(source, lambda v: str(v).strip(), anchored)
+        rows = np.flatnonzero(anchored & source.notna().to_numpy() & (values != ""))
+        row_blocks.append(rows)
+        var_blocks.append(np.full(len(rows), k))
+        qval_blocks.append(values[rows])
+
+    n_records = sum(len(rows) for rows in row_blocks)
+    if not n_records:
         return pd.DataFrame(columns=supp_columns)
 
-    result = pd.DataFrame(records, columns=supp_columns)
+    # Row-major order: each parent row's records in supp_variables order
+    rows = np.concatenate(row_blocks)
+    var_idx = np.concatenate(var_blocks)
+    order = np.lexsort((var_idx, rows))
+    rows = rows[order]
+    var_idx = var_idx[order]
+
+    def _per_variable(values: list[str]) -> np.ndarray:
+        return np.array(values, dtype=object)[var_idx]
+
+    result = pd.DataFrame(
+        {
+            "STUDYID": np.full(n_records, study_id, dtype=object),
+            "RDOMAIN": np.full(n_records, domain_upper, dtype=object),
+            "USUBJID": _distinct_map(usubjid, str, anchored)[rows],
+            "IDVAR": np.full(n_records, seq_var, dtype=object),
+            # Convert SEQ to string integer (no decimals)
+            "IDVARVAL": _distinct_map(seq, lambda v: str(int(v)), anchored)[rows],
+            "QNAM": _per_variable([sv.qnam[:8] for sv in supp_variables]),
+            "QLABEL": _per_variable([sv.qlabel[:40] for sv in supp_variables]),
+            "QVAL": np.concatenate(qval_blocks)[order],
+            "QORIG": _per_variable([sv.qorig for sv in supp_variables]),
+            "QEVAL": _per_variable([sv.qeval for sv in supp_variables]),
+        },
+        columns=supp_columns,
+    )
 
     logger.info(
         "Generated SUPP{}: {} records from {} parent rows, {} supp variables",
@@ -166,22 +218,22 @@ def validate_suppqual_integrity(
 
     # Check 3: Every IDVARVAL exists in parent SEQ
     if "IDVARVAL" in supp_df.columns and seq_var in parent_df.columns:
-        parent_seqs = set(str(int(v)) for v in parent_df[seq_var].dropna())
-        supp_idvarvals = set(supp_df["IDVARVAL"].dropna().unique())
-        orphans = supp_idvarvals - parent_seqs
-        for orphan in sorted(orphans):
-            errors.append(
-                f"Orphaned SUPPQUAL record: IDVARVAL='{orphan}' not found in parent {seq_var}"
-            )
+        parent_seqs = pd.Index([str(int(v)) for v in parent_df[seq_var].dropna().unique()])
+        supp_idvarvals = pd.Index(supp_df["IDVARVAL"].dropna().unique())
+        orphans = supp_idvarvals[~supp_idvarvals.isin(parent_seqs)].sort_values()
+        errors.extend(
+            f"Orphaned SUPPQUAL record: IDVARVAL='{orphan}' not found in parent {seq_var}"
+            for orphan in orphans
+        )
 
     # Check 4: No duplicate QNAM within same (USUBJID, IDVARVAL)
     if all(c in supp_df.columns for c in ("USUBJID", "IDVARVAL", "QNAM")):
         dups = supp_df.groupby(["USUBJID", "IDVARVAL", "QNAM"]).size()
         dup_entries = dups[dups > 1]
-        for (usubjid, idvarval, qnam), count in dup_entries.items():
-            errors.append(
-                f"Duplicate QNAM '{qnam}' for USUBJID='{usubjid}', "
-                f"IDVARVAL='{idvarval}' ({count} occurrences)"
-            )
+        errors.extend(
+            f"Duplicate QNAM '{qnam}' for USUBJID='{usubjid}', "
+            f"IDVARVAL='{idvarval}' ({count} occurrences)"
+            for (usubjid, idvarval, qnam), count in dup_entries.items()
+        )
 
     return errors
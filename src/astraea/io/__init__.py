@@ -1,12 +1,43 @@
-"""SAS reader and XPT writer using pyreadstat."""
+"""SAS reader (pyreadstat) and native streaming XPT v5 writer."""
 
-from astraea.io.sas_reader import read_all_sas_files, read_sas_with_metadata
-from astraea.io.xpt_writer import XPTValidationError, validate_for_xpt_v5, write_xpt_v5
+from astraea.io.sas_cache import SASReadCache
+from astraea.io.sas_reader import (
+    SASFileRead,
+    iter_sas_chunks,
+    read_all_sas_files,
+    read_sas_directory,
+    read_sas_metadata,
+    read_sas_with_metadata,
+)
+from astraea.io.xpt_writer import (
+    XPTColumn,
+    XPTStreamWriter,
+    XPTValidationError,
+    XPTWriteResult,
+    ieee_to_ibm,
+    validate_for_xpt_v5,
+    verify_xpt_header,
+    verify_xpt_readback,
+    write_xpt_v5,
+    xpt_columns_for,
+)
 
 __all__ = [
     "read_sas_with_metadata",
     "read_all_sas_files",
+    "read_sas_directory",
+    "SASFileRead",
+    "read_sas_metadata",
+    "iter_sas_chunks",
+    "SASReadCache",
     "write_xpt_v5",
     "validate_for_xpt_v5",
     "XPTValidationError",
+    "XPTStreamWriter",
+    "XPTColumn",
+    "XPTWriteResult",
+    "xpt_columns_for",
+    "verify_xpt_header",
+    "verify_xpt_readback",
+    "ieee_to_ibm",
 ]
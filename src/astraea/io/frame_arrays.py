@@ -0,0 +1,170 @@
+"""Pickle-free on-disk format for DataFrames: one NumPy array per column.
+
+Used wherever astraea writes a DataFrame to disk only to read it back
+itself: the SAS read cache, and the executed subject batches that
+partitioned Findings execution spills before writing XPT. Frames are stored column by column
+in an uncompressed ``.npz`` archive and loaded with ``allow_pickle=False``,
+so a stored frame is plain data and can never execute code.
+
+Column encodings:
+
+- NumPy numeric, boolean and datetime columns: their native array.
+- Nullable numeric columns (``Int64``, ``Float64``, ``boolean``): the
+  values with nulls filled, plus a null mask.
+- Object columns of ``str``: int32 codes per row plus the distinct
+  strings as one UTF-8 buffer with offsets. Nulls keep whether they were
+  None, NaN or pd.NA, per row if the column mixes them.
+
+Frames with any other column type, a non-default index, or duplicate or
+non-string column names raise UnsupportedFrameError.
+
+Exports:
+    UnsupportedFrameError: The frame has something the format cannot store.
+    encode_frame: Split a frame into plain arrays and a JSON-able schema.
+    decode_frame: Rebuild the frame from ``encode_frame`` output.
+    save_frame: Write a frame (schema included) to one ``.npz`` file.
+    load_frame: Read a frame written by ``save_frame``.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+# Null markers of object text columns, by the index stored in the schema
+_NULLS: tuple[Any, ...] = (None, np.nan, pd.NA)
+
+_SCHEMA_KEY = "schema"
+
+
+class UnsupportedFrameError(ValueError):
+    """The frame has a column type or layout the format does not store."""
+
+
+def _null_kind(value: Any) -> int:
+    for i, null in enumerate(_NULLS):
+        if value is null or (null is np.nan and isinstance(value, float)):
+            return i
+    msg = f"null value {value!r} is not None, NaN or pd.NA"
+    raise UnsupportedFrameError(msg)
+
+
+def _encode_text(
+    arrays: dict[str, np.ndarray], prefix: str, codes: np.ndarray, uniques: Any
+) -> None:
+    lengths = np.fromiter((len(v) for v in uniques), dtype=np.int64, count=len(uniques))
+    arrays[f"{prefix}.codes"] = codes.astype(np.int32)
+    arrays[f"{prefix}.text"] = np.frombuffer("".join(uniques).encode("utf-8"), dtype=np.uint8)
+    arrays[f"{prefix}.offsets"] = np.concatenate(([0], np.cumsum(lengths)))
+
+
+def _decode_text(archive: Any, prefix: str) -> list[str]:
+    text = archive[f"{prefix}.text"].tobytes().decode("utf-8")
+    offsets = archive[f"{prefix}.offsets"].tolist()
+    return [text[start:end] for start, end in zip(offsets, offsets[1:], strict=False)]
+
+
+def encode_frame(df: pd.DataFrame) -> tuple[dict[str, np.ndarray], dict[str, Any]]:
+    """Split ``df`` into plain arrays and a JSON-able schema.
+
+    Raises:
+        UnsupportedFrameError: If the frame has a non-default index,
+            duplicate or non-string column names, or a column of a type
+            listed in the module docstring as unsupported.
+    """
+    if not isinstance(df.index, pd.RangeIndex) or df.index.start != 0 or df.index.step != 1:
+        raise UnsupportedFrameError("index is not a default RangeIndex")
+    if df.columns.has_duplicates:
+        raise UnsupportedFrameError("column names are not unique")
+
+    arrays: dict[str, np.ndarray] = {}
+    columns: list[dict[str, Any]] = []
+    for i, (name, series) in enumerate(df.items()):
+        if not isinstance(name, str):
+            raise UnsupportedFrameError(f"column name {name!r} is not a string")
+        prefix = f"c{i}"
+        dtype = series.dtype
+        if isinstance(dtype, np.dtype) and dtype.kind in "biufcmM":
+            arrays[prefix] = series.to_numpy()
+            columns.append({"name": name, "kind": "array"})
+        elif pd.api.types.is_extension_array_dtype(dtype) and dtype.kind in "biuf":
+            mask = series.isna().to_numpy()
+            arrays[prefix] = series.to_numpy(dtype=dtype.numpy_dtype, na_value=0)
+            arrays[f"{prefix}.mask"] = mask
+            columns.append({"name": name, "kind": "masked", "dtype": str(dtype)})
+        elif pd.api.types.is_object_dtype(dtype) and pd.api.types.infer_dtype(
+            series, skipna=True
+        ) in ("string", "empty"):
+            codes, uniques = pd.factorize(series)
+            _encode_text(arrays, prefix, codes, uniques)
+            kinds = np.fromiter(
+                (_null_kind(v) for v in series.to_numpy()[codes < 0]), dtype=np.int8
+            )
+            column: dict[str, Any] = {"name": name, "kind": "strings"}
+            if len(np.unique(kinds)) > 1:
+                null_kinds = np.zeros(len(series), dtype=np.int8)
+                null_kinds[codes < 0] = kinds
+                arrays[f"{prefix}.nulls"] = null_kinds
+            else:
+                column["null"] = int(kinds[0]) if len(kinds) else 0
+            columns.append(column)
+        else:
+            raise UnsupportedFrameError(f"column {name} has dtype {dtype} or non-string values")
+
+    return arrays, {"rows": len(df), "columns": columns}
+
+
+def decode_frame(archive: Any, schema: dict[str, Any]) -> pd.DataFrame:
+    """Rebuild the DataFrame written by ``encode_frame``.
+
+    Args:
+        archive: Mapping of array name -> array, e.g. an open ``np.load``.
+        schema: The schema ``encode_frame`` returned with the arrays.
+    """
+    rows = schema["rows"]
+    data: dict[str, Any] = {}
+    for i, column in enumerate(schema["columns"]):
+        prefix = f"c{i}"
+        name = column["name"]
+        kind = column["kind"]
+        if kind == "array":
+            data[name] = archive[prefix]
+        elif kind == "masked":
+            values = pd.array(archive[prefix], dtype=column["dtype"])
+            values[archive[f"{prefix}.mask"]] = pd.NA
+            data[name] = values
+        else:
+            codes = archive[f"{prefix}.codes"]
+            # Trailing null is what code -1 (missing) indexes
+            uniques = np.array([*_decode_text(archive, prefix), None], dtype=object)
+            values = uniques[codes]
+            if f"{prefix}.nulls" in archive:
+                null_kinds = archive[f"{prefix}.nulls"]
+                for kind_index in range(1, len(_NULLS)):
+                    values[(codes < 0) & (null_kinds == kind_index)] = _NULLS[kind_index]
+            elif column["null"]:
+                values[codes < 0] = _NULLS[column["null"]]
+            data[name] = values
+    return pd.DataFrame(data, index=pd.RangeIndex(rows))
+
+
+def save_frame(path: str | Path, df: pd.DataFrame) -> None:
+    """Write ``df`` to ``path`` as one ``.npz`` archive holding its schema.
+
+    Raises:
+        UnsupportedFrameError: If ``encode_frame`` cannot store the frame.
+    """
+    arrays, schema = encode_frame(df)
+    with open(path, "wb") as f:
+        np.savez(f, **arrays, **{_SCHEMA_KEY: np.array(json.dumps(schema))})
+
+
+def load_frame(path: str | Path) -> pd.DataFrame:
+    """Read a DataFrame written by ``save_frame``; never unpickles."""
+    with np.load(path, allow_pickle=False) as archive:
+        schema = json.loads(archive[_SCHEMA_KEY].item())
+        return decode_frame(archive, schema)
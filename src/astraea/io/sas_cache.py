@@ -0,0 +1,229 @@
+"""Persistent on-disk cache for decoded SAS datasets.
+
+Decoding .sas7bdat files with pyreadstat dominates the runtime of every
+command that touches raw data, and the same files are re-read by profile,
+classify, map-domain, execute-domain and generate-trial-design. The cache
+stores each decoded DataFrame together with its DatasetMetadata, keyed by
+the source file's resolved path, size and modification time, so an edited
+or replaced file is never served stale.
+
+Frames are stored in the pickle-free ``.npz`` format of
+``astraea.io.frame_arrays``, so a cache entry is plain data and can never
+execute code. Frames that format cannot hold (pyreadstat produces none)
+are not cached.
+
+The default cache lives in the per-user cache directory
+(``$XDG_CACHE_HOME/astraea/sas_cache``, else ``~/.cache/astraea/sas_cache``)
+and is created with mode 0700. A cache directory that is not owned by the
+current user, or is writable by group or others, is ignored.
+
+The cache is bounded by total size on disk. When a write pushes it over
+the limit, the least recently used entries are evicted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import stat
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from astraea.io.frame_arrays import UnsupportedFrameError, decode_frame, encode_frame
+from astraea.models.metadata import DatasetMetadata
+
+
+def default_sas_cache_dir() -> Path:
+    """Per-user SAS read cache directory."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "astraea" / "sas_cache"
+
+
+DEFAULT_MAX_CACHE_BYTES = 4 * 1024**3
+
+_FRAME_SUFFIX = ".npz"
+_META_SUFFIX = ".json"
+_TMP_SUFFIX = ".tmp"
+
+
+class SASReadCache:
+    """Size-bounded LRU cache of decoded SAS files.
+
+    Each entry is a pair of files named by the cache key: ``<key>.npz``
+    holds the DataFrame's columns and ``<key>.json`` holds the
+    DatasetMetadata and the column schema. The JSON file is written last,
+    so its presence marks a complete entry. Its mtime records when the
+    entry was last used.
+
+    Args:
+        cache_dir: Directory holding cache entries (created with mode 0700
+            on first write). Defaults to ``default_sas_cache_dir()``.
+        max_bytes: Upper bound on the total size of all entries.
+
+    Raises:
+        ValueError: If max_bytes is not positive.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        max_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+    ) -> None:
+        if max_bytes <= 0:
+            msg = f"max_bytes must be positive, got {max_bytes}"
+            raise ValueError(msg)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else default_sas_cache_dir()
+        self.max_bytes = max_bytes
+
+    def get(self, filepath: str | Path) -> tuple[pd.DataFrame, DatasetMetadata] | None:
+        """Return the cached read of ``filepath``, or None on a miss.
+
+        Entries that cannot be loaded are discarded and reported as a miss.
+        """
+        key = self.key_for(filepath)
+        frame_path, meta_path = self._paths(key)
+        if not meta_path.exists() or not frame_path.exists() or not self._is_trusted():
+            return None
+
+        try:
+            entry = json.loads(meta_path.read_text())
+            meta = DatasetMetadata.model_validate(entry["metadata"])
+            with np.load(frame_path, allow_pickle=False) as archive:
+                df = decode_frame(archive, entry["schema"])
+        except Exception as e:
+            logger.warning("Discarding unreadable SAS cache entry {}: {}", key, e)
+            self._remove(key)
+            return None
+
+        # Bump recency for LRU eviction
+        now = time.time()
+        os.utime(meta_path, (now, now))
+        return df, meta
+
+    def put(self, filepath: str | Path, df: pd.DataFrame, meta: DatasetMetadata) -> None:
+        """Store a decoded read of ``filepath``, then evict down to ``max_bytes``.
+
+        Failures to write (e.g. a full disk) and frames the format cannot
+        hold are logged and otherwise ignored -- the cache never makes a
+        read fail.
+        """
+        key = self.key_for(filepath)
+        frame_path, meta_path = self._paths(key)
+        tmp_frame = frame_path.with_suffix(f".{os.getpid()}{_TMP_SUFFIX}")
+        tmp_meta = meta_path.with_suffix(f".{os.getpid()}.meta{_TMP_SUFFIX}")
+
+        try:
+            arrays, schema = encode_frame(df)
+        except UnsupportedFrameError as e:
+            logger.debug("Not caching {}: {}", Path(filepath).name, e)
+            return
+
+        try:
+            self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if not self._is_trusted():
+                return
+            with open(tmp_frame, "wb") as f:
+                np.savez(f, **arrays)
+            entry = {"metadata": meta.model_dump(mode="json"), "schema": schema}
+            tmp_meta.write_text(json.dumps(entry))
+            os.replace(tmp_frame, frame_path)
+            os.replace(tmp_meta, meta_path)
+        except OSError as e:
+            logger.warning("Could not write SAS cache entry for {}: {}", Path(filepath).name, e)
+            tmp_frame.unlink(missing_ok=True)
+            tmp_meta.unlink(missing_ok=True)
+            return
+
+        self._evict()
+
+    def clear(self) -> int:
+        """Delete every cache entry.
+
+        Returns:
+            Number of entries removed.
+        """
+        if not self.cache_dir.is_dir():
+            return 0
+        removed = 0
+        for path in self.cache_dir.iterdir():
+            if path.suffix in (_FRAME_SUFFIX, _META_SUFFIX, _TMP_SUFFIX):
+                if path.suffix == _META_SUFFIX:
+                    removed += 1
+                path.unlink(missing_ok=True)
+        logger.info("Cleared {} SAS cache entries from {}", removed, self.cache_dir)
+        return removed
+
+    def total_bytes(self) -> int:
+        """Total size of all complete cache entries on disk."""
+        return sum(size for _used, size, _key in self._entries())
+
+    def key_for(self, filepath: str | Path) -> str:
+        """Cache key for ``filepath``: resolved path + size + mtime.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        path = Path(filepath).resolve()
+        st = path.stat()
+        raw = f"{path}|{st.st_size}|{st.st_mtime_ns}"
+        return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+    def _is_trusted(self) -> bool:
+        """Whether the cache directory is owned by this user and not writable by others."""
+        try:
+            st = self.cache_dir.stat()
+        except OSError:
+            return False
+        owner_ok = not hasattr(os, "getuid") or st.st_uid == os.getuid()
+        if owner_ok and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            return True
+        logger.warning(
+            "Ignoring SAS cache at {}: it must be owned by the current user and not "
+            "writable by group or others",
+            self.cache_dir,
+        )
+        return False
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return (
+            self.cache_dir / f"{key}{_FRAME_SUFFIX}",
+            self.cache_dir / f"{key}{_META_SUFFIX}",
+        )
+
+    def _remove(self, key: str) -> None:
+        for path in self._paths(key):
+            path.unlink(missing_ok=True)
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        """(last_used, size_bytes, key) for each complete entry."""
+        if not self.cache_dir.is_dir():
+            return []
+        entries: list[tuple[float, int, str]] = []
+        for meta_path in self.cache_dir.glob(f"*{_META_SUFFIX}"):
+            frame_path = meta_path.with_suffix(_FRAME_SUFFIX)
+            try:
+                meta_stat = meta_path.stat()
+                size = meta_stat.st_size + frame_path.stat().st_size
+            except FileNotFoundError:
+                continue
+            entries.append((meta_stat.st_mtime, size, meta_path.stem))
+        return entries
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits in max_bytes."""
+        entries = sorted(self._entries())
+        total = sum(size for _used, size, _key in entries)
+        evicted = 0
+        for _used, size, key in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(key)
+            total -= size
+            evicted += 1
+        if evicted:
+            logger.debug("Evicted {} SAS cache entries ({} bytes remain)", evicted, total)
@@ -1,7 +1,10 @@
 """SAS file reader with metadata extraction using pyreadstat.
 
 Reads .sas7bdat files and extracts rich metadata including variable names,
-labels, SAS formats, data types, encoding, and row/column counts.
+labels, SAS formats, data types, encoding, and row/column counts. Reads
+can be projected onto a subset of columns, large files can be read
+header-only or streamed in row chunks, and whole directories can be
+decoded in parallel worker processes.
 
 IMPORTANT: Uses disable_datetime_conversion=True to preserve raw numeric
 date values (SAS DATETIME = seconds since 1960-01-01). Date conversion
@@ -10,44 +13,36 @@ is handled separately by the transforms layer.
 
 from __future__ import annotations
 
+import os
+import time
+from collections.abc import Collection, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 import pandas as pd
 import pyreadstat
 from loguru import logger
+from pydantic import BaseModel, ConfigDict, Field
 
 from astraea.models.metadata import DatasetMetadata, VariableMetadata
 
+if TYPE_CHECKING:
+    from astraea.io.sas_cache import SASReadCache
 
-def read_sas_with_metadata(
-    filepath: str | Path,
-) -> tuple[pd.DataFrame, DatasetMetadata]:
-    """Read a SAS .sas7bdat file, returning a DataFrame and structured metadata.
 
-    Args:
-        filepath: Path to a .sas7bdat file.
-
-    Returns:
-        Tuple of (DataFrame with raw data, DatasetMetadata with variable info).
-
-    Raises:
-        FileNotFoundError: If the file does not exist.
-        pyreadstat.ReadstatError: If the file cannot be read as SAS data.
-    """
+def _check_sas_path(filepath: str | Path) -> Path:
+    """Validate that ``filepath`` names an existing .sas7bdat file."""
     filepath = Path(filepath)
     if not filepath.exists():
         raise FileNotFoundError(f"SAS file not found: {filepath}")
     if not filepath.suffix == ".sas7bdat":
         raise ValueError(f"Expected .sas7bdat file, got: {filepath.suffix}")
+    return filepath
 
-    logger.info("Reading SAS file: {}", filepath.name)
-
-    df, meta = pyreadstat.read_sas7bdat(
-        str(filepath),
-        disable_datetime_conversion=True,
-    )
 
+def _build_dataset_metadata(filepath: Path, meta: Any) -> DatasetMetadata:
+    """Convert a pyreadstat metadata container to DatasetMetadata."""
     # Build variable metadata from pyreadstat meta object
     variables: list[VariableMetadata] = []
     for col_name in meta.column_names:
@@ -68,7 +63,7 @@ def read_sas_with_metadata(
             )
         )
 
-    dataset_meta = DatasetMetadata(
+    return DatasetMetadata(
         filename=filepath.name,
         row_count=meta.number_rows,
         col_count=meta.number_columns,
@@ -76,6 +71,78 @@ def read_sas_with_metadata(
         file_encoding=meta.file_encoding,
     )
 
+
+def _project_columns(available: Iterable[str], usecols: Collection[str]) -> list[str]:
+    """Names in ``available`` that appear in ``usecols``, case-insensitively, in file order."""
+    wanted = {name.lower() for name in usecols}
+    return [name for name in available if name.lower() in wanted]
+
+
+def read_sas_with_metadata(
+    filepath: str | Path,
+    *,
+    cache: SASReadCache | None = None,
+    usecols: Collection[str] | None = None,
+) -> tuple[pd.DataFrame, DatasetMetadata]:
+    """Read a SAS .sas7bdat file, returning a DataFrame and structured metadata.
+
+    Args:
+        filepath: Path to a .sas7bdat file.
+        cache: Optional on-disk read cache. A hit skips decoding entirely;
+            a miss decodes the file and stores the result.
+        usecols: Optional column names to load, matched case-insensitively
+            against the file header; names not in the file are ignored.
+            Only the matching columns are decoded. The metadata still
+            describes every variable in the file. A cache hit is sliced to
+            these columns, but a projected miss is not stored, since the
+            cache holds whole files. If no name matches, every column is read.
+
+    Returns:
+        Tuple of (DataFrame with raw data, DatasetMetadata with variable info).
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        pyreadstat.ReadstatError: If the file cannot be read as SAS data.
+    """
+    filepath = _check_sas_path(filepath)
+
+    if cache is not None:
+        cached = cache.get(filepath)
+        if cached is not None:
+            logger.info("Read {} from SAS cache", filepath.name)
+            if usecols is None:
+                return cached
+            cached_df, cached_meta = cached
+            columns = _project_columns(cached_df.columns, usecols)
+            return (cached_df[columns] if columns else cached_df), cached_meta
+
+    if usecols is not None:
+        header = read_sas_metadata(filepath)
+        columns = _project_columns((v.name for v in header.variables), usecols)
+        if columns:
+            logger.info(
+                "Reading SAS file: {} ({} of {} columns)",
+                filepath.name,
+                len(columns),
+                header.col_count,
+            )
+            df, _meta = pyreadstat.read_sas7bdat(
+                str(filepath),
+                disable_datetime_conversion=True,
+                usecols=columns,
+            )
+            return df, header
+        logger.debug("No requested columns found in {}; reading all columns", filepath.name)
+
+    logger.info("Reading SAS file: {}", filepath.name)
+
+    df, meta = pyreadstat.read_sas7bdat(
+        str(filepath),
+        disable_datetime_conversion=True,
+    )
+
+    dataset_meta = _build_dataset_metadata(filepath, meta)
+
     logger.info(
         "Read {}: {} rows x {} cols (encoding: {})",
         filepath.name,
@@ -84,16 +151,84 @@ def read_sas_with_metadata(
         dataset_meta.file_encoding,
     )
 
+    if cache is not None:
+        cache.put(filepath, df, dataset_meta)
+
     return df, dataset_meta
 
 
+def read_sas_metadata(filepath: str | Path) -> DatasetMetadata:
+    """Read only the header of a SAS .sas7bdat file.
+
+    No data rows are decoded, so this is cheap even for files larger
+    than available memory.
+
+    Args:
+        filepath: Path to a .sas7bdat file.
+
+    Returns:
+        DatasetMetadata with variable info and row/column counts.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        pyreadstat.ReadstatError: If the file cannot be read as SAS data.
+    """
+    filepath = _check_sas_path(filepath)
+    _empty, meta = pyreadstat.read_sas7bdat(str(filepath), metadataonly=True)
+    return _build_dataset_metadata(filepath, meta)
+
+
+def iter_sas_chunks(
+    filepath: str | Path,
+    chunksize: int = 100_000,
+) -> Iterator[pd.DataFrame]:
+    """Stream a SAS .sas7bdat file as DataFrames of at most ``chunksize`` rows.
+
+    Only one chunk is held in memory at a time. Chunks carry a continuous
+    RangeIndex, so concatenating them reproduces ``read_sas_with_metadata``.
+    Pair with ``read_sas_metadata`` for the variable metadata.
+
+    Args:
+        filepath: Path to a .sas7bdat file.
+        chunksize: Maximum number of rows per chunk.
+
+    Yields:
+        DataFrame chunks in file order.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If chunksize is not positive.
+        pyreadstat.ReadstatError: If the file cannot be read as SAS data.
+    """
+    filepath = _check_sas_path(filepath)
+    if chunksize <= 0:
+        msg = f"chunksize must be positive, got {chunksize}"
+        raise ValueError(msg)
+
+    logger.info("Streaming SAS file: {} ({} rows per chunk)", filepath.name, chunksize)
+
+    offset = 0
+    for chunk, _meta in pyreadstat.read_file_in_chunks(
+        pyreadstat.read_sas7bdat,
+        str(filepath),
+        chunksize=chunksize,
+        disable_datetime_conversion=True,
+    ):
+        chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+        offset += len(chunk)
+        yield chunk
+
+
 def read_all_sas_files(
     data_dir: str | Path,
+    *,
+    cache: SASReadCache | None = None,
 ) -> dict[str, tuple[pd.DataFrame, DatasetMetadata]]:
     """Read all .sas7bdat files in a directory.
 
     Args:
         data_dir: Path to directory containing .sas7bdat files.
+        cache: Optional on-disk read cache passed to each file read.
 
     Returns:
         Dict keyed by filename stem (e.g., "dm", "ae") with
@@ -116,7 +251,7 @@ def read_all_sas_files(
     results: dict[str, tuple[pd.DataFrame, DatasetMetadata]] = {}
     for sas_file in sas_files:
         try:
-            df, meta = read_sas_with_metadata(sas_file)
+            df, meta = read_sas_with_metadata(sas_file, cache=cache)
             results[sas_file.stem] = (df, meta)
         except Exception:
             logger.exception("Failed to read SAS file: {}", sas_file.name)
@@ -124,3 +259,99 @@ def read_all_sas_files(
 
     logger.info("Successfully read {} SAS files", len(results))
     return results
+
+
+class SASFileRead(BaseModel):
+    """Outcome of reading one file as part of a directory read."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    filename: str = Field(..., description="SAS filename (e.g., 'ae.sas7bdat')")
+    seconds: float = Field(default=0.0, ge=0.0, description="Wall-clock time spent reading")
+    data: pd.DataFrame | None = Field(default=None, description="Decoded rows, if read")
+    metadata: DatasetMetadata | None = Field(default=None, description="Metadata, if read")
+    error: str | None = Field(default=None, description="Error message if the read failed")
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+def _timed_read(filepath: Path, cache: SASReadCache | None) -> SASFileRead:
+    """Read one file, capturing wall-clock time and any error (worker entry point)."""
+    start = time.perf_counter()
+    try:
+        df, meta = read_sas_with_metadata(filepath, cache=cache)
+    except Exception as e:
+        logger.error("Failed to read SAS file {}: {}", filepath.name, e)
+        return SASFileRead(
+            filename=filepath.name,
+            seconds=time.perf_counter() - start,
+            error=f"{type(e).__name__}: {e}",
+        )
+    return SASFileRead(
+        filename=filepath.name,
+        seconds=time.perf_counter() - start,
+        data=df,
+        metadata=meta,
+    )
+
+
+def read_sas_directory(
+    data_dir: str | Path,
+    *,
+    max_workers: int | None = None,
+    cache: SASReadCache | None = None,
+) -> list[SASFileRead]:
+    """Read every .sas7bdat file in a directory, optionally in parallel.
+
+    Decoding is CPU-bound in pyreadstat's C code, so files are spread over
+    a process pool. Unlike ``read_all_sas_files``, a file that fails to
+    read does not stop the others; its error is recorded on its result.
+
+    Args:
+        data_dir: Path to directory containing .sas7bdat files.
+        max_workers: Worker processes (default: CPU count). 1 reads
+            serially in the calling process.
+        cache: Optional on-disk read cache, shared by all workers.
+
+    Returns:
+        One SASFileRead per file, sorted by filename regardless of the
+        order in which workers finish.
+
+    Raises:
+        FileNotFoundError: If the directory does not exist.
+        ValueError: If no .sas7bdat files are found.
+    """
+    data_dir = Path(data_dir)
+    if not data_dir.is_dir():
+        raise FileNotFoundError(f"Data directory not found: {data_dir}")
+
+    sas_files = sorted(data_dir.glob("*.sas7bdat"))
+    if not sas_files:
+        raise ValueError(f"No .sas7bdat files found in: {data_dir}")
+
+    workers = min(max_workers or os.cpu_count() or 1, len(sas_files))
+    logger.info("Reading {} SAS files from {} ({} workers)", len(sas_files), data_dir, workers)
+
+    if workers <= 1:
+        results = [_timed_read(sas_file, cache) for sas_file in sas_files]
+    else:
+        results = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_timed_read, sas_file, cache) for sas_file in sas_files]
+            for sas_file, future in zip(sas_files, futures, strict=True):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    # Worker died or the result could not be sent back
+                    logger.error("Failed to read SAS file {}: {}", sas_file.name, e)
+                    results.append(
+                        SASFileRead(filename=sas_file.name, error=f"{type(e).__name__}: {e}")
+                    )
+
+    n_failed = sum(1 for r in results if not r.succeeded)
+    logger.info(
+        "Read {} of {} SAS files ({} failed)", len(results) - n_failed, len(results), n_failed
+    )
+    return results
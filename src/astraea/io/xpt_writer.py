@@ -1,8 +1,15 @@
 """XPT v5 file writer with pre-write validation.
 
-Writes SDTM-compliant XPT (SAS Transport v5) files using pyreadstat,
-with comprehensive pre-write validation to catch constraint violations
-that pyreadstat would silently truncate.
+Writes SDTM-compliant XPT (SAS Transport v5) files with a native
+streaming writer, with comprehensive pre-write validation to catch
+constraint violations that would otherwise be silently truncated.
+
+Records are encoded a chunk of rows at a time (numerics as IBM floating
+point, characters blank-padded to the widths from ``optimize_char_lengths``)
+and streamed to disk, so a write never holds more than one encoded chunk in
+memory. The row count and a SHA-256 checksum are computed while writing;
+afterwards only the header and file size are checked. A full read-back
+through pyreadstat is available as an opt-in paranoid mode.
 
 XPT v5 constraints:
 - Variable names: <= 8 characters, alphanumeric + underscore, starts with letter
@@ -14,12 +21,24 @@ XPT v5 constraints:
 
 from __future__ import annotations
 
+import hashlib
+import math
+import os
 import re
+import struct
+from datetime import datetime
 from pathlib import Path
+from types import TracebackType
+from typing import Literal
 
+import numpy as np
 import pandas as pd
 import pyreadstat
 from loguru import logger
+from pydantic import BaseModel, Field
+
+from astraea.transforms.char_length import optimize_char_lengths
+from astraea.transforms.char_scan import CharColumnScan, scan_char_columns
 
 
 class XPTValidationError(Exception):
@@ -45,6 +64,8 @@ def validate_for_xpt_v5(
     column_labels: dict[str, str],
     table_name: str,
     table_label: str | None = None,
+    *,
+    char_scan: dict[str, CharColumnScan] | None = None,
 ) -> list[str]:
     """Validate a DataFrame against XPT v5 constraints.
 
@@ -57,6 +78,8 @@ def validate_for_xpt_v5(
         column_labels: Mapping of column name -> label string.
         table_name: XPT dataset name.
         table_label: Optional dataset label (max 40 characters).
+        char_scan: Optional ``scan_char_columns`` result for ``df``; columns
+            it covers are not scanned again.
 
     Returns:
         List of validation error messages. Empty if valid.
@@ -105,41 +128,484 @@ def validate_for_xpt_v5(
                 f"Label for '{col}' exceeds 40 characters ({len(label)} chars): '{label[:50]}...'"
             )
 
-    # Character column value validation
-    for col in df.columns:
-        if pd.api.types.is_string_dtype(df[col]):
-            non_null = df[col].dropna()
-            if non_null.empty:
-                continue
-
-            # Check value byte length (XPT v5 max 200 bytes)
-            max_bytes = non_null.astype(str).apply(lambda x: len(x.encode("utf-8"))).max()
-            if max_bytes > 200:
-                errors.append(
-                    f"Column '{col}' has character values exceeding 200 bytes "
-                    f"(max: {max_bytes} bytes)"
-                )
-
-            # Check ASCII compliance
-            non_ascii = non_null.astype(str).apply(lambda x: not x.isascii())
-            if non_ascii.any():
-                n_bad = int(non_ascii.sum())
-                errors.append(f"Column '{col}' contains {n_bad} non-ASCII value(s)")
+    # Character column value validation (one scan per column, shared with
+    # the width computation in write_xpt_v5)
+    for col, scan in scan_char_columns(df, char_scan).items():
+        # Check value byte length (XPT v5 max 200 bytes)
+        if scan.max_bytes > 200:
+            errors.append(
+                f"Column '{col}' has character values exceeding 200 bytes "
+                f"(max: {scan.max_bytes} bytes)"
+            )
+
+        # Check ASCII compliance
+        if scan.non_ascii_count:
+            errors.append(f"Column '{col}' contains {scan.non_ascii_count} non-ASCII value(s)")
 
     return errors
 
 
+# ---------------------------------------------------------------------------
+# Native XPT v5 encoding
+# ---------------------------------------------------------------------------
+
+_RECORD_LEN = 80
+_NAMESTR_LEN = 140
+_DEFAULT_CHUNK_ROWS = 100_000
+
+# Version and OS strings in the library and member headers -- the values
+# pyreadstat writes, so files are unchanged for downstream readers.
+_SAS_VERSION = b"6.06    "
+_SAS_OS = b"bsd4.2  "
+
+_MONTHS = ("JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC")
+
+# IBM missing value "." -- 0x2E followed by seven zero bytes
+_IBM_MISSING = np.uint64(0x2E << 56)
+
+_SIGN_MASK = np.uint64(0x8000_0000_0000_0000)
+_FRACTION_MASK = np.uint64(0x000F_FFFF_FFFF_FFFF)
+_IMPLICIT_BIT = np.uint64(0x0010_0000_0000_0000)
+
+
+def _header_record(kind: str, counts: str = "0" * 30) -> bytes:
+    """One ``HEADER RECORD*******<kind> HEADER RECORD!!!!!!!<counts>`` record."""
+    text = f"HEADER RECORD*******{kind:<8}HEADER RECORD!!!!!!!{counts}"
+    return text.ljust(_RECORD_LEN).encode("ascii")
+
+
+def _sas_timestamp(moment: datetime) -> bytes:
+    """Format ``moment`` as the 16-byte ``ddMMMyy:hh:mm:ss`` header timestamp."""
+    month = _MONTHS[moment.month - 1]
+    return f"{moment:%d}{month}{moment:%y:%H:%M:%S}".encode("ascii")
+
+
+def _pad(text: str, width: int) -> bytes:
+    return text.encode("ascii")[:width].ljust(width)
+
+
+def ieee_to_ibm(values: np.ndarray) -> np.ndarray:
+    """Convert float64 values to IBM System/360 double-precision bit patterns.
+
+    XPT v5 stores numerics as IBM hexadecimal floating point: a sign bit,
+    a 7-bit base-16 exponent biased by 64, and a 56-bit fraction. Every
+    finite IEEE double fits the fraction exactly. NaN becomes the SAS
+    missing value ``.``; magnitudes below ~5.4e-79 become zero.
+
+    Args:
+        values: Float64 array.
+
+    Returns:
+        Uint64 array of IBM bit patterns (to be written big-endian).
+
+    Raises:
+        ValueError: If a value is infinite or too large for IBM format
+            (above ~7.2e75).
+    """
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    bits = values.view(np.uint64)
+    biased = ((bits >> np.uint64(52)) & np.uint64(0x7FF)).astype(np.int64)
+
+    # IEEE value = m * 2**(e - 52) with m the 53-bit integer mantissa.
+    # Writing e = 4q + r and shifting m left by r gives the 56-bit IBM
+    # fraction with hexadecimal exponent q + 1 (biased by 64).
+    quotient, remainder = np.divmod(biased - 1023, 4)
+    fraction = ((bits & _FRACTION_MASK) | _IMPLICIT_BIT) << remainder.astype(np.uint64)
+    exponent = quotient + 65
+
+    nan = np.isnan(values)
+    finite = biased != 0x7FF
+    if not (finite | nan).all() or (exponent[finite] > 127).any():
+        msg = "Numeric value is infinite or too large for XPT (IBM) floating point"
+        raise ValueError(msg)
+
+    ibm = (bits & _SIGN_MASK) | (exponent.clip(0, 127).astype(np.uint64) << np.uint64(56))
+    ibm |= fraction
+    ibm[(biased == 0) | (exponent < 0)] = 0
+    ibm[nan] = _IBM_MISSING
+    return ibm
+
+
+class XPTColumn(BaseModel):
+    """Layout of one variable in an XPT v5 observation record."""
+
+    name: str = Field(..., description="Variable name as written (upper-cased, <= 8 chars)")
+    label: str = Field(default="", description="Variable label (<= 40 chars)")
+    is_character: bool = Field(..., description="Character (True) or numeric (False)")
+    length: int = Field(..., ge=1, le=200, description="Bytes per value (8 for numerics)")
+
+
+class XPTWriteResult(BaseModel):
+    """Outcome of writing one XPT v5 file."""
+
+    path: Path = Field(..., description="Written file")
+    table_name: str = Field(..., description="XPT dataset name")
+    row_count: int = Field(..., ge=0, description="Observations written")
+    col_count: int = Field(..., ge=0, description="Variables written")
+    record_length: int = Field(..., ge=0, description="Bytes per observation")
+    file_size: int = Field(..., ge=0, description="File size in bytes")
+    sha256: str = Field(..., description="SHA-256 of the complete file, computed while writing")
+
+
+def xpt_columns_for(
+    df: pd.DataFrame,
+    column_labels: dict[str, str],
+    char_widths: dict[str, int] | None = None,
+    *,
+    char_scan: dict[str, CharColumnScan] | None = None,
+) -> list[XPTColumn]:
+    """Derive the XPT variable layout for a DataFrame.
+
+    Numeric (and boolean) columns become 8-byte numerics; every other
+    column is character. Character widths come from ``char_widths`` (as
+    produced by ``optimize_char_lengths``) and are computed from the data
+    -- or from ``char_scan``, if given -- for columns it does not cover.
+    Labels are matched case-insensitively.
+    """
+    upper_labels = {k.upper(): v for k, v in column_labels.items()}
+    widths = dict(char_widths or {})
+    unsized = [
+        col
+        for col in df.columns
+        if not pd.api.types.is_numeric_dtype(df[col]) and col not in widths
+    ]
+    if unsized:
+        computed = optimize_char_lengths(df[unsized], char_scan=char_scan)
+        for col in unsized:
+            if col not in computed:
+                # e.g. categorical or datetime columns, written as their str()
+                non_null = df[col].dropna().astype(str)
+                computed[col] = max(1, int(non_null.str.len().max())) if len(non_null) else 1
+            widths[col] = computed[col]
+
+    columns: list[XPTColumn] = []
+    for col in df.columns:
+        name = str(col).upper()
+        is_character = not pd.api.types.is_numeric_dtype(df[col])
+        columns.append(
+            XPTColumn(
+                name=name,
+                label=column_labels.get(str(col), upper_labels.get(name, "")),
+                is_character=is_character,
+                length=widths[col] if is_character else 8,
+            )
+        )
+    return columns
+
+
+class XPTStreamWriter:
+    """Incremental XPT v5 writer: header first, then observations chunk by chunk.
+
+    XPT v5 headers carry no row count, so observations can be appended
+    until ``close()``. The file is written under a temporary name and moved
+    into place on a successful close. If the writer is abandoned (an
+    exception inside the ``with`` block), the partial file is deleted and
+    any existing file at ``path`` is left untouched.
+
+    Args:
+        path: Output .xpt path.
+        table_name: XPT dataset name.
+        columns: Variable layout (see ``xpt_columns_for``).
+        table_label: Optional dataset label.
+
+    Example::
+
+        columns = xpt_columns_for(first_chunk, labels, widths)
+        with XPTStreamWriter(path, "LB", columns) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+        result = writer.close()
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        table_name: str,
+        columns: list[XPTColumn],
+        table_label: str | None = None,
+    ) -> None:
+        self.path = Path(path)
+        self.table_name = table_name.upper()
+        self.columns = columns
+        self.table_label = table_label
+        self.row_count = 0
+
+        self._result: XPTWriteResult | None = None
+        self._record_dtype = np.dtype(
+            [(f"v{i}", f"S{c.length}" if c.is_character else ">u8") for i, c in enumerate(columns)]
+        )
+        self._data_bytes = 0
+        self._sha256 = hashlib.sha256()
+        self._tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self._tmp_path, "wb")  # noqa: SIM115 -- closed by close()/abort()
+        self._emit(self._header_bytes())
+
+    @property
+    def record_length(self) -> int:
+        """Bytes per observation."""
+        return self._record_dtype.itemsize
+
+    def write(self, df: pd.DataFrame) -> None:
+        """Append the rows of ``df`` (columns in layout order) as observations.
+
+        Raises:
+            ValueError: If the columns do not match the layout, a character
+                value is longer than its column width or is not ASCII, or a
+                numeric value cannot be represented.
+        """
+        if [str(c).upper() for c in df.columns] != [c.name for c in self.columns]:
+            msg = (
+                f"Chunk columns {list(df.columns)} do not match XPT layout "
+                f"{[c.name for c in self.columns]}"
+            )
+            raise ValueError(msg)
+        if df.empty:
+            return
+
+        records = np.empty(len(df), dtype=self._record_dtype)
+        for i, (column, col) in enumerate(zip(self.columns, df.columns, strict=True)):
+            if column.is_character:
+                records[f"v{i}"] = _encode_character(df[col], column)
+            else:
+                records[f"v{i}"] = ieee_to_ibm(df[col].to_numpy(dtype=np.float64, na_value=np.nan))
+
+        self._emit(records.tobytes())
+        self._data_bytes += records.nbytes
+        self.row_count += len(df)
+
+    def close(self) -> XPTWriteResult:
+        """Pad the last record, move the file into place and return the result."""
+        if self._result is not None:
+            return self._result
+        tail = -self._data_bytes % _RECORD_LEN
+        if tail:
+            self._emit(b" " * tail)
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+        self._result = XPTWriteResult(
+            path=self.path,
+            table_name=self.table_name,
+            row_count=self.row_count,
+            col_count=len(self.columns),
+            record_length=self.record_length,
+            file_size=self.path.stat().st_size,
+            sha256=self._sha256.hexdigest(),
+        )
+        return self._result
+
+    def abort(self) -> None:
+        """Discard the partially written file."""
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+    def __enter__(self) -> XPTStreamWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> Literal[False]:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+    def _emit(self, data: bytes) -> None:
+        self._file.write(data)
+        self._sha256.update(data)
+
+    def _header_bytes(self) -> bytes:
+        """Library, member, descriptor, NAMESTR and OBS header records."""
+        stamp = _sas_timestamp(datetime.now())
+        records = [
+            _header_record("LIBRARY"),
+            b"SAS     SAS     SASLIB  " + _SAS_VERSION + _SAS_OS + b" " * 24 + stamp,
+            stamp.ljust(_RECORD_LEN),
+            _header_record("MEMBER", "0" * 17 + "1600000000" + "140"),
+            _header_record("DSCRPTR"),
+            b"SAS     "
+            + _pad(self.table_name, 8)
+            + b"SASDATA "
+            + _SAS_VERSION
+            + _SAS_OS
+            + b" " * 24
+            + stamp,
+            stamp + b" " * 16 + _pad(self.table_label or "", 40) + b" " * 8,
+            _header_record("NAMESTR", f"000000{len(self.columns):04d}" + "0" * 20),
+        ]
+
+        namestrs = bytearray()
+        position = 0
+        for number, column in enumerate(self.columns, start=1):
+            namestrs += struct.pack(
+                ">hhhh8s40s8shhh2s8shhi52s",
+                2 if column.is_character else 1,
+                0,
+                column.length,
+                number,
+                _pad(column.name, 8),
+                _pad(column.label, 40),
+                b" " * 8,
+                0,
+                0,
+                0 if column.is_character else 1,  # nfj: numerics right-justified
+                b"\0\0",
+                b" " * 8,
+                0,
+                0,
+                position,
+                b"\0" * 52,
+            )
+            position += column.length
+        namestrs += b" " * (-len(namestrs) % _RECORD_LEN)
+
+        return b"".join([*records, bytes(namestrs), _header_record("OBS")])
+
+
+def _encode_character(series: pd.Series, column: XPTColumn) -> np.ndarray:
+    """Encode a character column as blank-padded fixed-width ASCII bytes.
+
+    Categorical columns are encoded once per category and expanded by code.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = pd.Series(series.cat.categories.astype(str).to_numpy(dtype=object))
+        encoded = _encode_character(pd.concat([categories, pd.Series([""])]), column)
+        codes = series.cat.codes.to_numpy()
+        return encoded[np.where(codes >= 0, codes, len(categories))]
+
+    values = series.astype(object).where(series.notna(), "").to_numpy(dtype=object)
+    try:
+        encoded = values.astype("S")
+    except UnicodeEncodeError as e:
+        msg = f"Column '{column.name}' contains non-ASCII values"
+        raise ValueError(msg) from e
+    if encoded.dtype.itemsize > column.length:
+        msg = (
+            f"Column '{column.name}' has values of {encoded.dtype.itemsize} bytes, "
+            f"longer than its XPT width {column.length}"
+        )
+        raise ValueError(msg)
+    fixed = encoded.astype(f"S{column.length}")
+    raw = fixed.view(np.uint8)
+    raw[raw == 0] = ord(" ")
+    return fixed
+
+
+def verify_xpt_header(path: str | Path, columns: list[XPTColumn], row_count: int) -> None:
+    """Check an XPT v5 file's header and size against what was written.
+
+    Reads only the header records: the variable names, types and lengths
+    must match ``columns``, and the file size must equal the header plus
+    ``row_count`` observations padded to whole 80-byte records.
+
+    Raises:
+        RuntimeError: If the header or size does not match.
+    """
+    path = Path(path)
+    namestr_bytes = math.ceil(len(columns) * _NAMESTR_LEN / _RECORD_LEN) * _RECORD_LEN
+    header_len = 8 * _RECORD_LEN + namestr_bytes + _RECORD_LEN
+
+    with open(path, "rb") as f:
+        header = f.read(header_len)
+    if len(header) < header_len:
+        msg = f"XPT header truncated in {path.name}"
+        raise RuntimeError(msg)
+
+    namestr_header = header[7 * _RECORD_LEN : 8 * _RECORD_LEN]
+    if not namestr_header.startswith(b"HEADER RECORD*******NAMESTR"):
+        msg = f"Missing NAMESTR header in {path.name}"
+        raise RuntimeError(msg)
+    n_vars = int(namestr_header[54:58])
+    if n_vars != len(columns):
+        msg = f"Header declares {n_vars} variables, expected {len(columns)}"
+        raise RuntimeError(msg)
+    if not header[-_RECORD_LEN:].startswith(b"HEADER RECORD*******OBS"):
+        msg = f"Missing OBS header in {path.name}"
+        raise RuntimeError(msg)
+
+    record_length = 0
+    for i, column in enumerate(columns):
+        start = 8 * _RECORD_LEN + i * _NAMESTR_LEN
+        ntype, _nhfun, length, _varnum, raw_name = struct.unpack(
+            ">hhhh8s", header[start : start + 16]
+        )
+        name = raw_name.decode("ascii").rstrip()
+        expected_type = 2 if column.is_character else 1
+        if (name, ntype, length) != (column.name, expected_type, column.length):
+            msg = (
+                f"Header variable {i + 1} is {name} (type {ntype}, length {length}), "
+                f"expected {column.name} (type {expected_type}, length {column.length})"
+            )
+            raise RuntimeError(msg)
+        record_length += length
+
+    data_bytes = row_count * record_length
+    expected_size = header_len + data_bytes + (-data_bytes % _RECORD_LEN)
+    actual_size = path.stat().st_size
+    if actual_size != expected_size:
+        msg = (
+            f"XPT size mismatch for {path.name}: {actual_size} bytes on disk, "
+            f"expected {expected_size} for {row_count} rows"
+        )
+        raise RuntimeError(msg)
+
+
+def verify_xpt_readback(result: XPTWriteResult, columns: list[XPTColumn]) -> None:
+    """Paranoid verification: re-hash the file and decode it in full with pyreadstat.
+
+    Raises:
+        RuntimeError: If the checksum, columns or row count do not match.
+    """
+    sha256 = hashlib.sha256()
+    with open(result.path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            sha256.update(block)
+    if sha256.hexdigest() != result.sha256:
+        msg = f"Checksum mismatch re-reading {result.path.name}"
+        raise RuntimeError(msg)
+
+    df_readback, _meta = pyreadstat.read_xport(str(result.path))
+
+    # Verify column names match
+    written_cols = {c.name for c in columns}
+    readback_cols = set(df_readback.columns)
+    if written_cols != readback_cols:
+        missing = written_cols - readback_cols
+        extra = readback_cols - written_cols
+        msg = f"Read-back column mismatch: missing={missing}, extra={extra}"
+        raise RuntimeError(msg)
+
+    # Verify row count matches
+    if len(df_readback) != result.row_count:
+        msg = (
+            f"Read-back row count mismatch: wrote {result.row_count}, read back {len(df_readback)}"
+        )
+        raise RuntimeError(msg)
+
+
 def write_xpt_v5(
     df: pd.DataFrame,
     path: str | Path,
     table_name: str,
     column_labels: dict[str, str],
     table_label: str | None = None,
-) -> None:
+    *,
+    char_widths: dict[str, int] | None = None,
+    chunk_size: int = _DEFAULT_CHUNK_ROWS,
+    verify_readback: bool = False,
+    char_scan: dict[str, CharColumnScan] | None = None,
+) -> XPTWriteResult:
     """Write a DataFrame as an XPT v5 (SAS Transport) file with validation.
 
-    Validates all XPT v5 constraints before writing. After writing,
-    performs a read-back verification to catch any silent corruption.
+    Validates all XPT v5 constraints before writing (scanning each
+    character column once for both validation and widths), then streams the rows
+    to disk ``chunk_size`` at a time without copying the DataFrame. After
+    writing, verifies the header and file size (see ``verify_xpt_header``).
 
     Args:
         df: DataFrame to write.
@@ -147,67 +613,63 @@ def write_xpt_v5(
         table_name: XPT dataset name (max 8 chars, alphanumeric).
         column_labels: Mapping of column name -> label string.
         table_label: Optional dataset label (max 40 characters).
+        char_widths: Character column widths in bytes, e.g. from
+            ``optimize_char_lengths``. Computed from the data if omitted.
+        chunk_size: Rows encoded per write.
+        verify_readback: Paranoid mode -- also re-hash the file and read it
+            back in full with pyreadstat.
+        char_scan: ``scan_char_columns`` result for ``df`` from an earlier
+            step (e.g. DatasetExecutor), reused instead of re-scanning.
+
+    Returns:
+        XPTWriteResult with the row count and SHA-256 of the written file.
 
     Raises:
         XPTValidationError: If data violates XPT v5 constraints.
-        RuntimeError: If read-back verification fails.
+        ValueError: If chunk_size is not positive.
+        RuntimeError: If verification fails.
     """
     path = Path(path)
+    if chunk_size <= 0:
+        msg = f"chunk_size must be positive, got {chunk_size}"
+        raise ValueError(msg)
 
     # Step 1: Validate
-    errors = validate_for_xpt_v5(df, column_labels, table_name, table_label=table_label)
+    char_scan = scan_char_columns(df, char_scan)
+    errors = validate_for_xpt_v5(
+        df, column_labels, table_name, table_label=table_label, char_scan=char_scan
+    )
     if errors:
         raise XPTValidationError(errors)
 
-    # Step 2: Uppercase column names (SDTM convention)
-    df_out = df.copy()
-    rename_map = {col: str(col).upper() for col in df_out.columns}
-    df_out = df_out.rename(columns=rename_map)
-
-    # Uppercase column labels keys
-    upper_labels = {k.upper(): v for k, v in column_labels.items()}
-
-    # Uppercase table name
+    # Step 2: Variable layout (column and table names upper-cased, SDTM convention)
+    columns = xpt_columns_for(df, column_labels, char_widths, char_scan=char_scan)
     upper_table = table_name.upper()
 
     logger.info(
         "Writing XPT v5: {} ({} rows x {} cols) -> {}",
         upper_table,
-        len(df_out),
-        len(df_out.columns),
+        len(df),
+        len(columns),
         path,
     )
 
-    # Step 3: Write using pyreadstat
-    write_kwargs: dict[str, object] = dict(
-        table_name=upper_table,
-        column_labels=upper_labels,
-        file_format_version=5,
-    )
-    if table_label is not None:
-        write_kwargs["file_label"] = table_label
-    pyreadstat.write_xport(df_out, str(path), **write_kwargs)
-
-    # Step 4: Read-back verification
-    df_readback, meta_readback = pyreadstat.read_xport(str(path))
+    # Step 3: Stream observations
+    with XPTStreamWriter(path, upper_table, columns, table_label=table_label) as writer:
+        for start in range(0, len(df), chunk_size):
+            writer.write(df.iloc[start : start + chunk_size])
+    result = writer.close()
 
-    # Verify column names match
-    written_cols = set(df_out.columns)
-    readback_cols = set(df_readback.columns)
-    if written_cols != readback_cols:
-        missing = written_cols - readback_cols
-        extra = readback_cols - written_cols
-        msg = f"Read-back column mismatch: missing={missing}, extra={extra}"
-        raise RuntimeError(msg)
-
-    # Verify row count matches
-    if len(df_readback) != len(df_out):
-        msg = f"Read-back row count mismatch: wrote {len(df_out)}, read back {len(df_readback)}"
-        raise RuntimeError(msg)
+    # Step 4: Verify header and size (full read-back only in paranoid mode)
+    verify_xpt_header(path, columns, result.row_count)
+    if verify_readback:
+        verify_xpt_readback(result, columns)
 
     logger.info(
-        "XPT v5 write verified: {} rows x {} cols in {}",
-        len(df_readback),
-        len(df_readback.columns),
+        "XPT v5 write verified: {} rows x {} cols in {} (sha256 {})",
+        result.row_count,
+        result.col_count,
         path.name,
+        result.sha256[:12],
     )
+    return result
@@ -133,7 +133,7 @@ def _format_variable_profile(vp: VariableProfile) -> str:
     parts = [
         f"- {vp.name} ({vp.dtype})",
         f'label="{vp.label}"',
-        f"unique={vp.n_unique}",
+        f"unique={'~' if vp.n_unique_approximate else ''}{vp.n_unique}",
         f"missing={vp.missing_pct:.0f}%",
     ]
     if samples:
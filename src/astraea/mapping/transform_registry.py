@@ -14,8 +14,11 @@ from astraea.transforms.ascii_validation import fix_common_non_ascii, validate_a
 from astraea.transforms.char_length import optimize_char_lengths
 from astraea.transforms.dates import (
     format_partial_iso8601,
+    parse_string_date_column,
     parse_string_date_to_iso,
+    sas_date_column_to_iso,
     sas_date_to_iso,
+    sas_datetime_column_to_iso,
     sas_datetime_to_iso,
 )
 from astraea.transforms.epoch import assign_epoch
@@ -62,6 +65,15 @@ AVAILABLE_TRANSFORMS: dict[str, Callable[..., object]] = {
 }
 
 
+# Whole-column equivalents of element-wise transforms. Callers that would
+# otherwise ``Series.map`` the scalar transform should prefer these.
+COLUMN_TRANSFORMS: dict[str, Callable[..., object]] = {
+    "sas_date_to_iso": sas_date_column_to_iso,
+    "sas_datetime_to_iso": sas_datetime_column_to_iso,
+    "parse_string_date_to_iso": parse_string_date_column,
+}
+
+
 def get_transform(name: str) -> Callable[..., object] | None:
     """Look up a transform function by name.
 
@@ -74,6 +86,19 @@ def get_transform(name: str) -> Callable[..., object] | None:
     return AVAILABLE_TRANSFORMS.get(name)
 
 
+def get_column_transform(name: str) -> Callable[..., object] | None:
+    """Look up the whole-column equivalent of a registered transform.
+
+    Args:
+        name: Transform function name (e.g., "sas_date_to_iso").
+
+    Returns:
+        A callable taking and returning a pd.Series, or None if the
+        transform has no column-level implementation.
+    """
+    return COLUMN_TRANSFORMS.get(name)
+
+
 def list_transforms() -> list[str]:
     """Return names of all registered transforms.
 
@@ -32,6 +32,9 @@ class VariableProfile(BaseModel):
     n_total: int = Field(..., ge=0, description="Total number of rows")
     n_missing: int = Field(..., ge=0, description="Number of missing values")
     n_unique: int = Field(..., ge=0, description="Number of unique non-missing values")
+    n_unique_approximate: bool = Field(
+        default=False, description="Whether n_unique is a HyperLogLog estimate"
+    )
     missing_pct: float = Field(..., ge=0.0, le=100.0, description="Percentage of missing values")
     sample_values: list[str] = Field(
         default_factory=list, description="Sample of unique non-missing values"
@@ -1,5 +1,9 @@
 """Dataset profiling for raw SAS files."""
 
-from astraea.profiling.profiler import detect_date_format, profile_dataset
+from astraea.profiling.profiler import (
+    detect_date_format,
+    profile_dataset,
+    profile_dataset_chunks,
+)
 
-__all__ = ["profile_dataset", "detect_date_format"]
+__all__ = ["profile_dataset", "profile_dataset_chunks", "detect_date_format"]
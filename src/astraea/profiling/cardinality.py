@@ -0,0 +1,77 @@
+"""Approximate distinct counting for high-cardinality profiling columns.
+
+Exact distinct counts need a hash table holding every value, which for
+identifier-like columns in multi-million-row files is as large as the
+column itself. ``HyperLogLog`` estimates the count in a fixed number of
+one-byte registers instead (16 KiB at the default precision, ~0.8%
+standard error), and all of its work is vectorized over NumPy arrays.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pandas as pd
+
+# Hash bits used for the rank after the register index is taken. 32 bits
+# keep the leading-zero count exact in float64 and cover cardinalities far
+# beyond any SAS dataset.
+_RANK_BITS = 32
+
+
+class HyperLogLog:
+    """HyperLogLog distinct-count sketch (Flajolet et al., 2007).
+
+    Values are hashed with ``pandas.util.hash_array``, so any values pandas
+    can factorize can be counted, and equal values always hash alike.
+    Adding a value more than once never changes the estimate, which lets
+    callers feed only the distinct values of each chunk.
+
+    Args:
+        precision: Number of hash bits selecting a register (4-18). The
+            sketch holds ``2**precision`` registers; standard error is
+            about ``1.04 / sqrt(2**precision)``.
+
+    Raises:
+        ValueError: If precision is outside 4-18.
+    """
+
+    def __init__(self, precision: int = 14) -> None:
+        if not 4 <= precision <= 18:
+            msg = f"precision must be between 4 and 18, got {precision}"
+            raise ValueError(msg)
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, values: np.ndarray | pd.Index) -> None:
+        """Add values to the sketch. Missing values must be removed first."""
+        if len(values) == 0:
+            return
+        hashes = pd.util.hash_array(np.asarray(values))
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+        rest = (hashes >> np.uint64(64 - self.precision - _RANK_BITS)) & np.uint64(
+            (1 << _RANK_BITS) - 1
+        )
+        # frexp gives the exact bit length of integers below 2**53
+        _mantissa, bit_length = np.frexp(rest.astype(np.float64))
+        rank = (_RANK_BITS + 1 - bit_length).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: HyperLogLog) -> None:
+        """Fold another sketch of the same precision into this one."""
+        if other.precision != self.precision:
+            msg = f"Cannot merge precision {other.precision} into {self.precision}"
+            raise ValueError(msg)
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> int:
+        """Estimated number of distinct values added so far."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / float(np.sum(np.ldexp(1.0, -self.registers.astype(np.int64))))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        # Linear counting is more accurate while many registers are empty
+        if raw <= 2.5 * m and zeros:
+            return round(m * math.log(m / zeros))
+        return round(raw)
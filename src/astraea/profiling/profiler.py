@@ -8,12 +8,15 @@ string pattern analysis.
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 
 from astraea.models.metadata import DatasetMetadata
 from astraea.models.profiling import DatasetProfile, ValueDistribution, VariableProfile
+from astraea.profiling.cardinality import HyperLogLog
 
 # EDC system column names (lowercase for case-insensitive matching).
 # These are standard Rave/EDC columns present in every dataset.
@@ -143,35 +146,114 @@ def _is_potential_string_date_column(name: str) -> bool:
     return "_RAW" in name.upper()
 
 
-def _compute_sample_values(series: pd.Series, max_samples: int = 10) -> list[str]:
-    """Get first N unique non-null values as strings."""
-    non_null = series.dropna()
-    if non_null.empty:
-        return []
-    unique = non_null.unique()[:max_samples]
-    return [str(v) for v in unique]
-
-
-def _compute_top_values(
-    series: pd.Series, n_total: int, max_top: int = 5, max_unique: int = 100
-) -> list[ValueDistribution]:
-    """Compute top N value frequencies for low-cardinality variables."""
-    non_null = series.dropna()
-    if non_null.empty:
-        return []
-    n_unique = non_null.nunique()
-    if n_unique > max_unique:
-        return []
-
-    counts = non_null.value_counts().head(max_top)
-    return [
-        ValueDistribution(
-            value=str(val),
-            count=int(cnt),
-            percentage=round(float(cnt) / n_total * 100, 2) if n_total > 0 else 0.0,
-        )
-        for val, cnt in counts.items()
-    ]
+# Leading non-null values handed to detect_date_format() for _RAW columns.
+_DATE_DETECTION_SAMPLES = 20
+
+# In approximate-distinct mode, a column stops being counted exactly once it
+# has this many distinct values; its cardinality then comes from a
+# HyperLogLog sketch. Top values are only reported for far fewer distinct
+# values (see _VariableAccumulator.top_values), so nothing else is lost.
+_EXACT_DISTINCT_LIMIT = 10_000
+
+# Unique values kept for VariableProfile.sample_values.
+_MAX_SAMPLE_VALUES = 10
+
+
+class _VariableAccumulator:
+    """Running statistics for one variable, merged across DataFrame chunks.
+
+    Each chunk is factorized once: the codes give the missing count, and a
+    bincount over them gives exact per-value counts with no Python-level
+    loop. Distinct values are kept in first-appearance order, which is
+    enough to reproduce the whole-frame unique/value_counts statistics
+    without ever holding more than one chunk of rows.
+
+    With ``approx_distinct``, a column that passes ``_EXACT_DISTINCT_LIMIT``
+    distinct values drops its value table (keeping only the sample values)
+    and reports the HyperLogLog estimate as its cardinality.
+    """
+
+    def __init__(self, collect_date_samples: bool, approx_distinct: bool = False) -> None:
+        self.n_total = 0
+        self.n_missing = 0
+        self.uniques: pd.Index | None = None
+        self.counts = np.zeros(0, dtype=np.int64)
+        self.date_samples: list[str] = []
+        self._date_values_seen = 0 if collect_date_samples else _DATE_DETECTION_SAMPLES
+        self._sketch = HyperLogLog() if approx_distinct else None
+        self._exact = True
+
+    @property
+    def n_unique(self) -> int:
+        """Distinct non-null values (estimated once exact counting stopped)."""
+        if not self._exact and self._sketch is not None:
+            # The sketch may undershoot slightly; the exact count was already larger
+            return max(self._sketch.estimate(), _EXACT_DISTINCT_LIMIT + 1)
+        return 0 if self.uniques is None else len(self.uniques)
+
+    @property
+    def is_approximate(self) -> bool:
+        return not self._exact
+
+    def update(self, series: pd.Series) -> None:
+        """Fold one chunk of the variable into the running statistics."""
+        self.n_total += len(series)
+        codes, uniques = pd.factorize(series)
+        present = codes[codes >= 0]
+        self.n_missing += len(codes) - len(present)
+
+        remaining = _DATE_DETECTION_SAMPLES - self._date_values_seen
+        if remaining > 0:
+            head = uniques.take(present[:remaining]).tolist()
+            self._date_values_seen += len(head)
+            self.date_samples.extend(str(v) for v in head if str(v).strip())
+
+        if self._sketch is not None:
+            self._sketch.update(uniques)
+        if not self._exact:
+            return
+
+        chunk_counts = np.bincount(present, minlength=len(uniques))
+        if self.uniques is None:
+            self.uniques, self.counts = uniques, chunk_counts
+        else:
+            positions = self.uniques.get_indexer(uniques)
+            known = positions >= 0
+            self.counts[positions[known]] += chunk_counts[known]
+            if not known.all():
+                self.uniques = self.uniques.append(uniques[~known])
+                self.counts = np.concatenate([self.counts, chunk_counts[~known]])
+
+        if self._sketch is not None and len(self.uniques) > _EXACT_DISTINCT_LIMIT:
+            self.uniques = self.uniques[:_MAX_SAMPLE_VALUES]
+            self.counts = np.zeros(0, dtype=np.int64)
+            self._exact = False
+
+    def sample_values(self, max_samples: int = _MAX_SAMPLE_VALUES) -> list[str]:
+        """First N unique non-null values as strings."""
+        if self.uniques is None:
+            return []
+        return [str(v) for v in self.uniques[:max_samples]]
+
+    def top_values(
+        self, n_total: int, max_top: int = 5, max_unique: int = 100
+    ) -> list[ValueDistribution]:
+        """Top N value frequencies for low-cardinality variables."""
+        if self.uniques is None or not self._exact:
+            return []
+        if len(self.uniques) == 0 or len(self.uniques) > max_unique:
+            return []
+        # Same ordering as Series.value_counts(): count descending over
+        # first-appearance order.
+        ranked = np.argsort(-self.counts, kind="stable")[:max_top]
+        return [
+            ValueDistribution(
+                value=str(self.uniques[i]),
+                count=int(self.counts[i]),
+                percentage=round(float(self.counts[i]) / n_total * 100, 2) if n_total > 0 else 0.0,
+            )
+            for i in ranked
+        ]
 
 
 # SDTM Findings domain prefixes and their characteristic variable suffixes.
@@ -229,12 +311,53 @@ def detect_sdtm_format(profile: DatasetProfile) -> bool:
     return False
 
 
-def profile_dataset(df: pd.DataFrame, meta: DatasetMetadata) -> DatasetProfile:
+def profile_dataset(
+    df: pd.DataFrame, meta: DatasetMetadata, *, approx_distinct: bool = False
+) -> DatasetProfile:
     """Profile a raw SAS dataset, producing rich statistical summaries.
 
     Args:
         df: DataFrame with raw data (from read_sas_with_metadata).
         meta: DatasetMetadata extracted by the SAS reader.
+        approx_distinct: Estimate the cardinality of columns with more than
+            10,000 distinct values instead of counting them exactly (see
+            ``profile_dataset_chunks``).
+
+    Returns:
+        DatasetProfile with per-variable statistics, EDC column detection,
+        and date format detection.
+    """
+    return profile_dataset_chunks([df], meta, approx_distinct=approx_distinct)
+
+
+def profile_dataset_chunks(
+    chunks: Iterable[pd.DataFrame],
+    meta: DatasetMetadata,
+    *,
+    approx_distinct: bool = True,
+) -> DatasetProfile:
+    """Profile a raw SAS dataset delivered as a stream of row chunks.
+
+    Per-variable statistics are merged chunk by chunk, so only one chunk
+    is resident at a time. The result is identical to ``profile_dataset``
+    on the concatenated DataFrame.
+
+    Every column is factorized once per chunk and all statistics (missing
+    count, cardinality, sample values, top values) are derived from the
+    codes with NumPy, so the cost is one hashing pass per column.
+
+    Args:
+        chunks: DataFrames with the same columns, in row order (e.g. from
+            iter_sas_chunks).
+        meta: DatasetMetadata extracted by the SAS reader (read_sas_metadata
+            suffices).
+        approx_distinct: Once a column has more than 10,000 distinct values,
+            stop counting them exactly and report a HyperLogLog estimate
+            (about 0.8% error) instead. On by default so memory stays
+            bounded for identifier-like, free-text and datetime columns of
+            files larger than RAM; pass False to count every column exactly.
+            Such columns have no top values either way, and their profiles
+            set ``n_unique_approximate``.
 
     Returns:
         DatasetProfile with per-variable statistics, EDC column detection,
@@ -244,21 +367,35 @@ def profile_dataset(df: pd.DataFrame, meta: DatasetMetadata) -> DatasetProfile:
         "Profiling dataset: {} ({} rows x {} cols)", meta.filename, meta.row_count, meta.col_count
     )
 
-    n_total = len(df)
+    # Build a quick lookup from variable name to metadata
+    var_meta_map = {v.name: v for v in meta.variables}
+
+    n_total = 0
+    accumulators: dict[str, _VariableAccumulator] = {}
+    for chunk in chunks:
+        n_total += len(chunk)
+        for col_name in chunk.columns:
+            acc = accumulators.get(col_name)
+            if acc is None:
+                var_meta = var_meta_map.get(col_name)
+                sas_format = var_meta.sas_format if var_meta else None
+                acc = accumulators[col_name] = _VariableAccumulator(
+                    collect_date_samples=not _is_sas_date_format(sas_format)
+                    and _is_potential_string_date_column(col_name),
+                    approx_distinct=approx_distinct,
+                )
+            acc.update(chunk[col_name])
+
     variable_profiles: list[VariableProfile] = []
     date_variables: list[str] = []
     edc_columns: list[str] = []
 
-    # Build a quick lookup from variable name to metadata
-    var_meta_map = {v.name: v for v in meta.variables}
-
-    for col_name in df.columns:
-        series = df[col_name]
+    for col_name, acc in accumulators.items():
         var_meta = var_meta_map.get(col_name)
 
         # Basic stats
-        n_missing = int(series.isna().sum())
-        n_unique = int(series.dropna().nunique())
+        n_missing = acc.n_missing
+        n_unique = acc.n_unique
         missing_pct = round(float(n_missing) / n_total * 100, 2) if n_total > 0 else 0.0
 
         # Variable metadata
@@ -267,8 +404,8 @@ def profile_dataset(df: pd.DataFrame, meta: DatasetMetadata) -> DatasetProfile:
         sas_format = var_meta.sas_format if var_meta else None
 
         # Sample and top values
-        sample_values = _compute_sample_values(series)
-        top_values = _compute_top_values(series, n_total)
+        sample_values = acc.sample_values()
+        top_values = acc.top_values(n_total)
 
         # EDC column detection
         is_edc = _is_edc_column(col_name)
@@ -284,8 +421,7 @@ def profile_dataset(df: pd.DataFrame, meta: DatasetMetadata) -> DatasetProfile:
 
         # String date detection for _RAW columns
         if not is_date and _is_potential_string_date_column(col_name):
-            non_empty = [str(v) for v in series.dropna().head(20).tolist() if str(v).strip()]
-            fmt = detect_date_format(non_empty)
+            fmt = detect_date_format(acc.date_samples)
             if fmt is not None:
                 is_date = True
                 detected_format = fmt
@@ -305,6 +441,7 @@ def profile_dataset(df: pd.DataFrame, meta: DatasetMetadata) -> DatasetProfile:
                 n_total=n_total,
                 n_missing=n_missing,
                 n_unique=n_unique,
+                n_unique_approximate=acc.is_approximate,
                 missing_pct=missing_pct,
                 sample_values=sample_values,
                 top_values=top_values,
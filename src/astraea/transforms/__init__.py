@@ -5,16 +5,27 @@ Re-exports key transform functions for convenient imports:
     from astraea.transforms import calculate_study_day, generate_seq
     from astraea.transforms import assign_epoch, assign_visit
     from astraea.transforms import validate_ascii, fix_common_non_ascii
-    from astraea.transforms import optimize_char_lengths
+    from astraea.transforms import optimize_char_lengths, scan_char_columns
+    from astraea.transforms import CharStorage, restore_char_columns
 """
 
 from astraea.transforms.ascii_validation import fix_common_non_ascii, validate_ascii
 from astraea.transforms.char_length import optimize_char_lengths
+from astraea.transforms.char_scan import CharColumnScan, scan_char_columns
+from astraea.transforms.char_storage import (
+    CharStorage,
+    compact_char_column,
+    restore_char_columns,
+)
 from astraea.transforms.dates import (
     detect_date_format,
     format_partial_iso8601,
+    format_partial_iso8601_column,
+    parse_string_date_column,
     parse_string_date_to_iso,
+    sas_date_column_to_iso,
     sas_date_to_iso,
+    sas_datetime_column_to_iso,
     sas_datetime_to_iso,
 )
 from astraea.transforms.epoch import assign_epoch
@@ -23,7 +34,13 @@ from astraea.transforms.imputation import (
     get_time_imputation_flag,
 )
 from astraea.transforms.sequence import generate_seq
-from astraea.transforms.study_day import calculate_study_day, calculate_study_day_column
+from astraea.transforms.study_day import (
+    build_reference_dates,
+    calculate_study_day,
+    calculate_study_day_column,
+    calculate_study_day_from_reference,
+    parse_iso_date_column,
+)
 from astraea.transforms.usubjid import (
     extract_usubjid_components,
     generate_usubjid,
@@ -38,11 +55,22 @@ __all__ = [
     "fix_common_non_ascii",
     # char length optimization
     "optimize_char_lengths",
+    # character column scan
+    "scan_char_columns",
+    "CharColumnScan",
+    # character column storage
+    "CharStorage",
+    "compact_char_column",
+    "restore_char_columns",
     # dates
     "sas_date_to_iso",
     "sas_datetime_to_iso",
+    "sas_date_column_to_iso",
+    "sas_datetime_column_to_iso",
     "parse_string_date_to_iso",
+    "parse_string_date_column",
     "format_partial_iso8601",
+    "format_partial_iso8601_column",
     "detect_date_format",
     # imputation flags
     "get_date_imputation_flag",
@@ -55,6 +83,9 @@ __all__ = [
     # study day
     "calculate_study_day",
     "calculate_study_day_column",
+    "calculate_study_day_from_reference",
+    "build_reference_dates",
+    "parse_iso_date_column",
     # sequence
     "generate_seq",
     # epoch
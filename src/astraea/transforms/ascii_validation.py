@@ -8,9 +8,12 @@ auto-replacement for common non-ASCII characters found in clinical data
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 
+from astraea.transforms.char_scan import CharColumnScan, scan_char_columns
+
 # Common non-ASCII characters found in clinical data and their ASCII replacements.
 _NON_ASCII_REPLACEMENTS: dict[str, str] = {
     "\u2018": "'",  # left single curly quote
@@ -27,14 +30,22 @@ _NON_ASCII_REPLACEMENTS: dict[str, str] = {
     "\u2265": ">=",  # greater-than-or-equal
 }
 
+_TRANSLATION = str.maketrans(_NON_ASCII_REPLACEMENTS)
+
 _MAX_ISSUES = 100
 
 
-def validate_ascii(df: pd.DataFrame) -> list[dict[str, str | int]]:
+def validate_ascii(
+    df: pd.DataFrame,
+    *,
+    char_scan: dict[str, CharColumnScan] | None = None,
+) -> list[dict[str, str | int]]:
     """Check all string columns for non-ASCII characters.
 
     Args:
         df: DataFrame to validate.
+        char_scan: Optional ``scan_char_columns`` result for ``df``; columns
+            it covers are not scanned again.
 
     Returns:
         List of dicts with keys: column, row, value, non_ascii_chars.
@@ -42,25 +53,18 @@ def validate_ascii(df: pd.DataFrame) -> list[dict[str, str | int]]:
     """
     issues: list[dict[str, str | int]] = []
 
-    string_cols = df.select_dtypes(include=["object", "string"]).columns
-
-    for col in string_cols:
-        for row_idx, val in df[col].items():
-            if len(issues) >= _MAX_ISSUES:
-                break
-            if pd.isna(val):
-                continue
-            str_val = str(val)
-            if not str_val.isascii():
-                non_ascii = "".join(c for c in str_val if ord(c) > 127)
-                issues.append(
-                    {
-                        "column": col,
-                        "row": row_idx,
-                        "value": str_val,
-                        "non_ascii_chars": non_ascii,
-                    }
-                )
+    for col, scan in scan_char_columns(df, char_scan).items():
+        for position in scan.non_ascii_rows[: _MAX_ISSUES - len(issues)]:
+            str_val = str(df[col].iloc[position])
+            non_ascii = "".join(c for c in str_val if ord(c) > 127)
+            issues.append(
+                {
+                    "column": col,
+                    "row": df.index[position],
+                    "value": str_val,
+                    "non_ascii_chars": non_ascii,
+                }
+            )
         if len(issues) >= _MAX_ISSUES:
             break
 
@@ -76,34 +80,87 @@ def validate_ascii(df: pd.DataFrame) -> list[dict[str, str | int]]:
     return issues
 
 
-def fix_common_non_ascii(df: pd.DataFrame) -> pd.DataFrame:
+def _fix_categorical(series: pd.Series) -> pd.Series:
+    """Translate the categories of a categorical text column, keeping it categorical.
+
+    Categories that become equal after translation are merged, and the
+    result's categories are sorted again.
+    """
+    categories = series.cat.categories
+    fixed = pd.Index([c.translate(_TRANSLATION) for c in categories])
+    changed = fixed != categories
+    if not changed.any():
+        return series
+
+    codes = series.cat.codes.to_numpy()
+    merged = fixed.unique().sort_values()
+    new_codes = merged.get_indexer(fixed)[codes]
+    new_codes[codes < 0] = -1
+    logger.info(
+        "Column '{}': {} non-ASCII replacement(s) applied",
+        series.name,
+        int(np.count_nonzero(changed[codes[codes >= 0]])),
+    )
+    return pd.Series(
+        pd.Categorical.from_codes(new_codes, categories=merged),
+        index=series.index,
+        name=series.name,
+    )
+
+
+def fix_common_non_ascii(
+    df: pd.DataFrame,
+    *,
+    char_scan: dict[str, CharColumnScan] | None = None,
+) -> pd.DataFrame:
     """Replace common non-ASCII characters with ASCII equivalents.
 
     Works on a copy of the DataFrame. Applies replacements from the
-    ``_NON_ASCII_REPLACEMENTS`` map to all object/string columns.
+    ``_NON_ASCII_REPLACEMENTS`` map to all object/string columns in a
+    single ``str.translate`` pass. Columns that are already ASCII are
+    skipped; in the others only the distinct values are translated and
+    the results are broadcast back to the rows. Categorical columns stay
+    categorical, with their categories translated. Missing values and
+    non-string values are left untouched.
 
     Args:
         df: DataFrame to fix.
+        char_scan: Optional ``scan_char_columns`` result for ``df``, used
+            to skip clean columns without scanning them again.
 
     Returns:
         New DataFrame with common non-ASCII characters replaced.
     """
     result = df.copy()
-    string_cols = result.select_dtypes(include=["object", "string"]).columns
-
-    for col in string_cols:
-        col_replacements = 0
-        for old_char, new_char in _NON_ASCII_REPLACEMENTS.items():
-            mask = result[col].astype(str).str.contains(old_char, na=False)
-            count = mask.sum()
-            if count > 0:
-                result[col] = result[col].astype(str).str.replace(old_char, new_char, regex=False)
-                col_replacements += count
-        if col_replacements > 0:
-            logger.info(
-                "Column '{}': {} non-ASCII replacement(s) applied",
-                col,
-                col_replacements,
-            )
+
+    for col, scan in scan_char_columns(df, char_scan).items():
+        if not scan.non_ascii_count:
+            continue
+
+        if isinstance(result[col].dtype, pd.CategoricalDtype):
+            result[col] = _fix_categorical(result[col])
+            continue
+
+        codes, uniques = pd.factorize(result[col])
+        fixed = np.array(
+            [u.translate(_TRANSLATION) if isinstance(u, str) else u for u in uniques],
+            dtype=object,
+        )
+        changed = fixed != uniques.to_numpy(dtype=object)
+        if not changed.any():
+            continue
+
+        values = result[col].to_numpy(dtype=object, copy=True)
+        present = codes >= 0
+        values[present] = fixed[codes[present]]
+        result[col] = pd.Series(values, index=result.index, dtype=result[col].dtype)
+
+        col_replacements = int(np.count_nonzero(changed[codes[present]]))
+        logger.info(
+            "Column '{}': {} non-ASCII replacement(s) applied",
+            col,
+            col_replacements,
+        )
 
     return result
+
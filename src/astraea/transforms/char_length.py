@@ -7,34 +7,41 @@ character column, preventing bloated XPT files and potential P21 warnings.
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 
+from astraea.transforms.char_scan import (
+    CharColumnScan,
+    factorize_text,
+    scan_char_columns,
+)
 
-def optimize_char_lengths(df: pd.DataFrame) -> dict[str, int]:
+
+def optimize_char_lengths(
+    df: pd.DataFrame,
+    *,
+    char_scan: dict[str, CharColumnScan] | None = None,
+) -> dict[str, int]:
     """Compute optimal byte width for each character column.
 
     For each object/string column, determines the maximum byte length
     of non-null values (using ASCII encoding with replacement for any
-    remaining non-ASCII bytes). Minimum width is always 1.
+    remaining non-ASCII bytes, i.e. one byte per character). Minimum
+    width is always 1.
 
     Args:
         df: DataFrame to analyze.
+        char_scan: Optional ``scan_char_columns`` result for ``df``; columns
+            it covers are not scanned again.
 
     Returns:
         Dict mapping column name to optimal byte width.
         Only includes object/string columns.
     """
-    widths: dict[str, int] = {}
-    string_cols = df.select_dtypes(include=["object", "string"]).columns
-
-    for col in string_cols:
-        non_null = df[col].dropna()
-        if len(non_null) == 0:
-            widths[col] = 1
-        else:
-            max_len = non_null.astype(str).str.encode("ascii", errors="replace").str.len().max()
-            widths[col] = max(1, int(max_len))
+    widths = {
+        col: max(1, scan.max_chars) for col, scan in scan_char_columns(df, char_scan).items()
+    }
 
     # Cap at XPT v5 max of 200 bytes
     for col in widths:
@@ -55,37 +62,37 @@ def optimize_char_lengths(df: pd.DataFrame) -> dict[str, int]:
 
 
 def validate_char_max_length(
-    df: pd.DataFrame, max_bytes: int = 200
+    df: pd.DataFrame,
+    max_bytes: int = 200,
+    *,
+    char_scan: dict[str, CharColumnScan] | None = None,
 ) -> dict[str, list[int]]:
     """Validate that character column values do not exceed max byte length.
 
-    Iterates over string/object columns, encodes non-null values to ASCII
-    (with replacement for non-ASCII bytes), and checks byte length against
-    the limit.
+    Checks string/object columns, measuring non-null values as ASCII
+    (with replacement for non-ASCII bytes), against the limit. Columns
+    whose longest value fits are skipped without locating rows.
 
     Args:
         df: DataFrame to validate.
         max_bytes: Maximum allowed byte length per value. Default 200
             (XPT v5 character variable limit).
+        char_scan: Optional ``scan_char_columns`` result for ``df``.
 
     Returns:
         Dict mapping column name to list of row indices where values
         exceed max_bytes. Empty dict if no violations found.
     """
     violations: dict[str, list[int]] = {}
-    string_cols = df.select_dtypes(include=["object", "string"]).columns
-
-    for col in string_cols:
-        col_violations: list[int] = []
-        for idx in df.index:
-            val = df.at[idx, col]
-            if pd.isna(val):
-                continue
-            byte_len = len(str(val).encode("ascii", errors="replace"))
-            if byte_len > max_bytes:
-                col_violations.append(idx)
-        if col_violations:
-            violations[col] = col_violations
+
+    for col, scan in scan_char_columns(df, char_scan).items():
+        if scan.max_chars <= max_bytes:
+            continue
+        codes, text = factorize_text(df[col])
+        too_long = text.str.len().to_numpy() > max_bytes
+        present = codes >= 0
+        rows = present & too_long[np.where(present, codes, 0)]
+        violations[col] = df.index[rows].tolist()
 
     if violations:
         logger.warning(
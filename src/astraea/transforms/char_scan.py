@@ -0,0 +1,131 @@
+"""Column-level scan of character data for XPT checks.
+
+The ASCII check, character length optimization and XPT v5 pre-write
+validation all need the same facts about each character column: the
+longest value in characters and in UTF-8 bytes, and which rows hold
+non-ASCII text. ``scan_char_columns`` computes them once per column,
+working on the column's distinct values rather than on every cell --
+clinical character columns (test codes, units, visit names) typically
+have a handful of distinct values across millions of rows.
+
+The scan is a plain snapshot: pass it to the consumers
+(``validate_ascii``, ``optimize_char_lengths``, ``validate_for_xpt_v5``)
+only while the DataFrame it was taken from is unchanged.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, Field
+
+# Row positions of non-ASCII values kept per column (enough for the
+# 100-issue cap of validate_ascii)
+_MAX_ROW_SAMPLES = 100
+
+
+class CharColumnScan(BaseModel):
+    """Length and ASCII facts for one character column."""
+
+    max_chars: int = Field(default=0, ge=0, description="Longest non-null value in characters")
+    max_bytes: int = Field(default=0, ge=0, description="Longest non-null value in UTF-8 bytes")
+    non_ascii_count: int = Field(default=0, ge=0, description="Rows holding non-ASCII text")
+    non_ascii_rows: list[int] = Field(
+        default_factory=list,
+        description=f"Positions of the first {_MAX_ROW_SAMPLES} non-ASCII rows",
+    )
+
+
+def factorize_text(series: pd.Series) -> tuple[np.ndarray, pd.Series]:
+    """Factorize a column into integer codes and its distinct values as strings.
+
+    Missing values get code -1. Non-string values are rendered with
+    ``str()``, as the XPT writer would.
+
+    Returns:
+        Tuple of (codes, distinct values as a string Series).
+    """
+    codes, uniques = pd.factorize(series)
+    return codes, pd.Series(uniques.astype(str), dtype=str)
+
+
+def scan_char_column(series: pd.Series) -> CharColumnScan:
+    """Scan one character column (see module docstring)."""
+    codes, text = factorize_text(series)
+    if text.empty:
+        return CharColumnScan()
+
+    n_chars = text.str.len().to_numpy()
+    n_bytes = text.str.encode("utf-8").str.len().to_numpy()
+    # A value is ASCII exactly when every character encodes to one byte
+    non_ascii = n_bytes != n_chars
+
+    scan = CharColumnScan(max_chars=int(n_chars.max()), max_bytes=int(n_bytes.max()))
+    if non_ascii.any():
+        present = codes >= 0
+        rows = present & non_ascii[np.where(present, codes, 0)]
+        positions = np.flatnonzero(rows)
+        scan.non_ascii_count = len(positions)
+        scan.non_ascii_rows = positions[:_MAX_ROW_SAMPLES].tolist()
+    return scan
+
+
+def char_columns(df: pd.DataFrame) -> list[str]:
+    """Names of the object/string columns of ``df``, and its categorical text columns."""
+    return [
+        col
+        for col, dtype in df.dtypes.items()
+        if pd.api.types.is_object_dtype(dtype)
+        or isinstance(dtype, pd.StringDtype)
+        or (
+            isinstance(dtype, pd.CategoricalDtype)
+            and pd.api.types.infer_dtype(dtype.categories, skipna=True) == "string"
+        )
+    ]
+
+
+def scan_char_columns(
+    df: pd.DataFrame,
+    char_scan: dict[str, CharColumnScan] | None = None,
+) -> dict[str, CharColumnScan]:
+    """Scan every object/string column of ``df``.
+
+    Args:
+        df: DataFrame to scan.
+        char_scan: An earlier scan of the same DataFrame. Its entries are
+            reused; only columns it does not cover are scanned.
+
+    Returns:
+        Dict mapping column name to its CharColumnScan.
+    """
+    previous = char_scan or {}
+    return {
+        col: previous[col] if col in previous else scan_char_column(df[col])
+        for col in char_columns(df)
+    }
+
+
+def stack_char_scans(
+    blocks: list[tuple[dict[str, CharColumnScan], int]],
+) -> dict[str, CharColumnScan]:
+    """Combine scans of consecutive row blocks into a scan of the stacked rows.
+
+    Args:
+        blocks: ``(scan, n_rows)`` per block, in stacking order.
+
+    Returns:
+        Dict mapping column name to the CharColumnScan of the column over
+        all blocks, with non-ASCII row positions offset accordingly.
+    """
+    combined: dict[str, CharColumnScan] = {}
+    offset = 0
+    for char_scan, n_rows in blocks:
+        for col, scan in char_scan.items():
+            total = combined.setdefault(col, CharColumnScan())
+            total.max_chars = max(total.max_chars, scan.max_chars)
+            total.max_bytes = max(total.max_bytes, scan.max_bytes)
+            total.non_ascii_count += scan.non_ascii_count
+            room = _MAX_ROW_SAMPLES - len(total.non_ascii_rows)
+            total.non_ascii_rows.extend(offset + row for row in scan.non_ascii_rows[:room])
+        offset += n_rows
+    return combined
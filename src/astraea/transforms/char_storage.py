@@ -0,0 +1,119 @@
+"""Compact storage for the character columns of SDTM result frames.
+
+SDTM frames are dominated by low-cardinality repeated strings -- STUDYID,
+DOMAIN, USUBJID, VISIT, EPOCH, --TESTCD, units -- which object dtype
+stores as one Python object reference per cell, and for derived values
+often one string object per cell. ``compact_char_column`` stores such a
+column either as ``category`` (small integer codes into the distinct
+values) or as Arrow-backed strings (``string[pyarrow]``, one contiguous
+buffer); ``restore_char_columns`` turns them back into object columns.
+
+The transforms that run on result frames -- --SEQ generation, row sort,
+ASCII fix, character scans, XPT encoding -- work on a categorical
+column's categories and codes, not on every cell, so a compact frame is
+only expanded to per-row byte strings chunk by chunk inside the XPT writer.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from enum import StrEnum
+
+import pandas as pd
+
+# Categorical storage only pays off when values repeat: columns with more
+# distinct values than this share of their rows stay as they are
+_MAX_CATEGORY_RATIO = 0.5
+
+
+class CharStorage(StrEnum):
+    """How DatasetExecutor stores character result columns."""
+
+    OBJECT = "object"
+    CATEGORY = "category"
+    ARROW = "arrow"
+
+
+def require_char_storage(storage: CharStorage | str) -> CharStorage:
+    """Validate a storage mode, checking that its backend is installed.
+
+    Raises:
+        ValueError: If ``storage`` is not a CharStorage value.
+        ImportError: If ``storage`` is ARROW and pyarrow is not installed.
+    """
+    storage = CharStorage(storage)
+    if storage == CharStorage.ARROW and importlib.util.find_spec("pyarrow") is None:
+        msg = (
+            "pyarrow is required for Arrow-backed character storage but is not "
+            "installed. Install it with: pip install pyarrow"
+        )
+        raise ImportError(msg)
+    return storage
+
+
+def is_text_column(series: pd.Series) -> bool:
+    """True for object columns whose non-null values are all ``str``."""
+    return (
+        pd.api.types.is_object_dtype(series)
+        and pd.api.types.infer_dtype(series, skipna=True) == "string"
+    )
+
+
+def is_compact_text(series: pd.Series) -> bool:
+    """True for categorical columns of strings and for pandas string columns."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return pd.api.types.infer_dtype(series.cat.categories, skipna=True) in ("string", "empty")
+    return isinstance(series.dtype, pd.StringDtype)
+
+
+def compact_char_column(series: pd.Series, storage: CharStorage) -> pd.Series:
+    """Store a text column compactly; other columns are returned unchanged.
+
+    CATEGORY converts columns with at most ``_MAX_CATEGORY_RATIO`` distinct
+    values per row, with the categories in sorted order so that sorting by
+    codes sorts by value. ARROW converts every text column.
+
+    Args:
+        series: Result column, e.g. a pattern handler's output.
+        storage: Target storage.
+
+    Returns:
+        The compacted column, or ``series`` itself.
+    """
+    if storage == CharStorage.OBJECT or not is_text_column(series):
+        return series
+    if storage == CharStorage.ARROW:
+        return series.astype("string[pyarrow]")
+    if series.nunique() > _MAX_CATEGORY_RATIO * len(series):
+        return series
+    return series.astype("category")
+
+
+def compact_char_columns(df: pd.DataFrame, storage: CharStorage) -> pd.DataFrame:
+    """Apply ``compact_char_column`` to every column of ``df``, in place.
+
+    Returns:
+        ``df``, for chaining.
+    """
+    if storage == CharStorage.OBJECT:
+        return df
+    for col in df.columns:
+        series = df[col]
+        compacted = compact_char_column(series, storage)
+        if compacted is not series:
+            df[col] = compacted
+    return df
+
+
+def restore_char_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert compact text columns back to object columns, None for missing.
+
+    Returns:
+        A new DataFrame; ``df`` is unchanged.
+    """
+    restored = df.copy(deep=False)
+    for col in df.columns:
+        if is_compact_text(df[col]):
+            values = df[col].astype(object)
+            restored[col] = values.where(values.notna(), None)
+    return restored
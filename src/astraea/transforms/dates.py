@@ -3,7 +3,8 @@
 Deterministic converters for:
 - SAS DATE values (days since 1960-01-01) -> ISO 8601
 - SAS DATETIME values (seconds since 1960-01-01 00:00:00) -> ISO 8601
-- String dates in various formats -> ISO 8601
+- Whole SAS DATE/DATETIME columns -> ISO 8601 in one NumPy pass
+- String dates in various formats -> ISO 8601 (per value or per column)
 - Partial dates -> truncated ISO 8601 per SDTM-IG rules
 
 All functions are pure -- no LLM, no guessing, no side effects.
@@ -13,8 +14,11 @@ from __future__ import annotations
 
 import math
 import re
+from collections.abc import Callable
 from datetime import UTC, date, datetime, timedelta
 
+import numpy as np
+import pandas as pd
 from loguru import logger
 
 
@@ -53,6 +57,14 @@ def _validate_date_components(
 SAS_EPOCH = date(1960, 1, 1)
 SAS_EPOCH_DATETIME = datetime(1960, 1, 1, tzinfo=UTC)
 
+# Representable range of the scalar converters (Python date/datetime, years 1-9999),
+# expressed as SAS offsets so the column kernels reject exactly the same values.
+_SAS_MIN_DAYS = (date.min - SAS_EPOCH).days
+_SAS_MAX_DAYS = (date.max - SAS_EPOCH).days
+_SAS_MIN_SECONDS = _SAS_MIN_DAYS * 86_400
+_SAS_MAX_SECONDS = _SAS_MAX_DAYS * 86_400 + 86_399
+_SAS_EPOCH_NP = np.datetime64("1960-01-01", "D")
+
 # Month abbreviation -> number mapping (case-insensitive)
 _MONTH_ABBREV: dict[str, int] = {
     "jan": 1,
@@ -178,6 +190,265 @@ def sas_datetime_to_iso(sas_numeric: float | None) -> str:
     return result_dt.strftime("%Y-%m-%dT%H:%M:%S")
 
 
+def _sas_offsets(
+    values: pd.Series, low: int, high: int, unit: str
+) -> tuple[np.ndarray, np.ndarray]:
+    """Round a SAS numeric column to int64 offsets, validating the representable range.
+
+    Returns:
+        Tuple of (int64 offsets with 0 at missing positions, boolean missing mask).
+
+    Raises:
+        OverflowError: If any value falls outside the range the scalar
+            converters can represent.
+    """
+    numeric = pd.to_numeric(values, errors="raise")
+    arr = np.asarray(numeric, dtype="float64")
+    missing = np.isnan(arr)
+    filled = np.where(missing, 0.0, arr)
+    rounded = np.rint(filled)  # round-half-to-even, same as round()
+
+    out_of_range = (rounded < low) | (rounded > high)
+    if out_of_range.any():
+        bad = filled[out_of_range][0]
+        msg = f"SAS {unit} value {bad!r} is outside the representable date range"
+        raise OverflowError(msg)
+
+    return rounded.astype("int64"), missing
+
+
+def sas_date_column_to_iso(values: pd.Series) -> pd.Series:
+    """Convert a column of SAS DATE values (days since 1960-01-01) to ISO 8601.
+
+    Array-level equivalent of ``sas_date_to_iso``: the whole column is
+    converted with NumPy ``datetime64`` arithmetic in one pass.
+
+    Args:
+        values: Series of SAS DATE numerics (float64, NaN for missing).
+
+    Returns:
+        Object-dtype Series of "YYYY-MM-DD" strings ("" for missing),
+        aligned with ``values.index``.
+
+    Raises:
+        OverflowError: If a value is outside the range ``sas_date_to_iso``
+            supports.
+    """
+    days, missing = _sas_offsets(values, _SAS_MIN_DAYS, _SAS_MAX_DAYS, "DATE")
+    dates = _SAS_EPOCH_NP + days.astype("timedelta64[D]")
+    result = np.datetime_as_string(dates, unit="D").astype(object)
+    result[missing] = ""
+    return pd.Series(result, index=values.index, dtype="object")
+
+
+def sas_datetime_column_to_iso(values: pd.Series) -> pd.Series:
+    """Convert a column of SAS DATETIME values (seconds since 1960-01-01) to ISO 8601.
+
+    Array-level equivalent of ``sas_datetime_to_iso``: the whole column is
+    converted with NumPy ``datetime64`` arithmetic in one pass.
+
+    Args:
+        values: Series of SAS DATETIME numerics (float64, NaN for missing).
+
+    Returns:
+        Object-dtype Series of "YYYY-MM-DDTHH:MM:SS" strings ("" for missing),
+        aligned with ``values.index``.
+
+    Raises:
+        OverflowError: If a value is outside the range ``sas_datetime_to_iso``
+            supports.
+    """
+    seconds, missing = _sas_offsets(values, _SAS_MIN_SECONDS, _SAS_MAX_SECONDS, "DATETIME")
+    stamps = _SAS_EPOCH_NP.astype("datetime64[s]") + seconds.astype("timedelta64[s]")
+    result = np.datetime_as_string(stamps, unit="s").astype(object)
+    result[missing] = ""
+    return pd.Series(result, index=values.index, dtype="object")
+
+
+# A parse step returns (iso_value, warning). ``warning`` is a loguru message
+# template with one "{}" placeholder for the input, or None on success.
+_ParseResult = tuple[str, str | None]
+_ParseStep = tuple[re.Pattern[str], Callable[[re.Match[str], str], _ParseResult]]
+
+
+def _parse_un_unk_yyyy(m: re.Match[str], s: str) -> _ParseResult:
+    """"UN UNK YYYY" or "UNK UNK YYYY" -- unknown day and month."""
+    year = int(m.group(1))
+    if not _validate_date_components(year=year):
+        return "", "Invalid year in date string: '{}'"
+    return f"{year:04d}", None
+
+
+def _parse_un_mon_yyyy(m: re.Match[str], s: str) -> _ParseResult:
+    """"UN Mon YYYY" or "UNK Mon YYYY" -- unknown day only."""
+    month = _MONTH_ABBREV[m.group(1).lower()]
+    year = int(m.group(2))
+    if not _validate_date_components(year=year, month=month):
+        return "", "Invalid date components in: '{}'"
+    return f"{year:04d}-{month:02d}", None
+
+
+def _parse_iso_datetime(m: re.Match[str], s: str) -> _ParseResult:
+    """ISO datetime passthrough: "YYYY-MM-DDTHH:MM(:SS)?" with optional timezone."""
+    year = int(m.group(1))
+    month = int(m.group(2))
+    day = int(m.group(3))
+    if not _validate_date_components(year=year, month=month, day=day):
+        return "", "Invalid date in ISO datetime string: '{}'"
+    return s, None
+
+
+def _parse_dd_mon_yyyy_hhmm(m: re.Match[str], s: str) -> _ParseResult:
+    """"DD MON YYYY HH:MM(:SS)?" -- datetime string."""
+    day = int(m.group(1))
+    month = _MONTH_ABBREV[m.group(2).lower()]
+    year = int(m.group(3))
+    hour = int(m.group(4))
+    minute = int(m.group(5))
+    second_str = m.group(6)
+    if not _validate_date_components(year=year, month=month, day=day):
+        return "", "Invalid date in datetime string: '{}'"
+    if hour < 0 or hour > 23 or minute < 0 or minute > 59:
+        return "", "Invalid time in datetime string: '{}'"
+    if second_str is not None:
+        second = int(second_str)
+        if second < 0 or second > 59:
+            return "", "Invalid seconds in datetime string: '{}'"
+        return f"{year:04d}-{month:02d}-{day:02d}T{hour:02d}:{minute:02d}:{second:02d}", None
+    return f"{year:04d}-{month:02d}-{day:02d}T{hour:02d}:{minute:02d}", None
+
+
+def _parse_dd_mon_yyyy(m: re.Match[str], s: str) -> _ParseResult:
+    """"DD Mon YYYY" or "DDMonYYYY" -- full date with month abbreviation."""
+    day = int(m.group(1))
+    month = _MONTH_ABBREV[m.group(2).lower()]
+    year = int(m.group(3))
+    if not _validate_date_components(year=year, month=month, day=day):
+        return "", "Invalid date: '{}'"
+    return f"{year:04d}-{month:02d}-{day:02d}", None
+
+
+def _parse_yyyy_mm_dd(m: re.Match[str], s: str) -> _ParseResult:
+    """"YYYY-MM-DD" -- pass through (with validation)."""
+    year = int(m.group(1))
+    month = int(m.group(2))
+    day = int(m.group(3))
+    if not _validate_date_components(year=year, month=month, day=day):
+        return "", "Invalid date: '{}'"
+    return s, None
+
+
+def _parse_mon_yyyy(m: re.Match[str], s: str) -> _ParseResult:
+    """"Mon YYYY" -- partial date."""
+    month = _MONTH_ABBREV[m.group(1).lower()]
+    year = int(m.group(2))
+    if not _validate_date_components(year=year, month=month):
+        return "", "Invalid date: '{}'"
+    return f"{year:04d}-{month:02d}", None
+
+
+def _parse_yyyy_mm(m: re.Match[str], s: str) -> _ParseResult:
+    """"YYYY-MM" -- partial, pass through."""
+    year = int(m.group(1))
+    month = int(m.group(2))
+    if not _validate_date_components(year=year, month=month):
+        return "", "Invalid date: '{}'"
+    return s, None
+
+
+def _parse_slash_date(m: re.Match[str], s: str) -> _ParseResult:
+    """Slash-separated: DD/MM/YYYY or MM/DD/YYYY, decided per value."""
+    first = int(m.group(1))
+    second = int(m.group(2))
+    year = int(m.group(3))
+
+    if first > 12:
+        # Must be DD/MM/YYYY (day > 12 can't be month)
+        day, month = first, second
+    elif second > 12:
+        # Must be MM/DD/YYYY (second > 12 can't be month)
+        month, day = first, second
+    else:
+        # Ambiguous -- default to DD/MM/YYYY
+        day, month = first, second
+        logger.debug(
+            "Ambiguous date '{}': assuming DD/MM/YYYY -> day={}, month={}",
+            s,
+            day,
+            month,
+        )
+
+    if not _validate_date_components(year=year, month=month, day=day):
+        return "", "Invalid date: '{}'"
+    return f"{year:04d}-{month:02d}-{day:02d}", None
+
+
+def _parse_yyyy(m: re.Match[str], s: str) -> _ParseResult:
+    """"YYYY" -- partial year only."""
+    year = int(m.group(1))
+    if not _validate_date_components(year=year):
+        return "", "Invalid year: '{}'"
+    return s, None
+
+
+# Order matters: the first matching pattern wins (e.g. the datetime form of
+# "DD MON YYYY HH:MM" must be tried before the plain "DD Mon YYYY").
+_STRING_DATE_LADDER: tuple[_ParseStep, ...] = (
+    (_PATTERN_UN_UNK_YYYY, _parse_un_unk_yyyy),
+    (_PATTERN_UN_MON_YYYY, _parse_un_mon_yyyy),
+    (_PATTERN_ISO_DATETIME, _parse_iso_datetime),
+    (_PATTERN_DD_MON_YYYY_HHMM, _parse_dd_mon_yyyy_hhmm),
+    (_PATTERN_DD_MON_YYYY, _parse_dd_mon_yyyy),
+    (_PATTERN_DDMONYYYY, _parse_dd_mon_yyyy),
+    (_PATTERN_YYYY_MM_DD, _parse_yyyy_mm_dd),
+    (_PATTERN_MON_YYYY, _parse_mon_yyyy),
+    (_PATTERN_YYYY_MM, _parse_yyyy_mm),
+    (_PATTERN_SLASH_DMY_OR_MDY, _parse_slash_date),
+    (_PATTERN_YYYY, _parse_yyyy),
+)
+
+# detect_date_format() result -> the ladder step that parses it. None of these
+# patterns can match a value that an earlier ladder step would also match, so
+# trying the dominant step first never changes the result. Slash dates are
+# still disambiguated per value.
+_FORMAT_FAST_PATH: dict[str, _ParseStep] = {
+    "DD Mon YYYY": (_PATTERN_DD_MON_YYYY, _parse_dd_mon_yyyy),
+    "DDMonYYYY": (_PATTERN_DDMONYYYY, _parse_dd_mon_yyyy),
+    "YYYY-MM-DD": (_PATTERN_YYYY_MM_DD, _parse_yyyy_mm_dd),
+    "DD/MM/YYYY": (_PATTERN_SLASH_DMY_OR_MDY, _parse_slash_date),
+    "MM/DD/YYYY": (_PATTERN_SLASH_DMY_OR_MDY, _parse_slash_date),
+}
+
+# Distinct values handed to detect_date_format() when no format is supplied.
+_FORMAT_DETECTION_SAMPLES = 100
+# Unparseable values quoted in the per-column warning.
+_MAX_WARNING_EXAMPLES = 5
+
+
+def _parse_string_date(s: str, first_step: _ParseStep | None = None) -> _ParseResult:
+    """Run a stripped, non-empty string through the format ladder.
+
+    Args:
+        s: Date string, already stripped.
+        first_step: Optional step to try before the ladder (the column's
+            dominant format).
+
+    Returns:
+        Tuple of (ISO 8601 string or "", warning template or None).
+    """
+    if first_step is not None:
+        m = first_step[0].match(s)
+        if m:
+            return first_step[1](m, s)
+
+    for pattern, parse in _STRING_DATE_LADDER:
+        m = pattern.match(s)
+        if m:
+            return parse(m, s)
+
+    return "", "Could not parse date string: '{}'"
+
+
 def parse_string_date_to_iso(date_str: str | None) -> str:
     """Parse various string date formats to ISO 8601.
 
@@ -209,152 +480,58 @@ def parse_string_date_to_iso(date_str: str | None) -> str:
         return ""
 
     s = str(date_str).strip()
+    result, warning = _parse_string_date(s)
+    if warning is not None:
+        logger.warning(warning, s)
+    return result
+
 
-    # "UN UNK YYYY" or "UNK UNK YYYY" -- unknown day and month
-    m = _PATTERN_UN_UNK_YYYY.match(s)
-    if m:
-        year = int(m.group(1))
-        if not _validate_date_components(year=year):
-            logger.warning("Invalid year in date string: '{}'", s)
-            return ""
-        return f"{year:04d}"
-
-    # "UN Mon YYYY" or "UNK Mon YYYY" -- unknown day only
-    m = _PATTERN_UN_MON_YYYY.match(s)
-    if m:
-        month = _MONTH_ABBREV[m.group(1).lower()]
-        year = int(m.group(2))
-        if not _validate_date_components(year=year, month=month):
-            logger.warning("Invalid date components in: '{}'", s)
-            return ""
-        return f"{year:04d}-{month:02d}"
-
-    # ISO datetime passthrough: "YYYY-MM-DDTHH:MM(:SS)?" with optional timezone
-    m = _PATTERN_ISO_DATETIME.match(s)
-    if m:
-        year = int(m.group(1))
-        month_num = int(m.group(2))
-        day = int(m.group(3))
-        if not _validate_date_components(year=year, month=month_num, day=day):
-            logger.warning("Invalid date in ISO datetime string: '{}'", s)
-            return ""
-        return s.strip()
-
-    # "DD MON YYYY HH:MM(:SS)?" -- datetime string (must be before DD Mon YYYY)
-    m = _PATTERN_DD_MON_YYYY_HHMM.match(s)
-    if m:
-        day = int(m.group(1))
-        month = _MONTH_ABBREV[m.group(2).lower()]
-        year = int(m.group(3))
-        hour = int(m.group(4))
-        minute = int(m.group(5))
-        second_str = m.group(6)
-        if not _validate_date_components(year=year, month=month, day=day):
-            logger.warning("Invalid date in datetime string: '{}'", s)
-            return ""
-        if hour < 0 or hour > 23 or minute < 0 or minute > 59:
-            logger.warning("Invalid time in datetime string: '{}'", s)
-            return ""
-        if second_str is not None:
-            second = int(second_str)
-            if second < 0 or second > 59:
-                logger.warning("Invalid seconds in datetime string: '{}'", s)
-                return ""
-            return f"{year:04d}-{month:02d}-{day:02d}T{hour:02d}:{minute:02d}:{second:02d}"
-        return f"{year:04d}-{month:02d}-{day:02d}T{hour:02d}:{minute:02d}"
-
-    # "DD Mon YYYY" -- primary format in Fakedata _RAW columns
-    m = _PATTERN_DD_MON_YYYY.match(s)
-    if m:
-        day = int(m.group(1))
-        month = _MONTH_ABBREV[m.group(2).lower()]
-        year = int(m.group(3))
-        if not _validate_date_components(year=year, month=month, day=day):
-            logger.warning("Invalid date: '{}'", s)
-            return ""
-        return f"{year:04d}-{month:02d}-{day:02d}"
-
-    # "DDMonYYYY" -- no spaces (e.g., "30MAR2022")
-    m = _PATTERN_DDMONYYYY.match(s)
-    if m:
-        day = int(m.group(1))
-        month = _MONTH_ABBREV[m.group(2).lower()]
-        year = int(m.group(3))
-        if not _validate_date_components(year=year, month=month, day=day):
-            logger.warning("Invalid date: '{}'", s)
-            return ""
-        return f"{year:04d}-{month:02d}-{day:02d}"
-
-    # "YYYY-MM-DD" -- pass through (with validation)
-    m = _PATTERN_YYYY_MM_DD.match(s)
-    if m:
-        year = int(m.group(1))
-        month = int(m.group(2))
-        day = int(m.group(3))
-        if not _validate_date_components(year=year, month=month, day=day):
-            logger.warning("Invalid date: '{}'", s)
-            return ""
-        return s.strip()
-
-    # "Mon YYYY" -- partial date
-    m = _PATTERN_MON_YYYY.match(s)
-    if m:
-        month = _MONTH_ABBREV[m.group(1).lower()]
-        year = int(m.group(2))
-        if not _validate_date_components(year=year, month=month):
-            logger.warning("Invalid date: '{}'", s)
-            return ""
-        return f"{year:04d}-{month:02d}"
-
-    # "YYYY-MM" -- partial, pass through
-    m = _PATTERN_YYYY_MM.match(s)
-    if m:
-        year = int(m.group(1))
-        month = int(m.group(2))
-        if not _validate_date_components(year=year, month=month):
-            logger.warning("Invalid date: '{}'", s)
-            return ""
-        return s.strip()
-
-    # Slash-separated: DD/MM/YYYY or MM/DD/YYYY
-    m = _PATTERN_SLASH_DMY_OR_MDY.match(s)
-    if m:
-        first = int(m.group(1))
-        second = int(m.group(2))
-        year = int(m.group(3))
-
-        if first > 12:
-            # Must be DD/MM/YYYY (day > 12 can't be month)
-            day, month = first, second
-        elif second > 12:
-            # Must be MM/DD/YYYY (second > 12 can't be month)
-            month, day = first, second
-        else:
-            # Ambiguous -- default to DD/MM/YYYY
-            day, month = first, second
-            logger.debug(
-                "Ambiguous date '{}': assuming DD/MM/YYYY -> day={}, month={}",
-                s,
-                day,
-                month,
-            )
-
-        if not _validate_date_components(year=year, month=month, day=day):
-            logger.warning("Invalid date: '{}'", s)
-            return ""
-        return f"{year:04d}-{month:02d}-{day:02d}"
-
-    # "YYYY" -- partial year only
-    m = _PATTERN_YYYY.match(s)
-    if m:
-        year = int(m.group(1))
-        if not _validate_date_components(year=year):
-            logger.warning("Invalid year: '{}'", s)
-            return ""
-        return s.strip()
-
-    logger.warning("Could not parse date string: '{}'", s)
-    return ""
+def parse_string_date_column(values: pd.Series, date_format: str | None = None) -> pd.Series:
+    """Parse a column of string dates to ISO 8601.
+
+    Column-level equivalent of ``parse_string_date_to_iso``. Each distinct
+    value is parsed once and broadcast back through ``pd.factorize`` codes.
+    The column's dominant format is tried first, so only outliers walk the
+    full format ladder, and unparseable values are reported in one warning
+    per column instead of one per row.
+
+    Args:
+        values: Series of raw date strings.
+        date_format: Dominant format name as returned by
+            ``detect_date_format`` (e.g. from the dataset profile). When None
+            it is detected from a sample of the column's distinct values.
+
+    Returns:
+        Object-dtype Series of ISO 8601 strings ("" for missing or
+        unparseable values), aligned with ``values.index``.
+    """
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    stripped = [str(v).strip() for v in uniques]
+
+    if date_format is None:
+        date_format = detect_date_format([s for s in stripped[:_FORMAT_DETECTION_SAMPLES] if s])
+    first_step = _FORMAT_FAST_PATH.get(date_format) if date_format else None
+
+    # One extra trailing slot so factorize's -1 (missing) sentinel maps to "".
+    parsed = np.full(len(stripped) + 1, "", dtype=object)
+    failures: list[str] = []
+    for i, s in enumerate(stripped):
+        if not s:
+            continue
+        result, warning = _parse_string_date(s, first_step)
+        parsed[i] = result
+        if warning is not None:
+            failures.append(s)
+
+    if failures:
+        logger.warning(
+            "Could not convert {} distinct date value(s) in column '{}' to ISO 8601: {}",
+            len(failures),
+            values.name,
+            ", ".join(repr(f) for f in failures[:_MAX_WARNING_EXAMPLES]),
+        )
+
+    return pd.Series(parsed[codes], index=values.index, dtype="object")
 
 
 def format_partial_iso8601(
@@ -426,6 +603,80 @@ def format_partial_iso8601(
     return result
 
 
+def _date_component(values: pd.Series | None, index: pd.Index) -> np.ndarray:
+    """Component column as truncated floats (``int(float(v))``), NaN for missing."""
+    if values is None:
+        return np.full(len(index), np.nan)
+    return np.trunc(pd.to_numeric(values, errors="coerce").to_numpy(dtype="float64"))
+
+
+def _zero_padded(values: np.ndarray, width: int) -> pd.Series:
+    return pd.Series(values.astype("int64")).astype(str).str.zfill(width)
+
+
+def format_partial_iso8601_column(
+    year: pd.Series | None,
+    month: pd.Series | None = None,
+    day: pd.Series | None = None,
+) -> pd.Series:
+    """Build partial ISO 8601 dates from year/month/day component columns.
+
+    Array-level equivalent of ``format_partial_iso8601`` for date parts:
+    components are truncated to integers, validated with vectorized range
+    and days-in-month checks (all supplied components, as the scalar
+    function does, even those truncation then drops), and assembled as
+    zero-padded strings, truncating from the right at the first missing
+    component. Non-numeric components count as missing.
+
+    Args:
+        year: Year column (``None`` if unavailable -- every result is "").
+        month: Optional month column.
+        day: Optional day column.
+
+    Returns:
+        Object-dtype Series of "YYYY", "YYYY-MM" or "YYYY-MM-DD" strings
+        ("" for a missing year or invalid components), aligned with the
+        first component's index.
+    """
+    index = next((c.index for c in (year, month, day) if c is not None), pd.RangeIndex(0))
+    y = _date_component(year, index)
+    m = _date_component(month, index)
+    d = _date_component(day, index)
+    has_y, has_m, has_d = ~np.isnan(y), ~np.isnan(m), ~np.isnan(d)
+
+    with np.errstate(invalid="ignore"):
+        valid = has_y & (y >= 1800) & (y <= 2100)
+        valid &= ~has_m | ((m >= 1) & (m <= 12))
+        valid &= ~has_d | ((d >= 1) & (d <= 31))
+
+    # Full dates must exist on the calendar
+    full = valid & has_m & has_d
+    yf, mf = y[full].astype("int64"), m[full].astype("int64")
+    leap = (yf % 4 == 0) & ((yf % 100 != 0) | (yf % 400 == 0))
+    days_in_month = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])[mf - 1]
+    valid[full] = d[full] <= days_in_month + (leap & (mf == 2))
+
+    invalid = has_y & ~valid
+    if invalid.any():
+        first = int(np.flatnonzero(invalid)[0])
+        logger.warning(
+            "Invalid date components in {} row(s), e.g. year={}, month={}, day={}",
+            int(invalid.sum()),
+            y[first],
+            m[first],
+            d[first],
+        )
+
+    result = np.full(len(index), "", dtype=object)
+    with_month = valid & has_m
+    with_day = with_month & has_d
+    text = _zero_padded(np.where(valid, y, 0), 4)
+    text = text.where(~with_month, text + "-" + _zero_padded(np.where(with_month, m, 0), 2))
+    text = text.where(~with_day, text + "-" + _zero_padded(np.where(with_day, d, 0), 2))
+    result[valid] = text.to_numpy()[valid]
+    return pd.Series(result, index=index, dtype="object")
+
+
 def detect_date_format(samples: list[str]) -> str | None:
     """Examine sample string values and determine the date format.
 
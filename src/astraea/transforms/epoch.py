@@ -8,6 +8,7 @@ All functions are deterministic -- no LLM, no guessing.
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 
@@ -35,6 +36,10 @@ def assign_epoch(
         partial date, no matching SE element, etc.).
 
     Notes:
+        - Vectorized: distinct (USUBJID, date) pairs are joined against the
+          subject's SE elements once and the result is broadcast back to rows.
+        - When SE elements overlap, the first matching element in SE row
+          order wins.
         - Uses string comparison for ISO 8601 dates (lexicographic order
           works correctly for YYYY-MM-DD format).
         - Partial dates (< 10 chars) are treated as unmatchable.
@@ -51,53 +56,98 @@ def assign_epoch(
     if missing_se:
         raise KeyError(f"Missing required columns in se_df: {missing_se}")
 
-    # Pre-group SE data by USUBJID for efficient lookup (vectorized)
-    se_records = se_df.to_dict("records")
-    se_grouped: dict[str, list[dict[str, str]]] = {}
-    for rec in se_records:
-        subj = str(rec[usubjid_col])
-        element = {
-            "sestdtc": str(rec["SESTDTC"]) if pd.notna(rec["SESTDTC"]) else "",
-            "seendtc": str(rec.get("SEENDTC", "")) if pd.notna(rec.get("SEENDTC")) else "",
-            "epoch": str(rec["EPOCH"]) if pd.notna(rec["EPOCH"]) else "",
+    result = pd.Series(np.nan, index=df.index, dtype="object")
+    if df.empty or se_df.empty:
+        return result
+
+    # Factorize observation dates and subjects so string normalization runs
+    # once per distinct value instead of once per row.
+    date_codes, date_uniques = pd.factorize(df[date_col], use_na_sentinel=True)
+    date_keys = np.array([_obs_date_key(v) for v in date_uniques], dtype=object)
+    subj_codes, subj_uniques = pd.factorize(df[usubjid_col], use_na_sentinel=False)
+
+    matchable = date_codes >= 0
+    if len(date_keys):
+        matchable &= date_keys[np.where(matchable, date_codes, 0)] != ""
+    if not matchable.any():
+        return result
+
+    # Distinct (subject, date) pairs -- LB/VS repeat these across many tests.
+    pair_key = subj_codes.astype(np.int64) * (len(date_uniques) + 1) + date_codes
+    unique_pairs, pair_inverse = np.unique(pair_key[matchable], return_inverse=True)
+    pair_subj = unique_pairs // (len(date_uniques) + 1)
+    pair_date = unique_pairs % (len(date_uniques) + 1)
+    pairs = pd.DataFrame(
+        {
+            "_pair": np.arange(len(unique_pairs)),
+            "_subj": [str(subj_uniques[c]) for c in pair_subj],
+            "_obs": date_keys[pair_date],
         }
-        se_grouped.setdefault(subj, []).append(element)
-
-    def _find_epoch(row: pd.Series) -> str | float:
-        obs_date_raw = row[date_col]
-        if pd.isna(obs_date_raw):
-            return float("nan")
-
-        obs_str = str(obs_date_raw).strip()
-        if len(obs_str) < 10:
-            return float("nan")
-
-        obs_date = obs_str[:10]
-        subj = str(row[usubjid_col])
-        elements = se_grouped.get(subj, [])
-
-        for elem in elements:
-            sestdtc = elem["sestdtc"][:10] if len(elem["sestdtc"]) >= 10 else ""
-            seendtc = elem["seendtc"][:10] if len(elem["seendtc"]) >= 10 else ""
-
-            if not sestdtc:
-                continue
-
-            # Check if obs_date >= SESTDTC
-            if obs_date < sestdtc:
-                continue
-
-            # Check if obs_date <= SEENDTC (or open-ended)
-            if seendtc and obs_date > seendtc:
-                continue
-
-            # Match found
-            return elem["epoch"] if elem["epoch"] else float("nan")
-
-        return float("nan")
-
-    result = df.apply(_find_epoch, axis=1)
-    return result
+    )
+
+    elements = _prepare_se_elements(se_df, usubjid_col)
+    if elements.empty:
+        return result
+
+    # Interval join: every candidate element per pair, then the first element
+    # in SE order that contains the date (same first-match rule as before).
+    candidates = pairs.merge(elements, on="_subj", how="inner")
+    in_range = (candidates["_obs"] >= candidates["_start"]) & (
+        (candidates["_end"] == "") | (candidates["_obs"] <= candidates["_end"])
+    )
+    first_match = (
+        candidates.loc[in_range.to_numpy(), ["_pair", "_order", "_epoch"]]
+        .sort_values(["_pair", "_order"], kind="stable")
+        .drop_duplicates("_pair", keep="first")
+    )
+
+    pair_epoch = np.full(len(unique_pairs), np.nan, dtype=object)
+    epochs = first_match["_epoch"].to_numpy(dtype=object)
+    epochs[epochs == ""] = np.nan
+    pair_epoch[first_match["_pair"].to_numpy()] = epochs
+
+    values = result.to_numpy(dtype=object, copy=True)
+    values[matchable] = pair_epoch[pair_inverse]
+    return pd.Series(values, index=df.index, dtype="object")
+
+
+def _obs_date_key(value: object) -> str:
+    """Normalize an observation date to its YYYY-MM-DD prefix, or "" if unmatchable."""
+    if pd.isna(value):
+        return ""
+    text = str(value).strip()
+    return text[:10] if len(text) >= 10 else ""
+
+
+def _se_date_key(value: object) -> str:
+    """Normalize an SE boundary date to its YYYY-MM-DD prefix, or "" if missing/partial."""
+    if pd.isna(value):
+        return ""
+    text = str(value)
+    return text[:10] if len(text) >= 10 else ""
+
+
+def _prepare_se_elements(se_df: pd.DataFrame, usubjid_col: str) -> pd.DataFrame:
+    """Build the SE element table used by the interval join.
+
+    Elements keep their original SE row order in ``_order`` so the first
+    matching element wins. Elements without a full SESTDTC are dropped
+    (they can never match); a missing or partial SEENDTC becomes "" and is
+    treated as open-ended.
+    """
+    end_values = se_df["SEENDTC"] if "SEENDTC" in se_df.columns else pd.Series(
+        None, index=se_df.index, dtype="object"
+    )
+    elements = pd.DataFrame(
+        {
+            "_subj": [str(v) for v in se_df[usubjid_col]],
+            "_start": [_se_date_key(v) for v in se_df["SESTDTC"]],
+            "_end": [_se_date_key(v) for v in end_values],
+            "_epoch": ["" if pd.isna(v) else str(v) for v in se_df["EPOCH"]],
+            "_order": np.arange(len(se_df)),
+        }
+    )
+    return elements[elements["_start"] != ""]
 
 
 def detect_epoch_overlaps(
@@ -68,7 +68,7 @@ def generate_seq(
 
     # Sort and compute cumcount within groups
     sorted_df = df.sort_values(full_sort, na_position="last")
-    seq_sorted = sorted_df.groupby(usubjid_col, sort=False).cumcount() + 1
+    seq_sorted = sorted_df.groupby(usubjid_col, sort=False, observed=True).cumcount() + 1
 
     # Reindex to match original DataFrame index
     result = seq_sorted.reindex(df.index)
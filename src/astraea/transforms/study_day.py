@@ -12,6 +12,7 @@ from __future__ import annotations
 
 from datetime import date
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 
@@ -78,6 +79,105 @@ def calculate_study_day(event_dtc: str | None, rfstdtc: str | None) -> int | Non
         return delta_days  # Day -1 = day before ref date
 
 
+def parse_iso_date_column(values: pd.Series) -> np.ndarray:
+    """Parse a column of ISO 8601 date/datetime strings to ``datetime64[D]`` in bulk.
+
+    Only the first 10 characters (YYYY-MM-DD) are used. Distinct values are
+    parsed once and broadcast back, since --DTC columns are highly repetitive.
+    Missing, partial (< 10 chars) and invalid dates become NaT; invalid dates
+    are logged once per call with a count rather than once per row.
+
+    Args:
+        values: Series of ISO 8601 date/datetime strings.
+
+    Returns:
+        NumPy ``datetime64[D]`` array aligned positionally with ``values``.
+    """
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    if len(uniques) == 0:
+        return np.full(len(values), np.datetime64("NaT", "D"), dtype="datetime64[D]")
+
+    date_strs = pd.Series([str(v).strip() for v in uniques], dtype="object")
+    full = date_strs.str.len() >= 10
+    parsed = pd.to_datetime(
+        date_strs.where(full).str[:10], format="%Y-%m-%d", errors="coerce"
+    )
+    unique_dates = parsed.to_numpy(dtype="datetime64[D]")
+
+    invalid = full & parsed.isna()
+    if invalid.any():
+        logger.warning(
+            "Invalid date(s) for --DY calculation: {} distinct value(s), e.g. '{}'",
+            int(invalid.sum()),
+            date_strs[invalid].iloc[0],
+        )
+
+    result = unique_dates[np.where(codes >= 0, codes, 0)]
+    result[codes < 0] = np.datetime64("NaT", "D")
+    return result
+
+
+def build_reference_dates(rfstdtc_lookup: dict[str, str]) -> pd.Series:
+    """Pre-parse a USUBJID -> RFSTDTC lookup into a ``datetime64`` Series.
+
+    Build this once per domain and reuse it for every --DY column via
+    ``calculate_study_day_from_reference``.
+
+    Returns:
+        Series indexed by USUBJID with ``datetime64`` values (NaT for
+        partial or invalid RFSTDTC).
+    """
+    keys = [str(k) for k in rfstdtc_lookup]
+    dates = parse_iso_date_column(pd.Series(list(rfstdtc_lookup.values()), dtype="object"))
+    reference = pd.Series(dates, index=pd.Index(keys, dtype="object"))
+    return reference[~reference.index.duplicated(keep="last")]
+
+
+def calculate_study_day_from_reference(
+    df: pd.DataFrame,
+    date_col: str,
+    reference_dates: pd.Series,
+    usubjid_col: str = "USUBJID",
+) -> pd.Series:
+    """Calculate --DY for a column against pre-parsed reference dates.
+
+    Columnar engine: subjects and event dates are resolved once per distinct
+    value, and the no-Day-0 offset is computed with NumPy over the whole
+    column.
+
+    Args:
+        df: Source DataFrame containing date and USUBJID columns.
+        date_col: Column name containing ISO 8601 event dates.
+        reference_dates: Output of ``build_reference_dates``.
+        usubjid_col: Column name for USUBJID. Default "USUBJID".
+
+    Returns:
+        pandas Series with Int64 dtype, null where either date is missing,
+        partial, invalid, or the subject has no reference date.
+
+    Raises:
+        KeyError: If required columns are missing from the DataFrame.
+    """
+    missing = [c for c in [date_col, usubjid_col] if c not in df.columns]
+    if missing:
+        raise KeyError(f"Missing required columns: {missing}")
+
+    subj_codes, subj_uniques = pd.factorize(df[usubjid_col], use_na_sentinel=False)
+    subj_keys = pd.Index([str(v) for v in subj_uniques], dtype="object")
+    subj_ref = reference_dates.reindex(subj_keys).to_numpy(dtype="datetime64[D]")
+    ref = subj_ref[subj_codes] if len(subj_ref) else np.array([], dtype="datetime64[D]")
+
+    event = parse_iso_date_column(df[date_col])
+
+    delta = (event - ref).astype("int64")
+    valid = ~(np.isnat(event) | np.isnat(ref))
+    days = np.where(delta >= 0, delta + 1, delta)  # Day 1 = ref date, no Day 0
+
+    result = pd.array(np.where(valid, days, 0), dtype="Int64")
+    result[~valid] = pd.NA
+    return pd.Series(result, index=df.index)
+
+
 def calculate_study_day_column(
     df: pd.DataFrame,
     date_col: str,
@@ -86,8 +186,8 @@ def calculate_study_day_column(
 ) -> pd.Series:
     """Calculate --DY for an entire DataFrame column.
 
-    Vectorized version that looks up each subject's RFSTDTC from a dictionary
-    and computes study day for each row.
+    Parses the RFSTDTC lookup once and delegates to the columnar
+    ``calculate_study_day_from_reference`` engine.
 
     Args:
         df: Source DataFrame containing date and USUBJID columns.
@@ -102,19 +202,9 @@ def calculate_study_day_column(
     Raises:
         KeyError: If required columns are missing from the DataFrame.
     """
-    missing = [c for c in [date_col, usubjid_col] if c not in df.columns]
-    if missing:
-        raise KeyError(f"Missing required columns: {missing}")
-
-    def _compute_row(row: pd.Series) -> int | None:
-        usubjid = str(row[usubjid_col])
-        rfstdtc = rfstdtc_lookup.get(usubjid)
-        if rfstdtc is None:
-            return None
-        event_dtc = row[date_col]
-        if pd.isna(event_dtc):
-            return None
-        return calculate_study_day(str(event_dtc), rfstdtc)
-
-    result = df.apply(_compute_row, axis=1)
-    return result.astype("Int64")
+    return calculate_study_day_from_reference(
+        df,
+        date_col,
+        build_reference_dates(rfstdtc_lookup),
+        usubjid_col=usubjid_col,
+    )
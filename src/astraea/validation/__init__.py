@@ -5,7 +5,7 @@ Rules are organized by category (terminology, presence, consistency,
 limits, format) and produce structured results with severity levels.
 """
 
-from astraea.validation.engine import ValidationEngine
+from astraea.validation.engine import RuleExecution, ValidationEngine
 from astraea.validation.rules.base import (
     RuleCategory,
     RuleResult,
@@ -15,6 +15,7 @@ from astraea.validation.rules.base import (
 
 __all__ = [
     "RuleCategory",
+    "RuleExecution",
     "RuleResult",
     "RuleSeverity",
     "ValidationEngine",
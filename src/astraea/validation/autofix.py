@@ -20,6 +20,7 @@ from astraea.models.mapping import DomainMappingSpec
 from astraea.reference.controlled_terms import CTReference
 from astraea.reference.sdtm_ig import SDTMReference
 from astraea.transforms.ascii_validation import fix_common_non_ascii
+from astraea.transforms.char_scan import scan_char_columns
 from astraea.validation.rules.base import RuleResult
 
 
@@ -52,6 +53,13 @@ class FixAction(BaseModel):
     after_value: str = Field(..., description="Value/state after fix")
     affected_count: int = Field(..., description="Number of rows affected")
     timestamp: str = Field(..., description="ISO 8601 timestamp of fix")
+    modified_variables: list[str] | None = Field(
+        default=None,
+        description=(
+            "Variables whose values, presence or spec metadata the fix changed; "
+            "None if it may have changed any variable of the domain"
+        ),
+    )
 
 
 class IssueClassification(BaseModel):
@@ -399,6 +407,7 @@ class AutoFixer:
                     after_value=f"Normalized to codelist {codelist_code} terms",
                     affected_count=total_fixed,
                     timestamp=now,
+                    modified_variables=[var_name],
                 )
             )
             logger.info(
@@ -436,6 +445,7 @@ class AutoFixer:
                 after_value=f"Added with value '{domain}'",
                 affected_count=len(fixed_df),
                 timestamp=now,
+                modified_variables=["DOMAIN"],
             )
             logger.info("Added missing DOMAIN column to {} with value '{}'", domain, domain)
             return fixed_df, [action]
@@ -455,6 +465,7 @@ class AutoFixer:
                 after_value=f"Set all to '{domain}'",
                 affected_count=wrong_count,
                 timestamp=now,
+                modified_variables=["DOMAIN"],
             )
             logger.info(
                 "Fixed DOMAIN column in {}: {} rows corrected",
@@ -485,6 +496,7 @@ class AutoFixer:
             after_value=f"Added with value '{spec.study_id}'",
             affected_count=len(fixed_df),
             timestamp=now,
+            modified_variables=["STUDYID"],
         )
         logger.info(
             "Added missing STUDYID column to {} with value '{}'",
@@ -526,6 +538,7 @@ class AutoFixer:
             after_value=f"'{truncated}' ({len(truncated)} chars)",
             affected_count=len(fixed_df),
             timestamp=now,
+            modified_variables=[var_name, truncated],
         )
         logger.info(
             "Renamed variable '{}' -> '{}' in domain {}",
@@ -564,6 +577,7 @@ class AutoFixer:
                         after_value=f"'{vm.sdtm_label}' (40 chars)",
                         affected_count=0,
                         timestamp=now,
+                        modified_variables=[vm.sdtm_variable],
                     )
                 )
                 logger.info(
@@ -582,7 +596,9 @@ class AutoFixer:
         result: RuleResult,
     ) -> tuple[pd.DataFrame, list[FixAction]]:
         """Fix non-ASCII characters using fix_common_non_ascii()."""
-        fixed_df = fix_common_non_ascii(df)
+        char_scan = scan_char_columns(df)
+        fixed_df = fix_common_non_ascii(df, char_scan=char_scan)
+        changed = [col for col, scan in char_scan.items() if scan.non_ascii_count]
         now = datetime.now(tz=UTC).isoformat()
 
         action = FixAction(
@@ -594,6 +610,7 @@ class AutoFixer:
             after_value="Replaced with ASCII equivalents",
             affected_count=result.affected_count,
             timestamp=now,
+            modified_variables=[str(col) for col in changed],
         )
         logger.info(
             "Fixed non-ASCII characters in domain {} ({})",
@@ -618,6 +635,7 @@ class AutoFixer:
             after_value=f"Tracked for rename to '{domain.lower()}.xpt'",
             affected_count=0,
             timestamp=now,
+            modified_variables=[],
         )
         logger.info("File naming fix tracked for domain {}", domain)
         return [action]
@@ -0,0 +1,164 @@
+"""Shared per-column statistics of one domain DataFrame for validation rules.
+
+Many rules scan the same columns the same way: drop nulls, stringify,
+take the distinct values, count rows per value, measure lengths or run a
+regex over --DTC values. ``DomainStats`` computes each of these once per
+column, on first use, and hands the memoized result to every rule that
+asks. Value-level checks run over the distinct values only and are
+broadcast back to rows through the factorized codes, so a 1M-row column
+with 12 distinct values costs 12 regex matches, not 1M.
+
+The engine builds one DomainStats per domain per validation pass. A
+DomainStats describes the DataFrame as it was when first queried; build a
+new one after the frame changes.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections.abc import Callable, Container, Hashable, Iterable
+from typing import Any, TypeVar
+
+import numpy as np
+import pandas as pd
+
+_T = TypeVar("_T")
+
+
+def parse_floats(values: Iterable[Any]) -> tuple[np.ndarray, np.ndarray]:
+    """``float()`` of each value, and a mask of the values it rejects.
+
+    The one definition of "numeric" shared by rules that parse character
+    values: whatever ``float()`` accepts, including ``" 2.5 "``,
+    ``"1_000"`` and ``"nan"``. Rejected values parse as NaN.
+    """
+    values = list(values)
+    parsed = np.full(len(values), np.nan)
+    rejected = np.zeros(len(values), dtype=bool)
+    for i, value in enumerate(values):
+        try:
+            parsed[i] = float(value)
+        except (ValueError, TypeError):
+            rejected[i] = True
+    return parsed, rejected
+
+
+class DomainStats:
+    """Lazily computed, memoized column statistics of a domain DataFrame.
+
+    Distinct values are the non-null values of a column converted with
+    ``str``, in order of first appearance. Methods returning per-value
+    arrays align with ``distinct(col)``; ``per_row`` maps them onto the
+    rows of ``non_null(col)``.
+
+    Safe to share between the threads of a parallel validation run: each
+    statistic is computed by one thread while the others wait for it.
+
+    Args:
+        df: The domain DataFrame.
+    """
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self.df = df
+        self._memo: dict[Hashable, Any] = {}
+        self._locks: dict[Hashable, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def _get(self, key: Hashable, compute: Callable[[], _T]) -> _T:
+        try:
+            return self._memo[key]
+        except KeyError:
+            pass
+        with self._locks_guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            if key not in self._memo:
+                self._memo[key] = compute()
+            return self._memo[key]
+
+    def not_null(self, col: str) -> pd.Series:
+        """Boolean mask of the rows where ``col`` is not null."""
+        return self._get(("not_null", col), lambda: self.df[col].notna())
+
+    def non_null(self, col: str) -> pd.Series:
+        """The non-null values of ``col``, with their row labels."""
+        return self._get(("non_null", col), lambda: self.df[col][self.not_null(col)])
+
+    def _factorized(self, col: str) -> tuple[np.ndarray, pd.Index]:
+        def compute() -> tuple[np.ndarray, pd.Index]:
+            codes, uniques = pd.factorize(self.non_null(col).astype(str))
+            return codes, pd.Index(uniques, dtype=object)
+
+        return self._get(("factorized", col), compute)
+
+    def distinct(self, col: str) -> pd.Index:
+        """Distinct non-null values of ``col`` as strings, in first-appearance order."""
+        return self._factorized(col)[1]
+
+    def value_counts(self, col: str) -> np.ndarray:
+        """Rows per distinct value, aligned with ``distinct(col)``."""
+
+        def compute() -> np.ndarray:
+            codes, uniques = self._factorized(col)
+            return np.bincount(codes, minlength=len(uniques))
+
+        return self._get(("value_counts", col), compute)
+
+    def per_row(self, col: str, per_value: np.ndarray) -> np.ndarray:
+        """Broadcast a per-distinct-value array onto the rows of ``non_null(col)``."""
+        return np.asarray(per_value)[self._factorized(col)[0]]
+
+    def rows_where(self, col: str, per_value: np.ndarray) -> np.ndarray:
+        """Mask over all rows: ``col`` is not null and ``per_value`` is True for its value."""
+        mask = np.zeros(len(self.df), dtype=bool)
+        mask[self.not_null(col).to_numpy()] = self.per_row(col, per_value)
+        return mask
+
+    def str_lengths(self, col: str) -> np.ndarray:
+        """Character length of each distinct value, aligned with ``distinct(col)``."""
+        return self._get(
+            ("str_lengths", col),
+            lambda: np.array([len(v) for v in self.distinct(col)], dtype=np.int64),
+        )
+
+    def byte_lengths(self, col: str) -> np.ndarray:
+        """UTF-8 byte length of each distinct value, aligned with ``distinct(col)``."""
+        return self._get(
+            ("byte_lengths", col),
+            lambda: np.array([len(v.encode("utf-8")) for v in self.distinct(col)], dtype=np.int64),
+        )
+
+    def matches(self, col: str, pattern: re.Pattern[str]) -> np.ndarray:
+        """Whether ``pattern.match`` succeeds on each distinct value of ``col``."""
+        return self._get(
+            ("matches", col, pattern.pattern, pattern.flags),
+            lambda: np.array(
+                [pattern.match(v) is not None for v in self.distinct(col)], dtype=bool
+            ),
+        )
+
+    def _parsed_floats(self, col: str) -> tuple[np.ndarray, np.ndarray]:
+        return self._get(("floats", col), lambda: parse_floats(self.distinct(col)))
+
+    def floats(self, col: str) -> np.ndarray:
+        """``float()`` of each distinct value, NaN where it fails; aligned with ``distinct``."""
+        return self._parsed_floats(col)[0]
+
+    def non_numeric(self, col: str) -> np.ndarray:
+        """Whether ``float()`` rejects each distinct value; aligned with ``distinct``.
+
+        Unlike ``np.isnan(floats(col))``, this is False for ``"nan"``.
+        """
+        return self._parsed_floats(col)[1]
+
+    def values_not_in(self, col: str, allowed: Container[str]) -> tuple[list[str], int]:
+        """Distinct values of ``col`` outside ``allowed``, and the rows holding them.
+
+        Returns:
+            The offending values in first-appearance order, and their total
+            row count.
+        """
+        distinct = self.distinct(col)
+        invalid = np.array([v not in allowed for v in distinct], dtype=bool)
+        return distinct[invalid].tolist(), int(self.value_counts(col)[invalid].sum())
@@ -3,18 +3,32 @@
 Discovers, registers, and runs validation rules against SDTM datasets.
 The engine maintains a registry of ValidationRule instances and provides
 methods to validate individual domains or entire studies.
+
+Rules are independent and only read the domain DataFrames, so each
+(domain, rule) evaluation can run on a worker: threads by default, since
+the heavy rules spend their time in pandas/NumPy code that releases the
+GIL, or processes for rules that hold the GIL in Python loops. Results are
+always collected in domain order then rule registration order, exactly as
+a serial run produces them.
 """
 
 from __future__ import annotations
 
+import os
+from collections.abc import Collection, Mapping
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from enum import StrEnum
 from pathlib import Path
+from typing import Any
 
 import pandas as pd
 from loguru import logger
+from pydantic import BaseModel, Field
 
 from astraea.models.mapping import DomainMappingSpec
 from astraea.reference.controlled_terms import CTReference
 from astraea.reference.sdtm_ig import SDTMReference
+from astraea.validation.domain_stats import DomainStats
 from astraea.validation.rules.base import (
     RuleCategory,
     RuleResult,
@@ -23,6 +37,112 @@ from astraea.validation.rules.base import (
 )
 
 
+class RuleExecution(StrEnum):
+    """Worker type used to evaluate rules when running in parallel."""
+
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class ValidationPass(BaseModel):
+    """Findings of one validation pass, kept per (domain, rule) for reuse.
+
+    Returned by ``ValidationEngine.validate_incremental`` and passed back to
+    it as ``previous`` so the next pass only re-evaluates what changed.
+    """
+
+    rule_ids: list[str] = Field(..., description="IDs of the rules evaluated, in order")
+    domain_results: dict[str, list[list[RuleResult]]] = Field(
+        ..., description="Per domain, the findings of each rule in rule order"
+    )
+    cross_domain_results: list[RuleResult] = Field(
+        default_factory=list, description="Findings of the cross-domain checks"
+    )
+
+    @property
+    def results(self) -> list[RuleResult]:
+        """All findings, in the order validate_all returns them."""
+        results = [
+            r
+            for per_rule in self.domain_results.values()
+            for rule_results in per_rule
+            for r in rule_results
+        ]
+        return results + self.cross_domain_results
+
+
+def _evaluate_rule(
+    rule: ValidationRule,
+    domain: str,
+    df: pd.DataFrame,
+    spec: DomainMappingSpec,
+    sdtm_ref: SDTMReference,
+    ct_ref: CTReference,
+    stats: DomainStats,
+) -> list[RuleResult]:
+    """Evaluate one rule, turning a crash into a WARNING result."""
+    extra = {"stats": stats} if rule.uses_stats else {}
+    try:
+        return rule.evaluate(
+            domain=domain,
+            df=df,
+            spec=spec,
+            sdtm_ref=sdtm_ref,
+            ct_ref=ct_ref,
+            **extra,
+        )
+    except Exception as exc:
+        return [_rule_failure(rule, domain, exc)]
+
+
+def _rule_failure(rule: ValidationRule, domain: str, exc: BaseException) -> RuleResult:
+    """WARNING result recording that ``rule`` could not be evaluated on ``domain``."""
+    logger.error("Rule {} failed on domain {}: {}", rule.rule_id, domain, exc)
+    return RuleResult(
+        rule_id=rule.rule_id,
+        rule_description=rule.description,
+        category=rule.category,
+        severity=RuleSeverity.WARNING,
+        domain=domain,
+        message=f"Rule execution failed: {exc}",
+    )
+
+
+# Populated once per worker process by _init_worker so the domain frames,
+# rules and references are transferred to each process a single time (and
+# with the default fork start method not copied at all) rather than once
+# per (domain, rule) task.
+_WORKER_STATE: dict[str, Any] = {}
+
+
+def _init_worker(
+    domains: dict[str, tuple[pd.DataFrame, DomainMappingSpec]],
+    rules: list[ValidationRule],
+    sdtm_ref: SDTMReference,
+    ct_ref: CTReference,
+) -> None:
+    _WORKER_STATE.update(
+        domains=domains,
+        stats={domain: DomainStats(df) for domain, (df, _spec) in domains.items()},
+        rules=rules,
+        sdtm_ref=sdtm_ref,
+        ct_ref=ct_ref,
+    )
+
+
+def _evaluate_rule_task(domain: str, rule_index: int) -> list[RuleResult]:
+    df, spec = _WORKER_STATE["domains"][domain]
+    return _evaluate_rule(
+        _WORKER_STATE["rules"][rule_index],
+        domain,
+        df,
+        spec,
+        _WORKER_STATE["sdtm_ref"],
+        _WORKER_STATE["ct_ref"],
+        _WORKER_STATE["stats"][domain],
+    )
+
+
 class ValidationEngine:
     """Orchestrates validation rule execution across SDTM domains.
 
@@ -35,15 +155,30 @@ class ValidationEngine:
         *,
         sdtm_ref: SDTMReference,
         ct_ref: CTReference,
+        max_workers: int | None = 1,
+        execution: RuleExecution | str = RuleExecution.THREAD,
     ) -> None:
         """Initialize the validation engine.
 
         Args:
             sdtm_ref: SDTM-IG reference for domain/variable lookups.
             ct_ref: Controlled Terminology reference for codelist lookups.
+            max_workers: Workers evaluating rules. ``1`` (the default)
+                runs every rule in the calling thread; ``None`` uses
+                ``os.cpu_count()``.
+            execution: Worker type when ``max_workers`` is not 1. Process
+                workers need picklable rules.
+
+        Raises:
+            ValueError: If max_workers is less than 1 or execution is unknown.
         """
+        if max_workers is not None and max_workers < 1:
+            msg = f"max_workers must be at least 1, got {max_workers}"
+            raise ValueError(msg)
         self._sdtm_ref = sdtm_ref
         self._ct_ref = ct_ref
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.execution = RuleExecution(execution)
         self._rules: list[ValidationRule] = []
         self.register_defaults()
 
@@ -149,6 +284,14 @@ class ValidationEngine:
         except (ImportError, AttributeError):
             logger.debug("No variable ordering rules available yet")
 
+        # Declarative rules from declarative_rules.json
+        try:
+            from astraea.validation.rules.declarative import load_declarative_rules
+
+            self.register(load_declarative_rules())
+        except (ImportError, AttributeError, OSError):
+            logger.debug("No declarative rules available yet")
+
     def validate_domain(
         self,
         domain: str,
@@ -165,30 +308,91 @@ class ValidationEngine:
         Returns:
             List of all RuleResult findings from all rules.
         """
-        results: list[RuleResult] = []
-        for rule in self._rules:
-            try:
-                rule_results = rule.evaluate(
-                    domain=domain,
-                    df=df,
-                    spec=spec,
-                    sdtm_ref=self._sdtm_ref,
-                    ct_ref=self._ct_ref,
+        return self._run_rules({domain: (df, spec)}, self._rules)
+
+    def _run_rules(
+        self,
+        domains: dict[str, tuple[pd.DataFrame, DomainMappingSpec]],
+        rules: list[ValidationRule],
+    ) -> list[RuleResult]:
+        """Evaluate every rule on every domain, in domain then rule order.
+
+        Args:
+            domains: Mapping of domain code to (DataFrame, DomainMappingSpec) tuples.
+            rules: Rules to evaluate on each domain.
+
+        Returns:
+            All findings, ordered by domain then by rule as a serial run
+            orders them, regardless of the order in which workers finish.
+        """
+        tasks = [(domain, index) for domain in domains for index in range(len(rules))]
+        return [r for task_results in self._run_tasks(domains, rules, tasks) for r in task_results]
+
+    def _run_tasks(
+        self,
+        domains: dict[str, tuple[pd.DataFrame, DomainMappingSpec]],
+        rules: list[ValidationRule],
+        tasks: list[tuple[str, int]],
+    ) -> list[list[RuleResult]]:
+        """Evaluate ``rules[index]`` on ``domain`` for each (domain, index) task.
+
+        Returns:
+            The findings of each task, in task order.
+        """
+        workers = min(self.max_workers, len(tasks))
+
+        # One DomainStats per domain, shared by every rule and thread. Process
+        # workers build their own in _init_worker.
+        stats = {domain: DomainStats(df) for domain, (df, _spec) in domains.items()}
+
+        if workers <= 1:
+            return [
+                _evaluate_rule(
+                    rules[index],
+                    domain,
+                    *domains[domain],
+                    self._sdtm_ref,
+                    self._ct_ref,
+                    stats[domain],
                 )
-                results.extend(rule_results)
-            except Exception as exc:
-                logger.error("Rule {} failed on domain {}: {}", rule.rule_id, domain, exc)
-                results.append(
-                    RuleResult(
-                        rule_id=rule.rule_id,
-                        rule_description=rule.description,
-                        category=rule.category,
-                        severity=RuleSeverity.WARNING,
-                        domain=domain,
-                        message=f"Rule execution failed: {exc}",
+                for domain, index in tasks
+            ]
+
+        pool: Executor
+        if self.execution == RuleExecution.PROCESS:
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(domains, rules, self._sdtm_ref, self._ct_ref),
+            )
+        else:
+            pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="validation")
+
+        with pool:
+            futures: list[Future[list[RuleResult]]] = []
+            for domain, index in tasks:
+                if self.execution == RuleExecution.PROCESS:
+                    futures.append(pool.submit(_evaluate_rule_task, domain, index))
+                else:
+                    futures.append(
+                        pool.submit(
+                            _evaluate_rule,
+                            rules[index],
+                            domain,
+                            *domains[domain],
+                            self._sdtm_ref,
+                            self._ct_ref,
+                            stats[domain],
+                        )
                     )
-                )
-        return results
+            results: list[list[RuleResult]] = []
+            for (domain, index), future in zip(tasks, futures, strict=True):
+                try:
+                    results.append(future.result())
+                except Exception as exc:
+                    # Worker died or the result could not be sent back
+                    results.append([_rule_failure(rules[index], domain, exc)])
+            return results
 
     def validate_cross_domain(
         self,
@@ -253,20 +457,7 @@ class ValidationEngine:
         Returns:
             Combined list of all RuleResult findings across all domains.
         """
-        all_results: list[RuleResult] = []
-        for domain_code, (df, spec) in domains.items():
-            logger.info(
-                "Validating domain {} ({} rows, {} rules)",
-                domain_code,
-                len(df),
-                len(self._rules),
-            )
-            domain_results = self.validate_domain(domain_code, df, spec)
-            all_results.extend(domain_results)
-
-        # Run cross-domain checks after all per-domain rules
-        cross_domain_results = self.validate_cross_domain(domains)
-        all_results.extend(cross_domain_results)
+        all_results = self.validate_incremental(domains).results
 
         # Run TRC checks when output context is provided
         if output_dir is not None and study_id is not None:
@@ -279,6 +470,82 @@ class ValidationEngine:
 
         return all_results
 
+    def validate_incremental(
+        self,
+        domains: dict[str, tuple[pd.DataFrame, DomainMappingSpec]],
+        *,
+        previous: ValidationPass | None = None,
+        changes: Mapping[str, Collection[str] | None] | None = None,
+    ) -> ValidationPass:
+        """Run per-domain and cross-domain rules, reusing unaffected findings.
+
+        Without ``previous`` every rule runs on every domain. With it, a
+        rule is re-evaluated on a domain only when ``changes`` lists that
+        domain and the rule reads one of its changed variables (see
+        ``ValidationRule.reads``); every other (domain, rule) pair keeps its
+        findings from ``previous``. Cross-domain checks re-run when any
+        domain changed.
+
+        Args:
+            domains: Mapping of domain code to (DataFrame, DomainMappingSpec) tuples.
+            previous: The pass to reuse findings from, run with the same rules.
+            changes: Per changed domain, the variables modified since
+                ``previous`` was run, or None when any variable may have
+                changed.
+
+        Returns:
+            The findings of this pass, to feed into the next one.
+        """
+        rule_ids = [rule.rule_id for rule in self._rules]
+        changes = changes or {}
+        if previous is not None and previous.rule_ids != rule_ids:
+            logger.debug("Rule registry changed since the previous pass; re-running all rules")
+            previous = None
+
+        tasks: list[tuple[str, int]] = []
+        for domain_code, (df, _spec) in domains.items():
+            cached = previous.domain_results.get(domain_code) if previous else None
+            if cached is None:
+                affected = range(len(self._rules))
+            elif domain_code in changes:
+                changed = changes[domain_code]
+                affected = [
+                    index
+                    for index, rule in enumerate(self._rules)
+                    if changed is None or rule.reads_any(domain_code, changed)
+                ]
+            else:
+                affected = []
+            logger.info(
+                "Validating domain {} ({} rows, {} of {} rules)",
+                domain_code,
+                len(df),
+                len(affected),
+                len(self._rules),
+            )
+            tasks.extend((domain_code, index) for index in affected)
+
+        task_results = self._run_tasks(domains, self._rules, tasks)
+
+        domain_results: dict[str, list[list[RuleResult]]] = {}
+        for domain_code in domains:
+            cached = previous.domain_results.get(domain_code) if previous else None
+            domain_results[domain_code] = list(cached) if cached else [[] for _ in self._rules]
+        for (domain_code, index), results in zip(tasks, task_results, strict=True):
+            domain_results[domain_code][index] = results
+
+        any_changed = any(changed is None or changed for changed in changes.values())
+        if previous is None or list(previous.domain_results) != list(domains) or any_changed:
+            cross_domain_results = self.validate_cross_domain(domains)
+        else:
+            cross_domain_results = previous.cross_domain_results
+
+        return ValidationPass(
+            rule_ids=rule_ids,
+            domain_results=domain_results,
+            cross_domain_results=cross_domain_results,
+        )
+
     @staticmethod
     def filter_results(
         results: list[RuleResult],
@@ -4,6 +4,10 @@ Orchestrates the auto-fix cycle: validate all domains, apply auto-fixes,
 re-validate to confirm fixes worked, repeat up to max_iterations. Produces
 a comprehensive FixLoopResult with accumulated fix actions, remaining issues,
 human-action items, and the final validation report.
+
+Re-validation is incremental: each FixAction records the variables it
+modified, and the next pass re-evaluates only the rules that read them,
+reusing the previous findings of every other (domain, rule) pair.
 """
 
 from __future__ import annotations
@@ -23,7 +27,7 @@ from astraea.validation.autofix import (
     FixClassification,
     IssueClassification,
 )
-from astraea.validation.engine import ValidationEngine
+from astraea.validation.engine import ValidationEngine, ValidationPass
 from astraea.validation.report import ValidationReport
 from astraea.validation.rules.base import RuleResult
 
@@ -126,7 +130,9 @@ class FixLoopEngine:
         5. Record iteration details
 
         After the loop, runs a final validation pass and optionally
-        writes fixed datasets and audit trail.
+        writes fixed datasets and audit trail. Every pass after the first
+        re-evaluates only the rules affected by the previous iteration's
+        fixes.
 
         Args:
             domains: Mapping of domain code to (DataFrame, DomainMappingSpec).
@@ -141,6 +147,8 @@ class FixLoopEngine:
         iteration_details: list[IterationResult] = []
         converged = False
         last_needs_human: list[IssueClassification] = []
+        validation: ValidationPass | None = None
+        changes: dict[str, set[str] | None] = {}
 
         for iteration in range(1, self._max_iterations + 1):
             logger.info(
@@ -149,8 +157,12 @@ class FixLoopEngine:
                 self._max_iterations,
             )
 
-            # Step 1: Validate all domains
-            results = self._engine.validate_all(domains)
+            # Step 1: Validate all domains (only rules affected by the last fixes)
+            validation = self._engine.validate_incremental(
+                domains, previous=validation, changes=changes
+            )
+            results = validation.results
+            changes = {}
 
             # Step 2: Classify all issues
             classifications = [self._auto_fixer.classify_issue(r) for r in results]
@@ -192,6 +204,7 @@ class FixLoopEngine:
                 )
                 domains[domain_code] = (fixed_df, fixed_spec)
                 iteration_fix_actions.extend(fix_actions)
+                changes[domain_code] = _modified_variables(fix_actions)
 
             all_fix_actions.extend(iteration_fix_actions)
 
@@ -216,7 +229,9 @@ class FixLoopEngine:
 
         # Step 5: Final validation pass
         logger.info("Running final validation pass after fix loop")
-        final_results = self._engine.validate_all(domains)
+        final_results = self._engine.validate_incremental(
+            domains, previous=validation, changes=changes
+        ).results
         final_report = ValidationReport.from_results(study_id, final_results, list(domains.keys()))
 
         # Step 6: Write fixed DataFrames to XPT if output_dir given
@@ -242,6 +257,21 @@ class FixLoopEngine:
         )
 
 
+def _modified_variables(fix_actions: list[FixAction]) -> set[str] | None:
+    """Union of the variables modified by ``fix_actions``.
+
+    Returns:
+        The modified variable names, or None if any action may have
+        changed the whole domain.
+    """
+    modified: set[str] = set()
+    for action in fix_actions:
+        if action.modified_variables is None:
+            return None
+        modified.update(action.modified_variables)
+    return modified
+
+
 def _write_fixed_datasets(
     domains: dict[str, tuple[pd.DataFrame, DomainMappingSpec]],
     output_dir: Path,
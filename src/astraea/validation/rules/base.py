@@ -8,7 +8,10 @@ and implement the evaluate() method.
 from __future__ import annotations
 
 from abc import abstractmethod
+from collections.abc import Iterable
 from enum import StrEnum
+from fnmatch import fnmatchcase
+from typing import ClassVar
 
 import pandas as pd
 from pydantic import BaseModel, ConfigDict, Field
@@ -96,6 +99,16 @@ class ValidationRule(BaseModel):
     and mapping specification against SDTM-IG and CT requirements.
 
     Uses model_config to allow arbitrary types (pd.DataFrame) in evaluate().
+
+    Rules that set ``uses_stats`` also accept a ``stats`` keyword argument:
+    the engine's shared DomainStats for the domain, so column statistics
+    are computed once per validation pass rather than once per rule.
+
+    ``reads`` declares the variables a rule inspects, so incremental
+    re-validation can skip it when none of them changed. Entries are
+    variable names or ``fnmatch`` patterns; a leading ``--`` stands for the
+    domain prefix (``--SEQ`` is ``AESEQ`` in AE). ``None``, the default,
+    means the rule may read any variable, the column set, or the spec.
     """
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -105,6 +118,20 @@ class ValidationRule(BaseModel):
     category: RuleCategory = Field(..., description="Rule category")
     severity: RuleSeverity = Field(..., description="Default severity for findings")
 
+    uses_stats: ClassVar[bool] = False
+    reads: ClassVar[frozenset[str] | None] = None
+
+    def reads_any(self, domain: str, variables: Iterable[str]) -> bool:
+        """Whether this rule, evaluated on ``domain``, reads any of ``variables``."""
+        variables = [str(variable).upper() for variable in variables]
+        if self.reads is None:
+            return bool(variables)
+        prefix = domain[:2].upper()
+        patterns = [
+            prefix + pattern[2:] if pattern.startswith("--") else pattern for pattern in self.reads
+        ]
+        return any(fnmatchcase(variable, pattern) for variable in variables for pattern in patterns)
+
     @abstractmethod
     def evaluate(
         self,
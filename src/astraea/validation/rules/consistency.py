@@ -11,6 +11,10 @@ import pandas as pd
 from loguru import logger
 
 from astraea.models.mapping import DomainMappingSpec
+from astraea.transforms.study_day import (
+    build_reference_dates,
+    calculate_study_day_from_reference,
+)
 from astraea.validation.rules.base import RuleCategory, RuleResult, RuleSeverity, ValidationRule
 
 
@@ -267,14 +271,15 @@ class CrossDomainValidator:
         if "RFSTDTC" not in dm_df.columns or "USUBJID" not in dm_df.columns:
             return results
 
-        # Vectorized: Build RFSTDTC reference from DM
-        dm_lookup = dm_df[["USUBJID", "RFSTDTC"]].dropna().copy()
-        dm_lookup["RFSTDTC"] = dm_lookup["RFSTDTC"].astype(str)
-        dm_lookup = dm_lookup[dm_lookup["RFSTDTC"].str.strip() != ""]
+        # Parse RFSTDTC once with the columnar --DY engine
+        dm_lookup = dm_df[["USUBJID", "RFSTDTC"]].dropna()
+        dm_lookup = dm_lookup[dm_lookup["RFSTDTC"].astype(str).str.strip() != ""]
         if dm_lookup.empty:
             return results
 
-        dm_lookup["_rfstdtc_date"] = dm_lookup["RFSTDTC"].str[:10]
+        reference_dates = build_reference_dates(
+            dict(zip(dm_lookup["USUBJID"].astype(str), dm_lookup["RFSTDTC"], strict=True))
+        )
 
         for domain_code, df in domains.items():
             if domain_code == "DM":
@@ -287,41 +292,22 @@ class CrossDomainValidator:
             if not dy_cols:
                 continue
 
-            # Merge RFSTDTC into domain DataFrame once
-            merged = df.merge(
-                dm_lookup[["USUBJID", "_rfstdtc_date"]], on="USUBJID", how="left"
-            )
-
             for dy_col in dy_cols:
                 # Corresponding DTC column: replace DY suffix with DTC
                 dtc_col = dy_col[:-2] + "DTC"
-                if dtc_col not in merged.columns:
+                if dtc_col not in df.columns:
                     continue
 
-                # Filter to rows with all required values
-                mask = (
-                    merged[dy_col].notna()
-                    & merged[dtc_col].notna()
-                    & merged["_rfstdtc_date"].notna()
-                )
-                subset = merged.loc[mask].copy()
-                if subset.empty:
-                    continue
-
-                subset["_dtc_date"] = subset[dtc_col].astype(str).str[:10]
-                subset["_dy_num"] = pd.to_numeric(subset[dy_col], errors="coerce")
-
-                # Drop rows where DY couldn't be converted to numeric
-                subset = subset.dropna(subset=["_dy_num"])
-                if subset.empty:
-                    continue
+                # Expected study day from the dates; null for partial/missing dates
+                expected_dy = calculate_study_day_from_reference(df, dtc_col, reference_dates)
+                actual_dy = pd.to_numeric(df[dy_col], errors="coerce")
 
-                # Vectorized sign consistency check
-                inconsistent = (
-                    ((subset["_dy_num"] > 0) & (subset["_dtc_date"] < subset["_rfstdtc_date"]))
-                    | ((subset["_dy_num"] < 0) & (subset["_dtc_date"] > subset["_rfstdtc_date"]))
+                # Sign consistency: positive DY needs date >= RFSTDTC (expected >= 1),
+                # negative DY needs date <= RFSTDTC (expected <= 1)
+                inconsistent = ((actual_dy > 0) & (expected_dy < 0)) | (
+                    (actual_dy < 0) & (expected_dy > 1)
                 )
-                inconsistent_count = int(inconsistent.sum())
+                inconsistent_count = int(inconsistent.fillna(False).sum())
 
                 if inconsistent_count > 0:
                     results.append(
@@ -0,0 +1,459 @@
+"""Declarative validation rules loaded from JSON.
+
+Most conformance checks take one of a few shapes: a value must be in a
+set, match a pattern, be populated, be populated when another variable
+is, be unique within key variables, or compare against another variable
+or a constant. Rules of these shapes are written as entries in
+``declarative_rules.json`` rather than as ValidationRule subclasses:
+
+    {
+      "rule_id": "ASTR-D003",
+      "description": "--TESTCD must be 1-8 characters ...",
+      "category": "FORMAT",
+      "severity": "ERROR",
+      "domains": ["LB", "VS", "EG"],
+      "check": "matches",
+      "variable": "--TESTCD",
+      "pattern": "^[A-Z][A-Z0-9_]{0,7}$"
+    }
+
+All entries evaluate together as one DeclarativeRuleSet. Checks on the
+values of a column (in_set, matches, not_null, compare with a constant)
+run over the distinct values from the shared DomainStats and are counted
+back to rows, so any number of rules on one column cost a single
+factorization of it. Row-level checks (required_when, unique, compare
+between variables) use vectorized pandas/NumPy operations.
+"""
+
+from __future__ import annotations
+
+import json
+import operator
+import re
+from collections.abc import Callable, Iterable
+from enum import StrEnum
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Any, ClassVar, Literal
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
+
+from astraea.models.mapping import DomainMappingSpec
+from astraea.reference.controlled_terms import CTReference
+from astraea.reference.sdtm_ig import SDTMReference
+from astraea.validation.domain_stats import DomainStats
+from astraea.validation.rules.base import (
+    RuleCategory,
+    RuleResult,
+    RuleSeverity,
+    ValidationRule,
+)
+
+_DEFAULT_RULES_PATH = Path(__file__).parent / "declarative_rules.json"
+
+_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">=": operator.ge,
+    ">": operator.gt,
+}
+
+# Number of offending values quoted in a finding message
+_MAX_EXAMPLES = 5
+
+
+class DeclarativeCheck(StrEnum):
+    """Shape of a declarative rule.
+
+    IN_SET: Non-null values of ``variable`` must be in ``values``.
+    MATCHES: Non-null values of ``variable`` must match ``pattern``.
+    NOT_NULL: ``variable`` must not be null or blank.
+    REQUIRED_WHEN: ``variable`` must be populated where ``when`` is
+        populated (and, if given, one of ``when_values``).
+    UNIQUE: Non-null values of ``variable`` must be unique within ``keys``.
+    COMPARE: ``variable <operator> other`` (or ``value``) must hold where
+        both sides are populated.
+    """
+
+    IN_SET = "in_set"
+    MATCHES = "matches"
+    NOT_NULL = "not_null"
+    REQUIRED_WHEN = "required_when"
+    UNIQUE = "unique"
+    COMPARE = "compare"
+
+
+class RuleDefinition(BaseModel):
+    """One declarative rule as written in the rules file.
+
+    Variable names may start with ``--`` for the domain prefix, as in the
+    SDTM-IG (``--TESTCD`` is ``LBTESTCD`` in LB). ``domains`` entries are
+    domain codes or ``fnmatch`` patterns such as ``SUPP*``.
+    """
+
+    rule_id: str = Field(..., description="Unique rule identifier")
+    description: str = Field(..., description="Human-readable rule description")
+    category: RuleCategory = Field(..., description="Rule category")
+    severity: RuleSeverity = Field(..., description="Severity of findings")
+    check: DeclarativeCheck = Field(..., description="Shape of the check")
+    variable: str = Field(..., description="Variable checked")
+    domains: list[str] = Field(default_factory=lambda: ["*"], description="Domains checked")
+    values: list[str] | None = Field(default=None, description="in_set: allowed values")
+    pattern: str | None = Field(default=None, description="matches: regular expression")
+    when: str | None = Field(default=None, description="required_when: condition variable")
+    when_values: list[str] | None = Field(
+        default=None, description="required_when: condition values (any non-null if omitted)"
+    )
+    keys: list[str] = Field(default_factory=list, description="unique: key variables")
+    operator: Literal["<", "<=", "==", "!=", ">=", ">"] | None = Field(
+        default=None, description="compare: comparison operator"
+    )
+    other: str | None = Field(default=None, description="compare: right-hand variable")
+    value: str | float | None = Field(default=None, description="compare: right-hand constant")
+    numeric: bool = Field(default=False, description="compare: compare as numbers")
+    min_length: int | None = Field(
+        default=None,
+        description="compare: only compare character values at least this long",
+    )
+    prefix_length: int | None = Field(
+        default=None,
+        description=(
+            "compare: compare only the first N characters of character values "
+            "(10 compares ISO 8601 dates and datetimes at day precision)"
+        ),
+    )
+    message: str | None = Field(
+        default=None,
+        description="Finding message; may use {variable}, {count} and {examples}",
+    )
+    fix_suggestion: str | None = Field(default=None, description="Suggested remediation")
+    p21_equivalent: str | None = Field(default=None, description="Pinnacle 21 rule ID")
+
+    @model_validator(mode="after")
+    def _validate_check_fields(self) -> RuleDefinition:
+        """Ensure the fields the check needs are present."""
+        required: dict[DeclarativeCheck, tuple[str, ...]] = {
+            DeclarativeCheck.IN_SET: ("values",),
+            DeclarativeCheck.MATCHES: ("pattern",),
+            DeclarativeCheck.REQUIRED_WHEN: ("when",),
+            DeclarativeCheck.COMPARE: ("operator",),
+        }
+        missing = [name for name in required.get(self.check, ()) if getattr(self, name) is None]
+        if missing:
+            msg = f"Rule {self.rule_id}: check '{self.check}' requires {', '.join(missing)}"
+            raise ValueError(msg)
+        if self.check == DeclarativeCheck.COMPARE and (self.other is None) == (self.value is None):
+            msg = f"Rule {self.rule_id}: compare needs exactly one of 'other' or 'value'"
+            raise ValueError(msg)
+        if self.numeric and self.prefix_length is not None:
+            msg = f"Rule {self.rule_id}: prefix_length applies to character comparisons only"
+            raise ValueError(msg)
+        if self.pattern is not None:
+            try:
+                re.compile(self.pattern)
+            except re.error as exc:
+                msg = f"Rule {self.rule_id}: invalid pattern {self.pattern!r}: {exc}"
+                raise ValueError(msg) from exc
+        return self
+
+    def applies_to(self, domain: str) -> bool:
+        """Whether the rule checks ``domain``."""
+        return any(fnmatchcase(domain.upper(), pattern.upper()) for pattern in self.domains)
+
+    def variables(self) -> list[str]:
+        """All variables the rule reads, unresolved."""
+        names = [self.variable, *self.keys]
+        names.extend(name for name in (self.when, self.other) if name is not None)
+        return names
+
+
+def _resolve(variable: str, domain: str) -> str:
+    """Replace a leading ``--`` with the domain prefix."""
+    return domain[:2].upper() + variable[2:] if variable.startswith("--") else variable
+
+
+def _examples(values: Iterable[Any]) -> list[str]:
+    return [str(v) for v in list(values)[:_MAX_EXAMPLES]]
+
+
+class DeclarativeRuleSet(ValidationRule):
+    """All declarative rules of a rules file, evaluated as one engine rule.
+
+    Findings carry the rule_id, category and severity of the definition
+    that produced them; the set's own rule_id only appears if evaluating
+    the set itself fails. A definition that raises yields a WARNING
+    finding for that definition, like a failing rule in the engine.
+    """
+
+    rule_id: str = "ASTR-DECL"
+    description: str = "Declarative validation rules"
+    category: RuleCategory = RuleCategory.CONSISTENCY
+    severity: RuleSeverity = RuleSeverity.WARNING
+    uses_stats: ClassVar[bool] = True
+
+    definitions: list[RuleDefinition] = Field(
+        default_factory=list, description="Rule definitions, in file order"
+    )
+
+    _patterns: dict[str, re.Pattern[str]] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._patterns = {
+            d.rule_id: re.compile(d.pattern) for d in self.definitions if d.pattern is not None
+        }
+
+    def reads_any(self, domain: str, variables: Iterable[str]) -> bool:
+        """Whether any definition applying to ``domain`` reads one of ``variables``."""
+        changed = {str(variable).upper() for variable in variables}
+        return any(
+            _resolve(name, domain).upper() in changed
+            for definition in self.definitions
+            if definition.applies_to(domain)
+            for name in definition.variables()
+        )
+
+    def evaluate(
+        self,
+        domain: str,
+        df: pd.DataFrame,
+        spec: DomainMappingSpec,
+        sdtm_ref: SDTMReference,
+        ct_ref: CTReference,
+        stats: DomainStats | None = None,
+    ) -> list[RuleResult]:
+        """Evaluate every definition that applies to ``domain``.
+
+        Value-level definitions are grouped by column so each column's
+        distinct values are computed once for all of them. Findings are
+        returned in definition order.
+        """
+        if stats is None:
+            stats = DomainStats(df)
+
+        findings: dict[int, RuleResult] = {}
+        by_column: dict[str, list[tuple[int, RuleDefinition]]] = {}
+        row_level: list[tuple[int, RuleDefinition]] = []
+        for index, definition in enumerate(self.definitions):
+            if not definition.applies_to(domain):
+                continue
+            if definition.check in (DeclarativeCheck.REQUIRED_WHEN, DeclarativeCheck.UNIQUE) or (
+                definition.check == DeclarativeCheck.COMPARE and definition.other is not None
+            ):
+                row_level.append((index, definition))
+            else:
+                column = _resolve(definition.variable, domain)
+                by_column.setdefault(column, []).append((index, definition))
+
+        for column, definitions in by_column.items():
+            if column not in df.columns:
+                continue
+            for index, definition in definitions:
+                result = self._run(definition, domain, self._check_values, column, stats)
+                if result is not None:
+                    findings[index] = result
+
+        for index, definition in row_level:
+            result = self._run(definition, domain, self._check_rows, df, stats)
+            if result is not None:
+                findings[index] = result
+
+        return [findings[index] for index in sorted(findings)]
+
+    def _run(
+        self,
+        definition: RuleDefinition,
+        domain: str,
+        check: Callable[..., tuple[int, list[str]] | None],
+        *args: Any,
+    ) -> RuleResult | None:
+        """Run one definition's check and build its finding, if any."""
+        try:
+            outcome = check(definition, domain, *args)
+        except Exception as exc:
+            logger.error("Rule {} failed on domain {}: {}", definition.rule_id, domain, exc)
+            return RuleResult(
+                rule_id=definition.rule_id,
+                rule_description=definition.description,
+                category=definition.category,
+                severity=RuleSeverity.WARNING,
+                domain=domain,
+                message=f"Rule execution failed: {exc}",
+            )
+        if outcome is None or outcome[0] == 0:
+            return None
+        count, examples = outcome
+        variable = _resolve(definition.variable, domain)
+        if definition.message is not None:
+            message = definition.message.format(variable=variable, count=count, examples=examples)
+        else:
+            message = _default_message(definition, domain, variable, count, examples)
+        return RuleResult(
+            rule_id=definition.rule_id,
+            rule_description=definition.description,
+            category=definition.category,
+            severity=definition.severity,
+            domain=domain,
+            variable=variable,
+            message=message,
+            affected_count=count,
+            fix_suggestion=definition.fix_suggestion,
+            p21_equivalent=definition.p21_equivalent,
+        )
+
+    def _check_values(
+        self, definition: RuleDefinition, domain: str, column: str, stats: DomainStats
+    ) -> tuple[int, list[str]]:
+        """Check the distinct values of ``column``; count offending rows."""
+        distinct = stats.distinct(column)
+        counts = stats.value_counts(column)
+
+        if definition.check == DeclarativeCheck.IN_SET:
+            invalid = ~distinct.isin(definition.values or [])
+        elif definition.check == DeclarativeCheck.MATCHES:
+            invalid = ~stats.matches(column, self._patterns[definition.rule_id])
+        elif definition.check == DeclarativeCheck.NOT_NULL:
+            invalid = distinct.str.strip().to_numpy() == ""
+            nulls = len(stats.df) - int(stats.not_null(column).sum())
+            return int(counts[invalid].sum()) + nulls, _examples(distinct[invalid])
+        else:
+            left, comparable = _comparable(definition, column, stats)
+            right = float(definition.value) if definition.numeric else str(definition.value)
+            invalid = comparable & ~_holds(definition, left, right)
+
+        return int(counts[invalid].sum()), _examples(distinct[invalid])
+
+    def _check_rows(
+        self, definition: RuleDefinition, domain: str, df: pd.DataFrame, stats: DomainStats
+    ) -> tuple[int, list[str]] | None:
+        """Check a definition relating several variables, row by row."""
+        column = _resolve(definition.variable, domain)
+        if column not in df.columns:
+            return None
+
+        if definition.check == DeclarativeCheck.REQUIRED_WHEN:
+            when = _resolve(definition.when or "", domain)
+            if when not in df.columns:
+                return None
+            if definition.when_values is None:
+                condition = stats.not_null(when).to_numpy()
+            else:
+                condition = stats.rows_where(
+                    when, stats.distinct(when).isin(definition.when_values)
+                )
+            populated = stats.rows_where(column, stats.distinct(column).str.strip() != "")
+            missing = condition & ~populated
+            return int(missing.sum()), []
+
+        if definition.check == DeclarativeCheck.UNIQUE:
+            keys = [_resolve(key, domain) for key in definition.keys]
+            if any(key not in df.columns for key in keys):
+                return None
+            subset = df.loc[stats.not_null(column), [*keys, column]]
+            duplicated = subset.duplicated(keep=False).to_numpy()
+            examples = pd.unique(subset[column].to_numpy()[duplicated])
+            return int(duplicated.sum()), _examples(examples)
+
+        other = _resolve(definition.other or "", domain)
+        if other not in df.columns:
+            return None
+        left, left_ok = _by_row(definition, column, stats)
+        right, right_ok = _by_row(definition, other, stats)
+        both = left_ok & right_ok
+        invalid = np.zeros(len(df), dtype=bool)
+        invalid[both] = ~_holds(definition, left[both], right[both])
+        # Quote the values as stored, not as compared (e.g. before prefix_length)
+        lhs, rhs = df[column].to_numpy()[invalid], df[other].to_numpy()[invalid]
+        return int(invalid.sum()), _examples(
+            f"{a} vs {b}" for a, b in zip(lhs[:_MAX_EXAMPLES], rhs[:_MAX_EXAMPLES], strict=True)
+        )
+
+
+def _holds(definition: RuleDefinition, left: np.ndarray, right: Any) -> np.ndarray:
+    """Elementwise ``left <operator> right`` as a boolean array."""
+    return np.asarray(_OPERATORS[definition.operator or "=="](left, right), dtype=bool)
+
+
+def _comparable(
+    definition: RuleDefinition, column: str, stats: DomainStats
+) -> tuple[np.ndarray, np.ndarray]:
+    """Distinct values of ``column`` as compared, and which of them take part."""
+    if definition.numeric:
+        values = stats.floats(column)
+        return values, ~np.isnan(values)
+    values = stats.distinct(column).to_numpy()
+    if definition.prefix_length is not None:
+        values = np.array([v[: definition.prefix_length] for v in values], dtype=object)
+    if definition.min_length is None:
+        return values, np.ones(len(values), dtype=bool)
+    return values, stats.str_lengths(column) >= definition.min_length
+
+
+def _by_row(
+    definition: RuleDefinition, column: str, stats: DomainStats
+) -> tuple[np.ndarray, np.ndarray]:
+    """Per-row values of ``column`` as compared, and which rows take part."""
+    values, comparable = _comparable(definition, column, stats)
+    rows = np.full(len(stats.df), np.nan if definition.numeric else None, dtype=values.dtype)
+    rows[stats.not_null(column).to_numpy()] = stats.per_row(column, values)
+    return rows, stats.rows_where(column, comparable)
+
+
+def _default_message(
+    definition: RuleDefinition, domain: str, variable: str, count: int, examples: list[str]
+) -> str:
+    """Finding message for definitions without a ``message`` template."""
+    check = definition.check
+    if check == DeclarativeCheck.IN_SET:
+        return (
+            f"{count} record(s) with invalid {variable} values {examples}. "
+            f"Valid values: {sorted(definition.values or [])}"
+        )
+    if check == DeclarativeCheck.MATCHES:
+        return f"{count} {variable} value(s) do not match {definition.pattern}: {examples}"
+    if check == DeclarativeCheck.NOT_NULL:
+        return f"{variable} has {count} null/blank value(s)"
+    if check == DeclarativeCheck.REQUIRED_WHEN:
+        when = _resolve(definition.when or "", domain)
+        condition = f"is in {definition.when_values}" if definition.when_values else "is populated"
+        return f"{variable} is null/blank in {count} record(s) where {when} {condition}"
+    if check == DeclarativeCheck.UNIQUE:
+        keys = [_resolve(key, domain) for key in definition.keys]
+        within = f" within {keys}" if keys else ""
+        return f"{count} record(s) share a {variable} value{within}: {examples}"
+    right = _resolve(definition.other, domain) if definition.other is not None else definition.value
+    return f"{count} record(s) where {variable} {definition.operator} {right} fails: {examples}"
+
+
+def load_declarative_rules(path: Path | None = None) -> DeclarativeRuleSet:
+    """Load a declarative rules file.
+
+    Args:
+        path: JSON file with a ``rules`` list of RuleDefinition entries.
+            Defaults to the bundled ``declarative_rules.json``.
+
+    Returns:
+        DeclarativeRuleSet holding the file's rules.
+
+    Raises:
+        pydantic.ValidationError: If an entry is malformed.
+        ValueError: If two entries share a rule_id.
+    """
+    path = path or _DEFAULT_RULES_PATH
+    with open(path) as f:
+        data = json.load(f)
+
+    definitions = [RuleDefinition.model_validate(entry) for entry in data.get("rules", [])]
+    seen: set[str] = set()
+    for definition in definitions:
+        if definition.rule_id in seen:
+            msg = f"Duplicate declarative rule_id {definition.rule_id} in {path}"
+            raise ValueError(msg)
+        seen.add(definition.rule_id)
+
+    logger.debug("Loaded {} declarative rule(s) from {}", len(definitions), path)
+    return DeclarativeRuleSet(definitions=definitions)
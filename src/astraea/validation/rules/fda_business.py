@@ -13,12 +13,15 @@ Implements FDA Business Rules covering:
 from __future__ import annotations
 
 import re
+from typing import ClassVar
 
+import numpy as np
 import pandas as pd
 
 from astraea.models.mapping import DomainMappingSpec
 from astraea.reference.controlled_terms import CTReference
 from astraea.reference.sdtm_ig import SDTMReference
+from astraea.validation.domain_stats import DomainStats, parse_floats
 from astraea.validation.rules.base import (
     RuleCategory,
     RuleResult,
@@ -114,6 +117,60 @@ _ISO_3166_ALPHA3 = {
 }
 
 
+def _parse_float(values: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """Convert non-null values with ``float()``, once per distinct value.
+
+    Numeric columns are cast directly. Character columns are factorized
+    and only their distinct values go through ``parse_floats``, the parser
+    DomainStats (and so the declarative rules) uses.
+
+    Returns:
+        The float values (NaN where ``float()`` fails), and a mask of the
+        values ``float()`` rejects.
+    """
+    if pd.api.types.is_numeric_dtype(values.dtype):
+        return values.to_numpy(dtype=float), np.zeros(len(values), dtype=bool)
+    codes, uniques = pd.factorize(values)
+    parsed, rejected = parse_floats(uniques)
+    return parsed[codes], rejected[codes]
+
+
+def _distinct_pairs(df: pd.DataFrame, key: str, value: str) -> pd.DataFrame:
+    """Distinct (key, value) pairs, as strings, of the rows where both are set.
+
+    Each column is factorized once and the pairs are deduplicated on their
+    integer codes, so the relationship checks group a frame of distinct
+    pairs rather than every record.
+    """
+    key_codes, key_values = _factorize_str(df[key])
+    value_codes, value_values = _factorize_str(df[value])
+    both = (key_codes >= 0) & (value_codes >= 0)
+    n_values = max(len(value_values), 1)
+    pairs = np.unique(key_codes[both] * n_values + value_codes[both])
+    return pd.DataFrame({key: key_values[pairs // n_values], value: value_values[pairs % n_values]})
+
+
+def _factorize_str(values: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """Factorize ``values.astype(str)`` without converting every row.
+
+    Returns:
+        Codes into the distinct strings (-1 for missing values), and the
+        distinct strings.
+    """
+    codes, uniques = pd.factorize(values)
+    if not len(uniques):
+        return codes.astype(np.int64), np.array([], dtype=object)
+    str_codes, str_uniques = pd.factorize(pd.Index(uniques).astype(str))
+    codes = np.where(codes >= 0, str_codes.astype(np.int64)[codes], -1)
+    return codes, np.asarray(str_uniques, dtype=object)
+
+
+def _group_values(pairs: pd.DataFrame, key: str, value: str) -> dict[str, list[str]]:
+    """Sorted ``value`` entries per ``key`` of a frame of distinct pairs."""
+    ordered = pairs.sort_values([key, value])
+    return ordered.groupby(key, sort=False)[value].agg(list).to_dict()
+
+
 # ---------------------------------------------------------------------------
 # Original rules
 # ---------------------------------------------------------------------------
@@ -126,6 +183,8 @@ class FDAB057Rule(ValidationRule):
     description: str = "DM.ETHNIC values must conform to CT codelist C66790"
     category: RuleCategory = RuleCategory.FDA_BUSINESS
     severity: RuleSeverity = RuleSeverity.ERROR
+    uses_stats: ClassVar[bool] = True
+    reads: ClassVar[frozenset[str]] = frozenset({"ETHNIC"})
 
     def evaluate(
         self,
@@ -134,6 +193,7 @@ class FDAB057Rule(ValidationRule):
         spec: DomainMappingSpec,
         sdtm_ref: SDTMReference,
         ct_ref: CTReference,
+        stats: DomainStats | None = None,
     ) -> list[RuleResult]:
         if domain != "DM":
             return []
@@ -156,8 +216,9 @@ class FDAB057Rule(ValidationRule):
         if codelist:
             valid_terms = set(codelist.terms.keys())
         if valid_terms:
-            ethnic_values = df["ETHNIC"].dropna().unique()
-            invalid = [str(v) for v in ethnic_values if str(v) not in valid_terms]
+            if stats is None:
+                stats = DomainStats(df)
+            invalid, affected = stats.values_not_in("ETHNIC", valid_terms)
             if invalid:
                 results.append(
                     RuleResult(
@@ -171,9 +232,7 @@ class FDAB057Rule(ValidationRule):
                             f"Invalid ETHNIC values found: {invalid}. "
                             f"Valid values from C66790: {sorted(valid_terms)}"
                         ),
-                        affected_count=sum(
-                            1 for v in df["ETHNIC"].dropna() if str(v) not in valid_terms
-                        ),
+                        affected_count=affected,
                         fix_suggestion="Map ETHNIC values to C66790 controlled terminology",
                     )
                 )
@@ -187,6 +246,8 @@ class FDAB055Rule(ValidationRule):
     description: str = "DM.RACE values must conform to CT codelist C74457"
     category: RuleCategory = RuleCategory.FDA_BUSINESS
     severity: RuleSeverity = RuleSeverity.WARNING
+    uses_stats: ClassVar[bool] = True
+    reads: ClassVar[frozenset[str]] = frozenset({"RACE"})
 
     def evaluate(
         self,
@@ -195,6 +256,7 @@ class FDAB055Rule(ValidationRule):
         spec: DomainMappingSpec,
         sdtm_ref: SDTMReference,
         ct_ref: CTReference,
+        stats: DomainStats | None = None,
     ) -> list[RuleResult]:
         if domain != "DM":
             return []
@@ -217,8 +279,9 @@ class FDAB055Rule(ValidationRule):
         if codelist:
             valid_terms = set(codelist.terms.keys())
         if valid_terms:
-            race_values = df["RACE"].dropna().unique()
-            invalid = [str(v) for v in race_values if str(v) not in valid_terms]
+            if stats is None:
+                stats = DomainStats(df)
+            invalid, affected = stats.values_not_in("RACE", valid_terms)
             if invalid:
                 results.append(
                     RuleResult(
@@ -232,9 +295,7 @@ class FDAB055Rule(ValidationRule):
                             f"Invalid RACE values found: {invalid}. "
                             f"Valid values from C74457: {sorted(valid_terms)}"
                         ),
-                        affected_count=sum(
-                            1 for v in df["RACE"].dropna() if str(v) not in valid_terms
-                        ),
+                        affected_count=affected,
                         fix_suggestion="Map RACE values to C74457 controlled terminology",
                     )
                 )
@@ -248,6 +309,7 @@ class FDAB039Rule(ValidationRule):
     description: str = "Normal range values must be numeric when STRESN is populated"
     category: RuleCategory = RuleCategory.FDA_BUSINESS
     severity: RuleSeverity = RuleSeverity.WARNING
+    reads: ClassVar[frozenset[str]] = frozenset({"--STRESN", "--ORNRLO", "--ORNRHI"})
 
     def evaluate(
         self,
@@ -271,12 +333,7 @@ class FDAB039Rule(ValidationRule):
                 continue
             mask = df[stresn_col].notna()
             nr_values = df.loc[mask, nr_col].dropna()
-            non_numeric_count = 0
-            for val in nr_values:
-                try:
-                    float(val)
-                except (ValueError, TypeError):
-                    non_numeric_count += 1
+            non_numeric_count = int(_parse_float(nr_values)[1].sum())
             if non_numeric_count > 0:
                 results.append(
                     RuleResult(
@@ -307,6 +364,7 @@ class FDAB009Rule(ValidationRule):
     description: str = "TESTCD and TEST must have a 1:1 relationship"
     category: RuleCategory = RuleCategory.FDA_BUSINESS
     severity: RuleSeverity = RuleSeverity.ERROR
+    reads: ClassVar[frozenset[str]] = frozenset({"--TESTCD", "--TEST"})
 
     def evaluate(
         self,
@@ -324,17 +382,14 @@ class FDAB009Rule(ValidationRule):
         if testcd_col not in df.columns or test_col not in df.columns:
             return []
         results: list[RuleResult] = []
-        valid = df[[testcd_col, test_col]].dropna().astype(str)
+        valid = _distinct_pairs(df, testcd_col, test_col)
         if valid.empty:
             return results
         fwd_counts = valid.groupby(testcd_col)[test_col].nunique()
         fwd_violations = fwd_counts[fwd_counts > 1].index.tolist()
         if fwd_violations:
-            fwd_details = (
-                valid[valid[testcd_col].isin(fwd_violations)]
-                .groupby(testcd_col)[test_col]
-                .apply(lambda x: sorted(x.unique().tolist()))
-                .to_dict()
+            fwd_details = _group_values(
+                valid[valid[testcd_col].isin(fwd_violations)], testcd_col, test_col
             )
             details = "; ".join(f"{cd} -> {tests}" for cd, tests in sorted(fwd_details.items()))
             results.append(
@@ -356,11 +411,8 @@ class FDAB009Rule(ValidationRule):
         rev_counts = valid.groupby(test_col)[testcd_col].nunique()
         rev_violations = rev_counts[rev_counts > 1].index.tolist()
         if rev_violations:
-            rev_details = (
-                valid[valid[test_col].isin(rev_violations)]
-                .groupby(test_col)[testcd_col]
-                .apply(lambda x: sorted(x.unique().tolist()))
-                .to_dict()
+            rev_details = _group_values(
+                valid[valid[test_col].isin(rev_violations)], test_col, testcd_col
             )
             details = "; ".join(f"{test} -> {cds}" for test, cds in sorted(rev_details.items()))
             results.append(
@@ -389,6 +441,7 @@ class FDAB030Rule(ValidationRule):
     description: str = "STRESU must be consistent for the same TESTCD"
     category: RuleCategory = RuleCategory.FDA_BUSINESS
     severity: RuleSeverity = RuleSeverity.WARNING
+    reads: ClassVar[frozenset[str]] = frozenset({"--TESTCD", "--STRESU"})
 
     def evaluate(
         self,
@@ -405,18 +458,15 @@ class FDAB030Rule(ValidationRule):
         stresu_col = f"{prefix}STRESU"
         if testcd_col not in df.columns or stresu_col not in df.columns:
             return []
-        valid = df[[testcd_col, stresu_col]].dropna().astype(str)
+        valid = _distinct_pairs(df, testcd_col, stresu_col)
         if valid.empty:
             return []
         unit_counts = valid.groupby(testcd_col)[stresu_col].nunique()
         violation_codes = unit_counts[unit_counts > 1].index.tolist()
         if not violation_codes:
             return []
-        violations = (
-            valid[valid[testcd_col].isin(violation_codes)]
-            .groupby(testcd_col)[stresu_col]
-            .apply(lambda x: sorted(x.unique().tolist()))
-            .to_dict()
+        violations = _group_values(
+            valid[valid[testcd_col].isin(violation_codes)], testcd_col, stresu_col
         )
         if not violations:
             return []
@@ -446,6 +496,8 @@ class FDAB015Rule(ValidationRule):
     description: str = "DM.SEX values must conform to CT codelist C66731"
     category: RuleCategory = RuleCategory.FDA_BUSINESS
     severity: RuleSeverity = RuleSeverity.ERROR
+    uses_stats: ClassVar[bool] = True
+    reads: ClassVar[frozenset[str]] = frozenset({"SEX"})
 
     def evaluate(
         self,
@@ -454,6 +506,7 @@ class FDAB015Rule(ValidationRule):
         spec: DomainMappingSpec,
         sdtm_ref: SDTMReference,
         ct_ref: CTReference,
+        stats: DomainStats | None = None,
     ) -> list[RuleResult]:
         if domain != "DM":
             return []
@@ -476,8 +529,9 @@ class FDAB015Rule(ValidationRule):
         if codelist:
             valid_terms = set(codelist.terms.keys())
         if valid_terms:
-            sex_values = df["SEX"].dropna().unique()
-            invalid = [str(v) for v in sex_values if str(v) not in valid_terms]
+            if stats is None:
+                stats = DomainStats(df)
+            invalid, affected = stats.values_not_in("SEX", valid_terms)
             if invalid:
                 results.append(
                     RuleResult(
@@ -491,9 +545,7 @@ class FDAB015Rule(ValidationRule):
                             f"Invalid SEX values found: {invalid}. "
                             f"Valid values from C66731: {sorted(valid_terms)}"
                         ),
-                        affected_count=sum(
-                            1 for v in df["SEX"].dropna() if str(v) not in valid_terms
-                        ),
+                        affected_count=affected,
                         fix_suggestion=(
                             f"Map SEX values to C66731 controlled "
                             f"terminology: {sorted(valid_terms)}"
@@ -559,6 +611,8 @@ class FDAB001Rule(ValidationRule):
     description: str = "AE.AESER values must be Y or N"
     category: RuleCategory = RuleCategory.FDA_BUSINESS
     severity: RuleSeverity = RuleSeverity.ERROR
+    uses_stats: ClassVar[bool] = True
+    reads: ClassVar[frozenset[str]] = frozenset({"AESER"})
 
     def evaluate(
         self,
@@ -567,14 +621,16 @@ class FDAB001Rule(ValidationRule):
         spec: DomainMappingSpec,
         sdtm_ref: SDTMReference,
         ct_ref: CTReference,
+        stats: DomainStats | None = None,
     ) -> list[RuleResult]:
         if domain != "AE":
             return []
         if "AESER" not in df.columns:
             return []
         valid_values = {"Y", "N"}
-        ae_ser = df["AESER"].dropna()
-        invalid = [str(v) for v in ae_ser.unique() if str(v) not in valid_values]
+        if stats is None:
+            stats = DomainStats(df)
+        invalid, affected = stats.values_not_in("AESER", valid_values)
         if not invalid:
             return []
         return [
@@ -586,7 +642,7 @@ class FDAB001Rule(ValidationRule):
                 domain=domain,
                 variable="AESER",
                 message=f"Invalid AESER values found: {invalid}. Must be Y or N",
-                affected_count=sum(1 for v in ae_ser if str(v) not in valid_values),
+                affected_count=affected,
                 fix_suggestion="Map AESER to Y or N",
             )
         ]
@@ -599,6 +655,8 @@ class FDAB002Rule(ValidationRule):
     description: str = "AE.AEREL values must use causality CT"
     category: RuleCategory = RuleCategory.FDA_BUSINESS
     severity: RuleSeverity = RuleSeverity.ERROR
+    uses_stats: ClassVar[bool] = True
+    reads: ClassVar[frozenset[str]] = frozenset({"AEREL"})
 
     _VALID_AEREL = {
         "RELATED",
@@ -615,13 +673,15 @@ class FDAB002Rule(ValidationRule):
         spec: DomainMappingSpec,
         sdtm_ref: SDTMReference,
         ct_ref: CTReference,
+        stats: DomainStats | None = None,
     ) -> list[RuleResult]:
         if domain != "AE":
             return []
         if "AEREL" not in df.columns:
             return []
-        ae_rel = df["AEREL"].dropna()
-        invalid = [str(v) for v in ae_rel.unique() if str(v) not in self._VALID_AEREL]
+        if stats is None:
+            stats = DomainStats(df)
+        invalid, affected = stats.values_not_in("AEREL", self._VALID_AEREL)
         if not invalid:
             return []
         return [
@@ -636,7 +696,7 @@ class FDAB002Rule(ValidationRule):
                     f"Invalid AEREL values found: {invalid}. "
                     f"Valid values: {sorted(self._VALID_AEREL)}"
                 ),
-                affected_count=sum(1 for v in ae_rel if str(v) not in self._VALID_AEREL),
+                affected_count=affected,
                 fix_suggestion="Map AEREL to standard causality CT values",
             )
         ]
@@ -649,6 +709,8 @@ class FDAB003Rule(ValidationRule):
     description: str = "AE.AEOUT values must use CT C101854"
     category: RuleCategory = RuleCategory.FDA_BUSINESS
     severity: RuleSeverity = RuleSeverity.ERROR
+    uses_stats: ClassVar[bool] = True
+    reads: ClassVar[frozenset[str]] = frozenset({"AEOUT"})
 
     _VALID_AEOUT = {
         "RECOVERED/RESOLVED",
@@ -666,13 +728,15 @@ class FDAB003Rule(ValidationRule):
         spec: DomainMappingSpec,
         sdtm_ref: SDTMReference,
         ct_ref: CTReference,
+        stats: DomainStats | None = None,
     ) -> list[RuleResult]:
         if domain != "AE":
             return []
         if "AEOUT" not in df.columns:
             return []
-        ae_out = df["AEOUT"].dropna()
-        invalid = [str(v) for v in ae_out.unique() if str(v) not in self._VALID_AEOUT]
+        if stats is None:
+            stats = DomainStats(df)
+        invalid, affected = stats.values_not_in("AEOUT", self._VALID_AEOUT)
         if not invalid:
             return []
         return [
@@ -687,7 +751,7 @@ class FDAB003Rule(ValidationRule):
                     f"Invalid AEOUT values found: {invalid}. "
                     f"Valid values: {sorted(self._VALID_AEOUT)}"
                 ),
-                affected_count=sum(1 for v in ae_out if str(v) not in self._VALID_AEOUT),
+                affected_count=affected,
                 fix_suggestion="Map AEOUT to CT C101854 values",
             )
         ]
@@ -700,6 +764,8 @@ class FDAB004Rule(ValidationRule):
     description: str = "AE.AEACN values must use action taken CT"
     category: RuleCategory = RuleCategory.FDA_BUSINESS
     severity: RuleSeverity = RuleSeverity.ERROR
+    uses_stats: ClassVar[bool] = True
+    reads: ClassVar[frozenset[str]] = frozenset({"AEACN"})
 
     _VALID_AEACN = {
         "DRUG WITHDRAWN",
@@ -717,13 +783,15 @@ class FDAB004Rule(ValidationRule):
         spec: DomainMappingSpec,
         sdtm_ref: SDTMReference,
         ct_ref: CTReference,
+        stats: DomainStats | None = None,
     ) -> list[RuleResult]:
         if domain != "AE":
             return []
         if "AEACN" not in df.columns:
             return []
-        ae_acn = df["AEACN"].dropna()
-        invalid = [str(v) for v in ae_acn.unique() if str(v) not in self._VALID_AEACN]
+        if stats is None:
+            stats = DomainStats(df)
+        invalid, affected = stats.values_not_in("AEACN", self._VALID_AEACN)
         if not invalid:
             return []
         return [
@@ -738,7 +806,7 @@ class FDAB004Rule(ValidationRule):
                     f"Invalid AEACN values found: {invalid}. "
                     f"Valid values: {sorted(self._VALID_AEACN)}"
                 ),
-                affected_count=sum(1 for v in ae_acn if str(v) not in self._VALID_AEACN),
+                affected_count=affected,
                 fix_suggestion="Map AEACN to action taken CT values",
             )
         ]
@@ -751,6 +819,8 @@ class FDAB005Rule(ValidationRule):
     description: str = "AESTDTC must not be after AEENDTC"
     category: RuleCategory = RuleCategory.FDA_BUSINESS
     severity: RuleSeverity = RuleSeverity.WARNING
+    uses_stats: ClassVar[bool] = True
+    reads: ClassVar[frozenset[str]] = frozenset({"AESTDTC", "AEENDTC"})
 
     def evaluate(
         self,
@@ -759,17 +829,18 @@ class FDAB005Rule(ValidationRule):
         spec: DomainMappingSpec,
         sdtm_ref: SDTMReference,
         ct_ref: CTReference,
+        stats: DomainStats | None = None,
     ) -> list[RuleResult]:
         if domain != "AE":
             return []
         if "AESTDTC" not in df.columns or "AEENDTC" not in df.columns:
             return []
+        if stats is None:
+            stats = DomainStats(df)
         # Only compare complete dates (at least YYYY-MM-DD = 10 chars)
-        mask = (
-            df["AESTDTC"].notna()
-            & df["AEENDTC"].notna()
-            & (df["AESTDTC"].astype(str).str.len() >= 10)
-            & (df["AEENDTC"].astype(str).str.len() >= 10)
+        mask = np.logical_and(
+            stats.rows_where("AESTDTC", stats.str_lengths("AESTDTC") >= 10),
+            stats.rows_where("AEENDTC", stats.str_lengths("AEENDTC") >= 10),
         )
         subset = df.loc[mask]
         if subset.empty:
@@ -804,6 +875,8 @@ class FDAB016Rule(ValidationRule):
     description: str = "DM.COUNTRY should use ISO 3166-1 alpha-3 codes"
     category: RuleCategory = RuleCategory.FDA_BUSINESS
     severity: RuleSeverity = RuleSeverity.WARNING
+    uses_stats: ClassVar[bool] = True
+    reads: ClassVar[frozenset[str]] = frozenset({"COUNTRY"})
 
     def evaluate(
         self,
@@ -812,13 +885,15 @@ class FDAB016Rule(ValidationRule):
         spec: DomainMappingSpec,
         sdtm_ref: SDTMReference,
         ct_ref: CTReference,
+        stats: DomainStats | None = None,
     ) -> list[RuleResult]:
         if domain != "DM":
             return []
         if "COUNTRY" not in df.columns:
             return []
-        country_values = df["COUNTRY"].dropna().unique()
-        invalid = [str(v) for v in country_values if str(v) not in _ISO_3166_ALPHA3]
+        if stats is None:
+            stats = DomainStats(df)
+        invalid, affected = stats.values_not_in("COUNTRY", _ISO_3166_ALPHA3)
         if not invalid:
             return []
         return [
@@ -833,9 +908,7 @@ class FDAB016Rule(ValidationRule):
                     f"Non-standard COUNTRY values found: {invalid}. "
                     f"Expected ISO 3166-1 alpha-3 codes"
                 ),
-                affected_count=sum(
-                    1 for v in df["COUNTRY"].dropna() if str(v) not in _ISO_3166_ALPHA3
-                ),
+                affected_count=affected,
                 fix_suggestion="Map COUNTRY to ISO 3166-1 alpha-3 codes (e.g., USA, GBR, DEU)",
             )
         ]
@@ -853,6 +926,7 @@ class FDAB025Rule(ValidationRule):
     description: str = "CM.CMTRT must not be null or blank"
     category: RuleCategory = RuleCategory.FDA_BUSINESS
     severity: RuleSeverity = RuleSeverity.ERROR
+    reads: ClassVar[frozenset[str]] = frozenset({"CMTRT"})
 
     def evaluate(
         self,
@@ -891,6 +965,7 @@ class FDAB026Rule(ValidationRule):
     description: str = "EX.EXTRT must not be null or blank"
     category: RuleCategory = RuleCategory.FDA_BUSINESS
     severity: RuleSeverity = RuleSeverity.ERROR
+    reads: ClassVar[frozenset[str]] = frozenset({"EXTRT"})
 
     def evaluate(
         self,
@@ -934,6 +1009,7 @@ class FDAB020Rule(ValidationRule):
     description: str = "VISITNUM must be numeric when present"
     category: RuleCategory = RuleCategory.FDA_BUSINESS
     severity: RuleSeverity = RuleSeverity.ERROR
+    reads: ClassVar[frozenset[str]] = frozenset({"VISITNUM"})
 
     def evaluate(
         self,
@@ -945,13 +1021,7 @@ class FDAB020Rule(ValidationRule):
     ) -> list[RuleResult]:
         if "VISITNUM" not in df.columns:
             return []
-        non_null = df["VISITNUM"].dropna()
-        non_numeric = 0
-        for val in non_null:
-            try:
-                float(val)
-            except (ValueError, TypeError):
-                non_numeric += 1
+        non_numeric = int(_parse_float(df["VISITNUM"].dropna())[1].sum())
         if non_numeric == 0:
             return []
         return [
@@ -976,6 +1046,7 @@ class FDAB021Rule(ValidationRule):
     description: str = "Study day (--DY) must not include Day 0"
     category: RuleCategory = RuleCategory.FDA_BUSINESS
     severity: RuleSeverity = RuleSeverity.ERROR
+    reads: ClassVar[frozenset[str]] = frozenset({"*DY"})
 
     def evaluate(
         self,
@@ -988,14 +1059,7 @@ class FDAB021Rule(ValidationRule):
         results: list[RuleResult] = []
         dy_cols = [c for c in df.columns if c.endswith("DY")]
         for col in dy_cols:
-            non_null = df[col].dropna()
-            zero_count = 0
-            for val in non_null:
-                try:
-                    if float(val) == 0:
-                        zero_count += 1
-                except (ValueError, TypeError):
-                    pass
+            zero_count = int((_parse_float(df[col].dropna())[0] == 0).sum())
             if zero_count > 0:
                 results.append(
                     RuleResult(
@@ -1020,6 +1084,8 @@ class FDAB022Rule(ValidationRule):
     description: str = "Date/time (--DTC) values must be ISO 8601"
     category: RuleCategory = RuleCategory.FDA_BUSINESS
     severity: RuleSeverity = RuleSeverity.ERROR
+    uses_stats: ClassVar[bool] = True
+    reads: ClassVar[frozenset[str]] = frozenset({"*DTC"})
 
     def evaluate(
         self,
@@ -1028,17 +1094,20 @@ class FDAB022Rule(ValidationRule):
         spec: DomainMappingSpec,
         sdtm_ref: SDTMReference,
         ct_ref: CTReference,
+        stats: DomainStats | None = None,
     ) -> list[RuleResult]:
+        if stats is None:
+            stats = DomainStats(df)
         results: list[RuleResult] = []
         dtc_cols = [c for c in df.columns if c.endswith("DTC")]
         for col in dtc_cols:
-            non_null = df[col].dropna().astype(str)
-            if non_null.empty:
-                continue
-            invalid_mask = ~non_null.apply(lambda v: bool(_ISO_8601_PATTERN.match(v)))
-            invalid_count = invalid_mask.sum()
+            invalid = ~stats.matches(col, _ISO_8601_PATTERN)
+            invalid_count = int(stats.value_counts(col)[invalid].sum())
             if invalid_count > 0:
-                sample_invalid = non_null[invalid_mask].head(3).tolist()
+                # First three offending rows, in row order
+                invalid_rows = stats.per_row(col, invalid)
+                row_values = stats.per_row(col, stats.distinct(col).to_numpy())
+                sample_invalid = row_values[invalid_rows][:3].tolist()
                 results.append(
                     RuleResult(
                         rule_id=self.rule_id,
@@ -1070,6 +1139,7 @@ class FDAB035Rule(ValidationRule):
     description: str = "LBORRES and LBORRESU must be paired"
     category: RuleCategory = RuleCategory.FDA_BUSINESS
     severity: RuleSeverity = RuleSeverity.WARNING
+    reads: ClassVar[frozenset[str]] = frozenset({"LBORRES", "LBORRESU"})
 
     def evaluate(
         self,
@@ -1109,6 +1179,7 @@ class FDAB036Rule(ValidationRule):
     description: str = "LBSTRESN and LBSTRESU must be paired"
     category: RuleCategory = RuleCategory.FDA_BUSINESS
     severity: RuleSeverity = RuleSeverity.WARNING
+    reads: ClassVar[frozenset[str]] = frozenset({"LBSTRESN", "LBSTRESU"})
 
     def evaluate(
         self,
@@ -1153,6 +1224,7 @@ class PopulationFlagRule(ValidationRule):
     description: str = "Population flags must not appear in DM domain"
     category: RuleCategory = RuleCategory.FDA_BUSINESS
     severity: RuleSeverity = RuleSeverity.ERROR
+    reads: ClassVar[frozenset[str]] = frozenset({"COMPLT", "FULLSET", "ITT", "PPROT", "SAFETY"})
 
     _POP_FLAGS = {"COMPLT", "FULLSET", "ITT", "PPROT", "SAFETY"}
 
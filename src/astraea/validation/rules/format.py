@@ -7,6 +7,7 @@ and domain file naming conventions.
 from __future__ import annotations
 
 import re
+from typing import ClassVar
 
 import pandas as pd
 
@@ -14,6 +15,7 @@ from astraea.models.mapping import DomainMappingSpec
 from astraea.reference.controlled_terms import CTReference
 from astraea.reference.sdtm_ig import SDTMReference
 from astraea.transforms.ascii_validation import validate_ascii
+from astraea.validation.domain_stats import DomainStats
 from astraea.validation.rules.base import (
     RuleCategory,
     RuleResult,
@@ -54,6 +56,8 @@ class DateFormatRule(ValidationRule):
     description: str = "Date/time variables (--DTC) must use ISO 8601 format"
     category: RuleCategory = RuleCategory.FORMAT
     severity: RuleSeverity = RuleSeverity.ERROR
+    uses_stats: ClassVar[bool] = True
+    reads: ClassVar[frozenset[str]] = frozenset({"*DTC"})
 
     def evaluate(
         self,
@@ -62,24 +66,22 @@ class DateFormatRule(ValidationRule):
         spec: DomainMappingSpec,
         sdtm_ref: SDTMReference,
         ct_ref: CTReference,
+        stats: DomainStats | None = None,
     ) -> list[RuleResult]:
         """Check --DTC columns for ISO 8601 compliance."""
+        if stats is None:
+            stats = DomainStats(df)
         results: list[RuleResult] = []
 
         dtc_cols = [c for c in df.columns if str(c).upper().endswith("DTC")]
 
         for col in dtc_cols:
             col_str = str(col)
-            non_null = df[col].dropna()
-            if non_null.empty:
-                continue
-
-            str_values = non_null.astype(str)
-            invalid_mask = ~str_values.str.match(_ISO_8601_PATTERN)
-            invalid_count = int(invalid_mask.sum())
+            invalid = ~stats.matches(col, _ISO_8601_PATTERN)
+            invalid_count = int(stats.value_counts(col)[invalid].sum())
 
             if invalid_count > 0:
-                invalid_examples = str_values[invalid_mask].unique()[:5].tolist()
+                invalid_examples = stats.distinct(col)[invalid][:5].tolist()
                 results.append(
                     RuleResult(
                         rule_id=self.rule_id,
@@ -167,6 +169,7 @@ class FileNamingRule(ValidationRule):
     description: str = "Domain code must be valid for XPT file naming (2-8 alpha chars)"
     category: RuleCategory = RuleCategory.FORMAT
     severity: RuleSeverity = RuleSeverity.ERROR
+    reads: ClassVar[frozenset[str]] = frozenset()
 
     def evaluate(
         self,
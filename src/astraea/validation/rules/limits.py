@@ -7,11 +7,14 @@ exceeding them causes silent truncation by pyreadstat.
 
 from __future__ import annotations
 
+from typing import ClassVar
+
 import pandas as pd
 
 from astraea.models.mapping import DomainMappingSpec
 from astraea.reference.controlled_terms import CTReference
 from astraea.reference.sdtm_ig import SDTMReference
+from astraea.validation.domain_stats import DomainStats
 from astraea.validation.rules.base import (
     RuleCategory,
     RuleResult,
@@ -123,6 +126,7 @@ class CharacterLengthRule(ValidationRule):
     description: str = "Character variable values must not exceed 200 bytes (XPT v5 limit)"
     category: RuleCategory = RuleCategory.LIMIT
     severity: RuleSeverity = RuleSeverity.ERROR
+    uses_stats: ClassVar[bool] = True
 
     def evaluate(
         self,
@@ -131,22 +135,25 @@ class CharacterLengthRule(ValidationRule):
         spec: DomainMappingSpec,
         sdtm_ref: SDTMReference,
         ct_ref: CTReference,
+        stats: DomainStats | None = None,
     ) -> list[RuleResult]:
         """Check character column value lengths."""
+        if stats is None:
+            stats = DomainStats(df)
         results: list[RuleResult] = []
 
         for col in df.columns:
             if not pd.api.types.is_string_dtype(df[col]):
                 continue
 
-            non_null = df[col].dropna()
-            if non_null.empty:
+            # Byte lengths are measured once per distinct value
+            byte_lengths = stats.byte_lengths(col)
+            if not len(byte_lengths):
                 continue
 
-            byte_lengths = non_null.astype(str).apply(lambda x: len(x.encode("utf-8")))
             max_bytes = int(byte_lengths.max())
             if max_bytes > 200:
-                over_count = int((byte_lengths > 200).sum())
+                over_count = int(stats.value_counts(col)[byte_lengths > 200].sum())
                 results.append(
                     RuleResult(
                         rule_id=self.rule_id,
@@ -7,6 +7,8 @@ critical identifiers like USUBJID are complete.
 
 from __future__ import annotations
 
+from typing import ClassVar
+
 import pandas as pd
 
 from astraea.models.mapping import DomainMappingSpec
@@ -175,6 +177,7 @@ class USUBJIDPresentRule(ValidationRule):
     description: str = "USUBJID must be present and complete (no nulls)"
     category: RuleCategory = RuleCategory.PRESENCE
     severity: RuleSeverity = RuleSeverity.ERROR
+    reads: ClassVar[frozenset[str]] = frozenset({"USUBJID"})
 
     def evaluate(
         self,
@@ -234,6 +237,7 @@ class SeqUniquenessRule(ValidationRule):
     description: str = "--SEQ must be unique per USUBJID within a domain"
     category: RuleCategory = RuleCategory.PRESENCE
     severity: RuleSeverity = RuleSeverity.ERROR
+    reads: ClassVar[frozenset[str]] = frozenset({"--SEQ", "USUBJID"})
 
     def evaluate(
         self,
@@ -294,6 +298,7 @@ class DMOneRecordPerSubjectRule(ValidationRule):
     description: str = "DM must have exactly one record per subject"
     category: RuleCategory = RuleCategory.PRESENCE
     severity: RuleSeverity = RuleSeverity.ERROR
+    reads: ClassVar[frozenset[str]] = frozenset({"USUBJID"})
 
     def evaluate(
         self,
@@ -345,6 +350,7 @@ class DMArmPresenceRule(ValidationRule):
     description: str = "DM must contain ARM, ARMCD, ACTARM, and ACTARMCD"
     category: RuleCategory = RuleCategory.PRESENCE
     severity: RuleSeverity = RuleSeverity.ERROR
+    reads: ClassVar[frozenset[str]] = frozenset({"ARM", "ARMCD", "ACTARM", "ACTARMCD"})
 
     _ARM_VARIABLES: tuple[str, ...] = ("ARM", "ARMCD", "ACTARM", "ACTARMCD")
 
@@ -399,6 +405,7 @@ class DMArmCopyPasteRule(ValidationRule):
     description: str = "ACTARM/ACTARMCD should be independently derived, not copied from ARM/ARMCD"
     category: RuleCategory = RuleCategory.PRESENCE
     severity: RuleSeverity = RuleSeverity.WARNING
+    reads: ClassVar[frozenset[str]] = frozenset({"ARM", "ARMCD", "ACTARM", "ACTARMCD"})
 
     def evaluate(
         self,
@@ -10,6 +10,7 @@ an existing record in the parent domain.
 from __future__ import annotations
 
 import re
+from typing import ClassVar
 
 import pandas as pd
 
@@ -46,6 +47,7 @@ class SUPPQUALIntegrityRule(ValidationRule):
     description: str = "SUPPQUAL referential integrity check"
     category: RuleCategory = RuleCategory.CONSISTENCY
     severity: RuleSeverity = RuleSeverity.ERROR
+    reads: ClassVar[frozenset[str]] = frozenset({"RDOMAIN", "IDVAR", "QNAM", "USUBJID", "IDVARVAL"})
 
     def evaluate(
         self,
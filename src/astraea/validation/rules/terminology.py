@@ -7,11 +7,14 @@ extensible and non-extensible codelist types.
 
 from __future__ import annotations
 
+from typing import ClassVar
+
 import pandas as pd
 
 from astraea.models.mapping import DomainMappingSpec
 from astraea.reference.controlled_terms import CTReference
 from astraea.reference.sdtm_ig import SDTMReference
+from astraea.validation.domain_stats import DomainStats
 from astraea.validation.rules.base import (
     RuleCategory,
     RuleResult,
@@ -33,6 +36,7 @@ class CTValueRule(ValidationRule):
     description: str = "Controlled terminology values must match codelist terms"
     category: RuleCategory = RuleCategory.TERMINOLOGY
     severity: RuleSeverity = RuleSeverity.ERROR
+    uses_stats: ClassVar[bool] = True
 
     def evaluate(
         self,
@@ -41,8 +45,11 @@ class CTValueRule(ValidationRule):
         spec: DomainMappingSpec,
         sdtm_ref: SDTMReference,
         ct_ref: CTReference,
+        stats: DomainStats | None = None,
     ) -> list[RuleResult]:
         """Check CT values for each mapped variable with a codelist."""
+        if stats is None:
+            stats = DomainStats(df)
         results: list[RuleResult] = []
 
         for vm in spec.variable_mappings:
@@ -74,20 +81,11 @@ class CTValueRule(ValidationRule):
                 )
                 continue
 
-            # Get unique non-null values
-            non_null = df[var_name].dropna()
-            if non_null.empty:
-                continue
-
-            unique_values = non_null.astype(str).unique()
-            invalid_values = [v for v in unique_values if v not in cl.terms]
-
+            # Distinct non-null values outside the codelist, and their rows
+            invalid_values, affected = stats.values_not_in(var_name, cl.terms)
             if not invalid_values:
                 continue
 
-            # Count affected rows
-            affected = int(non_null.astype(str).isin(invalid_values).sum())
-
             # Determine severity based on extensibility
             if cl.extensible:
                 severity = RuleSeverity.WARNING
@@ -139,6 +137,8 @@ class DomainValueRule(ValidationRule):
     description: str = "DOMAIN column value must match the dataset domain code"
     category: RuleCategory = RuleCategory.TERMINOLOGY
     severity: RuleSeverity = RuleSeverity.ERROR
+    uses_stats: ClassVar[bool] = True
+    reads: ClassVar[frozenset[str]] = frozenset({"DOMAIN"})
 
     def evaluate(
         self,
@@ -147,6 +147,7 @@ class DomainValueRule(ValidationRule):
         spec: DomainMappingSpec,
         sdtm_ref: SDTMReference,
         ct_ref: CTReference,
+        stats: DomainStats | None = None,
     ) -> list[RuleResult]:
         """Check that DOMAIN column equals the expected domain code."""
         results: list[RuleResult] = []
@@ -167,10 +168,10 @@ class DomainValueRule(ValidationRule):
             )
             return results
 
-        non_null = df["DOMAIN"].dropna()
-        wrong_values = non_null[non_null.astype(str) != domain]
-        if not wrong_values.empty:
-            unique_wrong = wrong_values.astype(str).unique().tolist()
+        if stats is None:
+            stats = DomainStats(df)
+        unique_wrong, wrong_count = stats.values_not_in("DOMAIN", {domain})
+        if unique_wrong:
             results.append(
                 RuleResult(
                     rule_id=self.rule_id,
@@ -184,7 +185,7 @@ class DomainValueRule(ValidationRule):
                         f"{', '.join(repr(v) for v in unique_wrong[:5])}; "
                         f"expected '{domain}'"
                     ),
-                    affected_count=len(wrong_values),
+                    affected_count=wrong_count,
                     fix_suggestion=f"Set all DOMAIN values to '{domain}'",
                 )
             )
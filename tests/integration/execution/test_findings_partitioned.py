@@ -0,0 +1,275 @@
+"""Subject-partitioned Findings execution writes the same XPT as the in-memory path."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from astraea.execution.executor import ExecutionError
+from astraea.execution.findings import FindingsExecutor, subject_batches
+from astraea.execution.lc_domain import LC_XPT_TABLE_LABEL, generate_lc_from_lb
+from astraea.io.xpt_writer import write_xpt_v5
+from astraea.models.mapping import (
+    ConfidenceLevel,
+    DomainMappingSpec,
+    MappingPattern,
+    VariableMapping,
+)
+from astraea.models.sdtm import CoreDesignation
+from astraea.reference import load_ct_reference, load_sdtm_reference
+from astraea.transforms.char_storage import CharStorage
+
+_STUDY = "PHA022121-C301"
+
+
+def _mapping(var: str, label: str, order: int, **kwargs: str) -> VariableMapping:
+    pattern = MappingPattern.DIRECT
+    if "assigned_value" in kwargs:
+        pattern = MappingPattern.ASSIGN
+    elif "derivation_rule" in kwargs:
+        pattern = MappingPattern.DERIVATION
+    return VariableMapping(
+        sdtm_variable=var,
+        sdtm_label=label,
+        sdtm_data_type="Char",
+        core=CoreDesignation.EXP,
+        mapping_pattern=pattern,
+        mapping_logic="test",
+        confidence=0.9,
+        confidence_level=ConfidenceLevel.HIGH,
+        confidence_rationale="test",
+        order=order,
+        **kwargs,
+    )
+
+
+@pytest.fixture()
+def lb_spec() -> DomainMappingSpec:
+    mappings = [
+        _mapping("STUDYID", "Study Identifier", 1, assigned_value=_STUDY),
+        _mapping("DOMAIN", "Domain Abbreviation", 2, assigned_value="LB"),
+        _mapping("USUBJID", "Unique Subject Identifier", 3, derivation_rule="generate_usubjid"),
+        _mapping("LBSEQ", "Sequence Number", 4, derivation_rule="generate_seq"),
+        _mapping("LBTESTCD", "Lab Test or Examination Short Name", 5, source_variable="LBTESTCD"),
+        _mapping("LBTEST", "Lab Test or Examination Name", 6, source_variable="LBTEST"),
+        _mapping("LBCAT", "Category for Lab Test", 7, source_variable="LBCAT"),
+        _mapping("LBORRES", "Result or Finding in Original Units", 8, source_variable="LBORRES"),
+        _mapping("LBORRESU", "Original Units", 9, source_variable="LBORRESU"),
+        _mapping("LBSTRESC", "Character Result/Finding in Std Format", 10),
+        _mapping("LBSTRESN", "Numeric Result/Finding in Std Units", 11),
+        _mapping("LBSTRESU", "Standard Units", 12),
+        _mapping(
+            "LBSTNRLO", "Reference Range Lower Limit-Std Units", 13, source_variable="LBSTNRLO"
+        ),
+        _mapping(
+            "LBSTNRHI", "Reference Range Upper Limit-Std Units", 14, source_variable="LBSTNRHI"
+        ),
+        _mapping("LBNRIND", "Reference Range Indicator", 15),
+        _mapping("LBDTC", "Date/Time of Specimen Collection", 16, source_variable="LBDTC"),
+    ]
+    return DomainMappingSpec(
+        domain="LB",
+        domain_label="Laboratory Test Results",
+        domain_class="Findings",
+        structure="One record per lab test per visit per subject",
+        study_id=_STUDY,
+        source_datasets=["lab_results.sas7bdat", "llb.sas7bdat"],
+        variable_mappings=mappings,
+        total_variables=len(mappings),
+        required_mapped=4,
+        expected_mapped=len(mappings) - 4,
+        high_confidence_count=len(mappings),
+        medium_confidence_count=0,
+        low_confidence_count=0,
+        mapping_timestamp="2026-02-27T00:00:00",
+        model_used="test",
+    )
+
+
+@pytest.fixture()
+def raw_dfs() -> dict[str, pd.DataFrame]:
+    """Two lab sources over 7 subjects across 2 sites, rows in no particular order."""
+    rng = np.random.default_rng(7)
+    n = 60
+    subjects = rng.choice(["004", "001", "007", "002", "006", "003", "005"], n)
+    tests = rng.choice(["ALT", "WBC", "HGB"], n)
+    lab_results = pd.DataFrame(
+        {
+            "Subject": subjects,
+            "SiteNumber": np.where(subjects < "004", "101", "102"),
+            "LBTESTCD": tests,
+            "LBTEST": [
+                {"ALT": "Alanine Aminotransferase", "WBC": "Leukocytes"}.get(t, t) for t in tests
+            ],
+            "LBCAT": "CHEMISTRY",
+            "LBORRES": rng.choice(["25", "5.2", "14.1", "<1", ""], n),
+            "LBORRESU": rng.choice(["U/L", "g/dL"], n),
+            "LBSTNRLO": rng.choice([4.0, 7.0, np.nan], n),
+            "LBSTNRHI": rng.choice([11.0, 56.0], n),
+            "LBDTC": rng.choice(["2022-01-15", "2022-02-15", "2022-03"], n),
+        }
+    )
+    llb = pd.DataFrame(
+        {
+            "Subject": ["002", "005", "001"],
+            "SiteNumber": ["101", "102", "101"],
+            "LBTEST2": ["Glucose", "Glucose", "Glucose µ-test"],
+            "LBORRES": ["95", "110", "88"],
+            "LBORRESU": ["mg/dL", "mg/dL", "mg/dL"],
+            "LBORNRLO": [70.0, 70.0, 70.0],
+            "LBORNRHI": [100.0, 100.0, 100.0],
+            "LBCAT": ["CHEMISTRY"] * 3,
+            "LBDTC": ["2022-01-15", "2022-01-20", "2022-01-25"],
+        }
+    )
+    return {"lab_results": lab_results, "llb": llb}
+
+
+@pytest.fixture()
+def executor() -> FindingsExecutor:
+    return FindingsExecutor(sdtm_ref=load_sdtm_reference(), ct_ref=load_ct_reference())
+
+
+def _mask_timestamps(data: bytes) -> bytes:
+    data = bytearray(data)
+    for record in (1, 2, 5, 6):
+        data[record * 80 : (record + 1) * 80] = b"\0" * 80
+    return bytes(data)
+
+
+def _labels(spec: DomainMappingSpec, df: pd.DataFrame) -> dict[str, str]:
+    return {m.sdtm_variable: m.sdtm_label for m in spec.variable_mappings if m.sdtm_variable in df}
+
+
+class TestSubjectBatches:
+    def test_batches_hold_whole_subjects_in_order(self) -> None:
+        keys = {
+            "a": pd.Series(["S3", "S1", None, "S2", "S1"]),
+            "b": pd.Series(["S2", "S4"]),
+        }
+        batches = subject_batches(keys, 2)
+
+        assert [b["a"].tolist() for b in batches] == [[1, 3, 4], [0], [2]]
+        assert [b["b"].tolist() for b in batches] == [[0], [1], []]
+
+    def test_rejects_non_positive_batch_size(self) -> None:
+        with pytest.raises(ValueError, match="subjects_per_batch"):
+            subject_batches({"a": pd.Series(["S1"])}, 0)
+
+
+class TestExecutePartitionedToXpt:
+    @pytest.mark.parametrize("ranges_missing", [False, True])
+    @pytest.mark.parametrize("subjects_per_batch", [1, 3, 100])
+    def test_matches_in_memory_output(
+        self,
+        tmp_path: Path,
+        lb_spec: DomainMappingSpec,
+        raw_dfs: dict[str, pd.DataFrame],
+        executor: FindingsExecutor,
+        subjects_per_batch: int,
+        ranges_missing: bool,
+    ) -> None:
+        if ranges_missing:
+            # Numeric columns with no value in any batch stay numeric
+            raw_dfs["lab_results"][["LBSTNRLO", "LBSTNRHI"]] = np.nan
+            raw_dfs["llb"][["LBORNRLO", "LBORNRHI"]] = np.nan
+        lb_df, _supp = executor.execute_lb(lb_spec, raw_dfs, study_id=_STUDY)
+        labels = _labels(lb_spec, lb_df)
+        write_xpt_v5(lb_df, tmp_path / "expected.xpt", "LB", labels, lb_spec.domain_label)
+
+        result = executor.execute_partitioned_to_xpt(
+            lb_spec,
+            raw_dfs,
+            tmp_path / "lb.xpt",
+            study_id=_STUDY,
+            subjects_per_batch=subjects_per_batch,
+        )
+
+        assert result.subject_count == 7
+        assert result.batch_count == -(-7 // subjects_per_batch)
+        assert result.row_count == len(lb_df) == 63
+        assert _mask_timestamps((tmp_path / "lb.xpt").read_bytes()) == _mask_timestamps(
+            (tmp_path / "expected.xpt").read_bytes()
+        )
+        # Spilled batches are cleaned up
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["expected.xpt", "lb.xpt"]
+
+    def test_compact_char_storage_matches_in_memory_output(
+        self, tmp_path: Path, lb_spec: DomainMappingSpec, raw_dfs: dict[str, pd.DataFrame]
+    ) -> None:
+        executor = FindingsExecutor(
+            sdtm_ref=load_sdtm_reference(),
+            ct_ref=load_ct_reference(),
+            char_storage=CharStorage.CATEGORY,
+        )
+        lb_df, _supp = executor.execute_lb(lb_spec, raw_dfs, study_id=_STUDY)
+        write_xpt_v5(
+            lb_df, tmp_path / "expected.xpt", "LB", _labels(lb_spec, lb_df), lb_spec.domain_label
+        )
+
+        executor.execute_partitioned_to_xpt(
+            lb_spec, raw_dfs, tmp_path / "lb.xpt", study_id=_STUDY, subjects_per_batch=2
+        )
+
+        assert _mask_timestamps((tmp_path / "lb.xpt").read_bytes()) == _mask_timestamps(
+            (tmp_path / "expected.xpt").read_bytes()
+        )
+
+    def test_conflicting_column_types_rejected(
+        self,
+        tmp_path: Path,
+        lb_spec: DomainMappingSpec,
+        raw_dfs: dict[str, pd.DataFrame],
+        executor: FindingsExecutor,
+    ) -> None:
+        # A subject with only llb rows gets a batch where LBDTC is numeric
+        raw_dfs["llb"]["Subject"] = "008"
+        raw_dfs["llb"]["LBDTC"] = [20220115.0, 20220120.0, 20220125.0]
+        with pytest.raises(ExecutionError, match="LBDTC"):
+            executor.execute_partitioned_to_xpt(
+                lb_spec, raw_dfs, tmp_path / "lb.xpt", study_id=_STUDY, subjects_per_batch=1
+            )
+
+    def test_lc_output_matches_structural_copy(
+        self,
+        tmp_path: Path,
+        lb_spec: DomainMappingSpec,
+        raw_dfs: dict[str, pd.DataFrame],
+        executor: FindingsExecutor,
+    ) -> None:
+        lb_df, _supp = executor.execute_lb(lb_spec, raw_dfs, study_id=_STUDY)
+        lc_df, _warnings = generate_lc_from_lb(lb_df, _STUDY)
+        lb_labels = _labels(lb_spec, lb_df)
+        lc_labels = {c: lb_labels.get("LB" + c[2:], lb_labels.get(c, "")) for c in lc_df}
+        write_xpt_v5(
+            lc_df,
+            tmp_path / "expected_lc.xpt",
+            "LC",
+            lc_labels,
+            LC_XPT_TABLE_LABEL,
+        )
+
+        result = executor.execute_partitioned_to_xpt(
+            lb_spec,
+            raw_dfs,
+            tmp_path / "lb.xpt",
+            study_id=_STUDY,
+            subjects_per_batch=2,
+            lc_output_path=tmp_path / "lc.xpt",
+        )
+
+        assert result.lc_xpt is not None
+        assert result.lc_xpt.row_count == len(lc_df)
+        assert _mask_timestamps((tmp_path / "lc.xpt").read_bytes()) == _mask_timestamps(
+            (tmp_path / "expected_lc.xpt").read_bytes()
+        )
+
+    def test_rejects_non_findings_domain(
+        self, tmp_path: Path, lb_spec: DomainMappingSpec, executor: FindingsExecutor
+    ) -> None:
+        ae_spec = lb_spec.model_copy(update={"domain": "AE"})
+        with pytest.raises(ValueError, match="LB, EG and VS"):
+            executor.execute_partitioned_to_xpt(ae_spec, {}, tmp_path / "ae.xpt")
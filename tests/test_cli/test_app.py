@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
+import pandas as pd
 from typer.testing import CliRunner
 
 from astraea.cli.app import app
+from astraea.models.metadata import DatasetMetadata, VariableMetadata
+from astraea.profiling.profiler import profile_dataset_chunks
 
 runner = CliRunner()
 
@@ -45,6 +50,32 @@ class TestProfileCommand:
         # Detail mode should show variable-level info
         assert "Variable" in result.output
 
+    def test_profile_chunk_size_streams(self, tmp_path) -> None:
+        (tmp_path / "dm.sas7bdat").write_bytes(b"dummy")
+        meta = DatasetMetadata(
+            filename="dm.sas7bdat",
+            row_count=3,
+            col_count=1,
+            variables=[VariableMetadata(name="AGE", dtype="numeric")],
+        )
+        chunks = [pd.DataFrame({"AGE": [30.0, 41.0]}), pd.DataFrame({"AGE": [30.0]})]
+
+        with (
+            patch("astraea.io.sas_reader.read_sas_metadata", return_value=meta),
+            patch("astraea.io.sas_reader.iter_sas_chunks", return_value=iter(chunks)) as mock_iter,
+            patch("astraea.io.sas_reader.read_all_sas_files") as mock_read_all,
+            patch(
+                "astraea.profiling.profiler.profile_dataset_chunks",
+                wraps=profile_dataset_chunks,
+            ) as mock_profile,
+        ):
+            result = runner.invoke(app, ["profile", str(tmp_path), "--chunk-size", "2"])
+
+        assert result.exit_code == 0, result.output
+        assert mock_iter.call_args.args[1] == 2
+        assert mock_profile.call_args.kwargs["approx_distinct"] is True
+        mock_read_all.assert_not_called()
+
 
 class TestReferenceCommand:
     def test_reference_dm_exits_zero(self) -> None:
@@ -5,19 +5,28 @@ from __future__ import annotations
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pandas as pd
 from typer.testing import CliRunner
 
 from astraea.cli.app import app
+from astraea.io.sas_reader import SASFileRead
 from astraea.models.classification import (
     ClassificationResult,
     DomainClassification,
     DomainPlan,
     HeuristicScore,
 )
+from astraea.models.metadata import DatasetMetadata
 
 runner = CliRunner()
 
 
+def _make_reads() -> list[SASFileRead]:
+    """One successfully read raw dataset, as returned by read_sas_directory."""
+    meta = DatasetMetadata(filename="ae.sas7bdat", row_count=0, col_count=0)
+    return [SASFileRead(filename="ae.sas7bdat", data=pd.DataFrame(), metadata=meta)]
+
+
 def _make_classification_result() -> ClassificationResult:
     """Create a sample classification result for testing."""
     return ClassificationResult(
@@ -107,7 +116,7 @@ class TestClassifyCommand:
 
     @patch("astraea.classification.classifier.classify_all")
     @patch("astraea.profiling.profiler.profile_dataset")
-    @patch("astraea.io.sas_reader.read_all_sas_files")
+    @patch("astraea.io.sas_reader.read_sas_directory")
     def test_successful_classify_shows_table(
         self,
         mock_read: MagicMock,
@@ -118,7 +127,7 @@ class TestClassifyCommand:
         sas_file = tmp_path / "ae.sas7bdat"
         sas_file.write_bytes(b"fake")
 
-        mock_read.return_value = {"ae.sas7bdat": (MagicMock(), MagicMock())}
+        mock_read.return_value = _make_reads()
         mock_profile.return_value = MagicMock(filename="ae.sas7bdat")
         mock_classify.return_value = _make_classification_result()
 
@@ -132,7 +141,7 @@ class TestClassifyCommand:
 
     @patch("astraea.classification.classifier.classify_all")
     @patch("astraea.profiling.profiler.profile_dataset")
-    @patch("astraea.io.sas_reader.read_all_sas_files")
+    @patch("astraea.io.sas_reader.read_sas_directory")
     def test_classify_shows_merge_groups(
         self,
         mock_read: MagicMock,
@@ -143,7 +152,7 @@ class TestClassifyCommand:
         sas_file = tmp_path / "ae.sas7bdat"
         sas_file.write_bytes(b"fake")
 
-        mock_read.return_value = {"ae.sas7bdat": (MagicMock(), MagicMock())}
+        mock_read.return_value = _make_reads()
         mock_profile.return_value = MagicMock(filename="ae.sas7bdat")
         mock_classify.return_value = _make_classification_result()
 
@@ -156,7 +165,7 @@ class TestClassifyCommand:
 
     @patch("astraea.classification.classifier.classify_all")
     @patch("astraea.profiling.profiler.profile_dataset")
-    @patch("astraea.io.sas_reader.read_all_sas_files")
+    @patch("astraea.io.sas_reader.read_sas_directory")
     def test_output_flag_writes_json(
         self,
         mock_read: MagicMock,
@@ -168,7 +177,7 @@ class TestClassifyCommand:
         sas_file.write_bytes(b"fake")
         output_file = tmp_path / "result.json"
 
-        mock_read.return_value = {"ae.sas7bdat": (MagicMock(), MagicMock())}
+        mock_read.return_value = _make_reads()
         mock_profile.return_value = MagicMock(filename="ae.sas7bdat")
         mock_classify.return_value = _make_classification_result()
 
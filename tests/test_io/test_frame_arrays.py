@@ -0,0 +1,51 @@
+"""Tests for the pickle-free DataFrame array format."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from astraea.io.frame_arrays import UnsupportedFrameError, load_frame, save_frame
+
+
+def test_round_trip_dtypes_and_nulls(tmp_path: Path) -> None:
+    df = pd.DataFrame(
+        {
+            "TEXT": np.array(["µg/L", None, "", "µg/L"], dtype=object),
+            "MIXED": np.array(["a", None, np.nan, pd.NA], dtype=object),
+            "EMPTY": np.array([None] * 4, dtype=object),
+            "N": [1.5, np.nan, 3.0, 4.0],
+            "SEQ": pd.array([1, None, 3, 4], dtype="Int64"),
+            "FLAG": pd.array([True, None, False, True], dtype="boolean"),
+            "DT": pd.to_datetime(["2022-01-01", None, "2022-01-03", "2022-01-04"]),
+        }
+    )
+    save_frame(tmp_path / "frame.npz", df)
+
+    loaded = load_frame(tmp_path / "frame.npz")
+    pd.testing.assert_frame_equal(loaded, df)
+    assert loaded["TEXT"][1] is None
+    assert [type(v).__name__ for v in loaded["MIXED"]] == ["str", "NoneType", "float", "NAType"]
+
+
+def test_unsupported_frames_rejected(tmp_path: Path) -> None:
+    with pytest.raises(UnsupportedFrameError, match="non-string"):
+        save_frame(tmp_path / "f.npz", pd.DataFrame({"D": np.array([{"a": 1}], dtype=object)}))
+    with pytest.raises(UnsupportedFrameError, match="RangeIndex"):
+        save_frame(tmp_path / "f.npz", pd.DataFrame({"A": [1.0]}, index=[5]))
+    assert not (tmp_path / "f.npz").exists()
+
+
+def test_object_arrays_are_never_unpickled(tmp_path: Path) -> None:
+    with open(tmp_path / "frame.npz", "wb") as f:
+        np.savez(
+            f,
+            schema=np.array('{"rows": 1, "columns": [{"name": "A", "kind": "array"}]}'),
+            c0=np.array([object()], dtype=object),
+        )
+
+    with pytest.raises(ValueError, match="allow_pickle"):
+        load_frame(tmp_path / "frame.npz")
@@ -0,0 +1,184 @@
+"""Tests for the on-disk SAS read cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from astraea.io.sas_cache import SASReadCache
+from astraea.io.sas_reader import read_sas_with_metadata
+from astraea.models.metadata import DatasetMetadata, VariableMetadata
+
+
+def _meta(name: str = "dm.sas7bdat") -> DatasetMetadata:
+    return DatasetMetadata(
+        filename=name,
+        row_count=2,
+        col_count=2,
+        variables=[
+            VariableMetadata(name="USUBJID", label="Subject", dtype="character"),
+            VariableMetadata(name="AGE", label="Age", dtype="numeric"),
+        ],
+        file_encoding="UTF-8",
+    )
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {"USUBJID": np.array(["S1-001", ""], dtype=object), "AGE": [34.0, np.nan]}
+    )
+
+
+@pytest.fixture()
+def sas_file(tmp_path: Path) -> Path:
+    path = tmp_path / "dm.sas7bdat"
+    path.write_bytes(b"raw sas bytes")
+    return path
+
+
+class TestSASReadCache:
+    def test_round_trip_preserves_frame_and_metadata(self, tmp_path, sas_file) -> None:
+        cache = SASReadCache(tmp_path / "cache")
+        assert cache.get(sas_file) is None
+
+        cache.put(sas_file, _frame(), _meta())
+        hit = cache.get(sas_file)
+
+        assert hit is not None
+        df, meta = hit
+        pd.testing.assert_frame_equal(df, _frame())
+        assert meta == _meta()
+
+    def test_modified_source_is_a_miss(self, tmp_path, sas_file) -> None:
+        cache = SASReadCache(tmp_path / "cache")
+        cache.put(sas_file, _frame(), _meta())
+
+        sas_file.write_bytes(b"a longer replacement file")
+        assert cache.get(sas_file) is None
+
+    def test_corrupt_entry_is_discarded(self, tmp_path, sas_file) -> None:
+        cache = SASReadCache(tmp_path / "cache")
+        cache.put(sas_file, _frame(), _meta())
+        (tmp_path / "cache" / f"{cache.key_for(sas_file)}.npz").write_bytes(b"garbage")
+
+        assert cache.get(sas_file) is None
+        assert cache.total_bytes() == 0
+
+    def test_evicts_least_recently_used(self, tmp_path) -> None:
+        files = []
+        for name in ("a", "b", "c"):
+            path = tmp_path / f"{name}.sas7bdat"
+            path.write_bytes(name.encode())
+            files.append(path)
+
+        cache = SASReadCache(tmp_path / "cache")
+        for i, path in enumerate(files[:2]):
+            cache.put(path, _frame(), _meta(path.name))
+            meta_path = tmp_path / "cache" / f"{cache.key_for(path)}.json"
+            os.utime(meta_path, (1_000_000 + i, 1_000_000 + i))
+        entry_size = cache.total_bytes() // 2
+
+        # Reading "a" makes "b" the least recently used entry
+        assert cache.get(files[0]) is not None
+        cache.max_bytes = entry_size * 2 + entry_size // 2
+        cache.put(files[2], _frame(), _meta(files[2].name))
+
+        assert cache.get(files[0]) is not None
+        assert cache.get(files[1]) is None
+        assert cache.get(files[2]) is not None
+
+    def test_clear(self, tmp_path, sas_file) -> None:
+        cache = SASReadCache(tmp_path / "cache")
+        cache.put(sas_file, _frame(), _meta())
+
+        assert cache.clear() == 1
+        assert cache.get(sas_file) is None
+        assert SASReadCache(tmp_path / "missing").clear() == 0
+
+    def test_round_trip_dtypes_and_nulls(self, tmp_path, sas_file) -> None:
+        df = pd.DataFrame(
+            {
+                "TEXT": np.array(["µg/L", None, "", "µg/L", "x"], dtype=object),
+                "NANTEXT": np.array(["a", np.nan, "b", "a", np.nan], dtype=object),
+                "N": [1.5, np.nan, 3.0, 4.0, 5.0],
+                "I": np.arange(5, dtype=np.int64),
+                "EMPTY": np.array([None] * 5, dtype=object),
+            }
+        )
+        cache = SASReadCache(tmp_path / "cache")
+        cache.put(sas_file, df, _meta())
+
+        hit = cache.get(sas_file)
+        assert hit is not None
+        pd.testing.assert_frame_equal(hit[0], df)
+        assert hit[0]["TEXT"][1] is None
+        assert np.isnan(hit[0]["NANTEXT"][1])
+
+    def test_uncacheable_frame_is_skipped(self, tmp_path, sas_file) -> None:
+        cache = SASReadCache(tmp_path / "cache")
+        cache.put(sas_file, pd.DataFrame({"D": np.array([{"a": 1}], dtype=object)}), _meta())
+        cache.put(sas_file, _frame().set_index("USUBJID"), _meta())
+        assert cache.get(sas_file) is None
+
+    def test_entries_never_unpickle(self, tmp_path, sas_file) -> None:
+        cache = SASReadCache(tmp_path / "cache")
+        cache.put(sas_file, _frame(), _meta())
+        frame_path = tmp_path / "cache" / f"{cache.key_for(sas_file)}.npz"
+        with open(frame_path, "wb") as f:
+            np.savez(f, c0=np.array([object()], dtype=object))
+
+        with patch("pickle.loads") as loads:
+            assert cache.get(sas_file) is None
+        loads.assert_not_called()
+
+    def test_default_dir_is_private_per_user(self, tmp_path, sas_file, monkeypatch) -> None:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+        cache = SASReadCache()
+        assert cache.cache_dir == tmp_path / "xdg" / "astraea" / "sas_cache"
+
+        cache.put(sas_file, _frame(), _meta())
+        assert cache.cache_dir.stat().st_mode & 0o777 == 0o700
+        assert cache.get(sas_file) is not None
+
+    def test_shared_writable_dir_is_ignored(self, tmp_path, sas_file) -> None:
+        cache = SASReadCache(tmp_path / "cache")
+        cache.put(sas_file, _frame(), _meta())
+        os.chmod(cache.cache_dir, 0o777)
+
+        assert cache.get(sas_file) is None
+        cache.put(sas_file, _frame(), _meta())
+        os.chmod(cache.cache_dir, 0o700)
+        assert cache.get(sas_file) is not None
+
+    def test_rejects_non_positive_limit(self, tmp_path) -> None:
+        with pytest.raises(ValueError, match="max_bytes"):
+            SASReadCache(tmp_path, max_bytes=0)
+
+
+def test_read_sas_with_metadata_decodes_once(tmp_path, sas_file) -> None:
+    """A second cached read is served without calling pyreadstat."""
+    raw_meta = SimpleNamespace(
+        column_names=["USUBJID", "AGE"],
+        original_variable_types={"USUBJID": "$8", "AGE": "BEST12"},
+        column_names_to_labels={"USUBJID": "Subject", "AGE": "Age"},
+        number_rows=2,
+        number_columns=2,
+        file_encoding="UTF-8",
+    )
+    cache = SASReadCache(tmp_path / "cache")
+
+    with patch(
+        "astraea.io.sas_reader.pyreadstat.read_sas7bdat", return_value=(_frame(), raw_meta)
+    ) as mock_read:
+        first_df, first_meta = read_sas_with_metadata(sas_file, cache=cache)
+        second_df, second_meta = read_sas_with_metadata(sas_file, cache=cache)
+
+    assert mock_read.call_count == 1
+    pd.testing.assert_frame_equal(first_df, second_df)
+    assert first_meta == second_meta
@@ -0,0 +1,69 @@
+"""Tests for parallel directory reads (read_sas_directory)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from astraea.io.sas_reader import read_sas_directory
+from astraea.models.metadata import DatasetMetadata
+
+
+def _fake_read(filepath, **_kwargs):
+    filepath = Path(filepath)
+    if filepath.stem == "bad":
+        raise ValueError("corrupt header")
+    meta = DatasetMetadata(filename=filepath.name, row_count=1, col_count=1)
+    return pd.DataFrame({"X": [filepath.stem]}), meta
+
+
+@pytest.fixture()
+def data_dir(tmp_path: Path) -> Path:
+    for name in ("lb", "ae", "bad", "dm"):
+        (tmp_path / f"{name}.sas7bdat").write_bytes(b"not really sas")
+    (tmp_path / "notes.txt").write_text("ignored")
+    return tmp_path
+
+
+def test_serial_collects_errors_in_filename_order(data_dir) -> None:
+    with patch("astraea.io.sas_reader.read_sas_with_metadata", side_effect=_fake_read):
+        reads = read_sas_directory(data_dir, max_workers=1)
+
+    assert [r.filename for r in reads] == [
+        "ae.sas7bdat",
+        "bad.sas7bdat",
+        "dm.sas7bdat",
+        "lb.sas7bdat",
+    ]
+    assert [r.succeeded for r in reads] == [True, False, True, True]
+    assert "corrupt header" in (reads[1].error or "")
+    assert reads[1].data is None
+    assert reads[0].data is not None and reads[0].data["X"].tolist() == ["ae"]
+    assert all(r.seconds >= 0 for r in reads)
+
+
+def test_process_pool_records_every_failure(data_dir) -> None:
+    """Unreadable files fail inside the workers without aborting the run."""
+    reads = read_sas_directory(data_dir, max_workers=2)
+
+    assert [r.filename for r in reads] == [
+        "ae.sas7bdat",
+        "bad.sas7bdat",
+        "dm.sas7bdat",
+        "lb.sas7bdat",
+    ]
+    assert not any(r.succeeded for r in reads)
+    assert all(r.error for r in reads)
+
+
+def test_missing_directory(tmp_path) -> None:
+    with pytest.raises(FileNotFoundError):
+        read_sas_directory(tmp_path / "missing")
+
+
+def test_empty_directory(tmp_path) -> None:
+    with pytest.raises(ValueError, match="No .sas7bdat"):
+        read_sas_directory(tmp_path)
@@ -0,0 +1,79 @@
+"""Tests for column-projected SAS reads (pyreadstat mocked)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from astraea.io.sas_cache import SASReadCache
+from astraea.io.sas_reader import read_sas_with_metadata
+
+_RAW_META = SimpleNamespace(
+    column_names=["Subject", "SiteNumber", "AETERM", "AEDECOD"],
+    original_variable_types={"Subject": "$8", "SiteNumber": "$4", "AETERM": "$200"},
+    column_names_to_labels={},
+    number_rows=2,
+    number_columns=4,
+    file_encoding="UTF-8",
+)
+
+_FULL = pd.DataFrame(
+    {
+        "Subject": ["001", "002"],
+        "SiteNumber": ["101", "102"],
+        "AETERM": ["Headache", "Nausea"],
+        "AEDECOD": ["HEADACHE", "NAUSEA"],
+    }
+)
+
+
+def _fake_read(path: str, **kwargs):
+    if kwargs.get("metadataonly"):
+        return pd.DataFrame(), _RAW_META
+    usecols = kwargs.get("usecols")
+    return (_FULL[usecols] if usecols else _FULL), _RAW_META
+
+
+@pytest.fixture()
+def sas_file(tmp_path: Path) -> Path:
+    path = tmp_path / "ae.sas7bdat"
+    path.write_bytes(b"raw sas bytes")
+    return path
+
+
+def test_usecols_matches_header_case_insensitively(sas_file) -> None:
+    with patch(
+        "astraea.io.sas_reader.pyreadstat.read_sas7bdat", side_effect=_fake_read
+    ) as mock_read:
+        df, meta = read_sas_with_metadata(sas_file, usecols={"aeterm", "SUBJECT", "MISSING"})
+
+    assert mock_read.call_args.kwargs["usecols"] == ["Subject", "AETERM"]
+    assert list(df.columns) == ["Subject", "AETERM"]
+    # Metadata still describes the whole file
+    assert meta.col_count == 4
+    assert [v.name for v in meta.variables] == list(_FULL.columns)
+
+
+def test_usecols_without_matches_reads_everything(sas_file) -> None:
+    with patch("astraea.io.sas_reader.pyreadstat.read_sas7bdat", side_effect=_fake_read):
+        df, _meta = read_sas_with_metadata(sas_file, usecols={"NOPE"})
+
+    assert list(df.columns) == list(_FULL.columns)
+
+
+def test_usecols_slices_cache_hit_and_skips_cache_on_miss(tmp_path, sas_file) -> None:
+    cache = SASReadCache(tmp_path / "cache")
+
+    with patch("astraea.io.sas_reader.pyreadstat.read_sas7bdat", side_effect=_fake_read):
+        read_sas_with_metadata(sas_file, cache=cache, usecols={"AETERM"})
+        assert cache.get(sas_file) is None
+
+        read_sas_with_metadata(sas_file, cache=cache)
+        df, meta = read_sas_with_metadata(sas_file, cache=cache, usecols={"aedecod"})
+
+    assert list(df.columns) == ["AEDECOD"]
+    assert meta.col_count == 4
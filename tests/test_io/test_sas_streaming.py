@@ -0,0 +1,71 @@
+"""Tests for header-only and chunked SAS reads (pyreadstat mocked)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from astraea.io.sas_reader import iter_sas_chunks, read_sas_metadata
+
+_RAW_META = SimpleNamespace(
+    column_names=["USUBJID", "AGE"],
+    original_variable_types={"USUBJID": "$8", "AGE": "BEST12"},
+    column_names_to_labels={"USUBJID": "Subject", "AGE": None},
+    number_rows=5,
+    number_columns=2,
+    file_encoding="UTF-8",
+)
+
+
+@pytest.fixture()
+def sas_file(tmp_path: Path) -> Path:
+    path = tmp_path / "lb.sas7bdat"
+    path.write_bytes(b"raw sas bytes")
+    return path
+
+
+def test_read_sas_metadata_is_header_only(sas_file) -> None:
+    with patch(
+        "astraea.io.sas_reader.pyreadstat.read_sas7bdat",
+        return_value=(pd.DataFrame(), _RAW_META),
+    ) as mock_read:
+        meta = read_sas_metadata(sas_file)
+
+    assert mock_read.call_args.kwargs["metadataonly"] is True
+    assert meta.filename == "lb.sas7bdat"
+    assert meta.row_count == 5
+    assert [v.dtype for v in meta.variables] == ["character", "numeric"]
+    assert meta.variables[1].label == ""
+
+
+def test_iter_sas_chunks_continuous_index(sas_file) -> None:
+    full = pd.DataFrame({"USUBJID": list("abcde"), "AGE": [1.0, 2.0, 3.0, 4.0, 5.0]})
+    # pyreadstat restarts each chunk's index at 0
+    raw_chunks = [
+        (full.iloc[0:2].reset_index(drop=True), _RAW_META),
+        (full.iloc[2:4].reset_index(drop=True), _RAW_META),
+        (full.iloc[4:5].reset_index(drop=True), _RAW_META),
+    ]
+    with patch(
+        "astraea.io.sas_reader.pyreadstat.read_file_in_chunks", return_value=iter(raw_chunks)
+    ) as mock_chunks:
+        chunks = list(iter_sas_chunks(sas_file, chunksize=2))
+
+    assert mock_chunks.call_args.kwargs["chunksize"] == 2
+    assert mock_chunks.call_args.kwargs["disable_datetime_conversion"] is True
+    assert [len(c) for c in chunks] == [2, 2, 1]
+    pd.testing.assert_frame_equal(pd.concat(chunks), full)
+
+
+def test_iter_sas_chunks_rejects_bad_chunksize(sas_file) -> None:
+    with pytest.raises(ValueError, match="chunksize"):
+        next(iter_sas_chunks(sas_file, chunksize=0))
+
+
+def test_iter_sas_chunks_missing_file(tmp_path) -> None:
+    with pytest.raises(FileNotFoundError):
+        next(iter_sas_chunks(tmp_path / "missing.sas7bdat"))
@@ -0,0 +1,199 @@
+"""Tests for the native streaming XPT v5 writer."""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyreadstat
+import pytest
+
+from astraea.io.xpt_writer import (
+    XPTColumn,
+    XPTStreamWriter,
+    ieee_to_ibm,
+    verify_xpt_header,
+    write_xpt_v5,
+    xpt_columns_for,
+)
+
+_LABELS = {"USUBJID": "Unique Subject Identifier", "LBTEST": "Test Name", "LBSTRESN": "Result"}
+
+
+def _frame(n: int = 7) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "USUBJID": [f"S01-{i:03d}" for i in range(n)],
+            "LBTEST": ["Hemoglobin" if i % 2 else None for i in range(n)],
+            "LBSTRESN": [np.nan if i % 3 == 0 else i * 1.5 - 2 for i in range(n)],
+        }
+    )
+
+
+def _mask_timestamps(data: bytes) -> bytes:
+    """Blank the header records that carry creation/modification times."""
+    data = bytearray(data)
+    for record in (1, 2, 5, 6):
+        start = record * 80
+        data[start : start + 80] = b"\0" * 80
+    return bytes(data)
+
+
+class TestIeeeToIbm:
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (1.0, 0x4110000000000000),
+            (34.0, 0x4222000000000000),
+            (-118.625, 0xC276A00000000000),
+            (0.0, 0),
+        ],
+    )
+    def test_known_values(self, value: float, expected: int) -> None:
+        assert int(ieee_to_ibm(np.array([value]))[0]) == expected
+
+    def test_nan_is_sas_missing(self) -> None:
+        assert int(ieee_to_ibm(np.array([np.nan]))[0]) == 0x2E00000000000000
+
+    def test_underflow_is_zero(self) -> None:
+        assert int(ieee_to_ibm(np.array([1e-300]))[0]) == 0
+
+    @pytest.mark.parametrize("value", [np.inf, -np.inf, 1e76])
+    def test_unrepresentable_raises(self, value: float) -> None:
+        with pytest.raises(ValueError, match="IBM"):
+            ieee_to_ibm(np.array([1.0, value]))
+
+
+class TestWriteXptV5Native:
+    def test_matches_pyreadstat_bytes(self, tmp_path: Path) -> None:
+        df = _frame()
+        ours = tmp_path / "ours.xpt"
+        theirs = tmp_path / "theirs.xpt"
+
+        write_xpt_v5(df, ours, "LB", _LABELS, table_label="Laboratory Test Results")
+        pyreadstat.write_xport(
+            df,
+            str(theirs),
+            file_format_version=5,
+            table_name="LB",
+            column_labels=[_LABELS[c] for c in df.columns],
+            file_label="Laboratory Test Results",
+        )
+
+        assert _mask_timestamps(ours.read_bytes()) == _mask_timestamps(theirs.read_bytes())
+
+    def test_chunk_size_does_not_change_output(self, tmp_path: Path) -> None:
+        df = _frame(23)
+        one = write_xpt_v5(df, tmp_path / "one.xpt", "LB", _LABELS)
+        many = write_xpt_v5(df, tmp_path / "many.xpt", "LB", _LABELS, chunk_size=4)
+
+        assert _mask_timestamps(one.path.read_bytes()) == _mask_timestamps(many.path.read_bytes())
+
+    def test_result_reports_rows_and_checksum(self, tmp_path: Path) -> None:
+        path = tmp_path / "lb.xpt"
+        result = write_xpt_v5(_frame(), path, "lb", _LABELS)
+
+        assert result.table_name == "LB"
+        assert result.row_count == 7
+        assert result.col_count == 3
+        assert result.file_size == path.stat().st_size
+        assert result.sha256 == hashlib.sha256(path.read_bytes()).hexdigest()
+
+    def test_round_trip_values(self, tmp_path: Path) -> None:
+        df = _frame()
+        path = tmp_path / "lb.xpt"
+        write_xpt_v5(df, path, "LB", _LABELS, verify_readback=True)
+
+        back, meta = pyreadstat.read_xport(str(path))
+        assert list(back["USUBJID"]) == list(df["USUBJID"])
+        assert list(back["LBTEST"]) == list(df["LBTEST"].fillna(""))
+        np.testing.assert_array_equal(back["LBSTRESN"].to_numpy(), df["LBSTRESN"].to_numpy())
+        assert meta.column_names_to_labels["LBTEST"] == "Test Name"
+
+    def test_explicit_char_widths_are_used(self, tmp_path: Path) -> None:
+        path = tmp_path / "lb.xpt"
+        write_xpt_v5(_frame(), path, "LB", _LABELS, char_widths={"LBTEST": 40})
+
+        _df, meta = pyreadstat.read_xport(str(path), metadataonly=True)
+        assert meta.variable_storage_width["LBTEST"] == 40
+
+    def test_rejects_non_positive_chunk_size(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="chunk_size"):
+            write_xpt_v5(_frame(), tmp_path / "lb.xpt", "LB", _LABELS, chunk_size=0)
+
+
+class TestXPTStreamWriter:
+    def test_incremental_writes_append_rows(self, tmp_path: Path) -> None:
+        df = _frame(10)
+        columns = xpt_columns_for(df, _LABELS)
+        with XPTStreamWriter(tmp_path / "lb.xpt", "LB", columns) as writer:
+            writer.write(df.iloc[:6])
+            writer.write(df.iloc[6:])
+        result = writer.close()
+
+        assert result.row_count == 10
+        back, _meta = pyreadstat.read_xport(str(result.path))
+        assert list(back["USUBJID"]) == list(df["USUBJID"])
+
+    def test_failure_keeps_existing_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "lb.xpt"
+        path.write_bytes(b"previous")
+        columns = xpt_columns_for(_frame(), _LABELS)
+
+        with pytest.raises(RuntimeError), XPTStreamWriter(path, "LB", columns) as writer:
+            writer.write(_frame())
+            raise RuntimeError("upstream failure")
+
+        assert path.read_bytes() == b"previous"
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_rejects_over_width_value(self, tmp_path: Path) -> None:
+        columns = [XPTColumn(name="USUBJID", is_character=True, length=4)]
+        with (
+            pytest.raises(ValueError, match="longer than its XPT width"),
+            XPTStreamWriter(tmp_path / "dm.xpt", "DM", columns) as writer,
+        ):
+            writer.write(pd.DataFrame({"USUBJID": ["S01-001"]}))
+
+    def test_rejects_non_ascii_value(self, tmp_path: Path) -> None:
+        columns = [XPTColumn(name="SITE", is_character=True, length=8)]
+        with (
+            pytest.raises(ValueError, match="non-ASCII"),
+            XPTStreamWriter(tmp_path / "dm.xpt", "DM", columns) as writer,
+        ):
+            writer.write(pd.DataFrame({"SITE": ["Zürich"]}))
+
+    def test_rejects_mismatched_columns(self, tmp_path: Path) -> None:
+        columns = xpt_columns_for(_frame(), _LABELS)
+        with (
+            pytest.raises(ValueError, match="do not match"),
+            XPTStreamWriter(tmp_path / "lb.xpt", "LB", columns) as writer,
+        ):
+            writer.write(_frame()[["LBTEST", "USUBJID", "LBSTRESN"]])
+
+
+class TestVerifyXptHeader:
+    def test_accepts_written_file(self, tmp_path: Path) -> None:
+        df = _frame()
+        result = write_xpt_v5(df, tmp_path / "lb.xpt", "LB", _LABELS)
+        verify_xpt_header(result.path, xpt_columns_for(df, _LABELS), 7)
+
+    def test_detects_truncation(self, tmp_path: Path) -> None:
+        df = _frame()
+        result = write_xpt_v5(df, tmp_path / "lb.xpt", "LB", _LABELS)
+        data = result.path.read_bytes()
+        result.path.write_bytes(data[:-80])
+
+        with pytest.raises(RuntimeError, match="size mismatch"):
+            verify_xpt_header(result.path, xpt_columns_for(df, _LABELS), 7)
+
+    def test_detects_layout_mismatch(self, tmp_path: Path) -> None:
+        df = _frame()
+        result = write_xpt_v5(df, tmp_path / "lb.xpt", "LB", _LABELS)
+        columns = xpt_columns_for(df, _LABELS)
+        columns[0] = columns[0].model_copy(update={"length": 20})
+
+        with pytest.raises(RuntimeError, match="expected USUBJID"):
+            verify_xpt_header(result.path, columns, 7)
@@ -0,0 +1,43 @@
+"""Tests for the HyperLogLog distinct-count sketch."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from astraea.profiling.cardinality import HyperLogLog
+
+
+@pytest.mark.parametrize("n", [0, 1, 50, 5_000, 200_000])
+def test_estimate_within_error_bound(n: int) -> None:
+    sketch = HyperLogLog()
+    sketch.update(np.array([f"SUBJ-{i}" for i in range(n)], dtype=object))
+    assert abs(sketch.estimate() - n) <= max(1, n * 0.03)
+
+
+def test_duplicates_do_not_change_estimate() -> None:
+    values = np.arange(1_000, dtype=np.float64)
+    once = HyperLogLog()
+    once.update(values)
+    repeated = HyperLogLog()
+    for _ in range(3):
+        repeated.update(values)
+    assert repeated.estimate() == once.estimate()
+
+
+def test_merge_equals_single_sketch() -> None:
+    values = np.arange(20_000, dtype=np.float64)
+    whole = HyperLogLog(precision=12)
+    whole.update(values)
+    left, right = HyperLogLog(precision=12), HyperLogLog(precision=12)
+    left.update(values[:12_000])
+    right.update(values[8_000:])
+    left.merge(right)
+    assert left.estimate() == whole.estimate()
+
+
+def test_rejects_bad_precision() -> None:
+    with pytest.raises(ValueError, match="precision"):
+        HyperLogLog(precision=3)
+    with pytest.raises(ValueError, match="precision"):
+        HyperLogLog(precision=10).merge(HyperLogLog(precision=11))
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import numpy as np
+import pandas as pd
+
+from astraea.models.metadata import DatasetMetadata, VariableMetadata
 from astraea.profiling.profiler import (
     EDC_SYSTEM_COLUMNS,
     _is_edc_column,
     _is_potential_string_date_column,
     detect_date_format,
+    profile_dataset,
+    profile_dataset_chunks,
 )
 
 
@@ -89,3 +95,103 @@ class TestIsPotentialStringDateColumn:
     def test_case_insensitive(self):
         """Detection should be case insensitive."""
         assert _is_potential_string_date_column("visit_raw") is True
+
+
+class TestProfileDatasetChunks:
+    """Chunked profiling must merge to exactly the whole-frame profile."""
+
+    @staticmethod
+    def _dataset() -> tuple[pd.DataFrame, DatasetMetadata]:
+        rng = np.random.default_rng(7)
+        n = 1000
+        df = pd.DataFrame(
+            {
+                "Subject": rng.choice([f"S{i:03d}" for i in range(40)], n),
+                "AGE": np.where(rng.random(n) < 0.2, np.nan, rng.integers(18, 80, n)),
+                "SEX": rng.choice(["M", "F", ""], n),
+                "AESTDAT_RAW": rng.choice(["30 Mar 2022", "", "1 Jan 2021", None], n),
+                "RECORDID": np.arange(n, dtype=float),
+                "AESTDAT": rng.random(n) * 1e9,
+            }
+        )
+        meta = DatasetMetadata(
+            filename="ae.sas7bdat",
+            row_count=n,
+            col_count=df.shape[1],
+            variables=[
+                VariableMetadata(name="AESTDAT", dtype="numeric", sas_format="DATETIME20."),
+                VariableMetadata(name="SEX", label="Sex", dtype="character", sas_format="$1"),
+            ],
+        )
+        return df, meta
+
+    def test_chunks_match_whole_frame(self):
+        df, meta = self._dataset()
+        whole = profile_dataset(df, meta)
+        chunked = profile_dataset_chunks((df.iloc[i : i + 97] for i in range(0, len(df), 97)), meta)
+        assert chunked == whole
+
+    def test_statistics(self):
+        df, meta = self._dataset()
+        profile = profile_dataset_chunks([df.iloc[:500], df.iloc[500:]], meta)
+        by_name = {v.name: v for v in profile.variables}
+
+        assert profile.row_count == 1000
+        assert by_name["AGE"].n_missing == int(df["AGE"].isna().sum())
+        assert by_name["RECORDID"].n_unique == 1000
+        assert by_name["RECORDID"].top_values == []
+        assert by_name["AESTDAT_RAW"].detected_date_format == "DD Mon YYYY"
+        assert by_name["AESTDAT"].detected_date_format == "SAS_DATETIME"
+        assert "Subject" in profile.edc_columns
+
+    def test_no_chunks(self):
+        _df, meta = self._dataset()
+        profile = profile_dataset_chunks([], meta)
+        assert profile.variables == []
+
+
+class TestApproxDistinct:
+    @staticmethod
+    def _dataset(n: int = 30_000) -> tuple[pd.DataFrame, DatasetMetadata]:
+        df = pd.DataFrame(
+            {
+                "RECORDID": [f"R{i:06d}" for i in range(n)],
+                "SEX": np.resize(["M", "F"], n),
+            }
+        )
+        meta = DatasetMetadata(
+            filename="lb.sas7bdat", row_count=n, col_count=2, variables=[]
+        )
+        return df, meta
+
+    def test_high_cardinality_column_is_estimated(self):
+        df, meta = self._dataset()
+        chunks = (df.iloc[i : i + 4000] for i in range(0, len(df), 4000))
+        profile = profile_dataset_chunks(chunks, meta, approx_distinct=True)
+        by_name = {v.name: v for v in profile.variables}
+
+        record_id = by_name["RECORDID"]
+        assert record_id.n_unique_approximate
+        assert abs(record_id.n_unique - 30_000) < 30_000 * 0.05
+        assert record_id.sample_values == [f"R{i:06d}" for i in range(10)]
+        assert record_id.n_missing == 0
+
+    def test_chunked_profiling_is_bounded_by_default(self):
+        df, meta = self._dataset()
+        chunks = [df.iloc[i : i + 4000] for i in range(0, len(df), 4000)]
+
+        bounded = profile_dataset_chunks(iter(chunks), meta)
+        exact = profile_dataset_chunks(iter(chunks), meta, approx_distinct=False)
+
+        assert bounded.variables[0].n_unique_approximate
+        assert not exact.variables[0].n_unique_approximate
+        assert exact.variables[0].n_unique == 30_000
+
+    def test_low_cardinality_columns_stay_exact(self):
+        df, meta = self._dataset()
+        exact = profile_dataset(df, meta)
+        approx = profile_dataset(df, meta, approx_distinct=True)
+
+        assert approx.variables[1] == exact.variables[1]
+        assert not approx.variables[1].n_unique_approximate
+        assert [t.value for t in approx.variables[1].top_values] == ["M", "F"]
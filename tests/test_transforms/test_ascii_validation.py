@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pandas as pd
 
 from astraea.transforms.ascii_validation import (
@@ -10,6 +12,7 @@ from astraea.transforms.ascii_validation import (
     fix_common_non_ascii,
     validate_ascii,
 )
+from astraea.transforms.char_scan import scan_char_columns
 
 
 class TestValidateAscii:
@@ -161,3 +164,26 @@ class TestFixCommonNonAscii:
     def test_all_12_replacements_exist(self) -> None:
         """Replacement map has exactly 12 entries."""
         assert len(_NON_ASCII_REPLACEMENTS) == 12
+
+    def test_fix_preserves_missing_values(self) -> None:
+        """Missing values stay missing instead of becoming the string 'nan'."""
+        df = pd.DataFrame({"text": ["37°C", None, "5µg"]})
+        result = fix_common_non_ascii(df)
+        assert result["text"].iloc[0] == "37degC"
+        assert pd.isna(result["text"].iloc[1])
+        assert result["text"].dtype == df["text"].dtype
+
+    def test_fix_repeated_values_and_non_strings(self) -> None:
+        """Distinct values are translated once and broadcast to every row."""
+        df = pd.DataFrame({"text": pd.Series(["≤ 5", 7, "≤ 5", "ok"], dtype=object)})
+        result = fix_common_non_ascii(df)
+        assert result["text"].tolist() == ["<= 5", 7, "<= 5", "ok"]
+
+    def test_fix_skips_clean_columns(self) -> None:
+        """Given a scan, columns with no non-ASCII text are not touched again."""
+        df = pd.DataFrame({"clean": ["a", "b"], "dirty": ["1–2", "b"]})
+        char_scan = scan_char_columns(df)
+        with patch("pandas.factorize", wraps=pd.factorize) as mock_factorize:
+            result = fix_common_non_ascii(df, char_scan=char_scan)
+        assert mock_factorize.call_count == 1
+        assert result["dirty"].tolist() == ["1-2", "b"]
@@ -0,0 +1,71 @@
+"""Tests for the shared character column scan."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from astraea.io.xpt_writer import validate_for_xpt_v5
+from astraea.transforms.ascii_validation import validate_ascii
+from astraea.transforms.char_length import optimize_char_lengths, validate_char_max_length
+from astraea.transforms.char_scan import scan_char_column, scan_char_columns
+
+
+class TestScanCharColumn:
+    def test_lengths_and_non_ascii_rows(self) -> None:
+        series = pd.Series(["mg", "µg", None, "mg", "10°C", "µg"])
+        scan = scan_char_column(series)
+
+        assert scan.max_chars == 4
+        assert scan.max_bytes == 5
+        assert scan.non_ascii_count == 3
+        assert scan.non_ascii_rows == [1, 4, 5]
+
+    def test_all_missing(self) -> None:
+        scan = scan_char_column(pd.Series([None, np.nan], dtype=object))
+        assert scan.max_chars == 0
+        assert scan.non_ascii_count == 0
+
+    def test_mixed_object_values_rendered_as_str(self) -> None:
+        scan = scan_char_column(pd.Series(["A", 12345, None], dtype=object))
+        assert scan.max_chars == 5
+
+    def test_only_string_columns_scanned(self) -> None:
+        df = pd.DataFrame({"USUBJID": ["S1", "S2"], "AGE": [30, 40]})
+        assert list(scan_char_columns(df)) == ["USUBJID"]
+
+
+class TestSharedScan:
+    def test_consumers_reuse_scan(self) -> None:
+        df = pd.DataFrame({"LBTEST": ["Glucose", "Sodium"], "LBORRESU": ["mg/dL", "µmol"]})
+        char_scan = scan_char_columns(df)
+
+        with patch("astraea.transforms.char_scan.scan_char_column") as mock_scan:
+            issues = validate_ascii(df, char_scan=char_scan)
+            widths = optimize_char_lengths(df, char_scan=char_scan)
+            errors = validate_for_xpt_v5(
+                df, {"LBTEST": "Test", "LBORRESU": "Unit"}, "LB", char_scan=char_scan
+            )
+
+        mock_scan.assert_not_called()
+        assert [(i["column"], i["row"]) for i in issues] == [("LBORRESU", 1)]
+        assert widths == {"LBTEST": 7, "LBORRESU": 5}
+        assert errors == ["Column 'LBORRESU' contains 1 non-ASCII value(s)"]
+
+    def test_issue_rows_are_index_labels(self) -> None:
+        df = pd.DataFrame({"TERM": ["ok", "café"]}, index=[10, 20])
+        issues = validate_ascii(df)
+        assert issues[0]["row"] == 20
+        assert issues[0]["non_ascii_chars"] == "é"
+
+
+class TestValidateCharMaxLength:
+    def test_reports_index_labels_of_long_values(self) -> None:
+        df = pd.DataFrame({"COVAL": ["a", "x" * 201, None, "x" * 201]}, index=[5, 6, 7, 8])
+        assert validate_char_max_length(df) == {"COVAL": [6, 8]}
+
+    def test_no_violations(self) -> None:
+        df = pd.DataFrame({"COVAL": ["a", "b"]})
+        assert validate_char_max_length(df) == {}
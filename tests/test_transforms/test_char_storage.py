@@ -0,0 +1,113 @@
+"""Tests for compact character column storage."""
+
+from __future__ import annotations
+
+import importlib.util
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from astraea.io.xpt_writer import write_xpt_v5
+from astraea.transforms.ascii_validation import fix_common_non_ascii
+from astraea.transforms.char_scan import scan_char_columns
+from astraea.transforms.char_storage import (
+    CharStorage,
+    compact_char_column,
+    compact_char_columns,
+    require_char_storage,
+    restore_char_columns,
+)
+from astraea.transforms.sequence import generate_seq
+
+
+def _lb_frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "STUDYID": ["S"] * 6,
+            "USUBJID": ["S-02", "S-01", "S-02", "S-01", "S-01", "S-02"],
+            "LBTESTCD": ["HGB", "ALT", "ALT", "HGB", None, "HGB"],
+            "LBORRESU": ["g/dL", "µkat/L", "µkat/L", "g/dL", None, "g/dL"],
+            "LBSTRESN": [13.1, 0.4, 0.5, 12.9, np.nan, 13.3],
+        }
+    )
+
+
+class TestCompactCharColumn:
+    def test_repeated_text_becomes_sorted_categorical(self) -> None:
+        result = compact_char_column(pd.Series(["B", "A", "B", None, "A", "B"]), "category")
+        assert isinstance(result.dtype, pd.CategoricalDtype)
+        assert list(result.cat.categories) == ["A", "B"]
+        assert result.isna().tolist() == [False, False, False, True, False, False]
+
+    def test_high_cardinality_and_non_text_unchanged(self) -> None:
+        unique = pd.Series(["A", "B", "C", "A"])
+        mixed = pd.Series(["A", 1, "A", "A"], dtype=object)
+        numeric = pd.Series([1.0, 1.0, 1.0])
+        for series in (unique, mixed, numeric):
+            assert compact_char_column(series, CharStorage.CATEGORY) is series
+
+    def test_object_storage_is_noop(self) -> None:
+        series = pd.Series(["A", "A"])
+        assert compact_char_column(series, CharStorage.OBJECT) is series
+
+    def test_restore_round_trip(self) -> None:
+        df = _lb_frame()
+        compact = compact_char_columns(df.copy(), CharStorage.CATEGORY)
+        assert isinstance(compact["LBTESTCD"].dtype, pd.CategoricalDtype)
+
+        restored = restore_char_columns(compact)
+        assert restored["LBTESTCD"].dtype == object
+        assert restored["LBTESTCD"].tolist() == ["HGB", "ALT", "ALT", "HGB", None, "HGB"]
+        pd.testing.assert_series_equal(restored["LBSTRESN"], df["LBSTRESN"])
+
+    def test_invalid_storage(self) -> None:
+        with pytest.raises(ValueError):
+            require_char_storage("parquet")
+
+    @pytest.mark.skipif(
+        importlib.util.find_spec("pyarrow") is not None, reason="pyarrow is installed"
+    )
+    def test_arrow_requires_pyarrow(self) -> None:
+        with pytest.raises(ImportError, match="pyarrow"):
+            require_char_storage("arrow")
+
+
+class TestTransformsOnCategoricals:
+    def test_scan_covers_categorical_text(self) -> None:
+        compact = compact_char_columns(_lb_frame(), CharStorage.CATEGORY)
+        scan = scan_char_columns(compact)
+        assert set(scan) == {"STUDYID", "USUBJID", "LBTESTCD", "LBORRESU"}
+        assert scan["LBORRESU"].non_ascii_rows == [1, 2]
+
+    def test_ascii_fix_translates_categories(self) -> None:
+        compact = compact_char_columns(_lb_frame(), CharStorage.CATEGORY)
+        fixed = fix_common_non_ascii(compact)
+        assert isinstance(fixed["LBORRESU"].dtype, pd.CategoricalDtype)
+        assert list(fixed["LBORRESU"].cat.categories) == ["g/dL", "ukat/L"]
+        assert fixed["LBORRESU"].tolist()[:3] == ["g/dL", "ukat/L", "ukat/L"]
+
+    def test_ascii_fix_merges_colliding_categories(self) -> None:
+        series = pd.Series(["µg", "ug", "µg", "ug"], dtype="category")
+        fixed = fix_common_non_ascii(pd.DataFrame({"U": series}))["U"]
+        assert list(fixed.cat.categories) == ["ug"]
+        assert fixed.tolist() == ["ug"] * 4
+
+    def test_seq_matches_object_storage(self) -> None:
+        df = _lb_frame()
+        compact = compact_char_columns(df.copy(), CharStorage.CATEGORY)
+        pd.testing.assert_series_equal(
+            generate_seq(compact, "LB", ["LBTESTCD"]), generate_seq(df, "LB", ["LBTESTCD"])
+        )
+
+    def test_xpt_bytes_match_object_storage(self, tmp_path) -> None:
+        df = fix_common_non_ascii(_lb_frame())
+        compact = compact_char_columns(df.copy(), CharStorage.CATEGORY)
+        labels = {col: col for col in df.columns}
+
+        # Fixed header timestamp so the two files can be compared byte for byte
+        with patch("astraea.io.xpt_writer._sas_timestamp", return_value=b"01JAN26:00:00:00"):
+            plain = write_xpt_v5(df, tmp_path / "plain.xpt", "LB", labels)
+            small = write_xpt_v5(compact, tmp_path / "compact.xpt", "LB", labels, chunk_size=4)
+        assert small.sha256 == plain.sha256
@@ -6,12 +6,20 @@ and format detection -- all critical path for SDTM compliance.
 
 from __future__ import annotations
 
+import numpy as np
+import pandas as pd
+import pytest
+
 from astraea.transforms.dates import (
     SAS_EPOCH,
     detect_date_format,
     format_partial_iso8601,
+    format_partial_iso8601_column,
+    parse_string_date_column,
     parse_string_date_to_iso,
+    sas_date_column_to_iso,
     sas_date_to_iso,
+    sas_datetime_column_to_iso,
     sas_datetime_to_iso,
 )
 
@@ -124,6 +132,42 @@ class TestSasDatetimeToIso:
         assert year > 2000, f"Year {year} is too early for this value"
 
 
+# ---------------------------------------------------------------------------
+# Column kernels (sas_date_column_to_iso / sas_datetime_column_to_iso)
+# ---------------------------------------------------------------------------
+
+
+class TestSasColumnKernels:
+    """Array-level converters must agree with the scalar converters."""
+
+    def test_date_column_matches_scalar(self):
+        values = pd.Series([22734.0, 0.0, -1.0, np.nan, 0.5, 1.5, 22734.4], index=list("abcdefg"))
+        result = sas_date_column_to_iso(values)
+        assert list(result.index) == list("abcdefg")
+        assert result.tolist() == [sas_date_to_iso(v) for v in values]
+
+    def test_datetime_column_matches_scalar(self):
+        values = pd.Series([1964217600.0, 0.0, -1.5, None, 1964262896.0], dtype="object")
+        result = sas_datetime_column_to_iso(values)
+        assert result.tolist() == [sas_datetime_to_iso(v) for v in values]
+
+    def test_missing_becomes_empty_string(self):
+        result = sas_date_column_to_iso(pd.Series([np.nan, np.nan]))
+        assert result.tolist() == ["", ""]
+        assert result.dtype == object
+
+    def test_empty_column(self):
+        assert sas_datetime_column_to_iso(pd.Series([], dtype="float64")).empty
+
+    def test_out_of_range_raises_like_scalar(self):
+        with pytest.raises(OverflowError):
+            sas_date_to_iso(1e9)
+        with pytest.raises(OverflowError):
+            sas_date_column_to_iso(pd.Series([22734.0, 1e9]))
+        with pytest.raises(OverflowError):
+            sas_datetime_column_to_iso(pd.Series([1e15]))
+
+
 # ---------------------------------------------------------------------------
 # parse_string_date_to_iso
 # ---------------------------------------------------------------------------
@@ -248,6 +292,72 @@ class TestParseStringDateToIso:
         assert parse_string_date_to_iso("1 Jan 2023 0:00") == "2023-01-01T00:00"
 
 
+# ---------------------------------------------------------------------------
+# parse_string_date_column
+# ---------------------------------------------------------------------------
+
+
+class TestParseStringDateColumn:
+    """Column parser must agree with the scalar parser value for value."""
+
+    MIXED = [
+        "30 Mar 2022",
+        "30 Mar 2022",
+        "30MAR2022",
+        "2022-03-30",
+        "2022-03-30T14:30",
+        "16 MAY 2022 21:30",
+        "05/06/2022",
+        "01/25/2022",
+        "Mar 2022",
+        "UN UNK 2004",
+        "un Mar 2022",
+        "2023-03",
+        "2022",
+        "30 Feb 2022",
+        "not a date",
+        "",
+        "   ",
+        None,
+    ]
+
+    def test_matches_scalar_parser(self):
+        values = pd.Series(self.MIXED, index=range(100, 100 + len(self.MIXED)))
+        result = parse_string_date_column(values)
+        expected = [parse_string_date_to_iso(v) for v in self.MIXED]
+        assert result.tolist() == expected
+        assert result.index.equals(values.index)
+        assert result.dtype == object
+
+    @pytest.mark.parametrize(
+        "date_format", ["DD Mon YYYY", "DDMonYYYY", "YYYY-MM-DD", "DD/MM/YYYY", "MM/DD/YYYY"]
+    )
+    def test_dominant_format_does_not_change_results(self, date_format):
+        values = pd.Series(self.MIXED)
+        result = parse_string_date_column(values, date_format=date_format)
+        assert result.tolist() == [parse_string_date_to_iso(v) for v in self.MIXED]
+
+    def test_nan_is_empty(self):
+        result = parse_string_date_column(pd.Series([np.nan, "30 Mar 2022"]))
+        assert result.tolist() == ["", "2022-03-30"]
+
+    def test_one_warning_per_column(self):
+        from loguru import logger
+
+        messages: list[str] = []
+        handler_id = logger.add(messages.append, level="WARNING", format="{message}")
+        try:
+            values = pd.Series(["bad", "bad", "worse", "30 Mar 2022"], name="AESTDAT_RAW")
+            result = parse_string_date_column(values)
+        finally:
+            logger.remove(handler_id)
+
+        assert result.tolist() == ["", "", "", "2022-03-30"]
+        assert len(messages) == 1
+        assert "2 distinct" in messages[0]
+        assert "AESTDAT_RAW" in messages[0]
+
+
 # ---------------------------------------------------------------------------
 # format_partial_iso8601
 # ---------------------------------------------------------------------------
@@ -306,6 +416,39 @@ class TestFormatPartialIso8601:
         assert format_partial_iso8601(2022, 2, 30) == ""
 
 
+class TestFormatPartialIso8601Column:
+    """The column builder must agree with format_partial_iso8601 row by row."""
+
+    def test_matches_scalar(self):
+        year = pd.Series([2023, 2023, 2023, None, 1799, 2024, 2022, 2023.9], index=list("abcdefgh"))
+        month = pd.Series([3, None, 3, 1, 1, 2, 13, 1.2], index=list("abcdefgh"))
+        day = pd.Series([15, 15, None, 1, 1, 29, 1, 31.5], index=list("abcdefgh"))
+        result = format_partial_iso8601_column(year, month, day)
+        assert list(result.index) == list("abcdefgh")
+        expected = [
+            format_partial_iso8601(
+                *(None if pd.isna(v) else int(v) for v in (year[k], month[k], day[k]))
+            )
+            for k in year.index
+        ]
+        assert result.tolist() == expected
+
+    def test_year_only_column(self):
+        result = format_partial_iso8601_column(pd.Series([1960.0, np.nan, "2001"]))
+        assert result.tolist() == ["1960", "", "2001"]
+        assert result.dtype == object
+
+    def test_invalid_calendar_date_is_empty(self):
+        result = format_partial_iso8601_column(
+            pd.Series([2022, 2024, 2100]), pd.Series([2, 2, 2]), pd.Series([29, 29, 29])
+        )
+        assert result.tolist() == ["", "2024-02-29", ""]
+
+    def test_non_numeric_component_treated_as_missing(self):
+        result = format_partial_iso8601_column(pd.Series([2023]), pd.Series(["UNK"]))
+        assert result.tolist() == ["2023"]
+
+
 # ---------------------------------------------------------------------------
 # detect_date_format
 # ---------------------------------------------------------------------------
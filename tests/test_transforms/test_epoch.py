@@ -140,3 +140,97 @@ class TestAssignEpoch:
         result = assign_epoch(df, se_df, "AESTDTC")
         assert result.iloc[0] == "SCREENING"  # Start boundary
         assert result.iloc[1] == "SCREENING"  # End boundary
+
+    def test_overlap_first_element_in_se_order_wins(self) -> None:
+        """Overlapping elements resolve to the first matching SE row, not the earliest start."""
+        se_overlap = pd.DataFrame(
+            {
+                "USUBJID": ["S1", "S1"],
+                "SESTDTC": ["2022-02-01", "2022-01-01"],
+                "SEENDTC": ["2022-03-01", "2022-02-15"],
+                "EPOCH": ["TREATMENT", "SCREENING"],
+            }
+        )
+        df = pd.DataFrame({"USUBJID": ["S1", "S1"], "AESTDTC": ["2022-02-10", "2022-01-10"]})
+        result = assign_epoch(df, se_overlap, "AESTDTC")
+        assert list(result) == ["TREATMENT", "SCREENING"]
+
+    def test_datetime_observation_uses_date_part(self, se_df: pd.DataFrame) -> None:
+        """ISO datetimes are matched on their YYYY-MM-DD prefix."""
+        df = pd.DataFrame({"USUBJID": ["SUBJ-001"], "LBDTC": ["2022-01-14T23:59"]})
+        result = assign_epoch(df, se_df, "LBDTC")
+        assert result.iloc[0] == "SCREENING"
+
+    def test_repeated_rows_and_index_preserved(self, se_df: pd.DataFrame) -> None:
+        """Duplicate subject/date rows are broadcast back onto the original index."""
+        df = pd.DataFrame(
+            {
+                "USUBJID": ["SUBJ-001", "SUBJ-002", "SUBJ-001", "SUBJ-001"],
+                "LBDTC": ["2022-03-15", "2022-03-15", None, "2022-03-15"],
+            },
+            index=[10, 20, 30, 40],
+        )
+        result = assign_epoch(df, se_df, "LBDTC")
+        assert list(result.index) == [10, 20, 30, 40]
+        assert result.loc[10] == "TREATMENT"
+        assert pd.isna(result.loc[20])  # unknown subject
+        assert pd.isna(result.loc[30])
+        assert result.loc[40] == "TREATMENT"
+
+    def test_empty_dataframe(self, se_df: pd.DataFrame) -> None:
+        """An empty observation frame yields an empty Series."""
+        df = pd.DataFrame({"USUBJID": [], "LBDTC": []})
+        result = assign_epoch(df, se_df, "LBDTC")
+        assert result.empty
+
+    def test_partial_open_and_blank_bounds(self) -> None:
+        """Row-by-row semantics on element edge cases, including the first-match order.
+
+        Elements with a partial SESTDTC never match, a missing or partial
+        SEENDTC leaves the element open-ended, and a blank EPOCH yields NaN.
+        Partial and missing observation dates are NaN.
+        """
+        se = pd.DataFrame(
+            {
+                "USUBJID": ["S1", "S1", "S1", "S2", "S2", "S3"],
+                "SESTDTC": [
+                    "2022-01-01",
+                    "2022-01-14",
+                    "2022-03-01",
+                    "2022-01",
+                    "2022-02-01T09:00",
+                    "2022-01-01",
+                ],
+                "SEENDTC": [
+                    "2022-01-15",
+                    "2022-02-28",
+                    None,
+                    "2022-01-31",
+                    "2022-04",
+                    "2022-12-31",
+                ],
+                "EPOCH": ["SCREENING", "TREATMENT", "FOLLOW-UP", "SCREENING", "TREATMENT", None],
+            }
+        )
+        df = pd.DataFrame(
+            {
+                "USUBJID": ["S1", "S1", "S1", "S1", "S1", "S1", "S2", "S2", "S2", "S3", "S4"],
+                "LBDTC": [
+                    "2021-12-31",
+                    "2022-01-14",
+                    "2022-01-15T08:00",
+                    "2022-02-28",
+                    "2022-09-01",
+                    "2022-03",
+                    "2022-01-10",
+                    "2022-06-30",
+                    None,
+                    "2022-06-01",
+                    "2022-01-10",
+                ],
+            }
+        )
+        result = assign_epoch(df, se, "LBDTC")
+        expected = [None, "SCREENING", "SCREENING", "TREATMENT", "FOLLOW-UP", None]
+        expected += [None, "TREATMENT", None, None, None]
+        assert result.astype(object).where(result.notna(), None).tolist() == expected
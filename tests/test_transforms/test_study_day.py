@@ -5,7 +5,12 @@ from __future__ import annotations
 import pandas as pd
 import pytest
 
-from astraea.transforms.study_day import calculate_study_day, calculate_study_day_column
+from astraea.transforms.study_day import (
+    build_reference_dates,
+    calculate_study_day,
+    calculate_study_day_column,
+    calculate_study_day_from_reference,
+)
 
 
 class TestCalculateStudyDay:
@@ -107,3 +112,60 @@ class TestCalculateStudyDayColumn:
         df = pd.DataFrame({"USUBJID": ["S001"]})
         with pytest.raises(KeyError, match="Missing required columns"):
             calculate_study_day_column(df, "NONEXISTENT", {})
+
+    def test_partial_and_invalid_dates_are_null(self) -> None:
+        """Partial, invalid, and missing event or reference dates yield nulls."""
+        df = pd.DataFrame(
+            {
+                "USUBJID": ["S001", "S001", "S001", "S002"],
+                "AESTDTC": ["2022-03", "2022-02-31", None, "2022-03-30"],
+            }
+        )
+        rfstdtc_lookup = {"S001": "2022-03-30", "S002": "2022-03"}
+
+        result = calculate_study_day_column(df, "AESTDTC", rfstdtc_lookup)
+
+        assert result.isna().all()
+
+    def test_datetime_values_and_index_preserved(self) -> None:
+        """Datetime strings use their date part; the source index is kept."""
+        df = pd.DataFrame(
+            {"USUBJID": ["S001", "S001"], "LBDTC": ["2022-03-29T23:59", "2022-03-30T00:01"]},
+            index=[7, 3],
+        )
+
+        result = calculate_study_day_column(df, "LBDTC", {"S001": "2022-03-30T08:00"})
+
+        assert list(result.index) == [7, 3]
+        assert list(result) == [-1, 1]
+
+    def test_matches_scalar_calculation(self) -> None:
+        """Column engine agrees with calculate_study_day row by row."""
+        dates = ["2021-12-31", "2022-01-01", "2022-01-02", "2022-03-01", "2023-01-01"]
+        df = pd.DataFrame({"USUBJID": ["S001"] * len(dates), "AESTDTC": dates})
+
+        result = calculate_study_day_column(df, "AESTDTC", {"S001": "2022-01-01"})
+
+        expected = [calculate_study_day(d, "2022-01-01") for d in dates]
+        assert list(result) == expected
+
+
+class TestCalculateStudyDayFromReference:
+    """Test the pre-parsed reference entry point."""
+
+    def test_reference_reused_across_columns(self) -> None:
+        """One parsed reference serves several --DTC columns."""
+        reference = build_reference_dates({"S001": "2022-01-10"})
+        df = pd.DataFrame(
+            {
+                "USUBJID": ["S001"],
+                "AESTDTC": ["2022-01-10"],
+                "AEENDTC": ["2022-01-05"],
+            }
+        )
+
+        start = calculate_study_day_from_reference(df, "AESTDTC", reference)
+        end = calculate_study_day_from_reference(df, "AEENDTC", reference)
+
+        assert start.iloc[0] == 1
+        assert end.iloc[0] == -5
@@ -275,3 +275,26 @@ def test_execute_domain_lb_no_suppqual(mock_read_sas, mock_ct, mock_sdtm, tmp_pa
         assert any("lb.xpt" in c for c in write_calls)
         assert any("lc.xpt" in c for c in write_calls)
         assert not any("supplb.xpt" in c for c in write_calls)
+
+
+@patch(_PATCH_READ_SAS, side_effect=_mock_read_sas)
+def test_execute_domain_subject_batch_size_rejected_for_non_findings(mock_read_sas, tmp_path):
+    """--subject-batch-size is an error for domains other than LB/EG/VS."""
+    spec_path = _make_spec_json("DM", tmp_path)
+    _make_dummy_sas(tmp_path)
+
+    result = runner.invoke(
+        app,
+        [
+            "execute-domain",
+            str(spec_path),
+            str(tmp_path),
+            "--output-dir",
+            str(tmp_path / "output"),
+            "--subject-batch-size",
+            "10",
+        ],
+    )
+    assert result.exit_code == 1
+    assert "--subject-batch-size supports LB, EG and VS, not DM" in result.output
+    mock_read_sas.assert_not_called()
@@ -0,0 +1,94 @@
+"""Tests for the execute-study CLI command."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+from typer.testing import CliRunner
+
+from astraea.cli.app import app
+
+runner = CliRunner()
+
+_PATCH_READ_SAS = "astraea.io.sas_reader.read_sas_with_metadata"
+_PATCH_LOAD_SDTM = "astraea.reference.load_sdtm_reference"
+_PATCH_LOAD_CT = "astraea.reference.load_ct_reference"
+
+
+def _make_var(name: str, value: str) -> dict:
+    return {
+        "sdtm_variable": name,
+        "sdtm_label": f"{name} label",
+        "sdtm_data_type": "Char",
+        "core": "Req",
+        "mapping_pattern": "assign",
+        "mapping_logic": f"{name} assignment",
+        "assigned_value": value,
+        "confidence": 1.0,
+        "confidence_level": "high",
+        "confidence_rationale": "Test fixture",
+    }
+
+
+def _write_spec(tmp_path: Path, domain: str, source: str) -> None:
+    spec = {
+        "domain": domain,
+        "domain_label": f"{domain} Domain",
+        "domain_class": "Events",
+        "structure": "test",
+        "study_id": "TEST001",
+        "source_datasets": [source],
+        "variable_mappings": [
+            _make_var("STUDYID", "TEST001"),
+            _make_var("DOMAIN", domain),
+            _make_var("USUBJID", "TEST001-001"),
+        ],
+        "total_variables": 3,
+        "required_mapped": 3,
+        "expected_mapped": 0,
+        "high_confidence_count": 3,
+        "medium_confidence_count": 0,
+        "low_confidence_count": 0,
+        "mapping_timestamp": "2026-02-27T00:00:00",
+        "model_used": "test",
+    }
+    (tmp_path / f"{domain.lower()}_spec.json").write_text(json.dumps(spec))
+    (tmp_path / source).write_bytes(b"dummy")
+
+
+def _mock_read_sas(*_args, **_kwargs):
+    return pd.DataFrame({"Subject": ["001"]}), MagicMock()
+
+
+@patch(_PATCH_LOAD_SDTM, return_value=None)
+@patch(_PATCH_LOAD_CT, return_value=None)
+@patch(_PATCH_READ_SAS, side_effect=_mock_read_sas)
+def test_execute_study_writes_each_domain(mock_read_sas, mock_ct, mock_sdtm, tmp_path):
+    """Every spec in the directory produces an XPT; shared sources are read once."""
+    _write_spec(tmp_path, "AE", "shared.sas7bdat")
+    _write_spec(tmp_path, "CM", "shared.sas7bdat")
+    output_dir = tmp_path / "out"
+
+    result = runner.invoke(
+        app,
+        ["execute-study", str(tmp_path), str(tmp_path), "--output-dir", str(output_dir), "-w", "1"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert (output_dir / "ae.xpt").exists()
+    assert (output_dir / "cm.xpt").exists()
+    assert mock_read_sas.call_count == 1
+
+
+def test_execute_study_no_specs_exits_nonzero(tmp_path):
+    result = runner.invoke(app, ["execute-study", str(tmp_path), str(tmp_path)])
+    assert result.exit_code == 1
+    assert "No mapping specs" in result.output
+
+
+def test_execute_study_missing_data_dir(tmp_path):
+    result = runner.invoke(app, ["execute-study", str(tmp_path), str(tmp_path / "missing")])
+    assert result.exit_code == 1
@@ -122,6 +122,21 @@ class TestHandleISO8601PartialDate:
         assert result.iloc[0] == "2023-03"
         assert result.iloc[1] == "2024-12"
 
+    def test_full_date_and_invalid_rows(self) -> None:
+        df = pd.DataFrame(
+            {
+                "YEAR": [2023.0, 2023.0, None, 2023.0],
+                "MONTH": [3.0, None, 1.0, 2.0],
+                "DAY": [15.0, 15.0, 1.0, 30.0],
+            }
+        )
+        mapping = _make_mapping(
+            sdtm_variable="DTC",
+            derivation_rule="ISO8601_PARTIAL_DATE(YEAR, MONTH, DAY)",
+        )
+        result = handle_derivation(df, mapping)
+        assert result.tolist() == ["2023-03-15", "2023", "", ""]
+
 
 class TestHandleParseStringDate:
     def test_parse_dd_mon_yyyy(self) -> None:
@@ -198,6 +213,29 @@ class TestHandleRaceCheckbox:
         result = handle_derivation(df, mapping)
         assert result.iloc[0] is None
 
+    def test_mixed_rows_with_missing_and_non_numeric(self) -> None:
+        df = pd.DataFrame(
+            {
+                "RACEAME": [1.0, None, 1.0, "Y", 0.0],
+                "RACEWHI": [0.0, 1.0, 1.0, None, None],
+                "RACEASI": [None, 0.0, 0.0, 1.0, None],
+            },
+            index=[10, 11, 12, 13, 14],
+        )
+        mapping = _make_mapping(
+            sdtm_variable="RACE",
+            derivation_rule="RACE_CHECKBOX(RACEAME, RACEWHI, RACEASI)",
+        )
+        result = handle_derivation(df, mapping)
+        assert list(result.index) == [10, 11, 12, 13, 14]
+        assert result.tolist() == [
+            "AMERICAN INDIAN OR ALASKA NATIVE",
+            "WHITE",
+            "MULTIPLE",
+            "ASIAN",
+            None,
+        ]
+
 
 class TestHandleNumericToYN:
     def test_numeric_to_yn(self) -> None:
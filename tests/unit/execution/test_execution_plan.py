@@ -0,0 +1,196 @@
+"""Tests for compiled execution plans and their cache."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from astraea.execution.executor import DatasetExecutor
+from astraea.execution.pattern_handlers import handle_direct, handle_lookup_recode
+from astraea.execution.plan import PlanCache, compile_plan, spec_fingerprint
+from astraea.models.mapping import (
+    ConfidenceLevel,
+    DomainMappingSpec,
+    MappingPattern,
+    VariableMapping,
+)
+from astraea.models.sdtm import CoreDesignation
+
+
+def _make_mapping(
+    sdtm_variable: str,
+    pattern: MappingPattern,
+    order: int,
+    **kwargs: str,
+) -> VariableMapping:
+    return VariableMapping(
+        sdtm_variable=sdtm_variable,
+        sdtm_label=f"{sdtm_variable} label",
+        sdtm_data_type="Char",
+        core=CoreDesignation.REQ,
+        mapping_pattern=pattern,
+        mapping_logic="test mapping",
+        confidence=0.9,
+        confidence_level=ConfidenceLevel.HIGH,
+        confidence_rationale="test",
+        order=order,
+        **kwargs,
+    )
+
+
+@pytest.fixture()
+def ae_spec() -> DomainMappingSpec:
+    return DomainMappingSpec(
+        domain="AE",
+        domain_label="Adverse Events",
+        domain_class="Events",
+        structure="One record per adverse event per subject",
+        study_id="TEST-001",
+        source_datasets=["ae.sas7bdat"],
+        variable_mappings=[
+            _make_mapping(
+                "AESTDTC",
+                MappingPattern.REFORMAT,
+                6,
+                source_variable="AESTDAT",
+                derivation_rule="ISO8601_DATE(AESTDAT)",
+            ),
+            _make_mapping(
+                "AESEV",
+                MappingPattern.LOOKUP_RECODE,
+                5,
+                source_variable="SEV",
+                codelist_code="C66769",
+            ),
+            _make_mapping("AETERM", MappingPattern.DIRECT, 4, source_variable="AETERM"),
+            _make_mapping(
+                "USUBJID", MappingPattern.DERIVATION, 3, derivation_rule="generate_usubjid"
+            ),
+            _make_mapping("STUDYID", MappingPattern.ASSIGN, 1, assigned_value="TEST-001"),
+            _make_mapping("AESEQ", MappingPattern.DERIVATION, 2, derivation_rule="generate_seq"),
+            _make_mapping("AESTDY", MappingPattern.DERIVATION, 7, derivation_rule="study_day"),
+            _make_mapping("EPOCH", MappingPattern.DERIVATION, 8, derivation_rule="epoch"),
+        ],
+        total_variables=8,
+        required_mapped=8,
+        expected_mapped=0,
+        high_confidence_count=8,
+        medium_confidence_count=0,
+        low_confidence_count=0,
+        mapping_timestamp="2026-02-27T00:00:00",
+        model_used="test",
+    )
+
+
+@pytest.fixture()
+def mock_ct() -> MagicMock:
+    ct = MagicMock(spec=["lookup_codelist"])
+    codelist = MagicMock()
+    codelist.terms = {
+        "MILD": MagicMock(nci_preferred_term="Mild Adverse Event"),
+        "SEVERE": MagicMock(nci_preferred_term="Severe Adverse Event"),
+    }
+    ct.lookup_codelist.return_value = codelist
+    return ct
+
+
+@pytest.fixture()
+def raw_ae_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Subject": ["001", "002"],
+            "SiteNumber": ["01", "01"],
+            "AETERM": ["Headache", "Nausea"],
+            "SEV": ["Mild Adverse Event", "SEVERE"],
+            "AESTDAT": [22000.0, 22010.0],
+        }
+    )
+
+
+class TestCompilePlan:
+    def test_mappings_in_pattern_priority_order(self, ae_spec: DomainMappingSpec) -> None:
+        plan = compile_plan(ae_spec)
+        assert [c.mapping.sdtm_variable for c in plan.mappings] == [
+            "STUDYID",
+            "AETERM",
+            "AESTDTC",
+            "AESEV",
+            "USUBJID",
+            "AESEQ",
+            "AESTDY",
+            "EPOCH",
+        ]
+
+    def test_rules_parsed_and_handlers_resolved(self, ae_spec: DomainMappingSpec) -> None:
+        plan = compile_plan(ae_spec)
+        by_var = {c.mapping.sdtm_variable: c for c in plan.mappings}
+        assert by_var["AESTDTC"].parsed_rule == ("ISO8601_DATE", ["AESTDAT"])
+        assert by_var["USUBJID"].parsed_rule == ("GENERATE_USUBJID", [])
+        assert by_var["AETERM"].parsed_rule is None
+        assert by_var["AETERM"].handler is handle_direct
+        assert by_var["AESEV"].handler is handle_lookup_recode
+
+    def test_recode_table_prebuilt(self, ae_spec: DomainMappingSpec, mock_ct: MagicMock) -> None:
+        plan = compile_plan(ae_spec, ct_ref=mock_ct)
+        recode = next(c for c in plan.mappings if c.mapping.sdtm_variable == "AESEV")
+        assert recode.recode_table == {
+            "Mild Adverse Event": "MILD",
+            "MILD": "MILD",
+            "Severe Adverse Event": "SEVERE",
+            "SEVERE": "SEVERE",
+        }
+
+    def test_derived_variable_targets(self, ae_spec: DomainMappingSpec) -> None:
+        plan = compile_plan(ae_spec)
+        assert plan.dy_vars == {"AESTDY"}
+        assert plan.epoch_date_col == "AESTDTC"
+        assert plan.seq_var == "AESEQ"
+        assert plan.column_order["AETERM"] == 4
+
+    def test_fingerprint_tracks_spec_content(self, ae_spec: DomainMappingSpec) -> None:
+        before = spec_fingerprint(ae_spec)
+        assert spec_fingerprint(ae_spec.model_copy(deep=True)) == before
+        ae_spec.variable_mappings[2].source_variable = "AETERM2"
+        assert spec_fingerprint(ae_spec) != before
+
+
+class TestPlanCache:
+    def test_hit_on_equal_spec_miss_after_edit(self, ae_spec: DomainMappingSpec) -> None:
+        cache = PlanCache()
+        first = cache.get(ae_spec)
+        assert cache.get(ae_spec.model_copy(deep=True)) is first
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        ae_spec.variable_mappings[2].order = 99
+        assert cache.get(ae_spec) is not first
+        assert cache.misses == 2
+
+    def test_evicts_least_recently_used(self, ae_spec: DomainMappingSpec) -> None:
+        cache = PlanCache(max_plans=1)
+        cache.get(ae_spec)
+        other = ae_spec.model_copy(update={"domain_label": "Other"})
+        cache.get(other)
+        assert len(cache) == 1
+        cache.get(ae_spec)
+        assert cache.misses == 3
+
+    def test_rejects_non_positive_size(self) -> None:
+        with pytest.raises(ValueError, match="max_plans"):
+            PlanCache(max_plans=0)
+
+
+class TestExecutorUsesPlan:
+    def test_repeated_execution_compiles_once(
+        self, ae_spec: DomainMappingSpec, mock_ct: MagicMock, raw_ae_df: pd.DataFrame
+    ) -> None:
+        executor = DatasetExecutor(ct_ref=mock_ct)
+        first = executor.execute(ae_spec, {"ae": raw_ae_df})
+        second = executor.execute(ae_spec, {"ae": raw_ae_df})
+
+        pd.testing.assert_frame_equal(first, second)
+        assert executor.plan_cache.misses == 1
+        assert executor.plan_cache.hits == 1
+        assert mock_ct.lookup_codelist.call_count == 1
+        assert list(first["AESEV"]) == ["MILD", "SEVERE"]
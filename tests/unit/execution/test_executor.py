@@ -11,6 +11,7 @@ from astraea.execution.executor import (
     CrossDomainContext,
     DatasetExecutor,
     ExecutionError,
+    required_source_columns,
 )
 from astraea.models.mapping import (
     ConfidenceLevel,
@@ -19,6 +20,7 @@ from astraea.models.mapping import (
     VariableMapping,
 )
 from astraea.models.sdtm import CoreDesignation
+from astraea.transforms.char_storage import restore_char_columns
 
 
 def _make_mapping(
@@ -290,6 +292,19 @@ class TestExecutorCrossDomain:
         assert dy_values["Nausea"] == 7
 
 
+class TestExecutorCharStorage:
+    def test_category_storage_matches_object_storage(self, raw_ae_df: pd.DataFrame) -> None:
+        spec = _make_ae_spec()
+        cross_domain = CrossDomainContext(rfstdtc_lookup={"TEST-001-101-001": "2022-03-30"})
+        plain = DatasetExecutor().execute(spec, {"ae": raw_ae_df}, cross_domain=cross_domain)
+        compact = DatasetExecutor(char_storage="category").execute(
+            spec, {"ae": raw_ae_df}, cross_domain=cross_domain
+        )
+
+        assert isinstance(compact["STUDYID"].dtype, pd.CategoricalDtype)
+        pd.testing.assert_frame_equal(restore_char_columns(compact), restore_char_columns(plain))
+
+
 class TestExecutorErrorHandling:
     def test_executor_noncritical_failure_continues(self) -> None:
         """Mapping referencing nonexistent source should log warning, not crash."""
@@ -373,3 +388,46 @@ class TestExecutorErrorHandling:
         executor = DatasetExecutor()
         with pytest.raises(ExecutionError, match="STUDYID"):
             executor.execute(spec, {"ae": df})
+
+
+class TestRequiredSourceColumns:
+    def test_collects_sources_rule_args_and_identifiers(self) -> None:
+        spec = _make_dm_spec()
+        spec.variable_mappings.append(
+            _make_mapping(
+                sdtm_variable="BRTHDTC",
+                pattern=MappingPattern.REFORMAT,
+                derivation_rule="ISO8601_PARTIAL_DATE(dm.BRTHYR, BRTHMO, BRTHDY)",
+                order=6,
+            )
+        )
+        columns = required_source_columns(spec)
+
+        assert columns is not None
+        assert {"Subject", "Gender", "BRTHYR", "BRTHMO", "BRTHDY"} <= columns
+        assert {"SiteNumber", "USUBJID", "InstanceName", "SSUBJID"} <= columns
+        assert "AETERM" not in columns
+
+    def test_transpose_needs_every_column(self) -> None:
+        spec = _make_dm_spec()
+        spec.variable_mappings.append(
+            _make_mapping(sdtm_variable="LBORRES", pattern=MappingPattern.TRANSPOSE, order=6)
+        )
+        assert required_source_columns(spec) is None
+
+    def test_projected_frame_executes_identically(
+        self, raw_dm_df: pd.DataFrame, mock_ct: MagicMock
+    ) -> None:
+        """Dropping columns outside the projection does not change the output."""
+        wide = raw_dm_df.assign(**{f"UNUSED{i}": range(len(raw_dm_df)) for i in range(20)})
+        spec = _make_dm_spec()
+        columns = required_source_columns(spec)
+        assert columns is not None
+        narrow = wide[[c for c in wide.columns if c in columns]]
+
+        executor = DatasetExecutor(ct_ref=mock_ct)
+        expected = executor.execute(spec, {"dm": wide}, study_id="TEST-001")
+        result = executor.execute(spec, {"dm": narrow}, study_id="TEST-001")
+
+        assert list(narrow.columns) == ["Subject", "Gender", "SiteNumber"]
+        pd.testing.assert_frame_equal(result, expected)
@@ -0,0 +1,290 @@
+"""Tests for study-level parallel execution (StudyExecutor)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pyreadstat
+import pytest
+from loguru import logger
+
+from astraea.execution.study import (
+    StudyExecutor,
+    build_study_context,
+    plan_study_waves,
+    study_source_columns,
+)
+from astraea.models.mapping import (
+    ConfidenceLevel,
+    DomainMappingSpec,
+    MappingPattern,
+    VariableMapping,
+)
+from astraea.models.sdtm import CoreDesignation
+
+
+def _make_mapping(
+    sdtm_variable: str,
+    pattern: MappingPattern,
+    *,
+    source_variable: str | None = None,
+    assigned_value: str | None = None,
+    order: int = 0,
+) -> VariableMapping:
+    return VariableMapping(
+        sdtm_variable=sdtm_variable,
+        sdtm_label=f"{sdtm_variable} label",
+        sdtm_data_type="Char",
+        core=CoreDesignation.REQ,
+        source_variable=source_variable,
+        mapping_pattern=pattern,
+        mapping_logic="test mapping",
+        assigned_value=assigned_value,
+        confidence=0.9,
+        confidence_level=ConfidenceLevel.HIGH,
+        confidence_rationale="test",
+        order=order,
+    )
+
+
+def _make_spec(
+    domain: str,
+    sources: list[str],
+    extra: list[VariableMapping] | None = None,
+    domain_class: str = "Events",
+) -> DomainMappingSpec:
+    mappings = [
+        _make_mapping("STUDYID", MappingPattern.ASSIGN, assigned_value="S1", order=1),
+        _make_mapping("DOMAIN", MappingPattern.ASSIGN, assigned_value=domain, order=2),
+        _make_mapping("USUBJID", MappingPattern.DIRECT, source_variable="USUBJID", order=3),
+    ]
+    mappings.extend(extra or [])
+    return DomainMappingSpec(
+        domain=domain,
+        domain_label=f"{domain} label",
+        domain_class=domain_class,
+        structure="test",
+        study_id="S1",
+        source_datasets=sources,
+        variable_mappings=mappings,
+        total_variables=len(mappings),
+        required_mapped=len(mappings),
+        expected_mapped=0,
+        high_confidence_count=len(mappings),
+        medium_confidence_count=0,
+        low_confidence_count=0,
+        mapping_timestamp="2026-01-01T00:00:00",
+        model_used="test",
+    )
+
+
+@pytest.fixture()
+def dm_spec() -> DomainMappingSpec:
+    return _make_spec(
+        "DM",
+        ["dm.sas7bdat"],
+        [_make_mapping("RFSTDTC", MappingPattern.DIRECT, source_variable="RFSTDTC", order=4)],
+        domain_class="Special Purpose",
+    )
+
+
+@pytest.fixture()
+def ae_spec() -> DomainMappingSpec:
+    return _make_spec(
+        "AE",
+        ["ae.sas7bdat"],
+        [
+            _make_mapping("AESTDTC", MappingPattern.DIRECT, source_variable="AESTDTC", order=4),
+            _make_mapping("AESTDY", MappingPattern.DIRECT, source_variable="AESTDTC", order=5),
+        ],
+    )
+
+
+@pytest.fixture()
+def cm_spec() -> DomainMappingSpec:
+    return _make_spec(
+        "CM",
+        ["cm.sas7bdat"],
+        [_make_mapping("CMTRT", MappingPattern.DIRECT, source_variable="CMTRT", order=4)],
+    )
+
+
+@pytest.fixture()
+def raw_data() -> dict[str, pd.DataFrame]:
+    return {
+        "dm.sas7bdat": pd.DataFrame(
+            {"USUBJID": ["S1-001", "S1-002"], "RFSTDTC": ["2022-01-10", "2022-02-01"]}
+        ),
+        "ae.sas7bdat": pd.DataFrame(
+            {"USUBJID": ["S1-001", "S1-002"], "AESTDTC": ["2022-01-12", "2022-01-31"]}
+        ),
+        "cm.sas7bdat": pd.DataFrame({"USUBJID": ["S1-001"], "CMTRT": ["ASPIRIN"]}),
+    }
+
+
+class TestPlanStudyWaves:
+    def test_context_domains_first(self, dm_spec, ae_spec, cm_spec) -> None:
+        waves = plan_study_waves([cm_spec, ae_spec, dm_spec])
+        assert [[s.domain for s in w] for w in waves] == [["DM"], ["AE", "CM"]]
+
+    def test_no_context_domains(self, ae_spec, cm_spec) -> None:
+        waves = plan_study_waves([cm_spec, ae_spec])
+        assert [[s.domain for s in w] for w in waves] == [["AE", "CM"]]
+
+    def test_duplicate_domain_rejected(self, ae_spec) -> None:
+        with pytest.raises(ValueError, match="Duplicate"):
+            plan_study_waves([ae_spec, ae_spec])
+
+
+class TestStudySourceColumns:
+    def test_shared_source_gets_union(self, ae_spec, cm_spec) -> None:
+        cm_spec.source_datasets = ["ae.sas7bdat"]
+        columns = study_source_columns([ae_spec, cm_spec])
+
+        assert list(columns) == ["ae.sas7bdat"]
+        assert {"USUBJID", "AESTDTC", "CMTRT"} <= (columns["ae.sas7bdat"] or set())
+
+    def test_findings_source_is_read_whole(self, ae_spec) -> None:
+        lb_spec = _make_spec("LB", ["ae.sas7bdat"], domain_class="Findings")
+        assert study_source_columns([ae_spec, lb_spec]) == {"ae.sas7bdat": None}
+        assert study_source_columns([lb_spec, ae_spec]) == {"ae.sas7bdat": None}
+
+
+class TestBuildStudyContext:
+    def test_rfstdtc_lookup_from_dm(self) -> None:
+        dm = pd.DataFrame(
+            {"USUBJID": ["A", "B", "C"], "RFSTDTC": ["2022-01-01", None, ""]}
+        )
+        ctx = build_study_context({"DM": dm})
+        assert ctx is not None
+        assert ctx.rfstdtc_lookup == {"A": "2022-01-01"}
+
+    def test_se_passed_through(self) -> None:
+        se = pd.DataFrame({"USUBJID": ["A"], "SESTDTC": ["2022-01-01"], "EPOCH": ["SCREENING"]})
+        ctx = build_study_context({"SE": se})
+        assert ctx is not None
+        assert ctx.se_data is se
+
+    def test_visit_mapping_from_tv(self) -> None:
+        tv = pd.DataFrame({"VISITNUM": [1, 2], "VISIT": ["SCREENING", "WEEK 1"]})
+        ctx = build_study_context({"TV": tv})
+        assert ctx is not None
+        assert ctx.visit_mapping == {"SCREENING": (1.0, "SCREENING"), "WEEK 1": (2.0, "WEEK 1")}
+
+    def test_empty_returns_none(self) -> None:
+        assert build_study_context({}) is None
+
+
+class TestStudyExecutor:
+    def test_serial_run_writes_all_domains(
+        self, dm_spec, ae_spec, cm_spec, raw_data, tmp_path: Path
+    ) -> None:
+        executor = StudyExecutor(max_workers=1)
+        results = executor.execute_study([ae_spec, cm_spec, dm_spec], raw_data, tmp_path)
+
+        assert [r.domain for r in results] == ["DM", "AE", "CM"]
+        assert [r.wave for r in results] == [0, 1, 1]
+        assert all(r.succeeded for r in results)
+        for name in ("dm.xpt", "ae.xpt", "cm.xpt"):
+            assert (tmp_path / name).exists()
+
+    def test_dm_context_feeds_study_day(
+        self, dm_spec, ae_spec, raw_data, tmp_path: Path
+    ) -> None:
+        executor = StudyExecutor(max_workers=1)
+        executor.execute_study([ae_spec, dm_spec], raw_data, tmp_path)
+
+        ae, _meta = pyreadstat.read_xport(str(tmp_path / "ae.xpt"))
+        assert list(ae["AESTDY"]) == [3, -1]
+
+    def test_tv_context_assigns_visit(self, ae_spec, raw_data, tmp_path: Path) -> None:
+        tv_spec = _make_spec(
+            "TV",
+            ["tv.sas7bdat"],
+            [
+                _make_mapping("VISITNUM", MappingPattern.DIRECT, source_variable="VISITNUM"),
+                _make_mapping("VISIT", MappingPattern.DIRECT, source_variable="VISIT"),
+            ],
+            domain_class="Trial Design",
+        )
+        # Placeholders the executor fills from the TV visit mapping
+        ae_spec.variable_mappings += [
+            _make_mapping("VISITNUM", MappingPattern.DERIVATION, order=6),
+            _make_mapping("VISIT", MappingPattern.DERIVATION, order=7),
+        ]
+        raw_data["tv.sas7bdat"] = pd.DataFrame(
+            {"USUBJID": ["", ""], "VISITNUM": [1.0, 2.0], "VISIT": ["SCREENING", "WEEK 1"]}
+        )
+        raw_data["ae.sas7bdat"]["InstanceName"] = ["WEEK 1", "SCREENING"]
+
+        executor = StudyExecutor(max_workers=1)
+        results = executor.execute_study([ae_spec, tv_spec], raw_data, tmp_path)
+
+        assert [(r.domain, r.wave) for r in results] == [("TV", 0), ("AE", 1)]
+        assert all(r.succeeded for r in results), [r.error for r in results]
+        ae, _meta = pyreadstat.read_xport(str(tmp_path / "ae.xpt"))
+        assert list(ae["VISIT"]) == ["WEEK 1", "SCREENING"]
+        assert list(ae["VISITNUM"]) == [2.0, 1.0]
+
+    def test_missing_source_recorded_as_error(
+        self, dm_spec, cm_spec, raw_data, tmp_path: Path
+    ) -> None:
+        del raw_data["cm.sas7bdat"]
+        executor = StudyExecutor(max_workers=1)
+        results = executor.execute_study([dm_spec, cm_spec], raw_data, tmp_path)
+
+        by_domain = {r.domain: r for r in results}
+        assert by_domain["DM"].succeeded
+        assert not by_domain["CM"].succeeded
+        assert "No source datasets" in (by_domain["CM"].error or "")
+
+    def test_process_pool_matches_serial(
+        self, dm_spec, ae_spec, cm_spec, raw_data, tmp_path: Path
+    ) -> None:
+        serial_dir = tmp_path / "serial"
+        parallel_dir = tmp_path / "parallel"
+        specs = [dm_spec, ae_spec, cm_spec]
+
+        StudyExecutor(max_workers=1).execute_study(specs, raw_data, serial_dir)
+        results = StudyExecutor(max_workers=2).execute_study(specs, raw_data, parallel_dir)
+
+        assert [r.domain for r in results] == ["DM", "AE", "CM"]
+        for name in ("dm.xpt", "ae.xpt", "cm.xpt"):
+            serial, _ = pyreadstat.read_xport(str(serial_dir / name))
+            parallel, _ = pyreadstat.read_xport(str(parallel_dir / name))
+            pd.testing.assert_frame_equal(serial, parallel)
+
+    def test_lb_writes_lc_domain(self, raw_data, tmp_path: Path) -> None:
+        lb_mappings = [
+            _make_mapping(name, MappingPattern.DIRECT, source_variable=source, order=order)
+            for order, (name, source) in enumerate(
+                [
+                    ("LBTESTCD", "LBTESTCD"),
+                    ("LBORRES", "LBORRES"),
+                    # Derived by FindingsExecutor; mapped here for their XPT labels
+                    ("LBSTRESC", "LBORRES"),
+                    ("LBSTRESN", "LBORRES"),
+                    ("LBNRIND", "LBORRES"),
+                ],
+                start=4,
+            )
+        ]
+        lb_spec = _make_spec("LB", ["lb.sas7bdat"], lb_mappings, domain_class="Findings")
+        raw_data["lb.sas7bdat"] = pd.DataFrame(
+            {"USUBJID": ["S1-001", "S1-002"], "LBTESTCD": ["GLUC", "ALT"], "LBORRES": ["5", "30"]}
+        )
+        messages: list[str] = []
+        handler = logger.add(lambda m: messages.append(m.record["message"]), level="WARNING")
+        try:
+            results = StudyExecutor(max_workers=1).execute_study([lb_spec], raw_data, tmp_path)
+        finally:
+            logger.remove(handler)
+
+        assert results[0].succeeded, results[0].error
+        assert results[0].lc_output_path == tmp_path / "lc.xpt"
+        lc, meta = pyreadstat.read_xport(str(tmp_path / "lc.xpt"))
+        assert list(lc["DOMAIN"]) == ["LC", "LC"]
+        assert list(lc["LCTESTCD"]) == ["GLUC", "ALT"]
+        assert meta.column_names_to_labels["LCTESTCD"] == "LBTESTCD label"
+        assert any("structural copy of LB" in m for m in messages)
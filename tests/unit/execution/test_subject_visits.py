@@ -106,6 +106,74 @@ class TestExtractVisitDates:
         assert result.empty
         assert "subject_id" in result.columns
 
+    def test_extract_visit_dates_spans_all_date_columns(self) -> None:
+        """Earliest/latest are taken across every date column of the visit."""
+        df = pd.DataFrame(
+            {
+                "Subject": ["S001", "S001", "S001"],
+                "InstanceName": ["Week 4"] * 3,
+                "FolderName": ["WK4"] * 3,
+                "FolderSeq": [2.0] * 3,
+                "AESTDAT": ["2022-02-07", None, "2022-02-05"],
+                "AEENDAT": [None, "2022-02-20", "2022-02-09"],
+            }
+        )
+        result = extract_visit_dates({"ae": df})
+        assert result.iloc[0]["earliest_date"] == "2022-02-05"
+        assert result.iloc[0]["latest_date"] == "2022-02-20"
+
+    def test_extract_visit_dates_undated_visit_and_no_folder_seq(self) -> None:
+        """Visits without dates keep None dates; no FolderSeq gives no visit_seq."""
+        df = pd.DataFrame(
+            {
+                "Subject": ["S001", "S001", None],
+                "InstanceName": ["Screening", "Week 4", "Week 8"],
+                "FolderName": ["SCRN", "WK4", "WK8"],
+                "CMSTDAT": ["2022-01-10", None, "2022-03-01"],
+            }
+        )
+        result = extract_visit_dates({"cm": df})
+        assert list(result["visit_name"]) == ["Screening", "Week 4"]
+        assert result.iloc[1]["earliest_date"] is None
+        assert result.iloc[1]["latest_date"] is None
+        assert result["visit_seq"].isna().all()
+
+    def test_extract_visit_dates_same_visit_in_several_datasets(self) -> None:
+        """The dated record with the earliest date wins; a missing folder reads "nan"."""
+        raw_dfs = {
+            "ae": pd.DataFrame(
+                {
+                    "Subject": ["1001", "1001", "1002"],
+                    "InstanceName": ["Visit 1", "Visit 2", "Visit 1"],
+                    "FolderName": ["V1", None, "V1"],
+                    "FolderSeq": [1.0, 2.0, 1.0],
+                    "AESTDAT": ["2022-01-03", "2022-01-30", None],
+                    "AEENDAT": [None, "2022-02-02", None],
+                }
+            ),
+            "cm": pd.DataFrame(
+                {
+                    "Subject": ["1001", "1002", "1002"],
+                    "InstanceName": ["Visit 1", "Visit 1", "Visit 2"],
+                    "FolderName": ["V1", "V1", "V2"],
+                    "CMSTDAT": ["2022-01-01", "2022-01-05", None],
+                    "CMENDAT": [None, "2022-01-07", None],
+                }
+            ),
+        }
+        result = extract_visit_dates(raw_dfs)
+
+        assert list(result["visit_folder"]) == ["V1", "nan", "V1", "V2"]
+        assert result["visit_seq"].tolist()[1] == 2.0
+        assert result["visit_seq"].drop(index=1).isna().all()
+        assert list(result["earliest_date"]) == ["2022-01-01", "2022-01-30", "2022-01-05", None]
+        assert list(result["latest_date"]) == ["2022-01-01", "2022-02-02", "2022-01-07", None]
+
+        sv = build_sv_domain(result, "STUDY")
+        assert list(sv["VISIT"]) == ["Visit 2", "Visit 1", "Visit 1", "Visit 2"]
+        assert list(sv["SVSEQ"]) == [1, 2, 1, 2]
+        assert list(sv["SVSTDTC"]) == ["2022-01-30", "2022-01-01", "2022-01-05", ""]
+
 
 # ---------------------------------------------------------------------------
 # build_sv_domain tests
@@ -238,6 +238,78 @@ class TestGenerateSuppqual:
 
         assert result.iloc[0]["QEVAL"] == "INVESTIGATOR"
 
+    def test_records_ordered_by_parent_row_then_variable(
+        self, parent_ae_df: pd.DataFrame, supp_vars: list[SuppVariable]
+    ) -> None:
+        """Each parent row's records appear together, in supp_variables order."""
+        result = generate_suppqual(parent_ae_df, "AE", "STUDY1", supp_vars)
+
+        assert list(zip(result["USUBJID"], result["IDVARVAL"], result["QNAM"], strict=True)) == [
+            ("S01", "1", "AESEV"),
+            ("S01", "1", "AEACNOTH"),
+            ("S01", "2", "AESEV"),
+            ("S01", "2", "AEACNOTH"),
+            ("S02", "1", "AESEV"),
+        ]
+
+    def test_rows_without_usubjid_or_seq_skipped(self) -> None:
+        """Rows missing USUBJID or SEQ produce no records; float SEQ loses decimals."""
+        parent_df = pd.DataFrame(
+            {
+                "USUBJID": ["S01", None, "S02"],
+                "AESEQ": [1.0, 2.0, float("nan")],
+                "AESEV": [" MILD ", "MODERATE", "SEVERE"],
+            }
+        )
+        supp_vars = [
+            SuppVariable(qnam="AESEV", qlabel="Severity", source_col="AESEV", qorig="CRF"),
+        ]
+        result = generate_suppqual(parent_df, "AE", "STUDY1", supp_vars)
+
+        assert len(result) == 1
+        assert result.iloc[0]["IDVARVAL"] == "1"
+        assert result.iloc[0]["QVAL"] == "MILD"
+
+    def test_missing_source_column_skipped(
+        self, parent_ae_df: pd.DataFrame, supp_vars: list[SuppVariable]
+    ) -> None:
+        """A SuppVariable whose source column is absent yields no records."""
+        missing = SuppVariable(qnam="AEXYZ", qlabel="Absent", source_col="AEXYZ", qorig="CRF")
+        result = generate_suppqual(parent_ae_df, "AE", "STUDY1", [missing, *supp_vars])
+
+        assert "AEXYZ" not in set(result["QNAM"])
+        assert len(result) == 5
+
+    def test_blank_and_numeric_values(self) -> None:
+        """Blank and whitespace values are skipped; numeric values keep their str() form."""
+        parent_df = pd.DataFrame(
+            {
+                "USUBJID": ["S01", "S01", "S02", "S02", "S03"],
+                "LBSEQ": [1.0, 2.0, 1.0, float("nan"), 7.0],
+                "LBCOM": ["", " Repeat sample ", None, "HEMOLYZED", "  "],
+                "LBFAST2": ["Y", None, "N", "Y", ""],
+                "LBTOXGR2": [float("nan"), 3.0, 0.0, 1.0, float("nan")],
+            }
+        )
+        supp_vars = [
+            SuppVariable(qnam="LBCOM", qlabel="Lab Comment", source_col="LBCOM", qorig="CRF"),
+            SuppVariable(qnam="LBFAST", qlabel="Fasting Status", source_col="LBFAST2", qorig="CRF"),
+            SuppVariable(
+                qnam="LBTOXGR", qlabel="Toxicity Grade", source_col="LBTOXGR2", qorig="DERIVED"
+            ),
+        ]
+        result = generate_suppqual(parent_df, "LB", "STUDY1", supp_vars)
+
+        columns = ["USUBJID", "IDVARVAL", "QNAM", "QVAL"]
+        assert list(result[columns].itertuples(index=False, name=None)) == [
+            ("S01", "1", "LBFAST", "Y"),
+            ("S01", "2", "LBCOM", "Repeat sample"),
+            ("S01", "2", "LBTOXGR", "3.0"),
+            ("S02", "1", "LBFAST", "N"),
+            ("S02", "1", "LBTOXGR", "0.0"),
+        ]
+        assert all(pd.api.types.is_object_dtype(dtype) for dtype in result.dtypes)
+
 
 # ---------------------------------------------------------------------------
 # Tests: validate_suppqual_integrity
@@ -0,0 +1,286 @@
+"""Tests for declarative validation rules loaded from JSON."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from pydantic import ValidationError
+
+from astraea.validation.domain_stats import DomainStats
+from astraea.validation.engine import ValidationEngine
+from astraea.validation.rules.base import RuleSeverity
+from astraea.validation.rules.declarative import (
+    DeclarativeRuleSet,
+    RuleDefinition,
+    load_declarative_rules,
+)
+
+
+def _rule(check: str, variable: str, **fields: Any) -> RuleDefinition:
+    return RuleDefinition(
+        rule_id=fields.pop("rule_id", "TEST-1"),
+        description="test rule",
+        category="CONSISTENCY",
+        severity="ERROR",
+        check=check,
+        variable=variable,
+        **fields,
+    )
+
+
+def _evaluate(domain: str, df: pd.DataFrame, *definitions: RuleDefinition, **kwargs: Any):
+    rules = DeclarativeRuleSet(definitions=list(definitions))
+    return rules.evaluate(domain, df, MagicMock(), MagicMock(), MagicMock(), **kwargs)
+
+
+class TestChecks:
+    def test_in_set(self) -> None:
+        df = pd.DataFrame({"LBSTAT": ["NOT DONE", None, "ND", "ND", "done"]})
+        results = _evaluate("LB", df, _rule("in_set", "--STAT", values=["NOT DONE"]))
+        assert len(results) == 1
+        assert results[0].variable == "LBSTAT"
+        assert results[0].affected_count == 3
+        assert "['ND', 'done']" in results[0].message
+
+    def test_matches(self) -> None:
+        df = pd.DataFrame({"VSTESTCD": ["SYSBP", "1BP", "temp", "SYSBP", "TOOLONGCODE"]})
+        results = _evaluate("VS", df, _rule("matches", "--TESTCD", pattern=r"^[A-Z]\w{0,7}$"))
+        assert results[0].affected_count == 3
+        assert "['1BP', 'temp', 'TOOLONGCODE']" in results[0].message
+
+    def test_not_null_counts_nulls_and_blanks(self) -> None:
+        df = pd.DataFrame({"AETERM": ["HEADACHE", None, "  ", "", "NAUSEA"]})
+        results = _evaluate("AE", df, _rule("not_null", "AETERM"))
+        assert results[0].affected_count == 3
+
+    def test_required_when(self) -> None:
+        df = pd.DataFrame(
+            {
+                "LBORRES": ["5", None, "3", "4", "7"],
+                "LBSTRESC": ["5", None, "", None, "7"],
+            }
+        )
+        results = _evaluate("LB", df, _rule("required_when", "--STRESC", when="--ORRES"))
+        assert results[0].affected_count == 2
+        assert "where LBORRES is populated" in results[0].message
+
+    def test_required_when_values(self) -> None:
+        df = pd.DataFrame(
+            {
+                "EGSTAT": ["NOT DONE", "NOT DONE", None, "ND"],
+                "EGREASND": ["MISSED", None, None, None],
+            }
+        )
+        definition = _rule("required_when", "--REASND", when="--STAT", when_values=["NOT DONE"])
+        assert _evaluate("EG", df, definition)[0].affected_count == 1
+
+    def test_unique_within_keys(self) -> None:
+        df = pd.DataFrame(
+            {
+                "SITEID": ["01", "01", "02", "02", "02"],
+                "SUBJID": ["001", "002", "001", "003", "003"],
+            }
+        )
+        results = _evaluate("DM", df, _rule("unique", "SUBJID", keys=["SITEID"]))
+        assert results[0].affected_count == 2
+        assert "['003']" in results[0].message
+        assert _evaluate("DM", df, _rule("unique", "SUBJID"))[0].affected_count == 4
+
+    def test_compare_columns_skips_partial_dates(self) -> None:
+        df = pd.DataFrame(
+            {
+                "RFSTDTC": ["2024-01-10", "2024-01-10", "2024-01", None, "2024-03-01"],
+                "RFENDTC": ["2024-01-09", "2024-02-01", "2023-12-01", "2024-01-01", "2024-02"],
+            }
+        )
+        definition = _rule("compare", "RFENDTC", operator=">=", other="RFSTDTC", min_length=10)
+        results = _evaluate("DM", df, definition)
+        assert results[0].affected_count == 1
+        assert "['2024-01-09 vs 2024-01-10']" in results[0].message
+
+    def test_compare_prefix_length_same_day_date_and_datetime(self) -> None:
+        df = pd.DataFrame(
+            {
+                "RFSTDTC": ["2023-01-15T08:00", "2023-01-15T08:00", "2023-01-15"],
+                "RFENDTC": ["2023-01-15", "2023-01-14T23:59", "2023-01-15T00:00"],
+            }
+        )
+        truncated = _rule(
+            "compare", "RFENDTC", operator=">=", other="RFSTDTC", min_length=10, prefix_length=10
+        )
+        results = _evaluate("DM", df, truncated)
+        assert results[0].affected_count == 1
+        assert "['2023-01-14T23:59 vs 2023-01-15T08:00']" in results[0].message
+
+        raw = _rule("compare", "RFENDTC", operator=">=", other="RFSTDTC", min_length=10)
+        assert _evaluate("DM", df, raw)[0].affected_count == 2
+
+    def test_bundled_reference_period_rule_accepts_same_day_datetime(self) -> None:
+        df = pd.DataFrame({"RFSTDTC": ["2023-01-15T08:00"], "RFENDTC": ["2023-01-15"]})
+        results = load_declarative_rules().evaluate("DM", df, MagicMock(), MagicMock(), MagicMock())
+        assert not [r for r in results if r.rule_id == "ASTR-D005"]
+
+    def test_compare_numeric_constant(self) -> None:
+        df = pd.DataFrame({"AGE": [30.0, -1.0, np.nan, -1.0, 45.0]})
+        definition = _rule("compare", "AGE", operator=">=", value=0, numeric=True)
+        assert _evaluate("DM", df, definition)[0].affected_count == 2
+
+    def test_compare_numeric_columns_ignores_unparseable(self) -> None:
+        df = pd.DataFrame({"LBSTNRLO": ["1", "5", "<2", "3"], "LBSTNRHI": ["10", "4", "8", None]})
+        definition = _rule("compare", "--STNRHI", operator=">=", other="--STNRLO", numeric=True)
+        assert _evaluate("LB", df, definition)[0].affected_count == 1
+
+    def test_no_finding_when_clean_or_column_absent(self) -> None:
+        df = pd.DataFrame({"LBSTAT": ["NOT DONE", None]})
+        definitions = [
+            _rule("in_set", "--STAT", values=["NOT DONE"], rule_id="A"),
+            _rule("not_null", "--TESTCD", rule_id="B"),
+            _rule("required_when", "--REASND", when="--STAT", rule_id="C"),
+        ]
+        assert _evaluate("LB", df, *definitions) == []
+
+    def test_domains_filter(self) -> None:
+        df = pd.DataFrame({"AETERM": [None]})
+        definition = _rule("not_null", "AETERM", domains=["CM", "SUPP*"])
+        assert _evaluate("AE", df, definition) == []
+        assert _evaluate("SUPPAE", pd.DataFrame({"AETERM": [None]}), definition)
+
+    def test_message_template(self) -> None:
+        df = pd.DataFrame({"AESEV": ["MILD", "BAD"]})
+        definition = _rule(
+            "in_set",
+            "AESEV",
+            values=["MILD"],
+            message="{variable}: {count} bad value(s) {examples}",
+            fix_suggestion="Map to CT",
+            p21_equivalent="CT2001",
+        )
+        result = _evaluate("AE", df, definition)[0]
+        assert result.message == "AESEV: 1 bad value(s) ['BAD']"
+        assert result.fix_suggestion == "Map to CT"
+        assert result.p21_equivalent == "CT2001"
+
+
+class TestRuleSet:
+    def test_results_in_definition_order(self) -> None:
+        df = pd.DataFrame({"AESEV": ["X"], "AETERM": [None], "AEDECOD": ["y"]})
+        definitions = [
+            _rule("matches", "AEDECOD", pattern="^[A-Z]+$", rule_id="A"),
+            _rule("required_when", "AETERM", when="AESEV", rule_id="B"),
+            _rule("in_set", "AESEV", values=["MILD"], rule_id="C"),
+            _rule("not_null", "AEDECOD", rule_id="D"),
+            _rule("matches", "AESEV", pattern="^M", rule_id="E"),
+        ]
+        assert [r.rule_id for r in _evaluate("AE", df, *definitions)] == ["A", "B", "C", "E"]
+
+    def test_rules_on_one_column_share_one_factorization(self) -> None:
+        df = pd.DataFrame({"AESEV": ["MILD", "SEVERE", "X", None] * 10})
+        definitions = [
+            _rule("in_set", "AESEV", values=["MILD", "SEVERE"], rule_id="A"),
+            _rule("matches", "AESEV", pattern="^[A-Z]+$", rule_id="B"),
+            _rule("not_null", "AESEV", rule_id="C"),
+        ]
+        stats = DomainStats(df)
+        with patch("pandas.factorize", wraps=pd.factorize) as factorize:
+            results = _evaluate("AE", df, *definitions, stats=stats)
+        assert factorize.call_count == 1
+        assert [(r.rule_id, r.affected_count) for r in results] == [("A", 10), ("C", 10)]
+
+    def test_failing_definition_reported_as_warning(self) -> None:
+        df = pd.DataFrame({"AGE": ["30"]})
+        definitions = [
+            _rule("compare", "AGE", operator="<", value="x", numeric=True, rule_id="A"),
+            _rule("not_null", "AGE", rule_id="B"),
+        ]
+        results = _evaluate("DM", df, *definitions)
+        assert len(results) == 1
+        assert results[0].rule_id == "A"
+        assert results[0].severity == RuleSeverity.WARNING
+        assert "Rule execution failed" in results[0].message
+
+    def test_reads_any(self) -> None:
+        rules = DeclarativeRuleSet(
+            definitions=[
+                _rule("required_when", "--STRESC", when="--ORRES", domains=["LB"]),
+                _rule("unique", "SUBJID", keys=["SITEID"], domains=["DM"], rule_id="B"),
+            ]
+        )
+        assert rules.reads_any("LB", ["LBORRES"])
+        assert not rules.reads_any("LB", ["SITEID"])
+        assert rules.reads_any("DM", ["SITEID"])
+        assert not rules.reads_any("DM", [])
+
+
+class TestDefinitions:
+    @pytest.mark.parametrize(
+        ("check", "fields"),
+        [
+            ("in_set", {}),
+            ("matches", {}),
+            ("matches", {"pattern": "(["}),
+            ("required_when", {}),
+            ("compare", {"operator": ">"}),
+            ("compare", {"operator": ">", "value": 1, "other": "B"}),
+            ("compare", {"value": 1}),
+            ("compare", {"operator": ">", "value": 1, "numeric": True, "prefix_length": 4}),
+        ],
+    )
+    def test_invalid_definition(self, check: str, fields: dict[str, Any]) -> None:
+        with pytest.raises(ValidationError):
+            _rule(check, "A", **fields)
+
+    def test_unknown_check(self) -> None:
+        with pytest.raises(ValidationError):
+            _rule("between", "A")
+
+
+class TestLoader:
+    def test_bundled_rules_load(self) -> None:
+        rules = load_declarative_rules()
+        ids = [d.rule_id for d in rules.definitions]
+        assert ids
+        assert len(ids) == len(set(ids))
+        assert all(rule_id.startswith("ASTR-D") for rule_id in ids)
+
+    def test_custom_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "rules.json"
+        entry = {
+            "rule_id": "X-1",
+            "description": "AESEV in CT",
+            "category": "TERMINOLOGY",
+            "severity": "ERROR",
+            "domains": ["AE"],
+            "check": "in_set",
+            "variable": "AESEV",
+            "values": ["MILD", "MODERATE", "SEVERE"],
+        }
+        path.write_text(json.dumps({"rules": [entry]}))
+        rules = load_declarative_rules(path)
+        results = rules.evaluate(
+            "AE", pd.DataFrame({"AESEV": ["MILD", "mild"]}), MagicMock(), MagicMock(), MagicMock()
+        )
+        assert [(r.rule_id, r.affected_count) for r in results] == [("X-1", 1)]
+
+    def test_duplicate_rule_ids_rejected(self, tmp_path: Path) -> None:
+        entry = {
+            "rule_id": "X-1",
+            "description": "d",
+            "category": "PRESENCE",
+            "severity": "ERROR",
+            "check": "not_null",
+            "variable": "A",
+        }
+        path = tmp_path / "rules.json"
+        path.write_text(json.dumps({"rules": [entry, entry]}))
+        with pytest.raises(ValueError, match="Duplicate"):
+            load_declarative_rules(path)
+
+    def test_engine_registers_declarative_rules(self) -> None:
+        engine = ValidationEngine(sdtm_ref=MagicMock(), ct_ref=MagicMock())
+        assert any(isinstance(rule, DeclarativeRuleSet) for rule in engine.rules)
@@ -0,0 +1,122 @@
+"""Tests for the shared per-domain column statistics used by validation rules."""
+
+from __future__ import annotations
+
+import re
+from typing import ClassVar
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+from astraea.validation.domain_stats import DomainStats, parse_floats
+from astraea.validation.engine import ValidationEngine
+from astraea.validation.rules.base import RuleCategory, RuleResult, RuleSeverity, ValidationRule
+from astraea.validation.rules.fda_business import FDAB022Rule
+from astraea.validation.rules.format import DateFormatRule
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "SEX": ["M", "F", None, "M", "U", "M"],
+            "AESTDTC": ["2024-01-05", "2024/01/06", None, "2024-01", "2024/01/06", "bad"],
+            "AGE": [30.0, 41.0, np.nan, 30.0, 1.0, 30.0],
+        }
+    )
+
+
+class TestDomainStats:
+    def test_distinct_values_and_counts(self) -> None:
+        stats = DomainStats(_frame())
+        assert stats.distinct("SEX").tolist() == ["M", "F", "U"]
+        assert stats.value_counts("SEX").tolist() == [3, 1, 1]
+        assert stats.distinct("AGE").tolist() == ["30.0", "41.0", "1.0"]
+        assert stats.not_null("SEX").tolist() == [True, True, False, True, True, True]
+
+    def test_values_not_in(self) -> None:
+        stats = DomainStats(_frame())
+        assert stats.values_not_in("SEX", {"M", "F"}) == (["U"], 1)
+        assert stats.values_not_in("SEX", {"M", "F", "U"}) == ([], 0)
+
+    def test_lengths_and_row_broadcast(self) -> None:
+        stats = DomainStats(pd.DataFrame({"X": ["ab", "µ", None, "ab"]}))
+        assert stats.str_lengths("X").tolist() == [2, 1]
+        assert stats.byte_lengths("X").tolist() == [2, 2]
+        assert stats.per_row("X", np.array([True, False])).tolist() == [True, False, True]
+        assert stats.rows_where("X", np.array([True, False])).tolist() == [
+            True,
+            False,
+            False,
+            True,
+        ]
+
+    def test_matches_runs_once_per_distinct_value(self) -> None:
+        stats = DomainStats(_frame())
+        pattern = MagicMock(wraps=re.compile(r"^\d{4}-\d{2}"))
+        pattern.pattern, pattern.flags = "p", 0
+        first = stats.matches("AESTDTC", pattern)
+        second = stats.matches("AESTDTC", pattern)
+        assert first is second
+        assert first.tolist() == [True, False, True, False]
+        assert pattern.match.call_count == 4
+
+    def test_floats_and_non_numeric(self) -> None:
+        stats = DomainStats(pd.DataFrame({"X": ["1", " 2.5 ", "nan", None, "<LLOQ", "1"]}))
+        assert stats.distinct("X").tolist() == ["1", " 2.5 ", "nan", "<LLOQ"]
+        np.testing.assert_array_equal(stats.floats("X"), [1.0, 2.5, np.nan, np.nan])
+        assert stats.non_numeric("X").tolist() == [False, False, False, True]
+
+    def test_parse_floats_matches_float(self) -> None:
+        parsed, rejected = parse_floats(["1_000", 5, "inf", "", None, b"x"])
+        np.testing.assert_array_equal(parsed, [1000.0, 5.0, np.inf, np.nan, np.nan, np.nan])
+        assert rejected.tolist() == [False, False, False, True, True, True]
+
+    def test_empty_column(self) -> None:
+        stats = DomainStats(pd.DataFrame({"X": [None, None]}))
+        assert stats.distinct("X").tolist() == []
+        assert stats.values_not_in("X", set()) == ([], 0)
+        assert stats.byte_lengths("X").tolist() == []
+
+
+class TestRulesWithStats:
+    def test_results_match_without_shared_stats(self) -> None:
+        df = _frame()
+        stats = DomainStats(df)
+        for rule in (DateFormatRule(), FDAB022Rule()):
+            alone = rule.evaluate("AE", df, MagicMock(), MagicMock(), MagicMock())
+            shared = rule.evaluate("AE", df, MagicMock(), MagicMock(), MagicMock(), stats=stats)
+            assert [r.model_dump() for r in shared] == [r.model_dump() for r in alone]
+            assert alone[0].affected_count == 3
+
+        fdab022 = FDAB022Rule().evaluate("AE", df, MagicMock(), MagicMock(), MagicMock())
+        assert "['2024/01/06', '2024/01/06', 'bad']" in fdab022[0].message
+
+    def test_engine_shares_one_stats_per_domain(self) -> None:
+        seen: list[DomainStats] = []
+
+        class StatsRule(ValidationRule):
+            uses_stats: ClassVar[bool] = True
+
+            def evaluate(self, domain, df, spec, sdtm_ref, ct_ref, stats=None) -> list[RuleResult]:
+                seen.append(stats)
+                return []
+
+        engine = ValidationEngine(sdtm_ref=MagicMock(), ct_ref=MagicMock())
+        engine._rules.clear()
+        for rule_id in ("A", "B"):
+            engine.register(
+                StatsRule(
+                    rule_id=rule_id,
+                    description=rule_id,
+                    category=RuleCategory.FORMAT,
+                    severity=RuleSeverity.NOTICE,
+                )
+            )
+
+        with patch.object(engine, "validate_cross_domain", return_value=[]):
+            engine.validate_all({"AE": (_frame(), MagicMock()), "DM": (_frame(), MagicMock())})
+        assert len(seen) == 4
+        assert seen[0] is seen[1]
+        assert seen[2] is seen[3]
+        assert seen[0] is not seen[2]
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import time
 from pathlib import Path
+from typing import ClassVar
 from unittest.mock import MagicMock
 
 import pandas as pd
 import pytest
 
 from astraea.models.mapping import DomainMappingSpec
-from astraea.validation.engine import ValidationEngine
+from astraea.reference import load_ct_reference, load_sdtm_reference
+from astraea.validation.engine import RuleExecution, ValidationEngine
 from astraea.validation.report import ValidationReport
 from astraea.validation.rules.base import (
     RuleCategory,
@@ -81,6 +84,24 @@ class ExplodingRule(ValidationRule):
         raise RuntimeError(msg)
 
 
+class SlowFirstDomainRule(ValidationRule):
+    """Rule that finishes last on the first domain it sees, to shuffle completion order."""
+
+    def evaluate(self, domain, df, spec, sdtm_ref, ct_ref) -> list[RuleResult]:
+        if domain == "AE":
+            time.sleep(0.05)
+        return [
+            RuleResult(
+                rule_id=self.rule_id,
+                rule_description=self.description,
+                category=self.category,
+                severity=self.severity,
+                domain=domain,
+                message=f"{domain} checked",
+            )
+        ]
+
+
 def _make_spec(domain: str = "AE") -> DomainMappingSpec:
     return DomainMappingSpec(
         domain=domain,
@@ -347,6 +368,194 @@ class TestValidationEngine:
         assert filtered[0].rule_id == "A"
 
 
+class TestParallelRuleExecution:
+    @staticmethod
+    def _domains() -> dict[str, tuple[pd.DataFrame, DomainMappingSpec]]:
+        return {
+            code: (
+                pd.DataFrame({"STUDYID": ["S1", "S1"], "DOMAIN": [code, code]}),
+                _make_spec(code),
+            )
+            for code in ("AE", "CM", "MH")
+        }
+
+    def _engine(self, max_workers: int, **kwargs) -> ValidationEngine:
+        engine = ValidationEngine(
+            sdtm_ref=MagicMock(), ct_ref=MagicMock(), max_workers=max_workers, **kwargs
+        )
+        engine._rules.clear()
+        engine.register(
+            SlowFirstDomainRule(
+                rule_id="SLOW",
+                description="Slow",
+                category=RuleCategory.FORMAT,
+                severity=RuleSeverity.NOTICE,
+            )
+        )
+        engine.register(
+            ExplodingRule(
+                rule_id="BOOM",
+                description="Explodes",
+                category=RuleCategory.FORMAT,
+                severity=RuleSeverity.ERROR,
+            )
+        )
+        return engine
+
+    def test_threads_keep_serial_order(self) -> None:
+        domains = self._domains()
+        serial = self._engine(1).validate_all(domains)
+        parallel = self._engine(4).validate_all(domains)
+
+        assert [r.model_dump() for r in parallel] == [r.model_dump() for r in serial]
+        assert [(r.domain, r.rule_id) for r in parallel[:4]] == [
+            ("AE", "SLOW"),
+            ("AE", "BOOM"),
+            ("CM", "SLOW"),
+            ("CM", "BOOM"),
+        ]
+        assert parallel[1].severity == RuleSeverity.WARNING
+        assert "Something went wrong" in parallel[1].message
+
+    def test_processes_match_serial_with_default_rules(self) -> None:
+        sdtm_ref = load_sdtm_reference()
+        ct_ref = load_ct_reference()
+        domains = {
+            "AE": (
+                pd.DataFrame(
+                    {
+                        "STUDYID": ["S1", "S1"],
+                        "DOMAIN": ["AE", "AE"],
+                        "USUBJID": ["S1-001", "S1-002"],
+                        "AESEQ": [1, 1],
+                        "AETERM": ["Headache", "NAUSEA"],
+                        "AESER": ["N", "maybe"],
+                    }
+                ),
+                _make_spec("AE"),
+            ),
+            "DM": (
+                pd.DataFrame(
+                    {"STUDYID": ["S1"], "DOMAIN": ["DM"], "USUBJID": ["S1-001"], "SEX": ["X"]}
+                ),
+                _make_spec("DM"),
+            ),
+        }
+        serial = ValidationEngine(sdtm_ref=sdtm_ref, ct_ref=ct_ref).validate_all(domains)
+        parallel = ValidationEngine(
+            sdtm_ref=sdtm_ref, ct_ref=ct_ref, max_workers=2, execution="process"
+        ).validate_all(domains)
+
+        assert serial
+        assert [r.model_dump() for r in parallel] == [r.model_dump() for r in serial]
+
+    def test_validate_domain_uses_workers(self) -> None:
+        df, spec = self._domains()["AE"]
+        results = self._engine(2, execution=RuleExecution.THREAD).validate_domain("AE", df, spec)
+        assert [r.rule_id for r in results] == ["SLOW", "BOOM"]
+
+    def test_invalid_settings(self) -> None:
+        with pytest.raises(ValueError, match="max_workers"):
+            ValidationEngine(sdtm_ref=MagicMock(), ct_ref=MagicMock(), max_workers=0)
+        with pytest.raises(ValueError):
+            ValidationEngine(sdtm_ref=MagicMock(), ct_ref=MagicMock(), execution="gpu")
+
+
+class TermRule(CountingRule):
+    """CountingRule that declares it only reads AETERM."""
+
+    reads: ClassVar[frozenset[str]] = frozenset({"AETERM"})
+
+
+class TestIncrementalValidation:
+    @staticmethod
+    def _engine() -> tuple[ValidationEngine, list[tuple[str, str]]]:
+        calls: list[tuple[str, str]] = []
+
+        class Recorded(CountingRule):
+            def evaluate(self, domain, df, spec, sdtm_ref, ct_ref) -> list[RuleResult]:
+                calls.append((domain, self.rule_id))
+                return super().evaluate(domain, df, spec, sdtm_ref, ct_ref)
+
+        class RecordedTerm(Recorded, TermRule):
+            pass
+
+        engine = ValidationEngine(sdtm_ref=MagicMock(), ct_ref=MagicMock())
+        engine._rules.clear()
+        for rule_id, cls in (("ANY", Recorded), ("TERM", RecordedTerm)):
+            engine.register(
+                cls(
+                    rule_id=rule_id,
+                    description=rule_id,
+                    category=RuleCategory.FORMAT,
+                    severity=RuleSeverity.NOTICE,
+                )
+            )
+        return engine, calls
+
+    def test_reads_any(self) -> None:
+        rule = TermRule(
+            rule_id="X", description="X", category=RuleCategory.FORMAT, severity=RuleSeverity.NOTICE
+        )
+        assert rule.reads_any("AE", ["AETERM"])
+        assert not rule.reads_any("AE", ["AESEQ", "USUBJID"])
+        assert not rule.reads_any("AE", [])
+
+        TermRule.reads = frozenset({"--SEQ", "*DTC"})
+        try:
+            assert rule.reads_any("AE", ["AESEQ"])
+            assert rule.reads_any("CM", ["cmstdtc"])
+            assert not rule.reads_any("CM", ["AESEQ"])
+        finally:
+            TermRule.reads = frozenset({"AETERM"})
+
+        any_rule = CountingRule(
+            rule_id="Y", description="Y", category=RuleCategory.FORMAT, severity=RuleSeverity.NOTICE
+        )
+        assert any_rule.reads_any("AE", ["ANYTHING"])
+        assert not any_rule.reads_any("AE", [])
+
+    def test_reruns_only_affected_rules(self) -> None:
+        engine, calls = self._engine()
+        domains = {
+            "AE": (pd.DataFrame({"AETERM": ["a", "b"]}), _make_spec("AE")),
+            "CM": (pd.DataFrame({"CMTRT": ["x"]}), _make_spec("CM")),
+        }
+        first = engine.validate_incremental(domains)
+        assert len(calls) == 4
+        assert [[r.rule_id for r in per_rule] for per_rule in first.domain_results["AE"]] == [
+            ["ANY", "ANY"],
+            ["TERM", "TERM"],
+        ]
+
+        calls.clear()
+        domains["AE"] = (pd.DataFrame({"AETERM": ["a", "b", "c"]}), _make_spec("AE"))
+        second = engine.validate_incremental(domains, previous=first, changes={"AE": {"AESEQ"}})
+        assert calls == [("AE", "ANY")]
+        # TERM on AE was not affected, so it keeps the findings of the 2-row frame
+        assert [r.rule_id for r in second.results].count("TERM") == 3
+
+        calls.clear()
+        third = engine.validate_incremental(domains, previous=second, changes={"AE": None})
+        assert calls == [("AE", "ANY"), ("AE", "TERM")]
+        assert [r.model_dump() for r in third.results] == [
+            r.model_dump() for r in engine.validate_all(domains)
+        ]
+
+        calls.clear()
+        engine.validate_incremental(domains, previous=third, changes={"AE": set()})
+        assert calls == []
+
+    def test_rule_registry_change_reruns_everything(self) -> None:
+        engine, calls = self._engine()
+        domains = {"AE": (pd.DataFrame({"AETERM": ["a"]}), _make_spec("AE"))}
+        first = engine.validate_incremental(domains)
+        engine._rules.pop()
+        calls.clear()
+        engine.validate_incremental(domains, previous=first)
+        assert calls == [("AE", "ANY")]
+
+
 # ---------------------------------------------------------------------------
 # ValidationReport tests
 # ---------------------------------------------------------------------------
@@ -345,6 +345,14 @@ class TestFDAB020:
         results = rule.evaluate("AE", df, ae_spec, mock_sdtm_ref, mock_ct_ref)
         assert len(results) == 0
 
+    def test_accepts_what_float_accepts(self, ae_spec, mock_sdtm_ref, mock_ct_ref) -> None:
+        """Strings float() parses are numeric; the count covers every bad row."""
+        rule = FDAB020Rule()
+        df = pd.DataFrame({"VISITNUM": ["1", " 2.5 ", "1_000", "nan", "X", None, "X", "1e3"]})
+        results = rule.evaluate("AE", df, ae_spec, mock_sdtm_ref, mock_ct_ref)
+        assert len(results) == 1
+        assert results[0].affected_count == 2
+
 
 # ---------------------------------------------------------------------------
 # FDAB021: DY Day 0
@@ -375,6 +383,14 @@ class TestFDAB021:
         assert len(results) == 1
         assert results[0].variable == "AESTDY"
 
+    def test_character_dy_values(self, ae_spec, mock_sdtm_ref, mock_ct_ref) -> None:
+        """Character --DY values equal to zero count; unparseable ones are ignored."""
+        rule = FDAB021Rule()
+        df = pd.DataFrame({"AEDY": ["0", "-0.0", "3", "N/A", None]})
+        results = rule.evaluate("AE", df, ae_spec, mock_sdtm_ref, mock_ct_ref)
+        assert len(results) == 1
+        assert results[0].affected_count == 2
+
 
 # ---------------------------------------------------------------------------
 # FDAB022: DTC ISO 8601
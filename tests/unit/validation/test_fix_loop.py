@@ -411,6 +411,56 @@ class TestFinalReport:
             assert len(post_domain_errors) < len(pre_domain_errors)
 
 
+class TestIncrementalRevalidation:
+    """Test that re-validation only re-runs rules affected by the fixes."""
+
+    def test_final_results_match_full_validation(
+        self,
+        fix_loop_engine: FixLoopEngine,
+        sample_domain_with_issues: dict[str, tuple[pd.DataFrame, DomainMappingSpec]],
+    ) -> None:
+        """Incremental passes report exactly what a full validation reports."""
+        domains = sample_domain_with_issues
+        result = fix_loop_engine.run_fix_loop(domains, study_id="TEST-001")
+
+        full = fix_loop_engine._engine.validate_all(domains)
+        assert [r.model_dump() for r in result.remaining_issues] == [r.model_dump() for r in full]
+
+    def test_fixes_record_modified_variables(
+        self,
+        fix_loop_engine: FixLoopEngine,
+        sample_domain_with_issues: dict[str, tuple[pd.DataFrame, DomainMappingSpec]],
+    ) -> None:
+        """The DOMAIN fix records DOMAIN so only rules reading it re-run."""
+        result = fix_loop_engine.run_fix_loop(sample_domain_with_issues, study_id="TEST-001")
+
+        domain_fixes = [a for a in result.all_fix_actions if a.variable == "DOMAIN"]
+        assert domain_fixes
+        assert all(a.modified_variables == ["DOMAIN"] for a in domain_fixes)
+
+    def test_skips_rules_not_reading_changed_variables(
+        self,
+        fix_loop_engine: FixLoopEngine,
+        sample_domain_with_issues: dict[str, tuple[pd.DataFrame, DomainMappingSpec]],
+    ) -> None:
+        """After the DOMAIN fix, rules declaring other inputs are not re-run."""
+        engine = fix_loop_engine._engine
+        seq_rule = next(r for r in engine.rules if r.rule_id == "ASTR-P005")
+        calls: list[str] = []
+        original = type(seq_rule).evaluate
+
+        def counting_evaluate(self, domain, *args, **kwargs):
+            calls.append(domain)
+            return original(self, domain, *args, **kwargs)
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(type(seq_rule), "evaluate", counting_evaluate)
+            fix_loop_engine.run_fix_loop(sample_domain_with_issues, study_id="TEST-001")
+
+        # Evaluated once on the first pass, never again after the DOMAIN fix
+        assert calls == ["AE"]
+
+
 class TestFormatNeedsHumanReport:
     """Test the format_needs_human_report helper."""
 
@@ -269,3 +269,28 @@ class TestASTRC005Vectorized:
         domains = {"DM": dm_df, "AE": ae_df}
         results = validator._check_studyday_consistency(domains)
         assert len(results) == 2  # One per DY column
+
+
+class TestASTRC005ColumnarEngine:
+    def test_partial_dates_not_flagged(self) -> None:
+        """Partial --DTC values cannot be compared and are skipped."""
+        validator = CrossDomainValidator()
+        dm_df = pd.DataFrame({"USUBJID": ["S1"], "RFSTDTC": ["2022-06-01"]})
+        ae_df = pd.DataFrame({"USUBJID": ["S1"], "AESTDTC": ["2022-05"], "AESTDY": [3]})
+        results = validator._check_studyday_consistency({"DM": dm_df, "AE": ae_df})
+        assert results == []
+
+    def test_negative_dy_on_reference_date_not_flagged(self) -> None:
+        """A negative DY on RFSTDTC itself matches the previous boundary rule."""
+        validator = CrossDomainValidator()
+        dm_df = pd.DataFrame({"USUBJID": ["S1", "S1b"], "RFSTDTC": ["2022-06-01", "2022-06-01"]})
+        ae_df = pd.DataFrame(
+            {
+                "USUBJID": ["S1", "S1b"],
+                "AESTDTC": ["2022-06-01", "2022-06-03T10:00"],
+                "AESTDY": [-1, -2],
+            }
+        )
+        results = validator._check_studyday_consistency({"DM": dm_df, "AE": ae_df})
+        assert len(results) == 1
+        assert results[0].affected_count == 1